@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""Incremental build graph over every generator.
+
+STAGES declares each generator's inputs and outputs; the graph follows from
+them (a stage depends on whichever stages produce its inputs). A stage runs
+only when it is stale:
+
+  - its input contents (plus jsemit.py and the --json-parse setting) hash
+    differently from the stamp of its last successful run, or
+  - an output is missing or no longer matches what that run wrote.
+
+Remote stages (poedb scraping) have no local inputs that could go stale and
+hit the network, so they run only when named in --force.
+Independent stages run in parallel. Stamps live in .build-stamps.json, along
+with a (mtime, size) -> SHA-256 cache so unchanged files are not re-read.
+
+Usage:
+    python build.py [TARGET ...] [--force STAGE ...] [-j N] [-n]
+
+TARGETs are stage names (default: every stage). -n lists the stages that are
+stale now, without running them.
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import importlib
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+STAMPS_JSON = ROOT / ".build-stamps.json"
+
+# Every generator writes through jsemit
+COMMON_INPUTS = ["jsemit.py"]
+# Precompressed siblings (serve.py, payload.py) are derived from the file next
+# to them; globbed inputs skip them, as they skip the stage's own outputs
+DERIVED_SUFFIXES = {".gz", ".br"}
+
+
+class Stage:
+    def __init__(self, name, run, inputs, outputs, remote=False, options=()):
+        self.name = name
+        self.run = run          # "module:function"
+        self.inputs = inputs    # paths or globs, relative to ROOT
+        self.outputs = outputs  # paths relative to ROOT
+        self.remote = remote
+        self.options = options  # keyword arguments taken from build(options=...)
+
+    def call(self, options):
+        module, func = self.run.split(":")
+        kwargs = {k: options[k] for k in self.options if k in options}
+        getattr(importlib.import_module(module), func)(**kwargs)
+
+
+STAGES = [
+    Stage("scrape", "scrape_poedb:main", ["scrape_poedb.py", "reward_matrix.py", "dataset.py"],
+          ["js/gems.js", "js/reward_matrix.js"],
+          remote=True, options=("icons", "bulk")),
+    Stage("details", "scrape_poedb:main_details", ["js/gems.js"],
+          ["js/gem_details.js", "gem_details_fetched.json", "gem_details_failed.json"],
+          remote=True, options=("budget", "time_budget", "bounded")),
+    Stage("stats", "build_gem_stats:main", ["js/gem_details.js", "build_gem_stats.py"],
+          ["js/gem_stats.js"]),
+    Stage("timeline", "gem_timeline:main", ["js/gems.js", "gem_timeline.py", "dataset.py"],
+          ["js/gem_timeline.js"]),
+    Stage("release", "releases:cut_release",
+          ["js/gems.js", "js/gem_details.js", "releases.py", "snapshots.py"],
+          ["releases/index.json", "js/release.js"]),
+    Stage("names", "names:main", ["names.py"],
+          ["js/names_en.js", "js/names_log_en.js", "js/names_log_kr.js"]),
+    Stage("guide", "build_guide:main", ["cyclon_campaign_guide.json", "build_guide.py", "names.py"],
+          ["js/guide.js"]),
+    Stage("prerender", "prerender:main", ["js/data_v2.js", "prerender.py", "names.py"],
+          ["js/prerendered.js"]),
+    Stage("precache", "precache:main",
+          ["index.html", "js/*", "css/*", "fonts/*", "releases/*", "precache.py", "payload.py",
+           "releases.py"],
+          ["sw.js", "precache-manifest.json"]),
+    Stage("payload", "payload:main",
+          ["index.html", "js/*", "css/*", "fonts/*", "releases/*", "payload.py",
+           "payload-budgets.json"],
+          ["payload-report.json"]),
+]
+STAGES_BY_NAME = {s.name: s for s in STAGES}
+
+
+def dependencies(stage, stages=STAGES):
+    """Stages whose outputs match one of stage's inputs."""
+    return [
+        other for other in stages
+        if other is not stage
+        and any(fnmatch.fnmatch(out, pattern) for out in other.outputs for pattern in stage.inputs)
+    ]
+
+
+def closure(targets, stages=STAGES):
+    """targets plus everything they depend on, in STAGES order.
+
+    Raises ValueError naming the stages involved if the dependencies form a
+    cycle (which would otherwise leave build() waiting forever).
+    """
+    wanted = set()
+    visiting = []
+
+    def visit(stage):
+        if stage.name in wanted:
+            return
+        if stage in visiting:
+            cycle = visiting[visiting.index(stage):] + [stage]
+            raise ValueError("build graph has a dependency cycle: "
+                             + " -> ".join(s.name for s in cycle))
+        visiting.append(stage)
+        for dep in dependencies(stage, stages):
+            visit(dep)
+        visiting.pop()
+        wanted.add(stage.name)
+
+    for stage in targets:
+        visit(stage)
+    return [s for s in stages if s.name in wanted]
+
+
+class Stamps:
+    """Per-stage stamps plus a stat-keyed file hash cache."""
+
+    def __init__(self, path=STAMPS_JSON):
+        self.path = path
+        data = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+        self.files = data.get("files", {})
+        self.stages = data.get("stages", {})
+
+    def save(self):
+        data = {"files": self.files, "stages": self.stages}
+        self.path.write_text(json.dumps(data, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+
+    def file_hash(self, rel):
+        path = ROOT / rel
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        cached = self.files.get(rel)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self.files[rel] = [st.st_mtime_ns, st.st_size, digest]
+        return digest
+
+    def input_digest(self, stage, json_parse):
+        files = set(COMMON_INPUTS)
+        for pattern in stage.inputs:
+            if any(ch in pattern for ch in "*?["):
+                matches = {p.relative_to(ROOT).as_posix() for p in ROOT.glob(pattern)
+                           if p.is_file() and p.suffix not in DERIVED_SUFFIXES}
+                files.update(matches.difference(stage.outputs))
+            else:
+                files.add(pattern)
+        h = hashlib.sha256(f"json_parse={json_parse}\n".encode())
+        for rel in sorted(files):
+            h.update(f"{rel}\0{self.file_hash(rel)}\n".encode())
+        return h.hexdigest()
+
+    def stale_reason(self, stage, json_parse, forced):
+        if stage.name in forced:
+            return "forced"
+        if stage.remote:
+            return None
+        if any(not (ROOT / out).exists() for out in stage.outputs):
+            return "output missing"
+        stamp = self.stages.get(stage.name)
+        if not stamp:
+            return "never built"
+        if stamp["inputs"] != self.input_digest(stage, json_parse):
+            return "inputs changed"
+        if any(stamp["outputs"].get(out) != self.file_hash(out) for out in stage.outputs):
+            return "output modified"
+        return None
+
+    def record(self, stage, json_parse):
+        self.stages[stage.name] = {
+            "inputs": self.input_digest(stage, json_parse),
+            "outputs": {out: self.file_hash(out) for out in stage.outputs},
+        }
+
+
+def build(targets=None, force=(), jobs=None, dry_run=False, options=None):
+    """Bring targets (stage names; default all) up to date. Returns stages run."""
+    import jsemit
+
+    options = options or {}
+    json_parse = jsemit.JSON_PARSE
+    stages = closure([STAGES_BY_NAME[t] for t in targets] if targets else STAGES)
+    deps = {s.name: {d.name for d in dependencies(s, stages)} for s in stages}
+    stamps = Stamps()
+    done, ran = set(), []
+    pending = {s.name: s for s in stages}
+    running = {}
+    t0 = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        while pending or running:
+            for name, stage in list(pending.items()):
+                if not deps[name] <= done:
+                    continue
+                del pending[name]
+                # A rebuilt dependency changes this stage's input hash by itself
+                reason = stamps.stale_reason(stage, json_parse, force)
+                if reason is None:
+                    done.add(name)
+                    continue
+                print(f"[build] {name}: {reason}")
+                if dry_run:
+                    ran.append(name)
+                    done.add(name)
+                    continue
+                running[pool.submit(stage.call, options)] = stage
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage = running.pop(future)
+                future.result()  # re-raise stage errors
+                stamps.record(stage, json_parse)
+                stamps.save()
+                done.add(stage.name)
+                ran.append(stage.name)
+
+    stamps.save()
+    verb = "would run" if dry_run else "ran"
+    print(f"[build] {verb} {len(ran)}/{len(stages)} stages "
+          f"({', '.join(ran) or 'all up to date'}) in {time.perf_counter() - t0:.2f}s")
+    return ran
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="build.py", description=__doc__.split("\n\n")[0])
+    parser.add_argument("targets", nargs="*", metavar="TARGET",
+                        help="stages to bring up to date (default: all)")
+    parser.add_argument("--force", nargs="+", default=[], choices=list(STAGES_BY_NAME),
+                        metavar="STAGE", help="run these stages even if up to date")
+    parser.add_argument("-j", "--jobs", type=int, help="parallel stages (default: CPU count)")
+    parser.add_argument("-n", "--dry-run", action="store_true", help="only list stale stages")
+    args = parser.parse_args(argv)
+    unknown = [t for t in args.targets if t not in STAGES_BY_NAME]
+    if unknown:
+        parser.error(f"unknown stage {unknown[0]!r} (choose from {', '.join(STAGES_BY_NAME)})")
+    build(args.targets, force=set(args.force), jobs=args.jobs, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
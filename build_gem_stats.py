@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Parse the display strings in js/gem_details.js into numeric ranges and generate js/gem_stats.js.
+
+gem_details.js keeps poedb's text as-is ("레벨:(1—20)", "소모:마나 (9—26)",
+"요구 사항 레벨(12—70),(21—98)힘,(14—68)지능"). This stage turns the fields
+consumers filter/sort on into column arrays aligned with `ids`, so the
+frontend can wrap them in typed arrays (e.g. new Uint16Array(col)) and filter
+"castable at level N with X int" with plain array comparisons.
+
+A value of 0 is a real value (e.g. a 0 int requirement); whether a gem has a
+column at all is in the `present` bitmap. Values that do not fit a column's
+type fail the build instead of being truncated.
+"""
+
+import json, re
+from array import array
+from pathlib import Path
+
+import jsemit
+
+ROOT = Path(__file__).parent
+DETAILS_JS = ROOT / 'js' / 'gem_details.js'
+STATS_JS = ROOT / 'js' / 'gem_stats.js'
+
+# "(21—873)" or "21" / "0.75"
+RANGE_RE = re.compile(r'\((-?\d+(?:\.\d+)?)—(-?\d+(?:\.\d+)?)\)|(-?\d+(?:\.\d+)?)')
+
+# requirements: "레벨(12—70),(21—98)힘,(14—68)지능"
+REQ_ATTR = {'힘': 'str', '민첩': 'dex', '지능': 'int'}
+
+# "소모:<resource> (9—26)" -> costKinds index
+COST_KINDS = ['', 'mana', 'life', 'es', 'mana/s']
+COST_RESOURCES = {'마나': 'mana', '생명력': 'life', '에너지 보호막': 'es'}
+
+# min/max column pairs -> array typecode ('H' = Uint16Array, 'd' = Float64Array).
+# Costs can be fractional ("(15—32.67)" for the link gems), so they are doubles.
+# Bit i of present[gem] is set when the gem has COLUMNS' i-th entry.
+COLUMNS = {'level': 'H', 'cost': 'd', 'reqLevel': 'H', 'str': 'H', 'dex': 'H', 'int': 'H'}
+UINT16_MAX = 0xFFFF
+
+
+def _num(text):
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+def parse_ranges(text):
+    """Return every numeric value in text as (min, max); single numbers give (n, n)."""
+    ranges = []
+    for m in RANGE_RE.finditer(text):
+        if m.group(3) is not None:
+            n = _num(m.group(3))
+            ranges.append((n, n))
+        else:
+            ranges.append((_num(m.group(1)), _num(m.group(2))))
+    return ranges
+
+
+def parse_requirements(text):
+    """'요구 사항 레벨(12—70),(21—98)힘' -> {'reqLevel': (12, 70), 'str': (21, 98)}."""
+    out = {}
+    if not text:
+        return out
+    for part in text.replace('요구 사항', '').split(','):
+        part = part.strip()
+        ranges = parse_ranges(part)
+        if not ranges:
+            continue
+        if part.startswith('레벨'):
+            out['reqLevel'] = ranges[0]
+            continue
+        for kr, key in REQ_ATTR.items():
+            if part.endswith(kr):
+                out[key] = ranges[0]
+    return out
+
+
+def parse_properties(props):
+    """Pull level and cost out of the properties list."""
+    out = {}
+    for prop in props:
+        label, _, value = prop.partition(':')
+        if label == '레벨':
+            ranges = parse_ranges(value)
+            if ranges:
+                out['level'] = ranges[0]
+        elif label == '소모':
+            ranges = parse_ranges(value)
+            if not ranges or value.rstrip().endswith('%'):
+                continue
+            if '초당' in value:
+                kind = 'mana/s'
+                ranges = ranges[1:]  # skip the "N초당" interval
+            else:
+                resource = value[:RANGE_RE.search(value).start()].strip()
+                kind = COST_RESOURCES.get(resource, '')
+            if ranges:
+                out['cost'] = ranges[0]
+                out['costKind'] = COST_KINDS.index(kind)
+    return out
+
+
+def check_value(gem_id, column, value):
+    """Raise ValueError unless value fits the column's array type exactly."""
+    if COLUMNS[column] == 'H' and not (isinstance(value, int) and 0 <= value <= UINT16_MAX):
+        raise ValueError(f'{gem_id}: {column} {value!r} does not fit a Uint16 column '
+                         f'(integers 0..{UINT16_MAX}); give the column a wider type')
+    if value < 0:
+        raise ValueError(f'{gem_id}: {column} {value!r} is negative')
+    return value
+
+
+def build_stats(details):
+    """Build column arrays from a gem_id -> detail record mapping."""
+    ids = sorted(details)
+    columns = {f'{c}{b}': array(t) for c, t in COLUMNS.items() for b in ('Min', 'Max')}
+    present = array('B')
+    cost_kind = array('B')
+    mod_ranges = {}
+
+    for gem_id in ids:
+        data = details[gem_id]
+        parsed = parse_properties(data.get('properties', []))
+        parsed.update(parse_requirements(data.get('requirements')))
+        bits = 0
+        for i, c in enumerate(COLUMNS):
+            if c in parsed:
+                bits |= 1 << i
+            lo, hi = parsed.get(c, (0, 0))
+            columns[f'{c}Min'].append(check_value(gem_id, c, lo))
+            columns[f'{c}Max'].append(check_value(gem_id, c, hi))
+        present.append(bits)
+        cost_kind.append(parsed.get('costKind', 0))
+
+        # Mods: one flat [min, max, min, max, ...] list per mod, aligned with details.mods
+        mods = [[v for r in parse_ranges(mod) for v in r] for mod in data.get('mods', [])]
+        if any(mods):
+            mod_ranges[gem_id] = mods
+
+    return {
+        'ids': ids,
+        'columns': {k: [_num(x) for x in v] for k, v in columns.items()},
+        'present': present.tolist(),
+        'costKind': cost_kind.tolist(),
+        'costKinds': COST_KINDS,
+        'modRanges': mod_ranges,
+    }
+
+
+def main(input_path=DETAILS_JS, output_path=STATS_JS):
+    from scrape_poedb import load_gem_details
+
+    details = load_gem_details(input_path)
+    stats = build_stats(details)
+
+    def dump(value):
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+    lines = [
+        '// Numeric ranges parsed from gem_details.js by build_gem_stats.py (do not edit)',
+        '// columns.* are index-aligned with ids. Wrap costMin/costMax in Float64Array, the',
+        '// rest in Uint16Array. present[i] bit k = ids[i] has columnNames[k] (else its value is 0).',
+        'const GEM_STATS = {',
+        f'  ids: {dump(stats["ids"])},',
+        f'  columnNames: {dump(list(COLUMNS))},',
+        f'  present: {dump(stats["present"])},',
+        '  columns: {',
+    ]
+    for name, values in stats['columns'].items():
+        lines.append(f'    {name}: {dump(values)},')
+    lines.append('  },')
+    lines.append(f'  costKind: {dump(stats["costKind"])},')
+    lines.append(f'  costKinds: {dump(stats["costKinds"])},')
+    lines.append('  modRanges: {')
+    for gem_id, mods in stats['modRanges'].items():
+        lines.append(f'    {json.dumps(gem_id)}: {dump(mods)},')
+    lines.append('  },')
+    lines.append('};')
+    lines.append('')
+
+    jsemit.write_js(output_path, '\n'.join(lines))
+
+    names = list(COLUMNS)
+    with_cost = sum(1 for bits in stats['present'] if bits >> names.index('cost') & 1)
+    with_req = sum(1 for bits in stats['present'] if bits >> names.index('reqLevel') & 1)
+    print(f'{len(stats["ids"])} gems, {with_cost} with cost, {with_req} with requirements, '
+          f'{len(stats["modRanges"])} with mod ranges')
+    print(f'Written to {output_path}')
+
+
+if __name__ == '__main__':
+    main()
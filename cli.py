@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""Single entry point for the data generators.
+
+Usage:
+    python cli.py scrape [--bulk] [--icons]   # Quest page -> js/gems.js
+    python cli.py details [--budget N] [--time-budget S] [--bounded]
+                                              # gem pages -> js/gem_details.js
+    python cli.py icons                       # download missing img/gems/*.png
+    python cli.py locales us,tw [--details]   # other poedb locales -> js/locales/<loc>.js
+    python cli.py guide [--input F] [--output F] [--watch [--port N] [--poll]]
+                                              # Cyclon CSV -> js/guide.js
+    python cli.py stats                       # gem_details.js -> js/gem_stats.js
+    python cli.py timeline                    # gems.js -> js/gem_timeline.js
+    python cli.py names                       # names.py -> js/names_en.js + js/names_log_*.js
+    python cli.py prerender                   # data_v2.js step markup -> js/prerendered.js
+    python cli.py release                     # gems.js/gem_details.js -> releases/delta-N.json
+    python cli.py snapshot [NAME] [--force]   # save js/ data to the snapshots/ store
+    python cli.py precache                    # hash assets -> sw.js + precache-manifest.json
+    python cli.py payload [--measure]         # per-asset size/parse report, enforce budgets
+    python cli.py build [STAGE ...] [--force STAGE ...] [-j N] [-n]
+                                              # rebuild only stale local stages (build.py)
+    python cli.py all                         # scrape + icons + details, then every stale stage
+    python cli.py bench                       # bench/json_parse.html parse-time comparison
+    python cli.py serve [--host H] [--port N] # precompressed, cached static server (serve.py)
+
+Pass --json-parse before the subcommand to emit every data constant as
+`JSON.parse('...')` instead of an object literal (faster browser parse);
+`python cli.py bench` writes a page comparing the two forms.
+
+Each subcommand imports its generator module (and through it requests/bs4/
+lxml/PIL) only when it runs, so offline commands like `guide` start without
+paying for the scraping stack.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from build import STAGES_BY_NAME
+
+STAGE_NAMES = list(STAGES_BY_NAME)
+
+
+def cmd_scrape(args):
+    import scrape_poedb
+    scrape_poedb.main(icons=args.icons, bulk=args.bulk)
+
+
+def cmd_details(args):
+    import scrape_poedb
+    scrape_poedb.main_details(budget=args.budget, time_budget=args.time_budget,
+                              bounded=args.bounded)
+
+
+def cmd_locales(args):
+    import scrape_poedb
+    scrape_poedb.main_locales(args.locales.split(","), details=args.details)
+
+
+def cmd_icons(args):
+    import scrape_poedb
+    scrape_poedb.main_icons()
+
+
+def cmd_guide(args):
+    import build_guide
+    run = build_guide.watch if args.watch else build_guide.main
+    kwargs = {"port": args.port, "poll": args.poll} if args.watch else {}
+    run(
+        input_path=args.input or build_guide.GUIDE_JSON,
+        output_path=args.output or build_guide.GUIDE_JS,
+        **kwargs,
+    )
+
+
+def cmd_stats(args):
+    import build_gem_stats
+    build_gem_stats.main()
+
+
+def cmd_timeline(args):
+    import gem_timeline
+    gem_timeline.main()
+
+
+def cmd_release(args):
+    import releases
+    releases.cut_release()
+
+
+def cmd_snapshot(args):
+    import snapshots
+    snapshots.main(["save"] + ([args.name] if args.name else []) + (["--force"] if args.force else []))
+
+
+def cmd_names(args):
+    import names
+    names.main()
+
+
+def cmd_prerender(args):
+    import prerender
+    prerender.main()
+
+
+def cmd_precache(args):
+    import precache
+    precache.main()
+
+
+def cmd_payload(args):
+    import payload
+    payload.main(args.budgets or payload.BUDGETS_JSON, measure=args.measure, top=args.top)
+
+
+def cmd_bench(args):
+    import jsemit
+    jsemit.write_bench()
+
+
+def cmd_serve(args):
+    import serve
+    serve.main(["--host", args.host, "--port", str(args.port)])
+
+
+def cmd_build(args):
+    import build
+    unknown = [t for t in args.targets if t not in STAGES_BY_NAME]
+    if unknown:
+        sys.exit(f"unknown stage {unknown[0]!r} (choose from {', '.join(STAGE_NAMES)})")
+    build.build(args.targets or None, force=set(args.force), jobs=args.jobs, dry_run=args.dry_run)
+
+
+def cmd_all(args):
+    import build
+    build.build(force={"scrape", "details"}, options={
+        "icons": True, "bulk": args.bulk,
+        "budget": args.budget, "time_budget": args.time_budget, "bounded": args.bounded,
+    })
+
+
+def add_details_args(parser):
+    parser.add_argument("--budget", type=int, help="max gem pages to fetch this run")
+    parser.add_argument("--time-budget", type=float, help="stop starting fetches after S seconds")
+    parser.add_argument("--bounded", action="store_true",
+                        help="spool records to disk so memory stays flat")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="cli.py", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--json-parse", action="store_true",
+                        help="emit data constants as JSON.parse('...') string literals")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("scrape", help="scrape quest/vendor rewards into js/gems.js")
+    p.add_argument("--bulk", action="store_true", help="use gem index pages for gem metadata")
+    p.add_argument("--icons", action="store_true", help="also download missing gem icons")
+    p.set_defaults(func=cmd_scrape)
+
+    p = sub.add_parser("details", help="scrape gem detail pages into js/gem_details.js")
+    add_details_args(p)
+    p.set_defaults(func=cmd_details)
+
+    p = sub.add_parser("icons", help="download missing gem icons")
+    p.set_defaults(func=cmd_icons)
+
+    p = sub.add_parser("locales", help="scrape gem/quest text of other poedb locales")
+    p.add_argument("locales", help="comma-separated poedb locales, e.g. us,tw")
+    p.add_argument("--details", action="store_true", help="also scrape gem detail pages")
+    p.set_defaults(func=cmd_locales)
+
+    p = sub.add_parser("guide", help="generate js/guide.js from the Cyclon guide export")
+    p.add_argument("--input", type=Path, help="guide JSON (default: cyclon_campaign_guide.json)")
+    p.add_argument("--output", type=Path, help="output JS (default: js/guide.js)")
+    p.add_argument("--watch", action="store_true",
+                   help="rebuild changed acts on save and push them to pages opened with ?live")
+    p.add_argument("--port", type=int, help="live reload port (default: 8765)")
+    p.add_argument("--poll", action="store_true", help="poll for changes instead of inotify")
+    p.set_defaults(func=cmd_guide)
+
+    p = sub.add_parser("stats", help="parse gem detail ranges into js/gem_stats.js")
+    p.set_defaults(func=cmd_stats)
+
+    p = sub.add_parser("timeline", help="derive the per-class gem timeline from js/gems.js")
+    p.set_defaults(func=cmd_timeline)
+
+    p = sub.add_parser("release", help="cut a data release and write its delta")
+    p.set_defaults(func=cmd_release)
+
+    p = sub.add_parser("snapshot", help="save the current data to the snapshot store")
+    p.add_argument("name", nargs="?", help="snapshot name (default: today's date)")
+    p.add_argument("--force", action="store_true", help="replace an existing snapshot of that name")
+    p.set_defaults(func=cmd_snapshot)
+
+    p = sub.add_parser("names", help="generate the name dictionaries from names.py")
+    p.set_defaults(func=cmd_names)
+
+    p = sub.add_parser("prerender", help="prerender data_v2.js step HTML into js/prerendered.js")
+    p.set_defaults(func=cmd_prerender)
+
+    p = sub.add_parser("precache", help="hash assets and generate the service worker")
+    p.set_defaults(func=cmd_precache)
+
+    p = sub.add_parser("payload", help="report asset sizes, unused files and duplicated strings")
+    p.add_argument("--measure", action="store_true", help="time parse cost in node")
+    p.add_argument("--budgets", type=Path, help="budget file (default: payload-budgets.json)")
+    p.add_argument("--top", type=int, default=5, help="rows per duplicate listing")
+    p.set_defaults(func=cmd_payload)
+
+    p = sub.add_parser("bench", help="write the JSON.parse vs literal parse-time page")
+    p.set_defaults(func=cmd_bench)
+
+    p = sub.add_parser("serve", help="serve the site with precompression, ETags and ranges")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8000)
+    p.set_defaults(func=cmd_serve)
+
+    p = sub.add_parser("build", help="rebuild stale stages of the build graph")
+    p.add_argument("targets", nargs="*", metavar="STAGE",
+                   help=f"stages to bring up to date (default: all of {', '.join(STAGE_NAMES)})")
+    p.add_argument("--force", nargs="+", default=[], choices=STAGE_NAMES, metavar="STAGE",
+                   help="run these stages even if up to date")
+    p.add_argument("-j", "--jobs", type=int, help="parallel stages (default: CPU count)")
+    p.add_argument("-n", "--dry-run", action="store_true", help="only list stale stages")
+    p.set_defaults(func=cmd_build)
+
+    p = sub.add_parser("all", help="scrape poedb, then rebuild every stale stage")
+    p.add_argument("--bulk", action="store_true", help="use gem index pages for gem metadata")
+    add_details_args(p)
+    p.set_defaults(func=cmd_all)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.json_parse:
+        import jsemit
+        jsemit.JSON_PARSE = True
+    args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""In-process read API over the generated data files.
+
+Loads js/gems.js (gems[], questRewards, vendorRewards), js/gem_details.js and
+js/guide.js once into slotted records with prebuilt indexes, so tools and
+generators stop re-implementing the regex/bracket-matching loaders.
+
+    import dataset
+    ds = dataset.load()
+    ds.gem("fireball").details.tags
+    ds.by_kr["화염구"].id
+    [g.id for g in ds.gems_for("witch", upto_act=2)]
+    ds.by_tag["번개"]
+
+load() is memoized on the files' modification times: repeated calls return
+the same Dataset until a file changes, so every caller shares it. Its
+collections are read-only (tuples, and MappingProxyType for the indexes);
+the records in them are shared too and must not be modified. Copy what you
+need to change (e.g. Gem.as_dict()). Query results on a Dataset are
+memoized per argument tuple.
+
+Usage:
+    python dataset.py    # print a summary of the loaded dataset
+"""
+
+import json
+import re
+from functools import lru_cache
+from types import MappingProxyType
+
+from jsemit import js_literal_to_json, read_js
+from scrape_poedb import (
+    ROOT,
+    parse_existing_gems,
+    parse_existing_rewards,
+    parse_gem_details_js,
+)
+
+GEMS_JS = ROOT / "js" / "gems.js"
+DETAILS_JS = ROOT / "js" / "gem_details.js"
+GUIDE_JS = ROOT / "js" / "guide.js"
+
+
+class Gem:
+    __slots__ = ("id", "name", "type", "color", "icon", "eng_name", "details")
+
+    def __init__(self, id, name, type, color, icon, details=None):
+        self.id = id
+        self.name = name
+        self.type = type
+        self.color = color
+        self.icon = icon
+        self.eng_name = icon[:-4] if icon.endswith(".png") else icon  # poedb page name
+        self.details = details
+
+    def as_dict(self):
+        """The gems.js entry form used by the scraper functions."""
+        return {"id": self.id, "name": self.name, "type": self.type,
+                "color": self.color, "icon": self.icon}
+
+    def __repr__(self):
+        return f"Gem({self.id!r}, {self.name!r})"
+
+
+class GemDetails:
+    __slots__ = ("tags", "properties", "requirements", "description", "mods",
+                 "reminder", "qualityHeader", "qualityMod", "supportText", "engName")
+
+    def __init__(self, data):
+        for field in self.__slots__:
+            setattr(self, field, data.get(field))
+        self.tags = tuple(self.tags or ())
+        self.properties = tuple(self.properties or ())
+        self.mods = tuple(self.mods or ())
+
+
+class Reward:
+    """One questRewards (kind='reward') or vendorRewards (kind='vendor') row.
+
+    Accepts gems.js rows ("rewards": gem ids) and scrape rows ("perClass":
+    English names). act is None when the row does not carry one; page_order()
+    resolves it from the quest or drops the row.
+    """
+
+    __slots__ = ("act", "quest_name", "kind", "npc", "cost", "max_select", "per_class")
+
+    def __init__(self, kind, row):
+        self.act = row.get("act")
+        self.quest_name = row["questName"]
+        self.kind = kind
+        self.npc = row.get("npc")
+        self.cost = row.get("cost")
+        self.max_select = row.get("maxSelect")
+        per_class = row.get("rewards") or row.get("perClass") or {}
+        self.per_class = MappingProxyType({cls: tuple(ids) for cls, ids in per_class.items()})
+
+    def __repr__(self):
+        return f"Reward({self.kind}, act {self.act}, {self.quest_name!r})"
+
+
+class GuideNote:
+    __slots__ = ("act", "zone", "kr", "todo", "notes", "layout", "video")
+
+    def __init__(self, act, data):
+        self.act = act
+        for field in self.__slots__[1:]:
+            setattr(self, field, data.get(field))
+
+
+class Dataset:
+    """Loaded records plus indexes; build with load().
+
+    rewards holds the quest reward and vendor rows merged in page order.
+    Everything is read-only: record lists are tuples, indexes are
+    MappingProxyType views (list-valued ones hold tuples).
+    """
+
+    def __init__(self, gems, rewards, guide):
+        self.gems = tuple(gems)
+        self.rewards = tuple(rewards)
+        self.guide = tuple(guide)
+        by_eng, by_tag = {}, {}
+        for g in self.gems:
+            by_eng[g.eng_name.lower()] = g
+            if g.details:
+                if g.details.engName:
+                    by_eng[g.details.engName.lower()] = g
+                for tag in g.details.tags:
+                    by_tag.setdefault(tag, []).append(g)
+        by_class = {}  # cls -> {gem_id: first act}
+        by_act = {}    # act -> [Reward]
+        for r in self.rewards:
+            by_act.setdefault(r.act, []).append(r)
+            for cls, ids in r.per_class.items():
+                first = by_class.setdefault(cls, {})
+                for gid in ids:
+                    if gid not in first or r.act < first[gid]:
+                        first[gid] = r.act
+        guide_by_act = {}
+        for note in self.guide:
+            guide_by_act.setdefault(note.act, []).append(note)
+
+        self.by_id = MappingProxyType({g.id: g for g in self.gems})
+        self.by_eng = MappingProxyType(by_eng)
+        self.by_kr = MappingProxyType({g.name: g for g in self.gems})
+        self.by_tag = _frozen(by_tag)
+        self.by_class = MappingProxyType({cls: MappingProxyType(first) for cls, first in by_class.items()})
+        self.by_act = _frozen(by_act)
+        self.guide_by_act = _frozen(guide_by_act)
+        self._memo = {}
+
+    def _cached(self, key, compute):
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def gem(self, key):
+        """Look up a gem by id, English name (poedb or display) or Korean name."""
+        return self.by_id.get(key) or self.by_eng.get(key.lower()) or self.by_kr.get(key)
+
+    def gems_for(self, cls, upto_act=None, kind=None):
+        """Gems a class can get from quest rewards and/or vendors, in id order."""
+        def compute():
+            ids = set()
+            for r in self.rewards:
+                if (upto_act is None or r.act <= upto_act) and (kind is None or r.kind == kind):
+                    ids.update(r.per_class.get(cls, ()))
+            return tuple(self.by_id[gid] for gid in sorted(ids) if gid in self.by_id)
+        return self._cached(("gems_for", cls, upto_act, kind), compute)
+
+    def rewards_for(self, gem_id, cls=None):
+        """Reward rows that offer a gem (optionally to one class)."""
+        def compute():
+            return tuple(
+                r for r in self.rewards
+                if any(gem_id in ids for c, ids in r.per_class.items() if cls is None or c == cls)
+            )
+        return self._cached(("rewards_for", gem_id, cls), compute)
+
+    def reward_gem_ids(self):
+        """Every gem id referenced by any reward row."""
+        return self._cached(("reward_gem_ids",), lambda: frozenset(
+            gid for r in self.rewards for ids in r.per_class.values() for gid in ids
+        ))
+
+
+def _frozen(index):
+    """Read-only view of a {key: [record, ...]} index, with tuple values."""
+    return MappingProxyType({k: tuple(v) for k, v in index.items()})
+
+
+def quest_order(rewards):
+    """questName -> sort key (act, position) for every reward/vendor quest.
+
+    questRewards and vendorRewards are each in quest-page order. Quest reward
+    rows give the base positions; a vendor-only quest (one with no gem reward,
+    e.g. a vendor unlocked by an item quest) is slotted right after the vendor
+    row that precedes it.
+    """
+    pos = {}
+    for r in rewards:
+        if r.kind == "reward" and r.act is not None:
+            pos.setdefault(r.quest_name, (r.act, len(pos)))
+    last = (0, -1)
+    for r in rewards:
+        if r.kind != "vendor" or r.act is None:
+            continue
+        if r.quest_name in pos:
+            last = pos[r.quest_name]
+        else:
+            last = pos[r.quest_name] = (r.act, last[1] + 0.5)
+    return pos
+
+
+def page_order(rewards):
+    """Merge quest reward and vendor rows into one list in quest-page order.
+
+    A row without an act takes the act of another row for the same quest;
+    rows whose act cannot be resolved are dropped rather than filed under an
+    act they do not belong to. For the same quest, the reward row comes first.
+    """
+    acts = {}
+    for r in rewards:
+        if r.act is not None:
+            acts.setdefault(r.quest_name, r.act)
+    for r in rewards:
+        if r.act is None:
+            r.act = acts.get(r.quest_name)
+    rows = [r for r in rewards if r.act is not None]
+    order = quest_order(rows)
+    return sorted(rows, key=lambda r: (order[r.quest_name], r.kind != "reward"))
+
+
+def read_guide_notes(text):
+    """Parse the GUIDE_NOTES object of guide.js into {actN: [entry, ...]}."""
+    m = re.search(r"const GUIDE_NOTES\s*=\s*(\{.*\});", text, re.DOTALL)
+    return json.loads(js_literal_to_json(m.group(1))) if m else {}
+
+
+def _mtime(path):
+    return path.stat().st_mtime_ns if path.exists() else 0
+
+
+def load(gems_js=GEMS_JS, details_js=DETAILS_JS, guide_js=GUIDE_JS):
+    """Load (or return the cached) Dataset for the given files."""
+    return _load(gems_js, details_js, guide_js,
+                 _mtime(gems_js), _mtime(details_js), _mtime(guide_js))
+
+
+@lru_cache(maxsize=4)
+def _load(gems_js, details_js, guide_js, *mtimes):
+    text = read_js(gems_js)
+    details = {}
+    if details_js.exists():
+        details = parse_gem_details_js(read_js(details_js))
+
+    gems = [
+        Gem(**g, details=GemDetails(details[g["id"]]) if g["id"] in details else None)
+        for g in parse_existing_gems(text)
+    ]
+    rewards = page_order(
+        [Reward("reward", r) for r in parse_existing_rewards(text, "questRewards")]
+        + [Reward("vendor", r) for r in parse_existing_rewards(text, "vendorRewards")])
+
+    guide = []
+    if guide_js.exists():
+        for act_key, entries in read_guide_notes(read_js(guide_js)).items():
+            act = int(act_key.replace("act", ""))
+            guide.extend(GuideNote(act, e) for e in entries)
+
+    return Dataset(gems, rewards, guide)
+
+
+def main():
+    ds = load()
+    with_details = sum(1 for g in ds.gems if g.details)
+    print(f"gems          : {len(ds.gems)} ({with_details} with details)")
+    print(f"rewards       : {sum(r.kind == 'reward' for r in ds.rewards)} quest, "
+          f"{sum(r.kind == 'vendor' for r in ds.rewards)} vendor")
+    print(f"tags          : {len(ds.by_tag)}")
+    print(f"guide notes   : {len(ds.guide)} across {len(ds.guide_by_act)} acts")
+    for cls in sorted(ds.by_class):
+        print(f"  {cls:<9}: {len(ds.by_class[cls])} gems")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Per-class gem availability timeline, precomputed from js/gems.js.
+
+Merges questRewards and vendorRewards into one quest-ordered list of steps
+per class, each with the gems it newly unlocks and running totals, plus each
+gem's earliest step, so the planner only needs array lookups:
+
+    GEM_TIMELINE.witch.steps[i]       // {act, questName, reward, vendor, ...}
+    GEM_TIMELINE.witch.earliest.spark // [quest reward step, vendor step]
+
+Works from the committed gems.js only, so it is an offline build stage
+(build.py timeline) rather than a side effect of the poedb scrape.
+
+Usage:
+    python gem_timeline.py    # js/gems.js -> js/gem_timeline.js
+"""
+
+import json
+
+import jsemit
+from dataset import quest_order
+from scrape_poedb import CLASS_COLUMNS, ROOT
+
+OUTPUT_JS = ROOT / "js" / "gem_timeline.js"
+
+
+def build_gem_timeline(rewards, gem_ids, classes=CLASS_COLUMNS):
+    """Build {cls: {"steps": [...], "earliest": {gem_id: [rewardStep, vendorStep]}}}.
+
+    rewards are dataset.Reward rows; gems outside gem_ids are ignored. A step
+    index of -1 means "never available that way".
+    """
+    order = quest_order(rewards)
+    # questName -> {"act", "questName", "reward": {...}, "vendor": {...}, "npc", "cost"}
+    points = {}
+    for r in rewards:
+        point = points.setdefault(r.quest_name, {"act": r.act, "questName": r.quest_name})
+        point[r.kind] = r.per_class
+        if r.kind == "vendor":
+            point["npc"], point["cost"] = r.npc or "???", r.cost or "???"
+    ordered = sorted(points.values(), key=lambda p: order[p["questName"]])
+
+    timeline = {}
+    for cls in classes:
+        steps = []
+        earliest = {}
+        reward_total = vendor_total = 0
+        for point in ordered:
+            new = {"reward": [], "vendor": []}
+            for source, slot in (("reward", 0), ("vendor", 1)):
+                for gid in point.get(source, {}).get(cls, ()):
+                    if gid not in gem_ids:
+                        continue
+                    first = earliest.setdefault(gid, [-1, -1])
+                    if first[slot] == -1:
+                        first[slot] = len(steps)
+                        new[source].append(gid)
+            if not new["reward"] and not new["vendor"]:
+                continue
+            reward_total += len(new["reward"])
+            vendor_total += len(new["vendor"])
+            step = {"act": point["act"], "questName": point["questName"], **new,
+                    "rewardTotal": reward_total, "vendorTotal": vendor_total}
+            if new["vendor"]:
+                step["npc"], step["cost"] = point["npc"], point["cost"]
+            steps.append(step)
+        timeline[cls] = {"steps": steps, "earliest": earliest}
+    return timeline
+
+
+def write_js(timeline, output_path=OUTPUT_JS):
+    """Write the per-class timeline as const GEM_TIMELINE."""
+    lines = [
+        "// Per-class gem availability timeline, generated by gem_timeline.py",
+        "// steps: quest-ordered rewards with newly unlocked gems and running totals",
+        "// earliest: gem_id -> [quest reward step, vendor step] (-1 = not available)",
+        "const GEM_TIMELINE = {",
+    ]
+    for cls, data in timeline.items():
+        lines.append(f"  {cls}: {{")
+        lines.append("    steps: [")
+        for step in data["steps"]:
+            lines.append(f"      {json.dumps(step, ensure_ascii=False)},")
+        lines.append("    ],")
+        earliest = json.dumps(dict(sorted(data["earliest"].items())), separators=(",", ":"))
+        lines.append(f"    earliest: {earliest},")
+        lines.append("  },")
+    lines.append("};")
+    jsemit.write_js(output_path, "\n".join(lines) + "\n")
+
+
+def main():
+    import dataset
+    ds = dataset.load()
+    timeline = build_gem_timeline(ds.rewards, {g.id for g in ds.gems})
+    write_js(timeline)
+    steps = sum(len(t["steps"]) for t in timeline.values())
+    print(f"{len(timeline)} classes, {steps} steps")
+    print(f"Written to {OUTPUT_JS}")
+
+
+if __name__ == "__main__":
+    main()
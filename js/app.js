@@ -39,6 +39,34 @@
     });
   }
 
+  // FNV-1a over the steps' text; must match source_hash() in prerender.py
+  function sourceHash(steps) {
+    const text = steps.map(step => {
+      if (typeof step === 'string') return step;
+      return typeof step.newLeague === 'string' ? step.text + '\0' + step.newLeague : step.text;
+    }).join('\x1e');
+    let h = 0x811c9dc5;
+    for (let i = 0; i < text.length; i++) h = Math.imul(h ^ text.charCodeAt(i), 0x01000193) >>> 0;
+    return h.toString(16).padStart(8, '0');
+  }
+
+  // Whether each steps array still matches what prerender.py rendered
+  const prerenderedFresh = new WeakMap();
+
+  // Build-time rendered step HTML (prerender.py) — valid only for the exact
+  // steps it was rendered from and while every English annotation is on;
+  // otherwise render at runtime.
+  function stepHtml(sectionId, steps, idx, displayText, useVariant) {
+    const pre = typeof PRERENDERED !== 'undefined' && PRERENDERED[sectionId];
+    if (pre && !prerenderedFresh.has(steps))
+      prerenderedFresh.set(steps, (PRERENDERED.hashes || {})[sectionId] === sourceHash(steps));
+    if (pre && prerenderedFresh.get(steps) && PRERENDERED.engTypes.every(t => showEnglish[t])) {
+      const entry = pre[idx];
+      return Array.isArray(entry) ? entry[useVariant ? 1 : 0] : entry;
+    }
+    return parseStep(displayText);
+  }
+
   // Normalize step: returns { text, isNewLeague, variantText, sub, video }
   function normalizeStep(step) {
     if (typeof step === 'string') return { text: step, isNewLeague: false, variantText: null, sub: null, video: null };
@@ -561,6 +589,10 @@
       section.appendChild(tipsDiv);
     }
 
+    // Cyclon guide notes (js/guide.js); replaced in place on live reload
+    const guide = renderGuideNotes(sectionId);
+    if (guide) section.appendChild(guide);
+
     // Progress bar with text — count only visible steps
     if (steps && steps.length > 0) {
       const visibleCount = getVisibleStepCount(steps);
@@ -619,7 +651,7 @@
 
         const lbl = document.createElement('label');
         lbl.htmlFor = stepId;
-        lbl.innerHTML = parseStep(displayText);
+        lbl.innerHTML = stepHtml(sectionId, steps, idx, displayText, !!(variantText && newLeague));
 
         const contentWrap = document.createElement('div');
         contentWrap.className = 'step-content';
@@ -684,6 +716,72 @@
     nav.appendChild(navLink);
   }
 
+  // Guide notes block for one act, or null when there are none
+  function renderGuideNotes(sectionId, open) {
+    const notes = typeof GUIDE_NOTES !== 'undefined' && GUIDE_NOTES[sectionId];
+    if (!notes || notes.length === 0) return null;
+
+    const div = document.createElement('div');
+    div.className = 'tips-container guide-notes' + (open ? ' open' : '');
+    div.dataset.section = sectionId;
+
+    const header = document.createElement('div');
+    header.className = 'tips-header';
+    const arrow = document.createElement('span');
+    arrow.className = 'tips-arrow';
+    arrow.textContent = '▶';
+    header.appendChild(arrow);
+    header.appendChild(document.createTextNode(' 가이드 노트'));
+    header.addEventListener('click', () => {
+      div.classList.toggle('open');
+    });
+    div.appendChild(header);
+
+    const list = document.createElement('ul');
+    list.className = 'tips-list';
+    notes.forEach(note => {
+      const li = document.createElement('li');
+      const title = document.createElement('strong');
+      title.textContent = note.kr || note.zone;
+      li.appendChild(title);
+      if (note.todo) li.appendChild(document.createTextNode(` — ${note.todo}`));
+      [note.notes, note.layout].forEach(text => {
+        if (!text) return;
+        const p = document.createElement('div');
+        p.className = 'step-sub';
+        p.textContent = text;
+        li.appendChild(p);
+      });
+      if (note.video) {
+        const a = document.createElement('a');
+        a.href = note.video;
+        a.target = '_blank';
+        a.rel = 'noopener';
+        a.textContent = '[영상]';
+        li.appendChild(document.createTextNode(' '));
+        li.appendChild(a);
+      }
+      list.appendChild(li);
+    });
+    div.appendChild(list);
+    return div;
+  }
+
+  // Live reload (`build_guide.py --watch`): swap in the rebuilt act's notes
+  function onGuideNotesUpdated(e) {
+    const sectionId = e.detail.act;
+    const section = document.getElementById(sectionId);
+    if (!section) return;
+    const old = section.querySelector('.guide-notes');
+    const fresh = renderGuideNotes(sectionId, !!(old && old.classList.contains('open')));
+    if (old && fresh) old.replaceWith(fresh);
+    else if (old) old.remove();
+    else if (fresh) {
+      const anchor = section.querySelector('.tips-container:not(.guide-notes)') || section.querySelector('.act-heading');
+      anchor.after(fresh);
+    }
+  }
+
   function getVisibleStepCount(steps) {
     return steps.filter(step => {
       const { isNewLeague } = normalizeStep(step);
@@ -842,6 +940,7 @@
         showEnglish[key] = cb.checked;
         saveEnglish();
         updateMaster();
+        needEnNames();
         render();
         setupScrollSpy();
       });
@@ -875,6 +974,7 @@
       subCbs.forEach(cb => { cb.checked = on; });
       ENG_ENTITIES.forEach(({ key }) => { showEnglish[key] = on; });
       saveEnglish();
+      needEnNames();
       render();
       setupScrollSpy();
     });
@@ -924,10 +1024,16 @@
     }, { passive: true });
   }
 
+  // names_en.js is only fetched while some English annotation is on
+  function needEnNames() {
+    if (Object.values(showEnglish).some(Boolean)) loadEnNames();
+  }
+
   // Init
   function init() {
     setupViewSettings();
 
+    needEnNames();
     render();
     setupScrollSpy();
     setupTocScroll();
@@ -936,6 +1042,14 @@
 
     // React to gem selection changes
     window.addEventListener('gems-changed', updateAllGemSteps);
+    window.addEventListener('guide-notes-updated', onGuideNotesUpdated);
+    // Newer gem data from a release delta (data-release.js)
+    window.addEventListener('data-release-applied', updateAllGemSteps);
+    // English annotations arrived (loadEnNames in i18n.js)
+    window.addEventListener('en-names-loaded', () => {
+      render();
+      setupScrollSpy();
+    });
   }
 
   // Expose for sync.js — check all items before target
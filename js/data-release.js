@@ -0,0 +1,79 @@
+// Brings GEM_DATA / GEM_DETAILS from the base release up to the latest (releases.py).
+// gems.js and gem_details.js are precached as release DATA_RELEASE.base; js/release.js
+// lists the deltas that follow it (precached too, so this makes no network requests
+// once cached). Each delta is applied in order, then 'data-release-applied' is
+// dispatched so views can re-render.
+(() => {
+  if (typeof DATA_RELEASE === 'undefined' || typeof GEM_DATA === 'undefined') return;
+  if (!DATA_RELEASE.deltas || !DATA_RELEASE.deltas.length) return;
+
+  const REWARD_SECTIONS = { reward: 'questRewards', vendor: 'vendorRewards' };
+
+  // Record key -> [array, index matcher] for keys stored in GEM_DATA arrays
+  function locate(key) {
+    const parts = key.split(':');
+    if (parts[0] === 'gem') return [GEM_DATA.gems, g => g.id === parts[1]];
+    if (parts[0] in REWARD_SECTIONS) {
+      // <kind>:<act>:<questName>
+      const act = Number(parts[1]);
+      const questName = parts.slice(2).join(':');
+      return [GEM_DATA[REWARD_SECTIONS[parts[0]]], r => (r.act || 0) === act && r.questName === questName];
+    }
+    return null;
+  }
+
+  // position: index of the row in its list once the delta is applied (new rows only)
+  function setRecord(key, record, position) {
+    if (key === 'classes') { GEM_DATA.classes = record; return; }
+    if (key.startsWith('details:')) {
+      if (typeof GEM_DETAILS !== 'undefined') GEM_DETAILS[key.slice(8)] = record;
+      return;
+    }
+    const found = locate(key);
+    if (!found) return;
+    const [rows, match] = found;
+    const idx = rows.findIndex(match);
+    if (idx >= 0) rows[idx] = record;
+    else if (position === undefined) rows.push(record);
+    else rows.splice(Math.min(position, rows.length), 0, record);
+  }
+
+  function removeRecord(key) {
+    if (key.startsWith('details:')) {
+      if (typeof GEM_DETAILS !== 'undefined') delete GEM_DETAILS[key.slice(8)];
+      return;
+    }
+    const found = locate(key);
+    if (!found) return;
+    const [rows, match] = found;
+    const idx = rows.findIndex(match);
+    if (idx >= 0) rows.splice(idx, 1);
+  }
+
+  function applyDelta(delta) {
+    // Removals first and insertions in position order, so every new row lands at
+    // its page position: the rows before it are already in place
+    const positions = delta.positions || {};
+    for (const key of delta.removed) removeRecord(key);
+    for (const [key, record] of Object.entries(delta.changed)) setRecord(key, record);
+    const added = Object.entries(delta.added)
+      .sort(([a], [b]) => (positions[a] ?? Infinity) - (positions[b] ?? Infinity));
+    for (const [key, record] of added) setRecord(key, record, positions[key]);
+  }
+
+  async function update() {
+    // Fetch in parallel, apply in order; a missing delta leaves the data as loaded
+    const deltas = await Promise.all(DATA_RELEASE.deltas.map(url =>
+      fetch(url).then(r => (r.ok ? r.json() : Promise.reject(new Error(`${url}: ${r.status}`))))));
+    let version = DATA_RELEASE.base;
+    for (const delta of deltas) {
+      if (delta.from !== version) break;
+      applyDelta(delta);
+      version = delta.version;
+    }
+    if (version === DATA_RELEASE.base) return;
+    window.dispatchEvent(new CustomEvent('data-release-applied', { detail: { version } }));
+  }
+
+  update().catch(err => console.warn('[release] update failed:', err));
+})();
@@ -0,0 +1,486 @@
+// Numeric ranges parsed from gem_details.js by build_gem_stats.py (do not edit)
+// columns.* are index-aligned with ids. Wrap costMin/costMax in Float64Array, the
+// rest in Uint16Array. present[i] bit k = ids[i] has columnNames[k] (else its value is 0).
+const GEM_STATS = {
+  ids: ["absolution","added_chaos_damage_support","added_cold_damage_support","added_fire_damage_support","added_lightning_damage_support","additional_accuracy_support","advanced_traps_support","alchemists_mark","ambush","ancestral_call_support","ancestral_cry","ancestral_protector","ancestral_warchief","anger","animate_guardian","animate_weapon","arc","arcane_cloak","arcane_surge_support","arcanist_brand","archmage_support","arctic_armour","armageddon_brand","arrogance_support","arrow_nova_support","artillery_ballista","assassins_mark","autoexertion","automation","ball_lightning","ballista_totem_support","bane","barrage","barrage_support","battlemages_cry","bear_trap","behead_support","berserk","blade_blast","blade_flurry","blade_trap","blade_vortex","bladefall","bladestorm","blasphemy_support","blast_rain","blastchain_mine_support","blazing_salvo","blight","blind_support","blink_arrow","blood_and_sand","blood_rage","bloodlust_support","bloodthirst_support","bodyswap","bone_offering","bonechill_support","boneshatter","brand_recall","brutality_support","burning_arrow","burning_damage_support","cast_on_critical_strike_support","cast_on_death_support","cast_on_melee_kill_support","cast_when_damage_taken_support","cast_when_stunned_support","cast_while_channelling_support","caustic_arrow","chain_hook","chain_support","chance_to_bleed_support","chance_to_flee_support","chance_to_poison_support","charged_dash","charged_mines_support","charged_traps_support","clarity","cleave","close_combat_support","cluster_traps_support","cobra_lash","cold_penetration_support","cold_snap","cold_to_fire_support","combustion_support","concentrated_effect_support","conductivity","conflagration","consecrated_path","contagion","controlled_blaze_support","controlled_destruction_support","conversion_trap","corrupting_cry_support","corrupting_fever","crackling_lance","creeping_frost","cremation","critical_strike_affliction_support","cruelty_support","crushing_fist","culling_strike_support","cursed_ground_support","cyclone","damage_on_full_life_support","dark_pact","dash","deadly_ailments_support","decay_support","decoy_totem","defiance_banner","desecrate","despair","destructive_link","determination","detonate_dead","devour_support","devouring_totem","discharge","discipline","divine_blessing_support","divine_ire","divine_retribution","dominating_blow","double_strike","dread_banner","dual_strike","earthbreaker_support","earthquake","earthshatter","efficacy_support","elemental_army_support","elemental_damage_with_attacks_support","elemental_focus_support","elemental_hit","elemental_proliferation_support","elemental_weakness","endurance_charge_on_melee_stun_support","enduring_cry","energy_blade","energy_leech_support","enfeeble","ensnaring_arrow","essence_drain","eternal_blessing_support","ethereal_knives","eviscerate","expert_retaliation_support","explosive_arrow","explosive_concoction","explosive_trap","exsanguinate","eye_of_winter","faster_attacks_support","faster_casting_support","faster_projectiles_support","feeding_frenzy_support","fire_penetration_support","fire_trap","fireball","firestorm","fist_of_war_support","flame_dash","flame_link","flame_surge","flame_wall","flameblast","flamethrower_trap","flamewood_support","flammability","flesh_and_stone","flesh_offering","flicker_strike","focused_ballista_support","focused_channelling_support","forbidden_rite","fork_support","fortify_support","freezing_pulse","frenzy","fresh_meat_support","frigid_bond_support","frost_blades","frost_bomb","frost_shield","frost_wall","frostbite","frostblink","frostbolt","frozen_legion","galvanic_arrow","galvanic_field","generals_cry","generosity_support","glacial_cascade","glacial_hammer","glacial_shield_swipe","grace","greater_multiple_projectiles_support","greater_volley_support","ground_slam","guardians_blessing_support","haste","hatred","heavy_strike","herald_of_agony","herald_of_ash","herald_of_ice","herald_of_purity","herald_of_thunder","hex_bloom_support","hexblast","hextouch_support","high-impact_mine_support","holy_flame_totem","hydrosphere","hypothermia_support","ice_bite_support","ice_crash","ice_nova","ice_shot","ice_spear","ice_trap","icicle_mine","ignite_proliferation_support","immolate_support","immortal_call","impale_support","impending_doom_support","incinerate","increased_area_of_effect_support","increased_critical_damage_support","increased_critical_strikes_support","infernal_blow","infernal_cry","infernal_legion_support","infused_channelling_support","innervate_support","inspiration_support","intensify_support","intimidating_cry","intuitive_link","iron_grip_support","iron_will_support","item_rarity_support","kinetic_blast","kinetic_bolt","kinetic_fusillade","kinetic_instability_support","kinetic_rain","knockback_support","lacerate","lancing_steel","leap_slam","less_duration_support","lesser_multiple_projectiles_support","life_gain_on_hit_support","life_leech_support","lifetap_support","lightning_arrow","lightning_conduit","lightning_penetration_support","lightning_spire_trap","lightning_strike","lightning_tendrils","lightning_trap","lightning_warp","living_lightning_support","locus_mine_support","maim_support","malevolence","mana_leech_support","manabond","manaforged_arrows_support","mark_on_hit_support","meat_shield_support","melee_physical_damage_support","melee_splash_support","minefield_support","minion_damage_support","minion_life_support","minion_speed_support","mirage_archer_support","mirror_arrow","molten_shell","molten_strike","momentum_support","more_duration_support","multiple_totems_support","multiple_traps_support","multistrike_support","nightblade_support","orb_of_storms","overcharge_support","overexertion_support","penance_brand","perforate","pestilent_strike","petrified_blood","phase_run","physical_to_lightning_support","pierce_support","pinpoint_support","plague_bearer","poachers_mark","point_blank_support","poisonous_concoction","power_charge_on_critical_support","power_siphon","precision","predator_support","pride","prismatic_burst_support","protective_link","pulverise_support","puncture","punishment","purifying_flame","purity_of_elements","purity_of_fire","purity_of_ice","purity_of_lightning","pyroclast_mine","rage_support","rage_vortex","rain_of_arrows","raise_spectre","raise_zombie","rallying_cry","reap","reave","rejuvenation_totem","returning_projectiles_support","righteous_fire","rolling_magma","rupture_support","ruthless_support","sacred_wisps_support","sacrifice_support","sadism_support","scorching_ray","scourge_arrow","searing_bond","second_wind_support","seismic_cry","seismic_trap","shattering_steel","shield_charge","shield_crush","shock_nova","shockwave_support","shockwave_totem","shrapnel_ballista","siege_ballista","sigil_of_power","siphoning_trap","slower_projectiles_support","smite","smoke_mine","snipe","snipers_mark","somatic_shell","soul_link","soulrend","spark","spectral_helix","spectral_shield_throw","spectral_throw","spell_cascade_support","spell_echo_support","spell_totem_support","spellblade_support","spellslinger","spirit_offering","split_arrow","splitting_steel","static_strike","steelskin","storm_brand","storm_burst","storm_call","storm_rain","stormbind","stormblast_mine","stun_support","summon_carrion_golem","summon_chaos_golem","summon_flame_golem","summon_holy_relic","summon_ice_golem","summon_lightning_golem","summon_phantasm_support","summon_raging_spirit","summon_reaper","summon_skeletons","summon_skitterbots","summon_stone_golem","sunder","sweep","swift_affliction_support","swift_assembly_support","swiftbrand_support","swordstorm","tectonic_slam","tempest_shield","temporal_chains","temporal_rift","thunderstorm","tornado","tornado_shot","toxic_rain","trap_and_mine_damage_support","trap_support","trauma_support","trinity_support","unbound_ailments_support","unearth","unleash_support","urgent_orders_support","vaal_absolution","vaal_ancestral_warchief","vaal_arc","vaal_blight","vaal_burning_arrow","vaal_cold_snap","vaal_double_strike","vaal_ground_slam","vaal_lightning_arrow","vampiric_link","vengeful_cry","venom_gyre","vicious_projectiles_support","vigilant_strike","vile_toxins_support","viper_strike","vitality","void_manipulation_support","void_sphere","volatile_dead","volatility_support","volcanic_fissure","volley_support","voltaxic_burst","vortex","vulnerability","wall_of_force","war_banner","warlords_mark","wave_of_conviction","whirling_blades","wild_strike","windburst_support","winter_orb","wintertide_brand","wither","withering_step","withering_touch_support","wrath","zealotry"],
+  columnNames: ["level","cost","reqLevel","str","dex","int"],
+  present: [47,37,21,13,37,29,21,23,55,13,15,15,15,45,47,55,39,37,37,39,37,53,47,13,21,23,55,13,53,39,29,39,23,21,47,23,13,15,23,55,23,23,23,31,37,23,53,39,39,21,23,29,23,13,13,55,39,53,15,47,13,23,45,53,53,45,45,53,53,23,15,21,13,53,21,23,53,53,37,31,29,53,55,21,55,45,45,37,39,23,47,55,13,37,55,13,15,39,55,55,21,45,15,21,37,31,13,39,23,53,53,15,31,55,55,55,13,55,53,15,39,37,45,47,47,47,23,15,31,13,15,15,37,45,45,37,23,37,39,13,15,39,37,39,23,55,13,55,31,29,23,23,55,47,39,21,37,21,37,13,55,39,39,13,39,15,39,39,39,55,45,47,29,39,23,21,53,39,21,13,39,23,37,37,23,39,55,39,55,39,39,47,23,39,15,45,39,15,31,21,21,21,15,45,21,53,15,21,45,53,45,37,37,39,37,53,47,39,21,21,47,39,23,39,55,55,45,45,15,29,37,39,37,37,37,15,15,45,53,37,45,37,15,23,13,13,37,39,39,39,37,39,13,31,31,15,13,21,13,13,13,23,39,37,55,55,39,55,39,37,53,13,53,21,37,53,21,37,13,13,53,37,37,37,21,23,15,15,29,13,45,53,29,53,39,37,13,47,31,55,13,23,45,21,53,23,23,21,23,37,39,21,37,13,53,47,13,55,47,47,45,45,53,37,55,13,15,23,39,39,31,47,55,15,21,45,39,29,13,37,37,29,39,23,47,53,15,55,31,15,15,39,13,15,23,23,39,55,21,47,55,23,23,39,39,39,39,31,31,31,37,37,45,45,37,39,23,31,47,15,39,47,39,23,39,55,13,39,39,47,47,55,55,37,39,39,39,53,31,15,15,21,53,37,31,15,45,55,53,23,55,23,23,53,53,13,53,53,55,37,13,45,13,37,37,21,53,21,13,21,31,15,55,21,47,21,23,13,53,39,55,13,15,21,55,39,47,39,15,31,47,55,31,21,39,39,39,55,21,37,37],
+  columns: {
+    levelMin: [1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],
+    levelMax: [20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,6,20,20,20,20,20,20,20,6,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20],
+    costMin: [9,0,0,0,0,0,0,16,8,0,14,6,8,0,11,4,8,0,0,18,0,0,15,0,0,9,16,0,0,12,0,10,5,0,15,6,0,10,6,5,8,6,12,10,0,7,0,8,2,0,14,0,12,0,0,8,16,0,9,7,0,8,0,0,0,0,0,0,0,6,5,0,0,0,0,5,0,0,0,7,0,0,5,0,11,0,0,0,24,9,9,5,0,0,6,0,78,11,7,11,0,0,8,0,0,2,0,7,4,0,0,9,14,11,16,15,0,5,0,20,13,0,0,3,9,7,7,15,8,0,10,8,0,0,0,0,5,0,16,0,13,136,0,16,7,8,0,5,7,0,7,6,6,16,14,0,0,0,0,0,8,6,13,0,8,15,6,4,4,13,0,24,0,16,5,0,0,8,0,0,5,7,0,0,6,4,30,9,24,12,6,12,6,9,15,0,10,6,7,0,0,0,6,0,0,0,7,0,0,0,0,0,0,16,0,0,11,12,0,0,10,8,6,8,13,3,0,0,21,0,0,2,0,0,0,6,15,0,0,0,0,0,13,15,0,0,0,6,5,4,0,7,0,10,9,6,0,0,0,0,0,6,6,0,13,6,1,8,9,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,14,8,6,0,0,0,0,0,0,22,0,0,15,7,7,0,8,0,0,0,6,16,0,5,0,5,0,0,0,0,15,0,8,16,6,0,0,0,0,4,0,25,6,15,9,15,25,6,9,0,0,6,0,0,0,0,0,2,4,18,0,14,13,7,6,7,12,0,21,7,8,30,7,0,7,6,4,16,7,15,14,5,6,7,5,0,0,0,0,0,16,5,6,6,4,8,2,6,7,3,2,0,30,30,30,11,30,30,0,4,15,5,0,30,8,9,0,0,0,7,9,0,16,0,7,15,9,6,0,0,0,0,0,4,0,0,0,0,0,0,0,0,0,0,0,15,15,5,0,7,0,6,0,0,30,9,0,8,0,5,13,16,9,13,16,9,6,7,0,2,6,3,8,0,0,0],
+    costMax: [26,0,0,0,0,0,0,33,23,0,19,10,11,0,20,16,23,0,0,32,0,0,27,0,0,13,33,0,0,23,0,20,9,0,19,23,0,16,16,6,20,16,23,14,0,10,0,23,5,0,20,0,29,0,0,23,33,0,12,16,0,14,0,0,0,0,0,0,0,10,8,0,0,0,0,6,0,0,0,13,0,0,8,0,28,0,0,0,50,13,13,20,0,0,23,0,520,21,20,20,0,0,14,0,0,3,0,13,16,0,0,35,19,26,33,32.67,0,20,0,44,25,0,0,5,23,10,13,19,14,0,13,13,0,0,0,0,8,0,33,0,19,624,0,33,10,23,0,20,10,0,10,9,20,46,26,0,0,0,0,0,20,25,25,0,23,32.67,16,16,7,25,0,50,0,33,8,0,0,21,0,0,21,10,0,0,10,16,54,33,50,22,25,23,10,18,19,0,20,10,11,0,0,0,11,0,0,0,12,0,0,0,0,0,0,30,0,0,39,20,0,0,14,23,10,23,22,6,0,0,36,0,0,4,0,0,0,10,19,0,0,0,0,0,19,32.67,0,0,0,9,9,6,0,10,0,17,13,10,0,0,0,0,0,10,16,0,25,10,5,20,26,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,20,12,10,0,0,0,0,0,0,16,0,0,27,13,10,0,13,0,0,0,13,33,0,9,0,9,0,0,0,0,32.67,0,14,33,25,0,0,0,0,6,0,46,10,28,28,19,46,10,32,0,0,23,0,0,0,0,0,5,5,51,0,19,25,12,10,13,23,0,39,13,13,54,24,0,12,13,6,33,10,32.67,26,21,9,10,9,0,0,0,0,0,33,9,11,10,16,21,4,16,10,5,6,0,54,54,54,28,54,54,0,16,28,16,0,54,13,14,0,0,0,10,13,0,33,0,10,25,13,10,0,0,0,0,0,10,0,0,0,0,0,0,0,0,0,0,0,32.67,19,8,0,12,0,10,0,0,54,26,0,13,0,13,25,33,33,19,33,23,10,10,0,4,16,9,23,0,0,0],
+    reqLevelMin: [12,31,8,8,8,8,31,24,34,4,16,4,28,24,28,4,12,16,1,38,31,16,28,31,8,28,16,24,24,28,8,24,12,38,24,4,38,34,16,28,12,12,28,28,31,28,8,12,1,8,10,4,16,18,31,10,12,38,28,16,38,1,31,38,38,38,38,38,38,1,12,38,1,8,1,28,31,31,10,1,18,38,1,31,16,18,8,18,24,28,28,4,31,18,4,31,16,28,12,28,31,18,4,18,31,28,18,28,4,18,38,4,16,16,24,34,24,4,8,4,28,24,31,28,16,28,1,24,1,8,28,12,8,31,18,18,12,1,24,18,10,24,31,24,16,12,38,1,16,31,28,28,1,12,28,8,18,31,31,31,12,1,28,38,10,34,12,4,28,28,8,24,16,12,10,31,31,16,31,31,1,16,18,38,1,4,34,4,24,4,1,39,1,16,24,31,28,1,16,24,38,38,1,31,24,24,1,16,16,16,16,16,38,28,38,31,4,34,31,31,28,12,1,12,28,12,38,38,34,31,31,12,38,18,8,12,24,8,4,31,31,31,10,34,18,18,31,28,1,12,18,28,8,12,28,10,31,8,8,31,8,12,28,31,28,12,1,12,10,18,8,8,24,31,12,8,38,31,18,8,38,8,18,18,4,10,16,1,1,31,38,8,38,18,4,18,38,28,1,28,24,34,18,4,31,24,16,18,12,18,12,10,18,24,1,34,31,4,24,1,24,24,24,24,28,18,28,12,28,1,24,28,12,4,38,16,1,38,1,18,31,18,12,28,12,31,16,28,12,4,1,28,18,28,4,12,34,10,31,1,10,34,4,28,34,28,1,12,28,1,4,38,8,38,24,12,1,1,12,4,12,12,12,28,28,1,8,34,34,34,4,34,34,4,4,28,10,16,34,12,12,31,4,31,16,28,16,24,34,28,34,28,12,18,8,38,18,8,10,38,31,12,28,12,1,1,16,1,1,12,34,24,12,18,4,38,1,10,8,34,12,18,12,4,12,28,24,16,4,16,16,10,28,31,28,12,10,10,38,24,24],
+    reqLevelMax: [70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70],
+    strMin: [21,0,0,18,0,0,0,0,0,0,41,16,67,37,42,0,0,0,0,0,0,0,29,52,0,0,0,58,0,0,0,0,0,0,37,0,63,79,0,0,0,0,0,42,0,0,0,0,0,0,0,0,0,33,52,0,0,0,67,18,63,0,33,0,0,39,39,0,0,0,33,0,0,0,0,0,0,0,0,0,14,0,0,0,0,21,0,0,0,0,42,0,52,0,0,52,41,0,0,0,0,21,16,0,0,29,33,0,0,0,0,16,26,0,0,0,58,0,0,16,0,0,33,29,18,42,0,58,0,18,67,33,0,23,21,0,0,0,0,33,29,0,0,0,0,0,63,0,26,33,0,0,0,21,0,0,0,0,0,52,0,0,0,63,0,79,0,0,0,0,0,25,26,0,0,0,0,0,0,52,0,0,0,0,0,0,0,0,0,0,0,57,0,0,58,33,0,0,18,0,0,0,0,33,0,0,0,0,26,0,26,0,0,0,0,0,0,0,0,0,42,0,0,0,0,0,27,27,79,23,0,0,0,0,0,33,58,0,0,0,33,0,29,0,33,33,0,0,0,0,0,0,18,14,29,29,52,0,18,52,18,0,0,0,0,0,0,0,0,0,0,18,0,0,0,0,0,0,33,18,0,0,0,0,0,0,41,0,0,52,39,0,39,0,0,0,63,29,0,0,58,0,14,0,0,0,0,0,0,0,0,0,0,58,0,50,52,0,37,0,25,37,0,0,0,33,67,0,0,0,37,42,0,16,0,18,0,27,0,0,0,14,0,0,21,0,41,0,14,16,0,0,33,67,0,0,0,0,0,0,0,0,0,0,0,0,0,14,29,0,0,0,0,27,0,0,0,0,21,16,0,14,0,0,0,0,18,0,0,50,0,0,0,0,0,0,0,0,50,33,33,0,0,0,26,67,18,0,0,0,0,0,0,0,0,63,0,0,0,0,52,21,67,0,0,0,0,0,0,0,35,58,0,0,0,0,0,22,0,0,0,33,33,0,0,0,37,0,16,26,18,0,29,0,0,0,0,0,0,0,0],
+    strMax: [98,0,0,111,0,48,0,0,0,111,155,155,155,98,98,0,0,0,0,0,0,0,68,111,0,0,0,155,0,0,70,0,0,0,98,0,111,155,0,0,0,0,0,98,0,0,0,0,0,0,0,98,0,111,111,0,0,0,155,68,111,0,70,0,0,70,70,0,0,0,155,0,111,0,0,0,0,0,0,98,48,0,0,0,0,70,48,0,0,0,98,0,111,0,0,111,155,0,0,0,0,70,155,0,0,68,111,0,0,0,0,155,98,0,0,0,155,0,0,155,0,0,70,68,68,98,0,155,68,111,155,155,0,48,70,0,0,0,0,111,155,0,0,0,0,0,111,0,98,70,0,0,0,98,0,0,0,0,0,111,0,0,0,111,0,155,0,0,0,0,70,68,98,0,0,0,0,0,0,111,0,0,0,0,0,0,0,0,0,0,0,98,0,0,155,70,0,155,68,0,0,0,155,70,0,0,155,0,98,0,98,0,0,0,0,0,98,0,0,0,98,0,0,0,0,0,48,48,155,48,0,0,0,0,0,155,155,48,0,0,70,0,155,0,111,111,0,0,0,0,0,0,111,68,68,155,111,0,111,111,111,0,0,0,0,0,0,0,0,0,0,111,0,0,0,0,0,0,111,111,0,0,0,0,0,0,155,155,48,111,70,0,70,0,0,0,111,68,98,0,155,0,48,0,0,0,0,0,0,0,0,0,0,155,0,98,111,0,98,68,68,98,0,0,0,111,155,0,0,0,98,98,0,155,0,68,0,48,111,0,0,48,0,0,98,0,155,0,68,155,155,0,111,155,0,0,0,0,0,98,0,0,0,0,0,0,0,68,68,68,0,0,70,48,0,0,0,68,98,155,0,68,0,0,0,0,111,0,0,98,68,0,0,0,0,0,0,0,98,155,155,0,0,0,98,155,68,0,0,0,0,0,0,0,0,111,0,0,0,0,111,98,155,0,0,0,0,0,155,0,68,155,0,0,98,0,0,119,0,0,0,111,155,0,0,0,98,0,155,98,68,0,68,0,0,0,0,0,0,0,0],
+    dexMin: [0,0,18,0,0,0,52,58,50,0,0,0,0,0,0,0,0,0,0,0,0,26,0,0,18,67,18,0,25,0,0,0,33,63,0,16,0,0,41,42,33,33,67,29,0,67,0,0,0,18,29,0,41,0,0,0,0,27,0,0,0,0,0,39,39,0,0,27,27,0,0,63,0,0,0,67,23,33,0,0,21,39,0,52,18,0,0,0,0,67,0,0,0,0,0,0,0,0,14,42,52,0,0,33,0,42,0,0,16,21,27,0,18,26,25,35,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,33,0,0,0,0,0,0,0,41,14,0,0,18,23,67,67,0,0,0,18,0,52,0,0,21,0,0,0,0,0,0,0,0,42,0,0,18,0,29,52,23,0,52,0,0,41,0,0,0,0,35,0,25,0,0,0,0,0,0,0,0,0,26,58,63,63,0,0,58,37,0,41,0,26,0,0,0,0,0,23,0,0,52,52,0,0,0,0,42,14,0,0,0,33,0,0,0,0,0,0,0,0,0,0,0,0,0,79,0,0,0,0,0,0,0,0,0,21,42,0,0,18,0,0,0,33,0,0,29,21,0,14,0,0,0,0,25,52,0,0,63,0,0,0,27,0,0,0,0,29,0,0,0,0,0,0,27,21,0,0,0,0,0,42,0,79,0,0,23,58,41,33,33,0,0,22,0,0,0,0,0,0,0,0,0,0,37,0,29,0,0,33,0,0,25,0,21,0,63,0,0,39,0,0,0,21,0,67,0,33,0,42,21,0,0,0,0,0,16,33,0,0,52,0,18,79,16,0,0,0,0,21,42,0,0,0,0,0,0,0,0,0,0,0,0,0,0,67,0,0,0,0,0,0,0,50,35,0,0,0,0,18,35,0,0,52,0,0,18,0,0,37,50,67,50,67,33,21,0,0,14,0,18,0,0,0,0,0,0,0,18,0,0,33,50,0,21,33,0,63,0,0,0,0,21,0,0,0,14,0,0,0,0,18,0,18,42,52,0,0,0,18,63,0,0],
+    dexMax: [0,0,111,0,0,70,111,155,98,0,0,0,0,0,0,98,0,0,0,0,0,98,0,0,111,155,68,0,68,0,48,0,155,111,0,155,0,0,155,98,155,155,155,68,0,155,48,0,0,111,155,68,155,0,0,68,0,48,0,0,0,155,0,70,70,0,0,48,48,155,0,111,0,70,111,155,48,70,0,68,70,70,98,111,68,0,0,0,0,155,0,68,0,0,68,0,0,0,68,98,111,0,0,111,0,98,0,0,155,70,48,0,68,98,68,68,0,98,48,0,0,0,0,0,0,0,155,0,98,0,0,0,0,0,0,0,155,0,0,0,0,0,0,0,155,68,0,98,68,48,155,155,98,0,0,111,0,111,0,0,98,0,0,0,0,0,0,0,0,98,0,0,68,0,155,111,48,0,111,0,0,155,0,0,155,0,68,0,68,0,0,0,155,0,0,0,0,0,98,155,111,111,0,0,155,98,0,155,0,98,0,0,0,0,0,48,0,0,111,111,0,0,155,0,98,68,0,0,0,70,0,0,0,0,0,0,0,0,48,0,0,0,0,155,0,0,0,0,0,0,0,0,0,98,98,0,0,111,0,0,0,155,0,0,68,98,0,68,0,0,70,0,68,111,0,70,111,0,0,0,48,0,0,0,111,155,0,0,70,0,0,70,48,70,0,0,0,0,68,98,0,155,0,111,48,155,155,111,155,0,0,119,0,0,48,0,0,98,0,0,0,0,98,0,68,0,0,155,0,0,68,0,98,0,111,0,0,70,0,0,0,70,0,155,0,70,0,98,98,0,0,0,0,0,155,155,0,68,111,0,98,155,155,0,0,0,0,98,98,98,0,0,0,0,0,0,155,98,0,0,0,0,0,155,0,68,0,0,0,0,0,98,68,0,0,0,0,68,68,0,0,111,70,0,68,0,0,98,98,155,98,155,155,70,70,0,48,48,98,0,0,0,0,0,0,155,68,155,0,155,98,0,98,111,0,111,155,0,70,0,98,0,0,111,68,0,0,0,0,68,0,98,98,111,0,0,0,98,111,0,0],
+    intMin: [14,52,0,0,18,0,0,0,35,0,0,0,0,25,29,0,33,41,0,88,52,18,42,0,0,0,26,0,37,67,0,58,0,0,25,0,0,0,0,29,0,0,0,0,52,0,0,33,0,0,0,0,0,0,0,18,33,39,0,26,0,0,23,27,27,27,27,39,39,0,0,0,0,0,0,0,33,23,22,0,0,27,0,0,26,14,0,33,58,0,29,0,0,33,0,0,0,67,21,29,0,14,0,0,52,0,0,67,0,14,39,0,0,18,37,50,0,0,0,0,67,58,23,42,26,29,0,0,0,0,0,0,18,33,14,33,0,0,58,0,0,58,52,58,0,21,0,0,0,0,0,0,0,14,67,0,33,0,52,0,14,0,67,0,29,0,33,16,67,29,0,37,0,33,0,0,33,41,0,0,0,0,33,63,0,16,50,16,37,16,0,39,0,41,0,23,67,0,0,0,0,0,0,23,0,25,0,0,18,18,18,41,63,67,63,33,0,79,0,0,29,33,0,33,29,21,39,39,0,0,52,33,63,33,18,0,0,0,0,52,23,52,0,0,0,0,52,67,0,33,33,67,0,0,0,0,0,0,0,0,0,0,67,52,42,14,0,21,29,33,0,0,37,0,33,0,0,52,0,0,39,18,33,33,0,0,0,0,0,0,27,0,0,14,16,33,0,42,0,29,0,0,21,0,33,0,0,0,0,33,33,0,33,0,0,35,0,0,25,0,37,25,25,58,42,0,0,0,67,0,0,29,14,0,0,26,0,0,0,33,52,0,33,0,14,23,0,29,0,0,0,67,0,0,0,0,79,18,0,0,0,0,0,67,79,67,0,0,0,0,0,63,0,39,58,33,0,0,14,0,33,21,33,0,67,0,0,79,79,35,0,35,50,0,16,67,29,26,0,0,0,0,0,52,0,0,26,25,35,0,35,0,0,14,0,0,21,0,0,63,0,14,0,33,0,0,26,0,0,0,0,0,14,0,0,0,0,0,0,79,14,0,0,0,21,67,25,41,0,0,26,0,0,0,67,33,29,0,0,58,58],
+    intMax: [68,111,0,0,111,0,0,0,68,0,0,0,0,68,68,68,155,155,111,155,111,68,98,0,0,0,98,0,98,155,0,155,0,0,68,0,0,0,0,68,0,0,0,0,111,0,70,155,155,0,0,0,0,0,0,98,155,70,0,98,0,0,48,48,48,48,48,70,70,0,0,0,0,48,0,0,70,48,119,0,0,48,68,0,98,48,70,111,155,0,68,98,0,111,98,0,0,155,98,68,0,48,0,0,111,0,0,155,0,48,70,0,0,68,98,98,0,68,70,0,155,155,48,98,98,68,0,0,0,0,0,0,111,70,48,111,0,111,155,0,0,155,111,155,0,98,0,68,0,0,0,0,68,68,155,0,111,0,111,0,68,155,155,0,155,0,155,155,155,68,48,98,0,155,0,0,70,155,0,0,155,0,111,111,0,155,98,155,98,155,155,68,0,155,0,48,155,0,0,0,0,0,0,48,0,68,0,0,68,68,68,155,111,155,111,70,68,155,0,0,68,155,0,155,68,98,70,70,0,0,111,155,111,111,111,0,0,70,70,111,48,111,0,0,0,0,111,155,155,155,111,155,0,0,0,0,0,0,0,0,0,0,155,111,98,68,155,98,155,111,48,0,98,0,155,48,0,111,0,0,70,111,111,111,0,0,0,0,0,0,48,48,0,48,155,111,0,98,0,68,0,0,70,0,70,0,0,0,0,111,155,0,111,0,70,68,0,68,68,98,98,68,68,155,98,0,0,0,155,155,0,68,68,0,0,98,155,0,0,111,111,0,155,0,68,48,0,68,0,0,0,155,0,0,0,0,155,98,0,68,68,0,0,155,155,155,155,0,0,0,111,111,48,70,155,155,0,0,68,0,155,98,155,0,155,98,0,155,155,68,98,68,98,111,155,155,155,98,0,0,0,0,48,111,0,0,98,68,68,0,68,0,0,48,48,0,70,70,68,111,0,68,0,155,155,0,98,0,0,0,0,0,68,0,68,0,0,0,48,155,68,0,0,0,98,155,68,155,0,0,98,68,0,0,155,155,155,68,0,155,155],
+  },
+  costKind: [1,0,0,0,0,0,0,1,1,0,1,1,1,0,1,1,1,0,0,1,0,0,1,0,0,1,1,0,0,1,0,1,1,0,1,1,0,1,1,1,1,1,1,1,0,1,0,1,1,0,1,0,2,0,0,1,1,0,1,1,0,1,0,0,0,0,0,0,0,1,1,0,0,0,0,1,0,0,0,1,0,0,1,0,1,0,0,0,1,1,1,1,0,0,1,0,2,1,1,1,0,0,1,0,0,1,0,1,1,0,0,1,1,1,1,4,0,1,0,1,1,0,0,1,1,1,1,1,1,0,1,1,0,0,0,0,1,0,1,0,1,3,0,1,1,1,0,1,1,0,1,1,1,2,1,0,0,0,0,0,1,1,1,0,1,4,1,1,1,1,0,1,0,1,1,0,0,1,0,0,1,1,0,0,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,0,0,0,1,0,0,0,1,0,0,0,0,0,0,1,0,0,1,1,0,0,1,1,1,1,1,1,0,0,1,0,0,1,0,0,0,1,1,0,0,0,0,0,1,4,0,0,0,1,1,1,0,1,0,1,1,1,0,0,0,0,0,1,1,0,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,1,1,0,0,0,0,0,0,1,0,0,1,1,1,0,1,0,0,0,1,1,0,1,0,1,0,0,0,0,4,0,1,1,1,0,0,0,0,1,0,2,1,1,1,1,2,1,1,0,0,1,0,0,0,0,0,1,1,1,0,1,1,1,1,1,1,0,1,1,1,1,1,0,1,1,1,1,1,4,1,1,1,1,1,0,0,0,0,0,1,1,1,1,1,1,1,1,1,1,1,0,1,1,1,1,1,1,0,1,1,1,0,1,1,1,0,0,0,1,1,0,1,0,1,1,1,1,0,0,0,0,0,1,0,0,0,0,0,0,0,0,0,0,0,4,1,1,0,1,0,1,0,0,1,1,0,1,0,1,1,1,1,1,1,1,1,1,0,1,1,1,1,0,0,0],
+  costKinds: ["","mana","life","es","mana/s"],
+  modRanges: {
+    "absolution": [[21,873,31,1310],[1,1],[2,2,10,10],[3,3],[0,0.6],[25,25],[50,50]],
+    "added_chaos_damage_support": [[18,154,26,231]],
+    "added_cold_damage_support": [[4,152,6,228]],
+    "added_fire_damage_support": [[25,39]],
+    "added_lightning_damage_support": [[1,19,8,358]],
+    "additional_accuracy_support": [[74,1034]],
+    "advanced_traps_support": [[50,107],[15,34]],
+    "alchemists_mark": [[4,4],[20,26,60,79,1,1,1,1],[1,1,3,3,1,1]],
+    "ambush": [[1.5,1.5],[],[25,25],[100,138],[3,3]],
+    "ancestral_call_support": [[2,2],[0,19]],
+    "ancestral_cry": [[2.5,3.4],[0,38],[],[5,5,5,5,30,30],[10,10,1,1,30,30],[8,8],[2,2]],
+    "ancestral_protector": [[12,12],[1,1],[10,20],[50,50],[1.6,1.8]],
+    "ancestral_warchief": [[12,12],[1,1],[8,18],[50,50],[1,1]],
+    "anger": [[0,1.9],[16,109,23,155],[16,109,23,155]],
+    "animate_guardian": [[0,38],[33,100],[0,38]],
+    "animate_weapon": [[40,40],[5,14],[9,100],[5,126,8,184],[1,17,2,80],[0,38],[0,38]],
+    "arc": [[6,198,32,1122],[4,7],[15,15]],
+    "arcane_cloak": [[3,3],[45,64],[75,75],[10,14],[]],
+    "arcane_surge_support": [[15,400],[20,20,30,30],[4,4],[14,35]],
+    "arcanist_brand": [[1,1],[],[5,5],[3,3],[40,40],[4.8,4.8],[40,40],[63,69],[40,59],[]],
+    "archmage_support": [[10,16],[5,5]],
+    "arctic_armour": [[2.5,4.4],[11,21],[11,20],[0.5,0.5,30,30],[]],
+    "armageddon_brand": [[1.5,1.5],[],[69,924,104,1386],[2.2,2.2],[6,6],[5,5],[10,29]],
+    "arrogance_support": [[10,19],[]],
+    "arrow_nova_support": [[16,30],[],[],[4,4],[]],
+    "artillery_ballista": [[8,8],[2,3],[6,6],[100,100],[1,1]],
+    "assassins_mark": [[100,100],[1.5,1.5],[30,49],[65,600],[25,80]],
+    "autoexertion": [[],[0,19],[],[10,10],[]],
+    "automation": [[],[5,24],[]],
+    "ball_lightning": [[2,32,47,617],[1.8,1.8]],
+    "ballista_totem_support": [[],[24,32],[1,1],[8,8],[2,2],[50,50]],
+    "bane": [[24,70],[1,1,59.3,1075.5],[2,2],[],[2.1,2.4],[28,42],[50,50],[25,25],[24,70],[],[25,25]],
+    "barrage": [[5,5],[]],
+    "barrage_support": [[62,68],[],[3,3],[5,5],[5,5],[]],
+    "battlemages_cry": [[2.5,3.4],[0,38],[],[5,5,0.5,0.5,25,25],[5,5],[],[38,44],[]],
+    "bear_trap": [[16,1447,22,2026],[],[4,4],[3,3],[],[25,25],[80,80]],
+    "behead_support": [[0.2,0.3],[30,49],[1,1,20,20],[20,20,5,5]],
+    "berserk": [[1,1,5,5],[5,5],[1,1,20,20],[],[40,59]],
+    "blade_blast": [[11,309,17,464],[1.4,1.4]],
+    "blade_flurry": [[25,25],[6,6]],
+    "blade_trap": [[4,4],[4,4],[25,25],[1,1],[1.6,2.2]],
+    "blade_vortex": [[3,140,5,211],[4,4],[0,0.2],[35,35],[35,35],[10,10]],
+    "bladefall": [[43,595,65,893],[6,6],[1,1,1,1],[5,5],[40,40]],
+    "bladestorm": [[3,3],[70,108],[10,12],[3,3],[30,38],[50,50]],
+    "blasphemy_support": [[],[],[25,25],[0,76]],
+    "blast_rain": [[6,6],[100,100],[20,30]],
+    "blastchain_mine_support": [[],[53,59],[5,5],[0.25,0.25],[],[1,1,5,5]],
+    "blazing_salvo": [[7,270,10,405],[5,7]],
+    "blight": [[1,1,5.9,421.5],[2,2],[2,2,1,1],[],[0,0.6],[80,80],[20,20]],
+    "blind_support": [[10,10],[0,38]],
+    "blink_arrow": [[3,3],[0,47],[0,57]],
+    "blood_and_sand": [[10,15],[5,5],[10,15],[5,5],[0,50]],
+    "blood_rage": [[7,10.8],[5,15],[1.2,1.2],[1,1,4,4],[1,1,4,4],[25,25]],
+    "bloodlust_support": [[25,39],[]],
+    "bloodthirst_support": [[2,2],[0,9]],
+    "bodyswap": [[3,210,5,315,4,4],[6,7.9],[0,0.2],[200,200]],
+    "bone_offering": [[5,5],[1,1],[25,35],[25,34],[4,4,1,1,4,4]],
+    "bonechill_support": [[25,44],[],[],[5,14]],
+    "boneshatter": [[11,158,17,238],[1,1,6,194,6,6],[3,6],[0.1,0.1,15,15,400,400]],
+    "brand_recall": [[0,40],[20,20],[25,45]],
+    "brutality_support": [[25,39],[],[]],
+    "burning_arrow": [[100,100],[25,25]],
+    "burning_damage_support": [[20,34]],
+    "cast_on_critical_strike_support": [[],[10,19]],
+    "cast_on_death_support": [[0,152],[100,100],[]],
+    "cast_on_melee_kill_support": [[],[20,39]],
+    "cast_when_damage_taken_support": [[38,70],[27,65],[528,3272]],
+    "cast_when_stunned_support": [[50,69]],
+    "cast_while_channelling_support": [[0.35,0.45],[30,30]],
+    "caustic_arrow": [[1,1,8.8,1927.1],[2,2],[60,60],[],[0,0.6]],
+    "chain_hook": [[5,5,0.1,0.1],[2,2]],
+    "chain_support": [[2,2],[11,30]],
+    "chance_to_bleed_support": [[25,25],[10,29]],
+    "chance_to_flee_support": [[25,44]],
+    "chance_to_poison_support": [[40,40],[1,94,2,141]],
+    "charged_dash": [[50,50],[150,150],[75,75],[130,130]],
+    "charged_mines_support": [[10,10],[25,25],[20,30],[20,30]],
+    "charged_traps_support": [[20,30],[20,30],[15,15],[10,10]],
+    "clarity": [[0,1.9],[1,1,2.9,33]],
+    "cleave": [[60,60],[0,1]],
+    "close_combat_support": [[25,39],[2,2],[20,20],[]],
+    "cluster_traps_support": [[2,2],[],[5,5],[55,61]],
+    "cobra_lash": [[8,8],[3,5],[60,60],[40,40]],
+    "cold_penetration_support": [[20,34]],
+    "cold_snap": [[34,1717,51,2575],[5,5],[1,1,28.6,2259.5],[],[1.5,1.5],[1.5,1.5],[3,3],[25,25]],
+    "cold_to_fire_support": [[10,29],[50,50]],
+    "combustion_support": [[10,19],[25,25],[-10,-10]],
+    "concentrated_effect_support": [[25,39],[30,30]],
+    "conductivity": [[8,11.8],[0,1],[-36,-17],[25,25]],
+    "conflagration": [[1,1,157.2,3022.8],[6,6],[3,3],[100,100],[],[3,3],[1,1],[1.5,2],[50,50],[20,20],[4,4]],
+    "consecrated_path": [[4,4],[50,50],[20,20]],
+    "contagion": [[1,1,3.4,281.5],[5,5],[],[1.7,1.7],[]],
+    "controlled_blaze_support": [[10,19],[4,4,10,14,230,364],[4,4,3,3,69,78]],
+    "controlled_destruction_support": [[80,80],[25,39]],
+    "conversion_trap": [[],[4,4],[5.3,10]],
+    "corrupting_cry_support": [[],[20,20],[1,1,52.7,691.8],[],[2,2],[4,4]],
+    "corrupting_fever": [[1,1,7.8,335.4],[6,6],[26,205],[1,1]],
+    "crackling_lance": [[28,458,84,1375],[0.5,0.5,1,1],[3,3],[0.3,0.3,33,33],[35,35]],
+    "creeping_frost": [[11,568,16,847],[5,5],[1,1,18.4,2225.7],[],[1.5,1.5],[2,2,1.8,1.8],[10,10]],
+    "cremation": [[1,1],[8,8],[49,434,74,651],[4,4],[1,1,3,3],[4,5],[0,0.3]],
+    "critical_strike_affliction_support": [[70,98]],
+    "cruelty_support": [[15,24],[4,4],[],[0,19]],
+    "crushing_fist": [[2,2],[],[60,60],[2,2.8]],
+    "culling_strike_support": [[10,10],[0,38]],
+    "cursed_ground_support": [[15,34,1,1]],
+    "cyclone": [[0.1,0.1,15,15],[20,30]],
+    "damage_on_full_life_support": [[20,34]],
+    "dark_pact": [[24,241,36,362],[2,2],[12,12],[],[56,136]],
+    "dash": [[0,19],[0,57],[]],
+    "deadly_ailments_support": [[30,44],[80,80]],
+    "decay_support": [[8,8,1,1,162,1230]],
+    "decoy_totem": [[8,8],[0,76],[1,1],[]],
+    "defiance_banner": [[10,10],[2.4,2.4],[],[5,10],[5,10],[8,8],[8,8],[-12,-5]],
+    "desecrate": [[1,1,8.2,294],[4,4],[5,5],[20,80],[10,10]],
+    "despair": [[8,11.8],[0,1],[-30,-15]],
+    "destructive_link": [[8,9.9],[30,49],[],[4,4,1,1]],
+    "determination": [[0,1.9],[90,1026],[40,49]],
+    "detonate_dead": [[15,798,22,1197],[6,7.9],[2.2,2.6]],
+    "devour_support": [[24,366,10,40]],
+    "devouring_totem": [[8,8],[0,76],[1,1],[30,299],[9,59]],
+    "discharge": [[69,639,206,1918],[110,1023,165,1535],[110,1023,165,1535],[60,60],[3,3],[15,15]],
+    "discipline": [[0,1.9],[60,217],[30,30]],
+    "divine_blessing_support": [[10,29],[90,233],[1,1],[9,10.9]],
+    "divine_ire": [[19,253,29,380],[50,50],[5,5],[250,250,105,105]],
+    "divine_retribution": [[57,1745,86,2617],[50,50],[2,2],[1.2,1.6],[6,6],[4,4]],
+    "dominating_blow": [[1,1],[2,2,20,20],[3,3],[9,9],[1,1],[25,25,1,1]],
+    "double_strike": [[25,25]],
+    "dread_banner": [[10,10],[2.4,2.4],[],[5,10],[5,10],[4,4],[9,34]],
+    "dual_strike": [[100,100],[60,60]],
+    "earthbreaker_support": [[0,19],[1,1],[12,12],[50,50],[30,30]],
+    "earthquake": [[1,1],[150,150]],
+    "earthshatter": [[6,6],[0,19],[30,30],[15,15],[5,5]],
+    "efficacy_support": [[15,24],[15,24]],
+    "elemental_army_support": [[19,29],[0,2],[-10,-10],[10,19]],
+    "elemental_damage_with_attacks_support": [[20,34]],
+    "elemental_focus_support": [[20,34],[]],
+    "elemental_hit": [[21,609,40,1133],[26,748,49,1389],[4,118,80,2287],[],[30,49],[1.4,1.4],[80,80],[10,10]],
+    "elemental_proliferation_support": [[0,19],[1.2,1.5],[20,20]],
+    "elemental_weakness": [[8,11.8],[0,1],[-30,-15]],
+    "endurance_charge_on_melee_stun_support": [[4,4],[0,19],[]],
+    "enduring_cry": [[2.5,3.4],[0,38],[],[5,5,1,1],[5,5,1,1,2,2,25,25]],
+    "energy_blade": [[2,2,2,12,40,40,40,235],[70,70],[50,50]],
+    "energy_leech_support": [[1.5,1.9],[15,24]],
+    "enfeeble": [[8,11.8],[0,1],[10,19],[15,29],[9,18]],
+    "ensnaring_arrow": [[15,20],[40,40],[30,30],[25,25],[3,3]],
+    "essence_drain": [[12,926,18,1389],[1,1,42,2170.2],[3.8,3.8],[],[0.5,0.5]],
+    "eternal_blessing_support": [[0,19],[],[1,1],[]],
+    "ethereal_knives": [[7,949,10,1423],[10,13]],
+    "eviscerate": [[2,2],[],[10,10],[2.8,3.2],[]],
+    "expert_retaliation_support": [[20,39],[40,78]],
+    "explosive_arrow": [[1,1],[50,50],[47,522,71,783],[0.2,0.2,1.2,1.2],[1,1,6,6],[1,1,3,3],[20,20]],
+    "explosive_concoction": [[65,806,98,1210],[6,6],[1.8,1.8],[1,1,1,1],[57,706,86,1058],[12,151,143,1764],[120,196]],
+    "explosive_trap": [[4,437,6,655],[4,4],[50,50],[1.2,1.8],[2,2,1.2,1.8],[0.7,1.3],[3,7,30,30,30,30]],
+    "exsanguinate": [[17,1193,25,1789],[1,1,27,1534.2],[1,1],[],[7,9]],
+    "eye_of_winter": [[16,245,25,367],[],[8,8],[200,200]],
+    "faster_attacks_support": [[20,44]],
+    "faster_casting_support": [[20,39]],
+    "faster_projectiles_support": [[50,69],[20,29]],
+    "feeding_frenzy_support": [[4,5.9],[25,44],[]],
+    "fire_penetration_support": [[20,34]],
+    "fire_trap": [[4,4],[1,1,27.7,2566],[1.75,1.75],[10,915,15,1373],[],[0,0.8],[3,286,5,429]],
+    "fireball": [[9,1640,14,2460],[25,25],[0.9,1.4]],
+    "firestorm": [[1.4,1.4],[23,361,35,541],[0.15,0.15,1,1],[1.3,1.3],[100,100],[325,325],[3,3]],
+    "fist_of_war_support": [[1.8,2.5,1,1],[70,98],[40,59]],
+    "flame_dash": [[1,1,19.7,1738.6],[4,4],[7,659,11,988],[],[0,19]],
+    "flame_link": [[8,9.9],[23,169,35,254],[5,5],[4,4,1,1]],
+    "flame_surge": [[4,4],[26,832,40,1247],[50,88],[],[0,9],[2,2,1,1],[1,1,25,25]],
+    "flame_wall": [[1,1,2.2,679.9],[2,2,1,1,7.2,2266.4],[3,4.9],[2,2,1,2],[],[4,5.9],[3,3],[3,78,5,117]],
+    "flameblast": [[31,405,46,608],[50,50],[165,165],[60,60],[10,10],[0.3,0.3]],
+    "flamethrower_trap": [[4,4],[3.5,3.5],[6,243,9,366],[4,4],[25,25]],
+    "flamewood_support": [[],[1.3,1.8],[80,137],[]],
+    "flammability": [[8,11.8],[0,1],[-36,-17],[25,25]],
+    "flesh_and_stone": [[2.8,2.8],[0,50],[10,20],[10,19]],
+    "flesh_offering": [[5,5],[1,1],[20,30],[20,30],[20,29]],
+    "flicker_strike": [[3,3],[10,10],[15,15],[20,20]],
+    "focused_ballista_support": [[],[40,68],[25,35],[0,9]],
+    "focused_channelling_support": [[1,1,9,24,60,60],[1,1,20,20,100,100]],
+    "forbidden_rite": [[15,498,22,747],[5,5],[12,12],[40,40,25,25],[6,7]],
+    "fork_support": [[],[-9,10]],
+    "fortify_support": [[],[10,19],[10,19]],
+    "freezing_pulse": [[8,1458,12,2188],[],[50,50,25,25,1,1,4,4]],
+    "frenzy": [[5,5],[5,5]],
+    "fresh_meat_support": [[10,10,10,10,2,3.9,50,69]],
+    "frigid_bond_support": [[],[1,1,355.9,3566.4],[2,2],[]],
+    "frost_blades": [[5,8],[60,60],[1.8,2.1],[30,30]],
+    "frost_bomb": [[9,1391,13,2086],[2,2],[2,2,5,5],[75,75],[2.4,3.1],[-15,-15]],
+    "frost_shield": [[10,10],[20,20],[60,60],[0.1,0.38],[190,910],[4,4],[0.3,0.3,1,1],[1,1,150,730]],
+    "frost_wall": [[8,462,12,693],[3,4.9],[0.15,0.15],[2.8,5.6]],
+    "frostbite": [[8,11.8],[0,1],[-36,-17],[25,25]],
+    "frostblink": [[9,1144,14,1716],[3,3],[0,0.3],[15,19,80,99],[0,38]],
+    "frostbolt": [[9,1594,13,2392],[]],
+    "frozen_legion": [[1,1],[100,100],[]],
+    "galvanic_arrow": [[50,50],[3,3],[0,0.5],[]],
+    "galvanic_field": [[1,56,23,1067],[],[6,6],[0.1,0.1],[0.5,0.7],[5,5,10,15],[10,10,0.1,0.1],[1,1],[20,20]],
+    "generals_cry": [[4,4.9],[0,38],[5,5],[],[5,5,2,2,1,1],[],[],[51,60],[]],
+    "generosity_support": [[],[20,39]],
+    "glacial_cascade": [[21,300,32,450],[],[100,100],[1,1,1,1,200,200,100,100],[4,4]],
+    "glacial_hammer": [[100,100],[25,25],[200,390],[35,35],[10,29]],
+    "glacial_shield_swipe": [[78,607,117,911],[15,15,17,29,25,43],[100,100],[2,2],[],[],[50,50],[8,8]],
+    "grace": [[0,1.9],[136,1545],[20,29]],
+    "greater_multiple_projectiles_support": [[26,35],[4,4]],
+    "greater_volley_support": [[4,4],[4,4],[21,30]],
+    "ground_slam": [[25,25],[0,1],[40,49]],
+    "guardians_blessing_support": [[-27,30],[],[1,1],[],[1,1,8,14.3]],
+    "haste": [[0,1.9],[10,16],[15,24],[15,24]],
+    "hatred": [[0,1.9],[30,39]],
+    "heavy_strike": [[25,25],[20,39,2,2]],
+    "herald_of_agony": [[1,1],[20,20],[],[10,10],[40,40],[2,4],[5,9],[1,45,3,84],[]],
+    "herald_of_ash": [[4,4],[25,25],[0,38],[15,20]],
+    "herald_of_ice": [[18,308,26,462],[],[1.2,1.2],[4,38,5,56],[4,38,5,56]],
+    "herald_of_purity": [[12,12],[4,4],[0,38],[],[20,20],[9,12],[0,95]],
+    "herald_of_thunder": [[1,23,31,1108],[],[6,6],[0.25,0.25],[],[2,19,7,76],[2,19,7,76]],
+    "hex_bloom_support": [[0,28],[3,3]],
+    "hexblast": [[111,1514,166,2271],[3.2,3.2],[],[],[90,90],[200,200],[]],
+    "hextouch_support": [[],[],[35,35],[26,35]],
+    "high-impact_mine_support": [[],[5,5],[],[0.25,0.25],[50,56],[2,2,2,2,100,100]],
+    "holy_flame_totem": [[2,153,5,230],[],[8,8],[3,3],[50,50],[1,1],[]],
+    "hydrosphere": [[37,510,56,765],[8,8],[2,2,4,4],[0.4,0.4],[1,1,1,1],[-10,-10],[100,100,100,100,100,100]],
+    "hypothermia_support": [[20,20],[20,29],[20,29]],
+    "ice_bite_support": [[15,15],[50,69],[8,69,12,103],[2,15,3,23]],
+    "ice_crash": [[100,100],[15,15],[30,30],[1.1,1.1],[2,2,2.1,2.1],[3,3,3.1,3.1]],
+    "ice_nova": [[23,988,34,1481],[2.6,3]],
+    "ice_shot": [[60,60],[2.4,2.4],[100,195]],
+    "ice_spear": [[22,568,33,852],[2,2],[600,600],[30,49],[300,300]],
+    "ice_trap": [[88,1275,132,1912],[4,4],[1.8,1.8],[2,2,0.9,0.9],[3,3,0.6,0.6]],
+    "icicle_mine": [[16,514,24,771],[5,5],[0.3,0.3],[5,5],[],[2,2,1,1],[10,10,500,500]],
+    "ignite_proliferation_support": [[1.4,2],[15,24]],
+    "immolate_support": [[42,205,63,308]],
+    "immortal_call": [[1,1],[20,20],[],[25,34],[25,35],[15,15]],
+    "impale_support": [[60,60],[0,28]],
+    "impending_doom_support": [[],[102,1654,154,2481],[]],
+    "incinerate": [[3,207,5,311],[25,25],[100,100,300,300],[],[8,8],[0.4,0.5,1.5,1.9],[500,500],[250,250]],
+    "increased_area_of_effect_support": [[30,49]],
+    "increased_critical_damage_support": [[100,138]],
+    "increased_critical_strikes_support": [[60,117],[2,2]],
+    "infernal_blow": [[0.8,0.8],[60,60],[6,6],[2.4,2.4],[1.8,1.8],[66,66]],
+    "infernal_cry": [[2.5,3.4],[0,38],[],[],[8,8],[5,5,5,5,25,25],[6,6],[],[2.5,3.4],[60,60],[]],
+    "infernal_legion_support": [[1,1,40,40],[1,1,15.5,2092.6],[0,0.5]],
+    "infused_channelling_support": [[20,29],[12,12]],
+    "innervate_support": [[],[1,8,17,145],[8,8],[20,20],[2,14,29,251]],
+    "inspiration_support": [[25,34],[],[6,8],[3,5],[122,800]],
+    "intensify_support": [[30,49],[0.5,0.5,1,1],[3,3,12,16,15,15]],
+    "intimidating_cry": [[2.5,3.4],[0,38],[],[],[5,5,3,3,30,30],[2,2],[2,2]],
+    "intuitive_link": [[8,9.9],[],[4,4,1,1],[38,44],[]],
+    "iron_grip_support": [[],[0,38]],
+    "iron_will_support": [[],[0,38]],
+    "item_rarity_support": [[40,59]],
+    "kinetic_blast": [[4,4],[200,200],[35,35],[1.4,1.4],[2,2,2,2]],
+    "kinetic_bolt": [[200,200],[5,8],[]],
+    "kinetic_fusillade": [[150,150],[0.7,0.7],[3,3],[1.2,1.2],[3,8],[12,12]],
+    "kinetic_instability_support": [[],[150,150],[6,6],[1.2,1.2],[20,20],[]],
+    "kinetic_rain": [[150,150],[8,8],[9,9],[4.5,4.5],[1.2,1.2],[150,150],[6,6],[1.2,1.2],[30,30],[]],
+    "knockback_support": [[25,44],[50,50]],
+    "lacerate": [[0,0.9],[50,88],[25,25],[50,50]],
+    "lancing_steel": [[4,4],[50,50],[20,20],[60,60],[4,4]],
+    "leap_slam": [[20,39],[0.55,0.55],[1.5,1.5],[]],
+    "less_duration_support": [[10,19],[40,49]],
+    "lesser_multiple_projectiles_support": [[6,15],[2,2]],
+    "life_gain_on_hit_support": [[6,44]],
+    "life_leech_support": [[2,3.9]],
+    "lifetap_support": [[],[23,273],[10,19],[4,4]],
+    "lightning_arrow": [[50,50],[3,3],[100,290]],
+    "lightning_conduit": [[33,387,98,1161],[],[],[6,6],[5,5,10,20]],
+    "lightning_penetration_support": [[20,34]],
+    "lightning_spire_trap": [[15,238,45,713],[4,4],[3.5,3.5],[0.36,0.55],[],[100,138],[3,3]],
+    "lightning_strike": [[50,50],[3,3],[50,50],[50,50],[50,50]],
+    "lightning_tendrils": [[1,75,6,1420],[3,3],[2.4,3.1]],
+    "lightning_trap": [[15,659,46,1978],[4,4],[9,9],[],[20,20],[80,118],[0,19]],
+    "lightning_warp": [[1,51,19,965],[0,0.4],[50,50],[30,49]],
+    "living_lightning_support": [[],[100,100],[5,5],[5,8],[1,1],[3,3],[],[3,3]],
+    "locus_mine_support": [[],[1,1],[2,2],[30,30],[],[5,5],[3,3],[11,30],[],[],[0.25,0.25]],
+    "maim_support": [[10,19],[30,30],[10,10]],
+    "malevolence": [[0,1.9],[14,20],[10,19]],
+    "mana_leech_support": [[2,3.9]],
+    "manabond": [[7,263,39,1488],[25,44],[25,25,6,6]],
+    "manaforged_arrows_support": [[31,40],[1,1,1,1],[300,300]],
+    "mark_on_hit_support": [[21,30],[]],
+    "meat_shield_support": [[20,20],[10,29],[20,30],[15,24],[]],
+    "melee_physical_damage_support": [[30,49],[30,49],[10,10]],
+    "melee_splash_support": [[],[40,40],[0,57]],
+    "minefield_support": [[4,4],[3,3],[46,55]],
+    "minion_damage_support": [[25,39],[25,25]],
+    "minion_life_support": [[30,49]],
+    "minion_speed_support": [[25,34],[25,34],[25,44]],
+    "mirage_archer_support": [[1,1],[1,1],[60,60],[4,4],[31,40]],
+    "mirror_arrow": [[3,3],[0,47],[0,57]],
+    "molten_shell": [[3,3],[],[75,75,10,10,5000,5000],[100,3000],[115,858]],
+    "molten_strike": [[4,4],[60,60],[60,60]],
+    "momentum_support": [[1,1,0.51,0.7,1,1],[15,20],[3,5,1.5,1.5],[15,15]],
+    "more_duration_support": [[30,39]],
+    "multiple_totems_support": [[2,2],[1,1,2,2],[21,40]],
+    "multiple_traps_support": [[2,2],[52,58],[3,3]],
+    "multistrike_support": [[2,2],[35,44],[20,30],[22,22],[44,44]],
+    "nightblade_support": [[],[0.7,1],[0,38],[100,138],[]],
+    "orb_of_storms": [[3,304,8,913],[2.55,3.5],[0.5,0.5],[10,29],[3,3]],
+    "overcharge_support": [[50,50],[25,25],[500,690]],
+    "overexertion_support": [[12,18],[10,10]],
+    "penance_brand": [[177,2541,265,3811],[50,50],[0.1,0.1],[],[30,30],[6,6]],
+    "perforate": [[7,7],[75,75],[0,76]],
+    "pestilent_strike": [[1,1],[2,2,1,1],[60,60],[60,60],[30,30],[50,50,1,1,2,2]],
+    "petrified_blood": [[50,50,40,40,81,100,4,4],[40,40]],
+    "phase_run": [[1.8,1.8],[2,2,0.2,0.2],[20,30],[100,100],[100,100],[],[30,39]],
+    "physical_to_lightning_support": [[10,29],[50,50]],
+    "pierce_support": [[2,4],[0,19]],
+    "pinpoint_support": [[3,3,1,1],[0.5,0.5,1,1],[20,20],[1,1],[3,3],[10,19]],
+    "plague_bearer": [[0,0.3],[20,20],[40,40],[1,1,12,12]],
+    "poachers_mark": [[100,100],[15,50],[8,25],[-20,-20],[3,30,4,45]],
+    "point_blank_support": [[30,30],[0,38]],
+    "poisonous_concoction": [[22,537,33,806],[40,40],[6,6],[1.8,1.8],[1,1,1,1],[4,16]],
+    "power_charge_on_critical_support": [[35,54],[4,4]],
+    "power_siphon": [[150,150],[4,7],[],[20,20],[10,10],[20,20]],
+    "precision": [[0,1.9],[20,58],[93,701]],
+    "predator_support": [[6,12],[15,24],[],[8,8]],
+    "pride": [[0,1],[15,19,4,4,30,39]],
+    "prismatic_burst_support": [[],[3,1224,5,1836],[1,153,7,2907],[3,1224,5,1836],[0,0.9],[100,100],[0,57]],
+    "protective_link": [[8,9.9],[31,297],[],[4,4,1,1]],
+    "pulverise_support": [[25,34],[15,15],[35,49]],
+    "puncture": [[8,8],[30,49],[]],
+    "punishment": [[8,11.8],[0,1],[30,58],[2,2]],
+    "purifying_flame": [[8,1324,11,1986],[4,4],[50,50],[0,0.2],[0,0.6],[25,25]],
+    "purity_of_elements": [[0,1.9],[20,34],[]],
+    "purity_of_fire": [[0,1.9],[22,41],[0,4]],
+    "purity_of_ice": [[0,1.9],[22,41],[0,4]],
+    "purity_of_lightning": [[0,1.9],[22,41],[0,4]],
+    "pyroclast_mine": [[5,5],[35,325,52,487],[0.35,0.35],[3,3],[3,3,1,1],[-15,-15]],
+    "rage_support": [[3,3],[10,10,10,19]],
+    "rage_vortex": [[3,3],[1.8,1.8],[10,10,20,20],[1,1,10,10],[2,2,0.1,0.1],[250,250],[1,1]],
+    "rain_of_arrows": [[18,22]],
+    "raise_spectre": [[1,2],[30,30],[55,55],[],[28,70]],
+    "raise_zombie": [[3,6],[0,38]],
+    "rallying_cry": [[2.5,3.4],[0,38],[],[5,5,4,4,30,30],[100,100],[5,5],[1,1,5,5,25,25]],
+    "reap": [[57,943,86,1414],[1,1,138.2,2002.5],[1,1],[],[1,1],[20,20],[15,15]],
+    "reave": [[4,4],[0,0.2],[50,50]],
+    "rejuvenation_totem": [[8,8],[0,76],[1,1],[1,1,8.6,317.5]],
+    "returning_projectiles_support": [[],[66,70],[]],
+    "righteous_fire": [[1,1,70,70],[1,1,70,70],[1,1,90,90],[1,1,70,70],[20,39],[1.8,2.3]],
+    "rolling_magma": [[9,1245,12,1868],[2,3],[0,0.4],[]],
+    "rupture_support": [[],[20,29],[25,25]],
+    "ruthless_support": [[],[70,98],[70,98],[0.8,0.8]],
+    "sacred_wisps_support": [[51,60],[],[],[10,10],[2,2,2,2],[25,25],[25,25]],
+    "sacrifice_support": [[20,20,35,54]],
+    "sadism_support": [[60,98],[70,70]],
+    "scorching_ray": [[1,1,13.4,780.7],[1.5,1.5],[],[8,8],[80,80],[-25,-25]],
+    "scourge_arrow": [[],[60,60],[150,150],[5,5,1,1],[9,9],[50,60]],
+    "searing_bond": [[1,1],[8,8],[1,1,32.2,3899.6],[],[1,1]],
+    "second_wind_support": [[5,24],[1,1]],
+    "seismic_cry": [[200,200],[2.5,3.4],[0,38],[],[],[5,5,5,5,25,25],[5,5,15,15,25,25],[6,6],[50,50]],
+    "seismic_trap": [[49,645,74,967],[4,4],[3.5,3.5],[],[0.9,0.9],[5,5]],
+    "shattering_steel": [[3,3],[40,40]],
+    "shield_charge": [[9,252,13,378],[15,15,3,8,5,12],[75,75],[100,100],[90,109]],
+    "shield_crush": [[4,300,6,450],[15,15,3,8,5,12],[0,0.6]],
+    "shock_nova": [[34,537,101,1610],[10,10],[]],
+    "shockwave_support": [[],[],[0,0.3],[0,38]],
+    "shockwave_totem": [[33,412,65,765],[8,8],[25,25],[1,1],[2.4,2.4]],
+    "shrapnel_ballista": [[8,8],[2,3],[3,3],[1,1]],
+    "siege_ballista": [[6,9],[2,3],[8,8],[1,1]],
+    "sigil_of_power": [[12,12],[72,400,1,1],[10,19],[4,4],[2,7,29,141],[1,1]],
+    "siphoning_trap": [[4,4],[3,3],[1,1,16.5,908.2],[],[10,10],[1,1,12.7,324.4],[1,1,2.9,17.2],[1,1,1.3,32.4],[1,1,0.3,1.7]],
+    "slower_projectiles_support": [[20,30],[10,19]],
+    "smite": [[50,50],[4,4],[20,30],[1.5,2.1],[3.6,4.2],[5,5,1,1],[1,12,4,220],[10,19]],
+    "smoke_mine": [[8,8],[4,5],[2,2,1,1],[],[],[],[],[20,29]],
+    "snipe": [[6,6],[50,80],[70,108],[40,40],[70,108],[50,80]],
+    "snipers_mark": [[10,29],[2,2]],
+    "somatic_shell": [[150,150],[5,5],[],[750,750],[1.5,1.5],[168,6214],[0.2,0.2],[3,6],[1,1],[150,150],[5,5],[],[750,750],[1.5,1.5],[0.2,0.2],[1,1]],
+    "soul_link": [[8,9.9],[5,14],[30,30],[4,4,1,1]],
+    "soulrend": [[21,885,31,1327],[],[1,1,180.9,3149.5],[0.6,0.6],[],[4,4]],
+    "spark": [[1,104,28,1983],[2,2],[4,8]],
+    "spectral_helix": [[3,3],[4.25,4.25]],
+    "spectral_shield_throw": [[50,50],[56,243,84,364],[15,15,3,5,5,9],[3,3],[3,3]],
+    "spell_cascade_support": [[16,25],[31,40],[]],
+    "spell_echo_support": [[1,1],[40,54]],
+    "spell_totem_support": [[40,49],[1,1],[8,8],[40,40]],
+    "spellblade_support": [[40,135,2,2,60,60]],
+    "spellslinger": [[],[],[0,38],[60,174,2,2],[20,30]],
+    "spirit_offering": [[5,5],[1,1],[110,148],[30,39]],
+    "split_arrow": [[5,9]],
+    "splitting_steel": [[],[2,5],[0.8,1.2],[40,40],[]],
+    "static_strike": [[0.32,0.4],[50,50],[3,3],[1,1],[40,40],[4,6]],
+    "steelskin": [[1.5,1.5],[],[70,70,54,2209],[]],
+    "storm_brand": [[3,92,8,277],[0.5,0.5],[],[6,6],[5,5],[3,3],[80,130]],
+    "storm_burst": [[6,168,8,252],[50,50],[1.2,1.2],[0,0.4],[0.4,0.4],[0.4,0.4,75,75]],
+    "storm_call": [[21,949,39,1762],[1.5,1.5],[0,0.6]],
+    "storm_rain": [[50,50],[0.41,0.5],[100,100],[4,4]],
+    "stormbind": [[36,444,107,1332],[12,12],[50,50],[1,1,30,30],[1,1,100,100],[5,24],[3,3]],
+    "stormblast_mine": [[3,367,8,1102],[5,5],[0.25,0.25],[0,0.5],[3,3,150,150]],
+    "stun_support": [[30,49]],
+    "summon_carrion_golem": [[0,10],[1,1],[5,5,50,50],[7,27,11,41]],
+    "summon_chaos_golem": [[0,10],[1,1],[10,16],[17,17]],
+    "summon_flame_golem": [[0,10],[1,1],[20,29],[20,20]],
+    "summon_holy_relic": [[1,1],[0,76],[1,1,5.2,154.6],[1,1,9,464],[]],
+    "summon_ice_golem": [[0,10],[1,1],[40,40],[132,420]],
+    "summon_lightning_golem": [[0,19],[1,1],[10,10],[7.3,18]],
+    "summon_phantasm_support": [[50,69,1,1],[5,10],[20,20,1,1],[15,15]],
+    "summon_raging_spirit": [[20,20],[5,5],[]],
+    "summon_reaper": [[1,1],[50,50],[30,87],[20,29],[20,29]],
+    "summon_skeletons": [[5,7],[20,20],[2,3]],
+    "summon_skitterbots": [[0,76],[0,19],[0,19],[1,1],[],[],[10,10]],
+    "summon_stone_golem": [[0,10],[1,1],[1,1,33,105],[20,20]],
+    "sunder": [[0,19],[40,40],[5,5],[0,25],[5,5],[2,2],[0.2,0.2]],
+    "sweep": [[],[0,0.4]],
+    "swift_affliction_support": [[25,39],[25,25]],
+    "swift_assembly_support": [[9,18,1,1],[6,12,2,2],[3,6,3,3],[]],
+    "swiftbrand_support": [[65,65],[65,65],[30,44]],
+    "swordstorm": [[2,2],[],[1.8,2.3],[8,8]],
+    "tectonic_slam": [[60,60],[5,5],[30,30],[5,5]],
+    "tempest_shield": [[38,896,115,2688],[1,1],[18,25],[]],
+    "temporal_chains": [[5,8.8],[0,1],[50,50],[15,29],[25,25],[9,18]],
+    "temporal_rift": [[0,38],[],[]],
+    "thunderstorm": [[60,60],[10,10],[1,1],[],[1.8,2.3],[3,3],[0.25,0.25,1,1,4,4],[30,30],[1.5,1.5],[300,300],[],[60,60],[3,3],[5,5],[],[40,40],[1.5,1.5]],
+    "tornado": [[31,414,46,620],[0.25,0.25],[1.5,1.5],[2,2,4,4],[20,20],[10,10],[-1,-1],[0,57],[1,1]],
+    "tornado_shot": [[3,3]],
+    "toxic_rain": [[1,1,8,238],[1,1],[5,5],[60,60],[],[5,5,30,30]],
+    "trap_and_mine_damage_support": [[30,49],[10,10],[10,10]],
+    "trap_support": [[],[4,4],[6,20],[0,19]],
+    "trauma_support": [[2,10,3,17],[5,5],[1,1,13,146,5,6.9],[]],
+    "trinity_support": [[2,2,1,1,25,25,1,1,5,5],[5,5,3,3],[25,25,7,16]],
+    "unbound_ailments_support": [[35,54],[35,54],[10,19]],
+    "unearth": [[15,607,22,911],[],[10,70],[10,10]],
+    "unleash_support": [[0.71,0.9,3,3],[36,45]],
+    "urgent_orders_support": [[50,69]],
+    "vaal_absolution": [[15,15],[],[1,1],[200,200],[70,70]],
+    "vaal_ancestral_warchief": [[1,1],[6,6],[],[1,1],[32,32],[50,50]],
+    "vaal_arc": [[38,924,64,1539],[100,100],[4,4],[5,9],[100,100],[15,15],[100,100]],
+    "vaal_blight": [[1,1,6.5,778.9],[6,6],[2,2,3,3],[],[],[0,0.9],[80,80],[20,20],[20,20]],
+    "vaal_burning_arrow": [[3,3],[100,100],[50,50],[]],
+    "vaal_cold_snap": [[45,1872,68,2807],[4,4],[1,1,37.6,2924.2],[],[],[],[3.2,3.2],[2,2,2,2],[3,3,3.6,3.6],[1,1]],
+    "vaal_double_strike": [[6,6],[],[0,57],[],[25,25],[8,8]],
+    "vaal_ground_slam": [[25,25],[0,0.9],[200,200],[],[40,49],[]],
+    "vaal_lightning_arrow": [[],[50,50],[5,5],[9,9],[],[],[3,3],[]],
+    "vampiric_link": [[8,9.9],[1,1],[1,1,2,5.8],[4,4,1,1]],
+    "vengeful_cry": [[2.5,3.4],[0,38],[2,2],[],[5,5,1,1,3,3,25,25],[25,25]],
+    "venom_gyre": [[12,12],[60,60],[],[40,40],[75,75],[],[30,30],[40,40]],
+    "vicious_projectiles_support": [[30,49],[30,49],[30,49],[10,10]],
+    "vigilant_strike": [[8,8]],
+    "vile_toxins_support": [[5,5,5,8],[10,19]],
+    "viper_strike": [[30,30],[20,20],[4,4],[60,60],[60,60]],
+    "vitality": [[0,1.9],[1,1,10,193.2]],
+    "void_manipulation_support": [[20,34],[]],
+    "void_sphere": [[27,344,40,516],[5,5],[0.4,0.4],[40,40],[3.8,3.8],[30,39]],
+    "volatile_dead": [[25,938,37,1407],[3,3],[3,4],[2,2],[1.5,1.5],[60,60]],
+    "volatility_support": [[30,58],[50,69]],
+    "volcanic_fissure": [[5,5],[60,60],[50,50],[60,60],[50,50]],
+    "volley_support": [[2,2],[2,2],[3,12]],
+    "voltaxic_burst": [[20,906,38,1683],[2.5,2.5],[40,40],[6,6],[0,0.3],[1,1]],
+    "vortex": [[48,933,72,1399],[3,3],[1,1,115.6,2772.8],[],[2,2],[2,2,2,2]],
+    "vulnerability": [[8,11.8],[0,1],[15,30],[25,25]],
+    "wall_of_force": [[5.1,7],[4.5,6],[1,1],[20,30],[11,17]],
+    "war_banner": [[10,10],[2.4,2.4],[],[5,10],[5,10],[8,8],[4,4]],
+    "warlords_mark": [[2,2.95],[2,2.95],[100,100],[40,59,2,2],[10,10]],
+    "wave_of_conviction": [[35,1476,52,2214],[25,25],[0.5,0.69],[2,2,4,4],[25,25],[-15,-15]],
+    "whirling_blades": [[75,75],[0.6,0.6]],
+    "wild_strike": [[],[4,7],[3,3],[0,19],[100,100]],
+    "windburst_support": [[10,10,1,1],[],[4,4],[3,3],[40,40],[1.5,1.5],[]],
+    "winter_orb": [[39,360,49,450],[1.6,1.6],[],[1.2,1.2],[30,30],[80,80],[20,20],[8,8]],
+    "wintertide_brand": [[0.25,0.25],[],[1,1,12.9,298.5],[1,1],[],[20,20],[20,20],[6,6],[2,2],[1,1]],
+    "wither": [[2,2],[0.5,0.5],[0,19],[30,36],[6,6]],
+    "withering_step": [[3,3],[0,0.6],[],[],[0,38],[4,6],[]],
+    "withering_touch_support": [[25,25],[2,2],[10,29]],
+    "wrath": [[0,1.9],[2,16,37,248],[15,21]],
+    "zealotry": [[0,1.9],[10,10,8,8],[20,39],[10,15]],
+  },
+};
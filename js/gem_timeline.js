@@ -0,0 +1,146 @@
+// Per-class gem availability timeline, generated by gem_timeline.py
+// steps: quest-ordered rewards with newly unlocked gems and running totals
+// earliest: gem_id -> [quest reward step, vendor step] (-1 = not available)
+const GEM_TIMELINE = {
+  marauder: {
+    steps: [
+      {"act": 1, "questName": "황혼의 해안", "reward": ["heavy_strike", "ruthless_support"], "vendor": [], "rewardTotal": 2, "vendorTotal": 0},
+      {"act": 1, "questName": "눈 앞의 적", "reward": ["ground_slam", "molten_strike", "shield_crush"], "vendor": ["molten_strike", "ground_slam", "fireball", "cleave", "double_strike", "dual_strike", "glacial_hammer", "heavy_strike", "ethereal_knives", "spectral_throw", "ruthless_support", "smite", "perforate", "shield_crush"], "rewardTotal": 5, "vendorTotal": 14, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "자비로운 임무", "reward": ["chance_to_bleed_support", "momentum_support", "ancestral_call_support"], "vendor": ["chance_to_bleed_support", "ancestral_call_support", "momentum_support", "volley_support"], "rewardTotal": 8, "vendorTotal": 18, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "로아 알 깨트리기", "reward": ["decoy_totem", "steelskin", "vigilant_strike", "crushing_fist", "shield_charge"], "vendor": ["ancestral_protector", "vigilant_strike", "decoy_totem", "steelskin", "shield_charge", "crushing_fist", "glacial_shield_swipe", "swordstorm", "rejuvenation_totem", "bear_trap", "devouring_totem", "holy_flame_totem", "war_banner", "dash", "blood_and_sand", "frostblink", "shrapnel_ballista"], "rewardTotal": 13, "vendorTotal": 35, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "감금된 덩치", "reward": ["faster_attacks_support", "melee_splash_support", "added_fire_damage_support", "lifetap_support", "flamewood_support", "leap_slam", "vitality", "enduring_cry", "intimidating_cry"], "vendor": ["leap_slam", "enduring_cry", "intimidating_cry", "added_fire_damage_support", "melee_splash_support", "faster_attacks_support", "vitality", "additional_accuracy_support", "knockback_support", "flicker_strike", "stun_support", "combustion_support", "life_gain_on_hit_support", "clarity", "spell_totem_support", "chance_to_flee_support", "blind_support", "smoke_mine", "maim_support", "precision", "lifetap_support", "earthbreaker_support", "flamewood_support", "vaal_burning_arrow", "vaal_ground_slam"], "rewardTotal": 22, "vendorTotal": 60, "npc": "네사", "cost": "transmutation"},
+      {"act": 1, "questName": "사이렌의 마침곡", "reward": ["infernal_blow", "static_strike", "sweep", "sunder", "chain_hook", "earthshatter", "volcanic_fissure"], "vendor": ["static_strike", "infernal_blow", "sweep", "sunder", "chain_hook", "earthshatter", "spectral_shield_throw", "lacerate", "searing_bond", "exsanguinate", "absolution", "spectral_helix", "volcanic_fissure"], "rewardTotal": 29, "vendorTotal": 73, "npc": "네사", "cost": "transmutation"},
+      {"act": 2, "questName": "검은 침략자", "reward": ["warlords_mark", "herald_of_ash", "herald_of_thunder", "herald_of_ice", "ancestral_cry", "seismic_cry", "corrupting_fever", "molten_shell", "eviscerate"], "vendor": ["molten_shell", "herald_of_ash", "herald_of_thunder", "herald_of_ice", "ancestral_cry", "seismic_cry", "warlords_mark", "corrupting_fever", "defiance_banner", "eviscerate"], "rewardTotal": 38, "vendorTotal": 83, "npc": "예나", "cost": "alteration"},
+      {"act": 2, "questName": "예리하고 잔인한", "reward": ["melee_physical_damage_support", "elemental_damage_with_attacks_support", "shockwave_support", "close_combat_support", "rage_support", "cruelty_support", "volatility_support"], "vendor": ["elemental_damage_with_attacks_support", "melee_physical_damage_support", "shockwave_support", "close_combat_support", "rage_support", "vicious_projectiles_support", "bloodlust_support", "culling_strike_support", "iron_grip_support", "iron_will_support", "damage_on_full_life_support", "endurance_charge_on_melee_stun_support", "physical_to_lightning_support", "cruelty_support", "volatility_support", "sadism_support"], "rewardTotal": 45, "vendorTotal": 99, "npc": "예나", "cost": "alteration"},
+      {"act": 2, "questName": "문제의 근원", "reward": ["vicious_projectiles_support"], "vendor": ["frenzy", "blood_rage", "righteous_fire", "tempest_shield", "herald_of_purity", "brand_recall", "flesh_and_stone"], "rewardTotal": 46, "vendorTotal": 106, "npc": "예나", "cost": "alteration"},
+      {"act": 3, "questName": "떠나보낸 연인", "reward": ["anger", "determination", "punishment", "vulnerability", "pride", "infernal_cry", "generals_cry", "petrified_blood", "vengeful_cry"], "vendor": ["anger", "determination", "punishment", "vulnerability", "pride", "infernal_cry", "generals_cry", "purity_of_elements", "hatred", "flammability", "purity_of_fire", "rallying_cry", "dread_banner", "petrified_blood", "automation", "autoexertion", "vengeful_cry"], "rewardTotal": 55, "vendorTotal": 123, "npc": "클라리사", "cost": "alteration"},
+      {"act": 3, "questName": "빅타리오의 비밀", "reward": [], "vendor": ["boneshatter"], "rewardTotal": 55, "vendorTotal": 124, "npc": "???", "cost": "???"},
+      {"act": 3, "questName": "오른팔 잘라내기", "reward": ["cyclone", "ice_crash", "earthquake", "tectonic_slam", "rage_vortex"], "vendor": ["ice_crash", "cyclone", "earthquake", "ancestral_warchief", "tectonic_slam", "charged_dash", "discharge", "explosive_arrow", "dominating_blow", "shockwave_totem", "animate_guardian", "flameblast", "consecrated_path", "bladestorm", "artillery_ballista", "reap", "rage_vortex", "battlemages_cry"], "rewardTotal": 60, "vendorTotal": 142, "npc": "클라리사", "cost": "chance"},
+      {"act": 3, "questName": "운명의 흔적", "reward": ["life_leech_support", "fortify_support", "arrogance_support", "more_duration_support", "pulverise_support", "impale_support", "urgent_orders_support", "bloodthirst_support", "corrupting_cry_support", "controlled_blaze_support"], "vendor": ["fire_penetration_support", "fortify_support", "pulverise_support", "life_leech_support", "more_duration_support", "impale_support", "urgent_orders_support", "inspiration_support", "burning_damage_support", "less_duration_support", "generosity_support", "blasphemy_support", "bloodthirst_support", "arrogance_support", "corrupting_cry_support", "controlled_blaze_support", "expert_retaliation_support"], "rewardTotal": 70, "vendorTotal": 159, "npc": "시오사", "cost": "chance"},
+      {"act": 4, "questName": "영원한 악몽", "reward": ["spell_echo_support", "multistrike_support", "greater_multiple_projectiles_support", "chain_support", "increased_area_of_effect_support", "brutality_support", "multiple_totems_support", "fist_of_war_support", "behead_support", "eternal_blessing_support", "trauma_support", "overexertion_support"], "vendor": ["spell_echo_support", "multistrike_support", "greater_multiple_projectiles_support", "chain_support", "increased_area_of_effect_support", "multiple_totems_support", "fist_of_war_support", "brutality_support", "greater_volley_support", "hextouch_support", "cast_on_critical_strike_support", "cast_on_melee_kill_support", "cast_on_death_support", "cast_when_damage_taken_support", "cast_when_stunned_support", "cast_while_channelling_support", "immolate_support", "barrage_support", "behead_support", "eternal_blessing_support", "mark_on_hit_support", "trauma_support", "returning_projectiles_support", "overexertion_support", "rupture_support"], "rewardTotal": 82, "vendorTotal": 184, "npc": "페타루스와 바냐", "cost": "alchemy"},
+      {"act": 4, "questName": "봉인 해제", "reward": ["summon_chaos_golem", "summon_ice_golem", "summon_flame_golem", "summon_stone_golem", "summon_lightning_golem", "berserk"], "vendor": ["summon_chaos_golem", "summon_ice_golem", "summon_flame_golem", "summon_stone_golem", "summon_lightning_golem", "berserk", "immortal_call", "flame_link", "protective_link", "frozen_legion"], "rewardTotal": 88, "vendorTotal": 194, "npc": "페타루스와 바냐", "cost": "chance"},
+      {"act": 4, "questName": "불굴의 혼백", "reward": ["fire_penetration_support"], "vendor": ["burning_arrow"], "rewardTotal": 89, "vendorTotal": 195, "npc": "???", "cost": "???"},
+      {"act": 6, "questName": "움브라의 정수", "reward": [], "vendor": ["vaal_ancestral_warchief"], "rewardTotal": 89, "vendorTotal": 196, "npc": "???", "cost": "???"},
+    ],
+    earliest: {"absolution":[-1,5],"added_fire_damage_support":[4,4],"additional_accuracy_support":[-1,4],"ancestral_call_support":[2,2],"ancestral_cry":[6,6],"ancestral_protector":[-1,3],"ancestral_warchief":[-1,11],"anger":[9,9],"animate_guardian":[-1,11],"arrogance_support":[12,12],"artillery_ballista":[-1,11],"autoexertion":[-1,9],"automation":[-1,9],"barrage_support":[-1,13],"battlemages_cry":[-1,11],"bear_trap":[-1,3],"behead_support":[13,13],"berserk":[14,14],"bladestorm":[-1,11],"blasphemy_support":[-1,12],"blind_support":[-1,4],"blood_and_sand":[-1,3],"blood_rage":[-1,8],"bloodlust_support":[-1,7],"bloodthirst_support":[12,12],"boneshatter":[-1,10],"brand_recall":[-1,8],"brutality_support":[13,13],"burning_arrow":[-1,15],"burning_damage_support":[-1,12],"cast_on_critical_strike_support":[-1,13],"cast_on_death_support":[-1,13],"cast_on_melee_kill_support":[-1,13],"cast_when_damage_taken_support":[-1,13],"cast_when_stunned_support":[-1,13],"cast_while_channelling_support":[-1,13],"chain_hook":[5,5],"chain_support":[13,13],"chance_to_bleed_support":[2,2],"chance_to_flee_support":[-1,4],"charged_dash":[-1,11],"clarity":[-1,4],"cleave":[-1,1],"close_combat_support":[7,7],"combustion_support":[-1,4],"consecrated_path":[-1,11],"controlled_blaze_support":[12,12],"corrupting_cry_support":[12,12],"corrupting_fever":[6,6],"cruelty_support":[7,7],"crushing_fist":[3,3],"culling_strike_support":[-1,7],"cyclone":[11,11],"damage_on_full_life_support":[-1,7],"dash":[-1,3],"decoy_totem":[3,3],"defiance_banner":[-1,6],"determination":[9,9],"devouring_totem":[-1,3],"discharge":[-1,11],"dominating_blow":[-1,11],"double_strike":[-1,1],"dread_banner":[-1,9],"dual_strike":[-1,1],"earthbreaker_support":[-1,4],"earthquake":[11,11],"earthshatter":[5,5],"elemental_damage_with_attacks_support":[7,7],"endurance_charge_on_melee_stun_support":[-1,7],"enduring_cry":[4,4],"eternal_blessing_support":[13,13],"ethereal_knives":[-1,1],"eviscerate":[6,6],"expert_retaliation_support":[-1,12],"explosive_arrow":[-1,11],"exsanguinate":[-1,5],"faster_attacks_support":[4,4],"fire_penetration_support":[15,12],"fireball":[-1,1],"fist_of_war_support":[13,13],"flame_link":[-1,14],"flameblast":[-1,11],"flamewood_support":[4,4],"flammability":[-1,9],"flesh_and_stone":[-1,8],"flicker_strike":[-1,4],"fortify_support":[12,12],"frenzy":[-1,8],"frostblink":[-1,3],"frozen_legion":[-1,14],"generals_cry":[9,9],"generosity_support":[-1,12],"glacial_hammer":[-1,1],"glacial_shield_swipe":[-1,3],"greater_multiple_projectiles_support":[13,13],"greater_volley_support":[-1,13],"ground_slam":[1,1],"hatred":[-1,9],"heavy_strike":[0,1],"herald_of_ash":[6,6],"herald_of_ice":[6,6],"herald_of_purity":[-1,8],"herald_of_thunder":[6,6],"hextouch_support":[-1,13],"holy_flame_totem":[-1,3],"ice_crash":[11,11],"immolate_support":[-1,13],"immortal_call":[-1,14],"impale_support":[12,12],"increased_area_of_effect_support":[13,13],"infernal_blow":[5,5],"infernal_cry":[9,9],"inspiration_support":[-1,12],"intimidating_cry":[4,4],"iron_grip_support":[-1,7],"iron_will_support":[-1,7],"knockback_support":[-1,4],"lacerate":[-1,5],"leap_slam":[4,4],"less_duration_support":[-1,12],"life_gain_on_hit_support":[-1,4],"life_leech_support":[12,12],"lifetap_support":[4,4],"maim_support":[-1,4],"mark_on_hit_support":[-1,13],"melee_physical_damage_support":[7,7],"melee_splash_support":[4,4],"molten_shell":[6,6],"molten_strike":[1,1],"momentum_support":[2,2],"more_duration_support":[12,12],"multiple_totems_support":[13,13],"multistrike_support":[13,13],"overexertion_support":[13,13],"perforate":[-1,1],"petrified_blood":[9,9],"physical_to_lightning_support":[-1,7],"precision":[-1,4],"pride":[9,9],"protective_link":[-1,14],"pulverise_support":[12,12],"punishment":[9,9],"purity_of_elements":[-1,9],"purity_of_fire":[-1,9],"rage_support":[7,7],"rage_vortex":[11,11],"rallying_cry":[-1,9],"reap":[-1,11],"rejuvenation_totem":[-1,3],"returning_projectiles_support":[-1,13],"righteous_fire":[-1,8],"rupture_support":[-1,13],"ruthless_support":[0,1],"sadism_support":[-1,7],"searing_bond":[-1,5],"seismic_cry":[6,6],"shield_charge":[3,3],"shield_crush":[1,1],"shockwave_support":[7,7],"shockwave_totem":[-1,11],"shrapnel_ballista":[-1,3],"smite":[-1,1],"smoke_mine":[-1,4],"spectral_helix":[-1,5],"spectral_shield_throw":[-1,5],"spectral_throw":[-1,1],"spell_echo_support":[13,13],"spell_totem_support":[-1,4],"static_strike":[5,5],"steelskin":[3,3],"stun_support":[-1,4],"summon_chaos_golem":[14,14],"summon_flame_golem":[14,14],"summon_ice_golem":[14,14],"summon_lightning_golem":[14,14],"summon_stone_golem":[14,14],"sunder":[5,5],"sweep":[5,5],"swordstorm":[-1,3],"tectonic_slam":[11,11],"tempest_shield":[-1,8],"trauma_support":[13,13],"urgent_orders_support":[12,12],"vaal_ancestral_warchief":[-1,16],"vaal_burning_arrow":[-1,4],"vaal_ground_slam":[-1,4],"vengeful_cry":[9,9],"vicious_projectiles_support":[8,7],"vigilant_strike":[3,3],"vitality":[4,4],"volatility_support":[7,7],"volcanic_fissure":[5,5],"volley_support":[-1,2],"vulnerability":[9,9],"war_banner":[-1,3],"warlords_mark":[6,6]},
+  },
+  witch: {
+    steps: [
+      {"act": 1, "questName": "황혼의 해안", "reward": ["fireball", "arcane_surge_support"], "vendor": [], "rewardTotal": 2, "vendorTotal": 0},
+      {"act": 1, "questName": "눈 앞의 적", "reward": ["freezing_pulse", "rolling_magma", "lightning_tendrils", "raise_zombie", "blight", "kinetic_bolt"], "vendor": ["freezing_pulse", "lightning_tendrils", "raise_zombie", "blight", "kinetic_bolt", "fireball", "spark", "ethereal_knives", "frostbolt", "arcane_surge_support", "explosive_trap", "purifying_flame", "stormblast_mine", "rolling_magma"], "rewardTotal": 8, "vendorTotal": 14, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "자비로운 임무", "reward": ["elemental_proliferation_support", "spell_cascade_support", "infused_channelling_support", "chance_to_poison_support", "summon_phantasm_support"], "vendor": ["elemental_proliferation_support", "spell_cascade_support", "infused_channelling_support", "summon_phantasm_support", "volley_support", "swift_assembly_support", "chance_to_poison_support"], "rewardTotal": 13, "vendorTotal": 21, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "로아 알 깨트리기", "reward": ["frost_bomb", "orb_of_storms", "summon_raging_spirit", "contagion", "detonate_dead", "flame_wall", "frostblink"], "vendor": ["frost_bomb", "orb_of_storms", "summon_raging_spirit", "contagion", "detonate_dead", "frostblink", "shield_charge", "frost_wall", "conversion_trap", "devouring_totem", "holy_flame_totem", "animate_weapon", "summon_holy_relic", "dash", "flame_wall"], "rewardTotal": 20, "vendorTotal": 36, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "감금된 덩치", "reward": ["added_lightning_damage_support", "minion_damage_support", "void_manipulation_support", "unbound_ailments_support", "combustion_support", "infernal_legion_support", "efficacy_support", "devour_support", "clarity", "summon_skeletons", "lightning_warp", "flame_dash", "wither", "bodyswap"], "vendor": ["clarity", "summon_skeletons", "lightning_warp", "flame_dash", "wither", "bodyswap", "added_lightning_damage_support", "minion_damage_support", "void_manipulation_support", "unbound_ailments_support", "combustion_support", "infernal_legion_support", "efficacy_support", "unearth", "lesser_multiple_projectiles_support", "added_cold_damage_support", "increased_critical_strikes_support", "trap_support", "vitality", "spell_totem_support", "blastchain_mine_support", "melee_splash_support", "multiple_traps_support", "smoke_mine", "siphoning_trap", "precision", "withering_step", "devour_support", "locus_mine_support"], "rewardTotal": 34, "vendorTotal": 65, "npc": "네사", "cost": "transmutation"},
+      {"act": 1, "questName": "사이렌의 마침곡", "reward": ["ice_nova", "blazing_salvo", "arc", "flesh_offering", "essence_drain", "scorching_ray", "volatile_dead", "creeping_frost", "manabond"], "vendor": ["ice_nova", "arc", "flesh_offering", "essence_drain", "scorching_ray", "volatile_dead", "creeping_frost", "wintertide_brand", "ice_spear", "power_siphon", "icicle_mine", "fire_trap", "incinerate", "searing_bond", "lightning_trap", "storm_call", "flame_surge", "bone_offering", "spirit_offering", "blade_vortex", "storm_brand", "blazing_salvo", "exsanguinate", "absolution", "voltaxic_burst", "manabond", "kinetic_fusillade"], "rewardTotal": 43, "vendorTotal": 92, "npc": "네사", "cost": "transmutation"},
+      {"act": 2, "questName": "검은 침략자", "reward": ["herald_of_ash", "herald_of_thunder", "herald_of_ice", "desecrate", "arctic_armour", "cold_snap", "arcane_cloak", "galvanic_field", "wall_of_force"], "vendor": ["herald_of_ash", "herald_of_thunder", "herald_of_ice", "desecrate", "arctic_armour", "cold_snap", "arcane_cloak", "forbidden_rite", "galvanic_field", "physical_to_lightning_support", "divine_retribution", "wall_of_force"], "rewardTotal": 52, "vendorTotal": 104, "npc": "예나", "cost": "alteration"},
+      {"act": 2, "questName": "예리하고 잔인한", "reward": ["faster_casting_support", "minion_speed_support", "concentrated_effect_support", "controlled_destruction_support", "elemental_focus_support", "predator_support", "trinity_support", "cruelty_support", "overcharge_support", "fresh_meat_support", "sacred_wisps_support", "kinetic_instability_support", "living_lightning_support"], "vendor": ["faster_casting_support", "minion_speed_support", "concentrated_effect_support", "controlled_destruction_support", "elemental_focus_support", "predator_support", "increased_critical_damage_support", "melee_physical_damage_support", "cold_to_fire_support", "minion_life_support", "culling_strike_support", "power_charge_on_critical_support", "trap_and_mine_damage_support", "deadly_ailments_support", "trinity_support", "cruelty_support", "overcharge_support", "fresh_meat_support", "sadism_support", "sacred_wisps_support", "living_lightning_support", "kinetic_instability_support"], "rewardTotal": 65, "vendorTotal": 126, "npc": "예나", "cost": "alteration"},
+      {"act": 2, "questName": "문제의 근원", "reward": ["wintertide_brand"], "vendor": ["righteous_fire", "tempest_shield", "herald_of_purity", "brand_recall", "wave_of_conviction", "summon_skitterbots", "blade_blast", "inspiration_support"], "rewardTotal": 66, "vendorTotal": 134, "npc": "예나", "cost": "alteration"},
+      {"act": 3, "questName": "떠나보낸 연인", "reward": ["flammability", "conductivity", "frostbite", "elemental_weakness", "despair", "enfeeble", "temporal_chains", "discipline", "purity_of_elements", "malevolence", "zealotry", "bane", "spellslinger"], "vendor": ["flammability", "conductivity", "frostbite", "discipline", "purity_of_elements", "despair", "malevolence", "zealotry", "bane", "spellslinger", "temporal_chains", "elemental_weakness", "enfeeble", "hatred", "wrath", "purity_of_lightning", "pride", "automation"], "rewardTotal": 79, "vendorTotal": 152, "npc": "클라리사", "cost": "alteration"},
+      {"act": 3, "questName": "빅타리오의 비밀", "reward": [], "vendor": ["vortex"], "rewardTotal": 79, "vendorTotal": 153, "npc": "???", "cost": "???"},
+      {"act": 3, "questName": "오른팔 잘라내기", "reward": ["glacial_cascade", "flameblast", "firestorm", "ball_lightning", "crackling_lance", "raise_spectre", "kinetic_blast", "somatic_shell", "kinetic_rain", "cremation", "soulrend", "stormbind", "hexblast", "summon_reaper", "eye_of_winter", "lightning_conduit"], "vendor": ["firestorm", "glacial_cascade", "flameblast", "ball_lightning", "raise_spectre", "kinetic_blast", "cremation", "soulrend", "stormbind", "discharge", "shock_nova", "shockwave_totem", "animate_guardian", "pyroclast_mine", "ice_trap", "bladefall", "flamethrower_trap", "lightning_spire_trap", "seismic_trap", "armageddon_brand", "divine_ire", "crackling_lance", "hexblast", "reap", "summon_reaper", "eye_of_winter", "lightning_conduit", "somatic_shell", "kinetic_rain"], "rewardTotal": 95, "vendorTotal": 182, "npc": "클라리사", "cost": "chance"},
+      {"act": 3, "questName": "운명의 흔적", "reward": ["fire_penetration_support", "cold_penetration_support", "lightning_penetration_support", "burning_damage_support", "blasphemy_support", "swift_affliction_support", "energy_leech_support", "intensify_support", "pinpoint_support", "feeding_frenzy_support", "meat_shield_support", "archmage_support", "impending_doom_support", "sacrifice_support", "focused_channelling_support"], "vendor": ["fire_penetration_support", "cold_penetration_support", "lightning_penetration_support", "burning_damage_support", "blasphemy_support", "swift_affliction_support", "energy_leech_support", "intensify_support", "feeding_frenzy_support", "meat_shield_support", "archmage_support", "hypothermia_support", "faster_projectiles_support", "mana_leech_support", "item_rarity_support", "fork_support", "elemental_army_support", "generosity_support", "ice_bite_support", "innervate_support", "advanced_traps_support", "charged_traps_support", "charged_mines_support", "pulverise_support", "high-impact_mine_support", "second_wind_support", "pinpoint_support", "impending_doom_support", "cursed_ground_support", "sacrifice_support", "guardians_blessing_support", "added_chaos_damage_support", "focused_channelling_support"], "rewardTotal": 110, "vendorTotal": 215, "npc": "시오사", "cost": "chance"},
+      {"act": 4, "questName": "영원한 악몽", "reward": ["spell_echo_support", "multistrike_support", "greater_multiple_projectiles_support", "chain_support", "increased_area_of_effect_support", "decay_support", "immolate_support", "bonechill_support", "hex_bloom_support", "unleash_support"], "vendor": ["spell_echo_support", "multistrike_support", "greater_multiple_projectiles_support", "chain_support", "increased_area_of_effect_support", "decay_support", "immolate_support", "bonechill_support", "unleash_support", "greater_volley_support", "hextouch_support", "cast_on_critical_strike_support", "cast_on_melee_kill_support", "cast_on_death_support", "cast_when_damage_taken_support", "cast_when_stunned_support", "cluster_traps_support", "minefield_support", "cast_while_channelling_support", "ignite_proliferation_support", "multiple_totems_support", "barrage_support", "eternal_blessing_support", "mark_on_hit_support", "hex_bloom_support", "frigid_bond_support", "returning_projectiles_support", "spellblade_support"], "rewardTotal": 120, "vendorTotal": 243, "npc": "페타루스와 바냐", "cost": "alchemy"},
+      {"act": 4, "questName": "봉인 해제", "reward": ["summon_chaos_golem", "summon_ice_golem", "summon_flame_golem", "summon_stone_golem", "summon_lightning_golem", "summon_carrion_golem", "sigil_of_power", "void_sphere", "frost_shield", "hydrosphere"], "vendor": ["summon_chaos_golem", "summon_ice_golem", "summon_flame_golem", "summon_stone_golem", "summon_lightning_golem", "summon_carrion_golem", "void_sphere", "frost_shield", "sigil_of_power", "hydrosphere", "temporal_rift", "soul_link", "destructive_link"], "rewardTotal": 130, "vendorTotal": 256, "npc": "페타루스와 바냐", "cost": "chance"},
+      {"act": 4, "questName": "불굴의 혼백", "reward": ["hypothermia_support"], "vendor": [], "rewardTotal": 131, "vendorTotal": 256},
+    ],
+    earliest: {"absolution":[-1,5],"added_chaos_damage_support":[-1,12],"added_cold_damage_support":[-1,4],"added_lightning_damage_support":[4,4],"advanced_traps_support":[-1,12],"animate_guardian":[-1,11],"animate_weapon":[-1,3],"arc":[5,5],"arcane_cloak":[6,6],"arcane_surge_support":[0,1],"archmage_support":[12,12],"arctic_armour":[6,6],"armageddon_brand":[-1,11],"automation":[-1,9],"ball_lightning":[11,11],"bane":[9,9],"barrage_support":[-1,13],"blade_blast":[-1,8],"blade_vortex":[-1,5],"bladefall":[-1,11],"blasphemy_support":[12,12],"blastchain_mine_support":[-1,4],"blazing_salvo":[5,5],"blight":[1,1],"bodyswap":[4,4],"bone_offering":[-1,5],"bonechill_support":[13,13],"brand_recall":[-1,8],"burning_damage_support":[12,12],"cast_on_critical_strike_support":[-1,13],"cast_on_death_support":[-1,13],"cast_on_melee_kill_support":[-1,13],"cast_when_damage_taken_support":[-1,13],"cast_when_stunned_support":[-1,13],"cast_while_channelling_support":[-1,13],"chain_support":[13,13],"chance_to_poison_support":[2,2],"charged_mines_support":[-1,12],"charged_traps_support":[-1,12],"clarity":[4,4],"cluster_traps_support":[-1,13],"cold_penetration_support":[12,12],"cold_snap":[6,6],"cold_to_fire_support":[-1,7],"combustion_support":[4,4],"concentrated_effect_support":[7,7],"conductivity":[9,9],"contagion":[3,3],"controlled_destruction_support":[7,7],"conversion_trap":[-1,3],"crackling_lance":[11,11],"creeping_frost":[5,5],"cremation":[11,11],"cruelty_support":[7,7],"culling_strike_support":[-1,7],"cursed_ground_support":[-1,12],"dash":[-1,3],"deadly_ailments_support":[-1,7],"decay_support":[13,13],"desecrate":[6,6],"despair":[9,9],"destructive_link":[-1,14],"detonate_dead":[3,3],"devour_support":[4,4],"devouring_totem":[-1,3],"discharge":[-1,11],"discipline":[9,9],"divine_ire":[-1,11],"divine_retribution":[-1,6],"efficacy_support":[4,4],"elemental_army_support":[-1,12],"elemental_focus_support":[7,7],"elemental_proliferation_support":[2,2],"elemental_weakness":[9,9],"energy_leech_support":[12,12],"enfeeble":[9,9],"essence_drain":[5,5],"eternal_blessing_support":[-1,13],"ethereal_knives":[-1,1],"explosive_trap":[-1,1],"exsanguinate":[-1,5],"eye_of_winter":[11,11],"faster_casting_support":[7,7],"faster_projectiles_support":[-1,12],"feeding_frenzy_support":[12,12],"fire_penetration_support":[12,12],"fire_trap":[-1,5],"fireball":[0,1],"firestorm":[11,11],"flame_dash":[4,4],"flame_surge":[-1,5],"flame_wall":[3,3],"flameblast":[11,11],"flamethrower_trap":[-1,11],"flammability":[9,9],"flesh_offering":[5,5],"focused_channelling_support":[12,12],"forbidden_rite":[-1,6],"fork_support":[-1,12],"freezing_pulse":[1,1],"fresh_meat_support":[7,7],"frigid_bond_support":[-1,13],"frost_bomb":[3,3],"frost_shield":[14,14],"frost_wall":[-1,3],"frostbite":[9,9],"frostblink":[3,3],"frostbolt":[-1,1],"galvanic_field":[6,6],"generosity_support":[-1,12],"glacial_cascade":[11,11],"greater_multiple_projectiles_support":[13,13],"greater_volley_support":[-1,13],"guardians_blessing_support":[-1,12],"hatred":[-1,9],"herald_of_ash":[6,6],"herald_of_ice":[6,6],"herald_of_purity":[-1,8],"herald_of_thunder":[6,6],"hex_bloom_support":[13,13],"hexblast":[11,11],"hextouch_support":[-1,13],"high-impact_mine_support":[-1,12],"holy_flame_totem":[-1,3],"hydrosphere":[14,14],"hypothermia_support":[15,12],"ice_bite_support":[-1,12],"ice_nova":[5,5],"ice_spear":[-1,5],"ice_trap":[-1,11],"icicle_mine":[-1,5],"ignite_proliferation_support":[-1,13],"immolate_support":[13,13],"impending_doom_support":[12,12],"incinerate":[-1,5],"increased_area_of_effect_support":[13,13],"increased_critical_damage_support":[-1,7],"increased_critical_strikes_support":[-1,4],"infernal_legion_support":[4,4],"infused_channelling_support":[2,2],"innervate_support":[-1,12],"inspiration_support":[-1,8],"intensify_support":[12,12],"item_rarity_support":[-1,12],"kinetic_blast":[11,11],"kinetic_bolt":[1,1],"kinetic_fusillade":[-1,5],"kinetic_instability_support":[7,7],"kinetic_rain":[11,11],"lesser_multiple_projectiles_support":[-1,4],"lightning_conduit":[11,11],"lightning_penetration_support":[12,12],"lightning_spire_trap":[-1,11],"lightning_tendrils":[1,1],"lightning_trap":[-1,5],"lightning_warp":[4,4],"living_lightning_support":[7,7],"locus_mine_support":[-1,4],"malevolence":[9,9],"mana_leech_support":[-1,12],"manabond":[5,5],"mark_on_hit_support":[-1,13],"meat_shield_support":[12,12],"melee_physical_damage_support":[-1,7],"melee_splash_support":[-1,4],"minefield_support":[-1,13],"minion_damage_support":[4,4],"minion_life_support":[-1,7],"minion_speed_support":[7,7],"multiple_totems_support":[-1,13],"multiple_traps_support":[-1,4],"multistrike_support":[13,13],"orb_of_storms":[3,3],"overcharge_support":[7,7],"physical_to_lightning_support":[-1,6],"pinpoint_support":[12,12],"power_charge_on_critical_support":[-1,7],"power_siphon":[-1,5],"precision":[-1,4],"predator_support":[7,7],"pride":[-1,9],"pulverise_support":[-1,12],"purifying_flame":[-1,1],"purity_of_elements":[9,9],"purity_of_lightning":[-1,9],"pyroclast_mine":[-1,11],"raise_spectre":[11,11],"raise_zombie":[1,1],"reap":[-1,11],"returning_projectiles_support":[-1,13],"righteous_fire":[-1,8],"rolling_magma":[1,1],"sacred_wisps_support":[7,7],"sacrifice_support":[12,12],"sadism_support":[-1,7],"scorching_ray":[5,5],"searing_bond":[-1,5],"second_wind_support":[-1,12],"seismic_trap":[-1,11],"shield_charge":[-1,3],"shock_nova":[-1,11],"shockwave_totem":[-1,11],"sigil_of_power":[14,14],"siphoning_trap":[-1,4],"smoke_mine":[-1,4],"somatic_shell":[11,11],"soul_link":[-1,14],"soulrend":[11,11],"spark":[-1,1],"spell_cascade_support":[2,2],"spell_echo_support":[13,13],"spell_totem_support":[-1,4],"spellblade_support":[-1,13],"spellslinger":[9,9],"spirit_offering":[-1,5],"storm_brand":[-1,5],"storm_call":[-1,5],"stormbind":[11,11],"stormblast_mine":[-1,1],"summon_carrion_golem":[14,14],"summon_chaos_golem":[14,14],"summon_flame_golem":[14,14],"summon_holy_relic":[-1,3],"summon_ice_golem":[14,14],"summon_lightning_golem":[14,14],"summon_phantasm_support":[2,2],"summon_raging_spirit":[3,3],"summon_reaper":[11,11],"summon_skeletons":[4,4],"summon_skitterbots":[-1,8],"summon_stone_golem":[14,14],"swift_affliction_support":[12,12],"swift_assembly_support":[-1,2],"tempest_shield":[-1,8],"temporal_chains":[9,9],"temporal_rift":[-1,14],"trap_and_mine_damage_support":[-1,7],"trap_support":[-1,4],"trinity_support":[7,7],"unbound_ailments_support":[4,4],"unearth":[-1,4],"unleash_support":[13,13],"vitality":[-1,4],"void_manipulation_support":[4,4],"void_sphere":[14,14],"volatile_dead":[5,5],"volley_support":[-1,2],"voltaxic_burst":[-1,5],"vortex":[-1,10],"wall_of_force":[6,6],"wave_of_conviction":[-1,8],"wintertide_brand":[8,5],"wither":[4,4],"withering_step":[-1,4],"wrath":[-1,9],"zealotry":[9,9]},
+  },
+  scion: {
+    steps: [
+      {"act": 1, "questName": "황혼의 해안", "reward": ["spectral_throw", "prismatic_burst_support"], "vendor": [], "rewardTotal": 2, "vendorTotal": 0},
+      {"act": 1, "questName": "눈 앞의 적", "reward": ["molten_strike", "split_arrow", "lightning_tendrils", "splitting_steel"], "vendor": ["lightning_tendrils", "molten_strike", "split_arrow", "fireball", "cleave", "double_strike", "dual_strike", "raise_zombie", "caustic_arrow", "ice_shot", "spark", "viper_strike", "heavy_strike", "burning_arrow", "spectral_throw", "frost_blades", "galvanic_arrow", "blight", "frostbolt", "momentum_support", "explosive_trap", "smite", "purifying_flame", "perforate", "cobra_lash", "stormblast_mine", "kinetic_bolt", "splitting_steel", "shield_crush", "rolling_magma"], "rewardTotal": 6, "vendorTotal": 30, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "자비로운 임무", "reward": ["ruthless_support", "elemental_proliferation_support", "arcane_surge_support", "chance_to_poison_support", "pierce_support", "chance_to_bleed_support", "ancestral_call_support", "spell_cascade_support", "momentum_support", "volley_support", "summon_phantasm_support"], "vendor": ["elemental_proliferation_support", "spell_cascade_support", "summon_phantasm_support", "arcane_surge_support", "ruthless_support", "chance_to_bleed_support", "ancestral_call_support", "pierce_support", "volley_support", "infused_channelling_support", "mirage_archer_support", "swift_assembly_support", "chance_to_poison_support"], "rewardTotal": 17, "vendorTotal": 43, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "로아 알 깨트리기", "reward": ["frost_bomb", "bear_trap", "decoy_totem", "vigilant_strike", "shield_charge", "dash", "frostblink"], "vendor": ["frost_bomb", "vigilant_strike", "decoy_totem", "bear_trap", "frostblink", "dash", "shield_charge", "rejuvenation_totem", "conversion_trap", "devouring_totem", "animate_weapon", "summon_raging_spirit", "orb_of_storms", "contagion", "ancestral_protector", "war_banner", "steelskin", "blood_and_sand", "shrapnel_ballista", "flame_wall", "crushing_fist"], "rewardTotal": 24, "vendorTotal": 64, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "감금된 덩치", "reward": ["faster_attacks_support", "added_cold_damage_support", "added_lightning_damage_support", "added_fire_damage_support", "melee_splash_support", "lesser_multiple_projectiles_support", "unbound_ailments_support", "lifetap_support", "flame_dash", "blink_arrow", "leap_slam", "withering_step"], "vendor": ["clarity", "flame_dash", "leap_slam", "blink_arrow", "precision", "withering_step", "added_lightning_damage_support", "unbound_ailments_support", "added_fire_damage_support", "melee_splash_support", "lesser_multiple_projectiles_support", "added_cold_damage_support", "faster_attacks_support", "vitality", "enduring_cry", "unearth", "additional_accuracy_support", "increased_critical_strikes_support", "knockback_support", "flicker_strike", "stun_support", "trap_support", "lightning_warp", "summon_skeletons", "minion_damage_support", "life_gain_on_hit_support", "spell_totem_support", "blastchain_mine_support", "chance_to_flee_support", "blind_support", "ballista_totem_support", "multiple_traps_support", "wither", "void_manipulation_support", "efficacy_support", "maim_support", "bodyswap", "siphoning_trap", "arrow_nova_support", "intimidating_cry", "lifetap_support", "earthbreaker_support", "devour_support", "flamewood_support", "locus_mine_support"], "rewardTotal": 36, "vendorTotal": 109, "npc": "네사", "cost": "transmutation"},
+      {"act": 1, "questName": "사이렌의 마침곡", "reward": ["static_strike", "rain_of_arrows", "ice_nova", "blade_vortex", "scorching_ray", "storm_burst", "exsanguinate", "spectral_helix"], "vendor": ["ice_nova", "scorching_ray", "storm_burst", "static_strike", "rain_of_arrows", "blade_vortex", "spectral_shield_throw", "lacerate", "elemental_hit", "volatile_dead", "creeping_frost", "ice_spear", "infernal_blow", "lightning_strike", "power_siphon", "icicle_mine", "fire_trap", "incinerate", "lightning_trap", "storm_call", "barrage", "flame_surge", "flesh_offering", "bone_offering", "spirit_offering", "siege_ballista", "essence_drain", "sunder", "toxic_rain", "storm_brand", "shattering_steel", "chain_hook", "venom_gyre", "wintertide_brand", "earthshatter", "blazing_salvo", "exsanguinate", "absolution", "blade_trap", "voltaxic_burst", "manabond", "spectral_helix", "poisonous_concoction", "volcanic_fissure", "kinetic_fusillade"], "rewardTotal": 44, "vendorTotal": 154, "npc": "네사", "cost": "transmutation"},
+      {"act": 2, "questName": "검은 침략자", "reward": ["herald_of_ash", "herald_of_ice", "herald_of_thunder", "frenzy", "arctic_armour", "corrupting_fever"], "vendor": ["herald_of_ash", "herald_of_thunder", "herald_of_ice", "arctic_armour", "frenzy", "molten_shell", "corrupting_fever", "defiance_banner", "forbidden_rite", "physical_to_lightning_support", "glacial_shield_swipe", "divine_retribution", "swordstorm", "eviscerate", "wall_of_force"], "rewardTotal": 50, "vendorTotal": 169, "npc": "예나", "cost": "alteration"},
+      {"act": 2, "questName": "예리하고 잔인한", "reward": ["melee_physical_damage_support", "elemental_damage_with_attacks_support", "faster_casting_support", "concentrated_effect_support", "vicious_projectiles_support", "deadly_ailments_support", "cruelty_support", "sadism_support"], "vendor": ["faster_casting_support", "concentrated_effect_support", "elemental_damage_with_attacks_support", "melee_physical_damage_support", "vicious_projectiles_support", "deadly_ailments_support", "increased_critical_damage_support", "cold_to_fire_support", "minion_speed_support", "minion_life_support", "bloodlust_support", "culling_strike_support", "point_blank_support", "iron_grip_support", "iron_will_support", "damage_on_full_life_support", "power_charge_on_critical_support", "endurance_charge_on_melee_stun_support", "trap_and_mine_damage_support", "controlled_destruction_support", "elemental_focus_support", "close_combat_support", "shockwave_support", "rage_support", "predator_support", "nightblade_support", "trinity_support", "cruelty_support", "sadism_support", "fresh_meat_support", "volatility_support", "sacred_wisps_support", "living_lightning_support", "kinetic_instability_support"], "rewardTotal": 58, "vendorTotal": 203, "npc": "예나", "cost": "alteration"},
+      {"act": 2, "questName": "문제의 근원", "reward": [], "vendor": ["cold_snap", "blood_rage", "righteous_fire", "tempest_shield", "desecrate", "herald_of_agony", "herald_of_purity", "seismic_cry", "brand_recall", "wave_of_conviction", "flesh_and_stone", "summon_skitterbots", "ensnaring_arrow", "arcane_cloak", "blade_blast", "ancestral_cry", "inspiration_support"], "rewardTotal": 58, "vendorTotal": 220, "npc": "예나", "cost": "alteration"},
+      {"act": 3, "questName": "떠나보낸 연인", "reward": ["flammability", "conductivity", "frostbite", "elemental_weakness", "vulnerability", "temporal_chains", "punishment", "anger", "wrath", "hatred", "bane", "malevolence", "zealotry", "petrified_blood"], "vendor": ["flammability", "conductivity", "frostbite", "malevolence", "zealotry", "bane", "anger", "punishment", "vulnerability", "hatred", "wrath", "temporal_chains", "elemental_weakness", "warlords_mark", "enfeeble", "assassins_mark", "despair", "haste", "purity_of_elements", "discipline", "purity_of_fire", "purity_of_ice", "purity_of_lightning", "poachers_mark", "rallying_cry", "infernal_cry", "dread_banner", "pride", "plague_bearer", "spellslinger", "generals_cry", "snipers_mark", "petrified_blood", "energy_blade", "alchemists_mark", "automation", "autoexertion", "vengeful_cry"], "rewardTotal": 72, "vendorTotal": 258, "npc": "클라리사", "cost": "alteration"},
+      {"act": 3, "questName": "오른팔 잘라내기", "reward": ["cyclone", "tornado_shot", "flameblast", "bladefall", "blade_flurry", "charged_dash", "tectonic_slam", "divine_ire", "soulrend", "hexblast", "reap"], "vendor": ["flameblast", "soulrend", "divine_ire", "cyclone", "tectonic_slam", "charged_dash", "tornado_shot", "blade_flurry", "bladefall", "discharge", "raise_spectre", "shock_nova", "dominating_blow", "firestorm", "animate_guardian", "glacial_cascade", "pyroclast_mine", "kinetic_blast", "ice_crash", "ice_trap", "wild_strike", "blast_rain", "earthquake", "vortex", "ancestral_warchief", "dark_pact", "cremation", "flamethrower_trap", "lightning_spire_trap", "seismic_trap", "consecrated_path", "scourge_arrow", "winter_orb", "lancing_steel", "armageddon_brand", "stormbind", "bladestorm", "pestilent_strike", "artillery_ballista", "penance_brand", "crackling_lance", "hexblast", "reap", "rage_vortex", "boneshatter", "battlemages_cry", "storm_rain", "explosive_concoction", "summon_reaper", "eye_of_winter", "kinetic_rain", "thunderstorm", "somatic_shell"], "rewardTotal": 83, "vendorTotal": 311, "npc": "클라리사", "cost": "chance"},
+      {"act": 3, "questName": "운명의 흔적", "reward": ["fire_penetration_support", "cold_penetration_support", "lightning_penetration_support", "life_leech_support", "fortify_support", "ice_bite_support", "innervate_support", "energy_leech_support", "intensify_support", "impending_doom_support", "arrogance_support", "bloodthirst_support"], "vendor": ["fire_penetration_support", "cold_penetration_support", "lightning_penetration_support", "energy_leech_support", "intensify_support", "fortify_support", "life_leech_support", "ice_bite_support", "innervate_support", "faster_projectiles_support", "mana_leech_support", "item_rarity_support", "fork_support", "burning_damage_support", "elemental_army_support", "slower_projectiles_support", "less_duration_support", "generosity_support", "blasphemy_support", "hypothermia_support", "swift_affliction_support", "advanced_traps_support", "charged_traps_support", "charged_mines_support", "impale_support", "pulverise_support", "feeding_frenzy_support", "meat_shield_support", "high-impact_mine_support", "archmage_support", "second_wind_support", "swiftbrand_support", "urgent_orders_support", "pinpoint_support", "impending_doom_support", "bloodthirst_support", "arrogance_support", "focused_ballista_support", "critical_strike_affliction_support", "cursed_ground_support", "controlled_blaze_support", "corrupting_cry_support", "guardians_blessing_support", "sacrifice_support", "expert_retaliation_support", "windburst_support"], "rewardTotal": 95, "vendorTotal": 357, "npc": "시오사", "cost": "chance"},
+      {"act": 4, "questName": "영원한 악몽", "reward": ["spell_echo_support", "multistrike_support", "greater_multiple_projectiles_support", "chain_support", "increased_area_of_effect_support", "decay_support", "immolate_support", "unleash_support", "greater_volley_support", "barrage_support", "returning_projectiles_support", "frigid_bond_support"], "vendor": ["spell_echo_support", "multistrike_support", "greater_multiple_projectiles_support", "chain_support", "increased_area_of_effect_support", "decay_support", "immolate_support", "unleash_support", "greater_volley_support", "barrage_support", "hextouch_support", "cast_on_critical_strike_support", "cast_on_melee_kill_support", "cast_on_death_support", "cast_when_damage_taken_support", "cast_when_stunned_support", "cluster_traps_support", "minefield_support", "cast_while_channelling_support", "ignite_proliferation_support", "vile_toxins_support", "brutality_support", "withering_touch_support", "bonechill_support", "multiple_totems_support", "fist_of_war_support", "arcanist_brand", "behead_support", "eternal_blessing_support", "mark_on_hit_support", "hex_bloom_support", "frigid_bond_support", "returning_projectiles_support", "spellblade_support", "trauma_support", "rupture_support", "overexertion_support"], "rewardTotal": 107, "vendorTotal": 394, "npc": "페타루스와 바냐", "cost": "alchemy"},
+      {"act": 4, "questName": "봉인 해제", "reward": ["summon_chaos_golem", "summon_ice_golem", "summon_flame_golem", "summon_stone_golem", "summon_lightning_golem", "void_sphere", "frost_shield", "soul_link", "flame_link", "intuitive_link"], "vendor": ["summon_chaos_golem", "summon_ice_golem", "summon_flame_golem", "summon_stone_golem", "summon_lightning_golem", "immortal_call", "phase_run", "berserk", "summon_carrion_golem", "void_sphere", "frost_shield", "sigil_of_power", "hydrosphere", "ambush", "temporal_rift", "tornado", "soul_link", "flame_link", "intuitive_link", "protective_link", "vampiric_link", "destructive_link", "frozen_legion"], "rewardTotal": 117, "vendorTotal": 417, "npc": "페타루스와 바냐", "cost": "chance"},
+    ],
+    earliest: {"absolution":[-1,5],"added_cold_damage_support":[4,4],"added_fire_damage_support":[4,4],"added_lightning_damage_support":[4,4],"additional_accuracy_support":[-1,4],"advanced_traps_support":[-1,11],"alchemists_mark":[-1,9],"ambush":[-1,13],"ancestral_call_support":[2,2],"ancestral_cry":[-1,8],"ancestral_protector":[-1,3],"ancestral_warchief":[-1,10],"anger":[9,9],"animate_guardian":[-1,10],"animate_weapon":[-1,3],"arcane_cloak":[-1,8],"arcane_surge_support":[2,2],"arcanist_brand":[-1,12],"archmage_support":[-1,11],"arctic_armour":[6,6],"armageddon_brand":[-1,10],"arrogance_support":[11,11],"arrow_nova_support":[-1,4],"artillery_ballista":[-1,10],"assassins_mark":[-1,9],"autoexertion":[-1,9],"automation":[-1,9],"ballista_totem_support":[-1,4],"bane":[9,9],"barrage":[-1,5],"barrage_support":[12,12],"battlemages_cry":[-1,10],"bear_trap":[3,3],"behead_support":[-1,12],"berserk":[-1,13],"blade_blast":[-1,8],"blade_flurry":[10,10],"blade_trap":[-1,5],"blade_vortex":[5,5],"bladefall":[10,10],"bladestorm":[-1,10],"blasphemy_support":[-1,11],"blast_rain":[-1,10],"blastchain_mine_support":[-1,4],"blazing_salvo":[-1,5],"blight":[-1,1],"blind_support":[-1,4],"blink_arrow":[4,4],"blood_and_sand":[-1,3],"blood_rage":[-1,8],"bloodlust_support":[-1,7],"bloodthirst_support":[11,11],"bodyswap":[-1,4],"bone_offering":[-1,5],"bonechill_support":[-1,12],"boneshatter":[-1,10],"brand_recall":[-1,8],"brutality_support":[-1,12],"burning_arrow":[-1,1],"burning_damage_support":[-1,11],"cast_on_critical_strike_support":[-1,12],"cast_on_death_support":[-1,12],"cast_on_melee_kill_support":[-1,12],"cast_when_damage_taken_support":[-1,12],"cast_when_stunned_support":[-1,12],"cast_while_channelling_support":[-1,12],"caustic_arrow":[-1,1],"chain_hook":[-1,5],"chain_support":[12,12],"chance_to_bleed_support":[2,2],"chance_to_flee_support":[-1,4],"chance_to_poison_support":[2,2],"charged_dash":[10,10],"charged_mines_support":[-1,11],"charged_traps_support":[-1,11],"clarity":[-1,4],"cleave":[-1,1],"close_combat_support":[-1,7],"cluster_traps_support":[-1,12],"cobra_lash":[-1,1],"cold_penetration_support":[11,11],"cold_snap":[-1,8],"cold_to_fire_support":[-1,7],"concentrated_effect_support":[7,7],"conductivity":[9,9],"consecrated_path":[-1,10],"contagion":[-1,3],"controlled_blaze_support":[-1,11],"controlled_destruction_support":[-1,7],"conversion_trap":[-1,3],"corrupting_cry_support":[-1,11],"corrupting_fever":[6,6],"crackling_lance":[-1,10],"creeping_frost":[-1,5],"cremation":[-1,10],"critical_strike_affliction_support":[-1,11],"cruelty_support":[7,7],"crushing_fist":[-1,3],"culling_strike_support":[-1,7],"cursed_ground_support":[-1,11],"cyclone":[10,10],"damage_on_full_life_support":[-1,7],"dark_pact":[-1,10],"dash":[3,3],"deadly_ailments_support":[7,7],"decay_support":[12,12],"decoy_totem":[3,3],"defiance_banner":[-1,6],"desecrate":[-1,8],"despair":[-1,9],"destructive_link":[-1,13],"devour_support":[-1,4],"devouring_totem":[-1,3],"discharge":[-1,10],"discipline":[-1,9],"divine_ire":[10,10],"divine_retribution":[-1,6],"dominating_blow":[-1,10],"double_strike":[-1,1],"dread_banner":[-1,9],"dual_strike":[-1,1],"earthbreaker_support":[-1,4],"earthquake":[-1,10],"earthshatter":[-1,5],"efficacy_support":[-1,4],"elemental_army_support":[-1,11],"elemental_damage_with_attacks_support":[7,7],"elemental_focus_support":[-1,7],"elemental_hit":[-1,5],"elemental_proliferation_support":[2,2],"elemental_weakness":[9,9],"endurance_charge_on_melee_stun_support":[-1,7],"enduring_cry":[-1,4],"energy_blade":[-1,9],"energy_leech_support":[11,11],"enfeeble":[-1,9],"ensnaring_arrow":[-1,8],"essence_drain":[-1,5],"eternal_blessing_support":[-1,12],"eviscerate":[-1,6],"expert_retaliation_support":[-1,11],"explosive_concoction":[-1,10],"explosive_trap":[-1,1],"exsanguinate":[5,5],"eye_of_winter":[-1,10],"faster_attacks_support":[4,4],"faster_casting_support":[7,7],"faster_projectiles_support":[-1,11],"feeding_frenzy_support":[-1,11],"fire_penetration_support":[11,11],"fire_trap":[-1,5],"fireball":[-1,1],"firestorm":[-1,10],"fist_of_war_support":[-1,12],"flame_dash":[4,4],"flame_link":[13,13],"flame_surge":[-1,5],"flame_wall":[-1,3],"flameblast":[10,10],"flamethrower_trap":[-1,10],"flamewood_support":[-1,4],"flammability":[9,9],"flesh_and_stone":[-1,8],"flesh_offering":[-1,5],"flicker_strike":[-1,4],"focused_ballista_support":[-1,11],"forbidden_rite":[-1,6],"fork_support":[-1,11],"fortify_support":[11,11],"frenzy":[6,6],"fresh_meat_support":[-1,7],"frigid_bond_support":[12,12],"frost_blades":[-1,1],"frost_bomb":[3,3],"frost_shield":[13,13],"frostbite":[9,9],"frostblink":[3,3],"frostbolt":[-1,1],"frozen_legion":[-1,13],"galvanic_arrow":[-1,1],"generals_cry":[-1,9],"generosity_support":[-1,11],"glacial_cascade":[-1,10],"glacial_shield_swipe":[-1,6],"greater_multiple_projectiles_support":[12,12],"greater_volley_support":[12,12],"guardians_blessing_support":[-1,11],"haste":[-1,9],"hatred":[9,9],"heavy_strike":[-1,1],"herald_of_agony":[-1,8],"herald_of_ash":[6,6],"herald_of_ice":[6,6],"herald_of_purity":[-1,8],"herald_of_thunder":[6,6],"hex_bloom_support":[-1,12],"hexblast":[10,10],"hextouch_support":[-1,12],"high-impact_mine_support":[-1,11],"hydrosphere":[-1,13],"hypothermia_support":[-1,11],"ice_bite_support":[11,11],"ice_crash":[-1,10],"ice_nova":[5,5],"ice_shot":[-1,1],"ice_spear":[-1,5],"ice_trap":[-1,10],"icicle_mine":[-1,5],"ignite_proliferation_support":[-1,12],"immolate_support":[12,12],"immortal_call":[-1,13],"impale_support":[-1,11],"impending_doom_support":[11,11],"incinerate":[-1,5],"increased_area_of_effect_support":[12,12],"increased_critical_damage_support":[-1,7],"increased_critical_strikes_support":[-1,4],"infernal_blow":[-1,5],"infernal_cry":[-1,9],"infused_channelling_support":[-1,2],"innervate_support":[11,11],"inspiration_support":[-1,8],"intensify_support":[11,11],"intimidating_cry":[-1,4],"intuitive_link":[13,13],"iron_grip_support":[-1,7],"iron_will_support":[-1,7],"item_rarity_support":[-1,11],"kinetic_blast":[-1,10],"kinetic_bolt":[-1,1],"kinetic_fusillade":[-1,5],"kinetic_instability_support":[-1,7],"kinetic_rain":[-1,10],"knockback_support":[-1,4],"lacerate":[-1,5],"lancing_steel":[-1,10],"leap_slam":[4,4],"less_duration_support":[-1,11],"lesser_multiple_projectiles_support":[4,4],"life_gain_on_hit_support":[-1,4],"life_leech_support":[11,11],"lifetap_support":[4,4],"lightning_penetration_support":[11,11],"lightning_spire_trap":[-1,10],"lightning_strike":[-1,5],"lightning_tendrils":[1,1],"lightning_trap":[-1,5],"lightning_warp":[-1,4],"living_lightning_support":[-1,7],"locus_mine_support":[-1,4],"maim_support":[-1,4],"malevolence":[9,9],"mana_leech_support":[-1,11],"manabond":[-1,5],"mark_on_hit_support":[-1,12],"meat_shield_support":[-1,11],"melee_physical_damage_support":[7,7],"melee_splash_support":[4,4],"minefield_support":[-1,12],"minion_damage_support":[-1,4],"minion_life_support":[-1,7],"minion_speed_support":[-1,7],"mirage_archer_support":[-1,2],"molten_shell":[-1,6],"molten_strike":[1,1],"momentum_support":[2,1],"multiple_totems_support":[-1,12],"multiple_traps_support":[-1,4],"multistrike_support":[12,12],"nightblade_support":[-1,7],"orb_of_storms":[-1,3],"overexertion_support":[-1,12],"penance_brand":[-1,10],"perforate":[-1,1],"pestilent_strike":[-1,10],"petrified_blood":[9,9],"phase_run":[-1,13],"physical_to_lightning_support":[-1,6],"pierce_support":[2,2],"pinpoint_support":[-1,11],"plague_bearer":[-1,9],"poachers_mark":[-1,9],"point_blank_support":[-1,7],"poisonous_concoction":[-1,5],"power_charge_on_critical_support":[-1,7],"power_siphon":[-1,5],"precision":[-1,4],"predator_support":[-1,7],"pride":[-1,9],"prismatic_burst_support":[0,-1],"protective_link":[-1,13],"pulverise_support":[-1,11],"punishment":[9,9],"purifying_flame":[-1,1],"purity_of_elements":[-1,9],"purity_of_fire":[-1,9],"purity_of_ice":[-1,9],"purity_of_lightning":[-1,9],"pyroclast_mine":[-1,10],"rage_support":[-1,7],"rage_vortex":[-1,10],"rain_of_arrows":[5,5],"raise_spectre":[-1,10],"raise_zombie":[-1,1],"rallying_cry":[-1,9],"reap":[10,10],"rejuvenation_totem":[-1,3],"returning_projectiles_support":[12,12],"righteous_fire":[-1,8],"rolling_magma":[-1,1],"rupture_support":[-1,12],"ruthless_support":[2,2],"sacred_wisps_support":[-1,7],"sacrifice_support":[-1,11],"sadism_support":[7,7],"scorching_ray":[5,5],"scourge_arrow":[-1,10],"second_wind_support":[-1,11],"seismic_cry":[-1,8],"seismic_trap":[-1,10],"shattering_steel":[-1,5],"shield_charge":[3,3],"shield_crush":[-1,1],"shock_nova":[-1,10],"shockwave_support":[-1,7],"shrapnel_ballista":[-1,3],"siege_ballista":[-1,5],"sigil_of_power":[-1,13],"siphoning_trap":[-1,4],"slower_projectiles_support":[-1,11],"smite":[-1,1],"snipers_mark":[-1,9],"somatic_shell":[-1,10],"soul_link":[13,13],"soulrend":[10,10],"spark":[-1,1],"spectral_helix":[5,5],"spectral_shield_throw":[-1,5],"spectral_throw":[0,1],"spell_cascade_support":[2,2],"spell_echo_support":[12,12],"spell_totem_support":[-1,4],"spellblade_support":[-1,12],"spellslinger":[-1,9],"spirit_offering":[-1,5],"split_arrow":[1,1],"splitting_steel":[1,1],"static_strike":[5,5],"steelskin":[-1,3],"storm_brand":[-1,5],"storm_burst":[5,5],"storm_call":[-1,5],"storm_rain":[-1,10],"stormbind":[-1,10],"stormblast_mine":[-1,1],"stun_support":[-1,4],"summon_carrion_golem":[-1,13],"summon_chaos_golem":[13,13],"summon_flame_golem":[13,13],"summon_ice_golem":[13,13],"summon_lightning_golem":[13,13],"summon_phantasm_support":[2,2],"summon_raging_spirit":[-1,3],"summon_reaper":[-1,10],"summon_skeletons":[-1,4],"summon_skitterbots":[-1,8],"summon_stone_golem":[13,13],"sunder":[-1,5],"swift_affliction_support":[-1,11],"swift_assembly_support":[-1,2],"swiftbrand_support":[-1,11],"swordstorm":[-1,6],"tectonic_slam":[10,10],"tempest_shield":[-1,8],"temporal_chains":[9,9],"temporal_rift":[-1,13],"thunderstorm":[-1,10],"tornado":[-1,13],"tornado_shot":[10,10],"toxic_rain":[-1,5],"trap_and_mine_damage_support":[-1,7],"trap_support":[-1,4],"trauma_support":[-1,12],"trinity_support":[-1,7],"unbound_ailments_support":[4,4],"unearth":[-1,4],"unleash_support":[12,12],"urgent_orders_support":[-1,11],"vampiric_link":[-1,13],"vengeful_cry":[-1,9],"venom_gyre":[-1,5],"vicious_projectiles_support":[7,7],"vigilant_strike":[3,3],"vile_toxins_support":[-1,12],"viper_strike":[-1,1],"vitality":[-1,4],"void_manipulation_support":[-1,4],"void_sphere":[13,13],"volatile_dead":[-1,5],"volatility_support":[-1,7],"volcanic_fissure":[-1,5],"volley_support":[2,2],"voltaxic_burst":[-1,5],"vortex":[-1,10],"vulnerability":[9,9],"wall_of_force":[-1,6],"war_banner":[-1,3],"warlords_mark":[-1,9],"wave_of_conviction":[-1,8],"wild_strike":[-1,10],"windburst_support":[-1,11],"winter_orb":[-1,10],"wintertide_brand":[-1,5],"wither":[-1,4],"withering_step":[4,4],"withering_touch_support":[-1,12],"wrath":[9,9],"zealotry":[9,9]},
+  },
+  ranger: {
+    steps: [
+      {"act": 1, "questName": "황혼의 해안", "reward": ["burning_arrow", "momentum_support"], "vendor": [], "rewardTotal": 2, "vendorTotal": 0},
+      {"act": 1, "questName": "눈 앞의 적", "reward": ["split_arrow", "ice_shot", "frost_blades", "galvanic_arrow", "caustic_arrow"], "vendor": ["galvanic_arrow", "split_arrow", "ice_shot", "frost_blades", "caustic_arrow", "cleave", "double_strike", "dual_strike", "viper_strike", "burning_arrow", "spectral_throw", "momentum_support", "explosive_trap", "perforate", "cobra_lash", "kinetic_bolt", "splitting_steel"], "rewardTotal": 7, "vendorTotal": 17, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "자비로운 임무", "reward": ["pierce_support", "chance_to_poison_support", "mirage_archer_support", "volley_support"], "vendor": ["pierce_support", "volley_support", "mirage_archer_support", "chance_to_bleed_support", "ancestral_call_support", "swift_assembly_support", "chance_to_poison_support"], "rewardTotal": 11, "vendorTotal": 24, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "로아 알 깨트리기", "reward": ["snipers_mark", "bear_trap", "puncture", "shrapnel_ballista", "dash"], "vendor": ["puncture", "bear_trap", "shrapnel_ballista", "dash", "shield_charge", "detonate_dead", "glacial_shield_swipe", "conversion_trap", "decoy_totem", "devouring_totem", "vigilant_strike", "war_banner", "blood_and_sand", "frostblink", "snipers_mark"], "rewardTotal": 16, "vendorTotal": 39, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "감금된 덩치", "reward": ["faster_attacks_support", "lesser_multiple_projectiles_support", "added_cold_damage_support", "melee_splash_support", "void_manipulation_support", "arrow_nova_support", "manaforged_arrows_support", "whirling_blades", "blink_arrow", "smoke_mine", "precision"], "vendor": ["blink_arrow", "whirling_blades", "precision", "smoke_mine", "void_manipulation_support", "melee_splash_support", "lesser_multiple_projectiles_support", "added_cold_damage_support", "arrow_nova_support", "faster_attacks_support", "leap_slam", "unearth", "added_fire_damage_support", "additional_accuracy_support", "increased_critical_strikes_support", "flicker_strike", "trap_support", "vitality", "clarity", "blastchain_mine_support", "chance_to_flee_support", "blind_support", "ballista_totem_support", "multiple_traps_support", "maim_support", "bodyswap", "withering_step", "mirror_arrow", "manaforged_arrows_support", "locus_mine_support"], "rewardTotal": 27, "vendorTotal": 69, "npc": "네사", "cost": "transmutation"},
+      {"act": 1, "questName": "사이렌의 마침곡", "reward": ["toxic_rain", "rain_of_arrows", "lightning_arrow", "reave", "lightning_strike", "siege_ballista", "elemental_hit", "poisonous_concoction"], "vendor": ["rain_of_arrows", "toxic_rain", "lightning_arrow", "reave", "lightning_strike", "siege_ballista", "elemental_hit", "spectral_shield_throw", "lacerate", "volatile_dead", "static_strike", "infernal_blow", "fire_trap", "lightning_trap", "barrage", "blade_vortex", "shattering_steel", "venom_gyre", "blade_trap", "spectral_helix", "poisonous_concoction"], "rewardTotal": 35, "vendorTotal": 90, "npc": "네사", "cost": "transmutation"},
+      {"act": 2, "questName": "검은 침략자", "reward": ["poachers_mark", "herald_of_agony", "herald_of_ice", "herald_of_thunder", "herald_of_ash", "frenzy", "arctic_armour", "blood_rage", "ensnaring_arrow"], "vendor": ["herald_of_ash", "herald_of_thunder", "herald_of_ice", "arctic_armour", "frenzy", "blood_rage", "herald_of_agony", "ensnaring_arrow", "poachers_mark", "physical_to_lightning_support"], "rewardTotal": 44, "vendorTotal": 100, "npc": "예나", "cost": "alteration"},
+      {"act": 2, "questName": "예리하고 잔인한", "reward": ["vicious_projectiles_support", "elemental_damage_with_attacks_support", "close_combat_support", "trinity_support"], "vendor": ["elemental_damage_with_attacks_support", "close_combat_support", "vicious_projectiles_support", "increased_critical_damage_support", "melee_physical_damage_support", "bloodlust_support", "culling_strike_support", "point_blank_support", "iron_grip_support", "power_charge_on_critical_support", "trap_and_mine_damage_support", "deadly_ailments_support", "rage_support", "nightblade_support", "trinity_support", "overcharge_support", "sadism_support", "sacred_wisps_support"], "rewardTotal": 48, "vendorTotal": 118, "npc": "예나", "cost": "alteration"},
+      {"act": 2, "questName": "문제의 근원", "reward": [], "vendor": ["cold_snap", "desecrate", "summon_skitterbots", "blade_blast", "damage_on_full_life_support", "inspiration_support"], "rewardTotal": 48, "vendorTotal": 124, "npc": "예나", "cost": "alteration"},
+      {"act": 3, "questName": "떠나보낸 연인", "reward": ["hatred", "grace", "despair", "alchemists_mark"], "vendor": ["despair", "hatred", "grace", "temporal_chains", "warlords_mark", "assassins_mark", "haste", "purity_of_elements", "anger", "wrath", "frostbite", "purity_of_ice", "dread_banner", "pride", "plague_bearer", "alchemists_mark", "automation"], "rewardTotal": 52, "vendorTotal": 141, "npc": "클라리사", "cost": "alteration"},
+      {"act": 3, "questName": "빅타리오의 비밀", "reward": [], "vendor": ["vaal_lightning_arrow"], "rewardTotal": 52, "vendorTotal": 142, "npc": "???", "cost": "???"},
+      {"act": 3, "questName": "오른팔 잘라내기", "reward": ["scourge_arrow", "conflagration", "thunderstorm", "tornado_shot", "blast_rain", "wild_strike", "blade_flurry", "charged_dash", "artillery_ballista", "storm_rain", "explosive_concoction"], "vendor": ["blast_rain", "charged_dash", "scourge_arrow", "tornado_shot", "wild_strike", "blade_flurry", "artillery_ballista", "discharge", "explosive_arrow", "cyclone", "animate_guardian", "ice_crash", "bladefall", "cremation", "lancing_steel", "pestilent_strike", "storm_rain", "explosive_concoction", "thunderstorm", "conflagration"], "rewardTotal": 63, "vendorTotal": 162, "npc": "클라리사", "cost": "chance"},
+      {"act": 3, "questName": "운명의 흔적", "reward": ["life_leech_support", "fork_support", "fortify_support", "hypothermia_support", "ice_bite_support", "critical_strike_affliction_support", "impale_support", "windburst_support", "second_wind_support", "focused_ballista_support"], "vendor": ["fortify_support", "life_leech_support", "impale_support", "hypothermia_support", "fork_support", "ice_bite_support", "second_wind_support", "faster_projectiles_support", "mana_leech_support", "cold_penetration_support", "slower_projectiles_support", "blasphemy_support", "innervate_support", "swift_affliction_support", "advanced_traps_support", "pulverise_support", "focused_ballista_support", "critical_strike_affliction_support", "spell_totem_support", "windburst_support"], "rewardTotal": 73, "vendorTotal": 182, "npc": "시오사", "cost": "chance"},
+      {"act": 4, "questName": "영원한 악몽", "reward": ["spell_echo_support", "multistrike_support", "greater_multiple_projectiles_support", "chain_support", "increased_area_of_effect_support", "withering_touch_support", "greater_volley_support", "barrage_support", "returning_projectiles_support", "rupture_support"], "vendor": ["spell_echo_support", "multistrike_support", "greater_multiple_projectiles_support", "chain_support", "increased_area_of_effect_support", "greater_volley_support", "barrage_support", "withering_touch_support", "hextouch_support", "cast_on_critical_strike_support", "cast_on_melee_kill_support", "cast_on_death_support", "cast_when_damage_taken_support", "cast_when_stunned_support", "cluster_traps_support", "cast_while_channelling_support", "vile_toxins_support", "multiple_totems_support", "eternal_blessing_support", "mark_on_hit_support", "returning_projectiles_support", "rupture_support"], "rewardTotal": 83, "vendorTotal": 204, "npc": "페타루스와 바냐", "cost": "alchemy"},
+      {"act": 4, "questName": "봉인 해제", "reward": ["summon_chaos_golem", "summon_ice_golem", "summon_flame_golem", "summon_stone_golem", "summon_lightning_golem", "tornado", "snipe"], "vendor": ["summon_chaos_golem", "summon_ice_golem", "summon_flame_golem", "summon_stone_golem", "summon_lightning_golem", "phase_run", "summon_carrion_golem", "ambush", "temporal_rift", "tornado", "intuitive_link", "vampiric_link", "snipe"], "rewardTotal": 90, "vendorTotal": 217, "npc": "페타루스와 바냐", "cost": "chance"},
+    ],
+    earliest: {"added_cold_damage_support":[4,4],"added_fire_damage_support":[-1,4],"additional_accuracy_support":[-1,4],"advanced_traps_support":[-1,12],"alchemists_mark":[9,9],"ambush":[-1,14],"ancestral_call_support":[-1,2],"anger":[-1,9],"animate_guardian":[-1,11],"arctic_armour":[6,6],"arrow_nova_support":[4,4],"artillery_ballista":[11,11],"assassins_mark":[-1,9],"automation":[-1,9],"ballista_totem_support":[-1,4],"barrage":[-1,5],"barrage_support":[13,13],"bear_trap":[3,3],"blade_blast":[-1,8],"blade_flurry":[11,11],"blade_trap":[-1,5],"blade_vortex":[-1,5],"bladefall":[-1,11],"blasphemy_support":[-1,12],"blast_rain":[11,11],"blastchain_mine_support":[-1,4],"blind_support":[-1,4],"blink_arrow":[4,4],"blood_and_sand":[-1,3],"blood_rage":[6,6],"bloodlust_support":[-1,7],"bodyswap":[-1,4],"burning_arrow":[0,1],"cast_on_critical_strike_support":[-1,13],"cast_on_death_support":[-1,13],"cast_on_melee_kill_support":[-1,13],"cast_when_damage_taken_support":[-1,13],"cast_when_stunned_support":[-1,13],"cast_while_channelling_support":[-1,13],"caustic_arrow":[1,1],"chain_support":[13,13],"chance_to_bleed_support":[-1,2],"chance_to_flee_support":[-1,4],"chance_to_poison_support":[2,2],"charged_dash":[11,11],"clarity":[-1,4],"cleave":[-1,1],"close_combat_support":[7,7],"cluster_traps_support":[-1,13],"cobra_lash":[-1,1],"cold_penetration_support":[-1,12],"cold_snap":[-1,8],"conflagration":[11,11],"conversion_trap":[-1,3],"cremation":[-1,11],"critical_strike_affliction_support":[12,12],"culling_strike_support":[-1,7],"cyclone":[-1,11],"damage_on_full_life_support":[-1,8],"dash":[3,3],"deadly_ailments_support":[-1,7],"decoy_totem":[-1,3],"desecrate":[-1,8],"despair":[9,9],"detonate_dead":[-1,3],"devouring_totem":[-1,3],"discharge":[-1,11],"double_strike":[-1,1],"dread_banner":[-1,9],"dual_strike":[-1,1],"elemental_damage_with_attacks_support":[7,7],"elemental_hit":[5,5],"ensnaring_arrow":[6,6],"eternal_blessing_support":[-1,13],"explosive_arrow":[-1,11],"explosive_concoction":[11,11],"explosive_trap":[-1,1],"faster_attacks_support":[4,4],"faster_projectiles_support":[-1,12],"fire_trap":[-1,5],"flicker_strike":[-1,4],"focused_ballista_support":[12,12],"fork_support":[12,12],"fortify_support":[12,12],"frenzy":[6,6],"frost_blades":[1,1],"frostbite":[-1,9],"frostblink":[-1,3],"galvanic_arrow":[1,1],"glacial_shield_swipe":[-1,3],"grace":[9,9],"greater_multiple_projectiles_support":[13,13],"greater_volley_support":[13,13],"haste":[-1,9],"hatred":[9,9],"herald_of_agony":[6,6],"herald_of_ash":[6,6],"herald_of_ice":[6,6],"herald_of_thunder":[6,6],"hextouch_support":[-1,13],"hypothermia_support":[12,12],"ice_bite_support":[12,12],"ice_crash":[-1,11],"ice_shot":[1,1],"impale_support":[12,12],"increased_area_of_effect_support":[13,13],"increased_critical_damage_support":[-1,7],"increased_critical_strikes_support":[-1,4],"infernal_blow":[-1,5],"innervate_support":[-1,12],"inspiration_support":[-1,8],"intuitive_link":[-1,14],"iron_grip_support":[-1,7],"kinetic_bolt":[-1,1],"lacerate":[-1,5],"lancing_steel":[-1,11],"leap_slam":[-1,4],"lesser_multiple_projectiles_support":[4,4],"life_leech_support":[12,12],"lightning_arrow":[5,5],"lightning_strike":[5,5],"lightning_trap":[-1,5],"locus_mine_support":[-1,4],"maim_support":[-1,4],"mana_leech_support":[-1,12],"manaforged_arrows_support":[4,4],"mark_on_hit_support":[-1,13],"melee_physical_damage_support":[-1,7],"melee_splash_support":[4,4],"mirage_archer_support":[2,2],"mirror_arrow":[-1,4],"momentum_support":[0,1],"multiple_totems_support":[-1,13],"multiple_traps_support":[-1,4],"multistrike_support":[13,13],"nightblade_support":[-1,7],"overcharge_support":[-1,7],"perforate":[-1,1],"pestilent_strike":[-1,11],"phase_run":[-1,14],"physical_to_lightning_support":[-1,6],"pierce_support":[2,2],"plague_bearer":[-1,9],"poachers_mark":[6,6],"point_blank_support":[-1,7],"poisonous_concoction":[5,5],"power_charge_on_critical_support":[-1,7],"precision":[4,4],"pride":[-1,9],"pulverise_support":[-1,12],"puncture":[3,3],"purity_of_elements":[-1,9],"purity_of_ice":[-1,9],"rage_support":[-1,7],"rain_of_arrows":[5,5],"reave":[5,5],"returning_projectiles_support":[13,13],"rupture_support":[13,13],"sacred_wisps_support":[-1,7],"sadism_support":[-1,7],"scourge_arrow":[11,11],"second_wind_support":[12,12],"shattering_steel":[-1,5],"shield_charge":[-1,3],"shrapnel_ballista":[3,3],"siege_ballista":[5,5],"slower_projectiles_support":[-1,12],"smoke_mine":[4,4],"snipe":[14,14],"snipers_mark":[3,3],"spectral_helix":[-1,5],"spectral_shield_throw":[-1,5],"spectral_throw":[-1,1],"spell_echo_support":[13,13],"spell_totem_support":[-1,12],"split_arrow":[1,1],"splitting_steel":[-1,1],"static_strike":[-1,5],"storm_rain":[11,11],"summon_carrion_golem":[-1,14],"summon_chaos_golem":[14,14],"summon_flame_golem":[14,14],"summon_ice_golem":[14,14],"summon_lightning_golem":[14,14],"summon_skitterbots":[-1,8],"summon_stone_golem":[14,14],"swift_affliction_support":[-1,12],"swift_assembly_support":[-1,2],"temporal_chains":[-1,9],"temporal_rift":[-1,14],"thunderstorm":[11,11],"tornado":[14,14],"tornado_shot":[11,11],"toxic_rain":[5,5],"trap_and_mine_damage_support":[-1,7],"trap_support":[-1,4],"trinity_support":[7,7],"unearth":[-1,4],"vaal_lightning_arrow":[-1,10],"vampiric_link":[-1,14],"venom_gyre":[-1,5],"vicious_projectiles_support":[7,7],"vigilant_strike":[-1,3],"vile_toxins_support":[-1,13],"viper_strike":[-1,1],"vitality":[-1,4],"void_manipulation_support":[4,4],"volatile_dead":[-1,5],"volley_support":[2,2],"war_banner":[-1,3],"warlords_mark":[-1,9],"whirling_blades":[4,4],"wild_strike":[11,11],"windburst_support":[12,12],"withering_step":[-1,4],"withering_touch_support":[13,13],"wrath":[-1,9]},
+  },
+  duelist: {
+    steps: [
+      {"act": 1, "questName": "황혼의 해안", "reward": ["double_strike", "chance_to_bleed_support"], "vendor": [], "rewardTotal": 2, "vendorTotal": 0},
+      {"act": 1, "questName": "눈 앞의 적", "reward": ["cleave", "molten_strike", "galvanic_arrow", "perforate", "splitting_steel"], "vendor": ["molten_strike", "cleave", "galvanic_arrow", "perforate", "ground_slam", "double_strike", "dual_strike", "caustic_arrow", "ice_shot", "split_arrow", "glacial_hammer", "viper_strike", "heavy_strike", "burning_arrow", "spectral_throw", "frost_blades", "chance_to_bleed_support", "splitting_steel", "shield_crush"], "rewardTotal": 7, "vendorTotal": 19, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "자비로운 임무", "reward": ["ruthless_support", "chance_to_poison_support", "pierce_support", "momentum_support", "volley_support", "mirage_archer_support", "ancestral_call_support"], "vendor": ["ruthless_support", "ancestral_call_support", "pierce_support", "volley_support", "mirage_archer_support", "momentum_support", "swift_assembly_support", "chance_to_poison_support"], "rewardTotal": 14, "vendorTotal": 27, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "로아 알 깨트리기", "reward": ["snipers_mark", "decoy_totem", "puncture", "vigilant_strike", "war_banner", "blood_and_sand", "crushing_fist", "shield_charge", "dash"], "vendor": ["ancestral_protector", "vigilant_strike", "decoy_totem", "puncture", "war_banner", "blood_and_sand", "dash", "shield_charge", "crushing_fist", "frost_wall", "glacial_shield_swipe", "swordstorm", "rejuvenation_totem", "devouring_totem", "steelskin", "frostblink", "shrapnel_ballista", "snipers_mark"], "rewardTotal": 23, "vendorTotal": 45, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "감금된 덩치", "reward": ["faster_attacks_support", "added_fire_damage_support", "melee_splash_support", "lesser_multiple_projectiles_support", "maim_support", "lifetap_support", "blink_arrow", "leap_slam", "whirling_blades", "precision", "vitality", "enduring_cry", "intimidating_cry"], "vendor": ["leap_slam", "enduring_cry", "intimidating_cry", "blink_arrow", "whirling_blades", "precision", "added_fire_damage_support", "melee_splash_support", "lesser_multiple_projectiles_support", "maim_support", "faster_attacks_support", "vitality", "additional_accuracy_support", "knockback_support", "flicker_strike", "stun_support", "trap_support", "life_gain_on_hit_support", "clarity", "chance_to_flee_support", "blind_support", "ballista_totem_support", "smoke_mine", "withering_step", "arrow_nova_support", "lifetap_support", "earthbreaker_support"], "rewardTotal": 36, "vendorTotal": 72, "npc": "네사", "cost": "transmutation"},
+      {"act": 1, "questName": "사이렌의 마침곡", "reward": ["lacerate", "sweep", "rain_of_arrows", "shattering_steel", "earthshatter"], "vendor": ["sweep", "earthshatter", "lacerate", "rain_of_arrows", "shattering_steel", "elemental_hit", "static_strike", "infernal_blow", "lightning_strike", "lightning_arrow", "reave", "barrage", "siege_ballista", "sunder", "toxic_rain", "chain_hook", "spectral_helix", "poisonous_concoction", "volcanic_fissure"], "rewardTotal": 41, "vendorTotal": 91, "npc": "네사", "cost": "transmutation"},
+      {"act": 2, "questName": "검은 침략자", "reward": ["poachers_mark", "warlords_mark", "herald_of_ash", "herald_of_ice", "frenzy", "herald_of_thunder", "flesh_and_stone", "blood_rage", "ancestral_cry", "seismic_cry", "corrupting_fever", "defiance_banner", "eviscerate", "swordstorm", "glacial_shield_swipe"], "vendor": ["herald_of_ash", "herald_of_thunder", "herald_of_ice", "ancestral_cry", "seismic_cry", "frenzy", "flesh_and_stone", "blood_rage", "warlords_mark", "poachers_mark", "molten_shell", "corrupting_fever", "defiance_banner", "vaal_double_strike", "eviscerate"], "rewardTotal": 56, "vendorTotal": 106, "npc": "예나", "cost": "alteration"},
+      {"act": 2, "questName": "예리하고 잔인한", "reward": ["melee_physical_damage_support", "elemental_damage_with_attacks_support", "vicious_projectiles_support", "close_combat_support", "rage_support", "cruelty_support", "sadism_support"], "vendor": ["elemental_damage_with_attacks_support", "melee_physical_damage_support", "close_combat_support", "rage_support", "vicious_projectiles_support", "bloodlust_support", "culling_strike_support", "point_blank_support", "iron_grip_support", "iron_will_support", "damage_on_full_life_support", "endurance_charge_on_melee_stun_support", "physical_to_lightning_support", "deadly_ailments_support", "shockwave_support", "trinity_support", "cruelty_support", "sadism_support", "volatility_support"], "rewardTotal": 63, "vendorTotal": 125, "npc": "예나", "cost": "alteration"},
+      {"act": 2, "questName": "문제의 근원", "reward": [], "vendor": ["tempest_shield", "arctic_armour", "herald_of_agony", "herald_of_purity", "plague_bearer", "ensnaring_arrow"], "rewardTotal": 63, "vendorTotal": 131, "npc": "예나", "cost": "alteration"},
+      {"act": 3, "questName": "떠나보낸 연인", "reward": ["hatred", "grace", "dread_banner", "pride", "rallying_cry", "petrified_blood"], "vendor": ["pride", "hatred", "grace", "dread_banner", "rallying_cry", "punishment", "assassins_mark", "haste", "purity_of_elements", "determination", "anger", "purity_of_fire", "purity_of_ice", "infernal_cry", "vulnerability", "generals_cry", "petrified_blood", "automation", "autoexertion", "vengeful_cry"], "rewardTotal": 69, "vendorTotal": 151, "npc": "클라리사", "cost": "alteration"},
+      {"act": 3, "questName": "오른팔 잘라내기", "reward": ["cyclone", "ice_crash", "blast_rain", "thunderstorm", "charged_dash", "lancing_steel", "bladestorm", "spectral_shield_throw"], "vendor": ["ice_crash", "cyclone", "blast_rain", "charged_dash", "lancing_steel", "bladestorm", "blade_flurry", "discharge", "explosive_arrow", "dominating_blow", "animate_guardian", "tornado_shot", "earthquake", "ancestral_warchief", "tectonic_slam", "scourge_arrow", "artillery_ballista", "rage_vortex", "boneshatter", "battlemages_cry", "storm_rain", "explosive_concoction", "spectral_shield_throw", "thunderstorm"], "rewardTotal": 77, "vendorTotal": 175, "npc": "클라리사", "cost": "chance"},
+      {"act": 3, "questName": "운명의 흔적", "reward": ["life_leech_support", "fortify_support", "arrogance_support", "hypothermia_support", "pulverise_support", "impale_support", "windburst_support", "urgent_orders_support", "bloodthirst_support", "corrupting_cry_support", "expert_retaliation_support"], "vendor": ["fortify_support", "pulverise_support", "life_leech_support", "impale_support", "urgent_orders_support", "hypothermia_support", "inspiration_support", "mana_leech_support", "more_duration_support", "fork_support", "slower_projectiles_support", "less_duration_support", "blasphemy_support", "ice_bite_support", "second_wind_support", "bloodthirst_support", "arrogance_support", "focused_ballista_support", "added_chaos_damage_support", "corrupting_cry_support", "controlled_blaze_support", "expert_retaliation_support", "windburst_support"], "rewardTotal": 88, "vendorTotal": 198, "npc": "시오사", "cost": "chance"},
+      {"act": 4, "questName": "영원한 악몽", "reward": ["spell_echo_support", "multistrike_support", "greater_multiple_projectiles_support", "chain_support", "increased_area_of_effect_support", "greater_volley_support", "barrage_support", "fist_of_war_support", "behead_support", "trauma_support"], "vendor": ["spell_echo_support", "multistrike_support", "greater_multiple_projectiles_support", "chain_support", "increased_area_of_effect_support", "fist_of_war_support", "greater_volley_support", "barrage_support", "hextouch_support", "cast_on_critical_strike_support", "cast_on_melee_kill_support", "cast_on_death_support", "cast_when_damage_taken_support", "cast_when_stunned_support", "cast_while_channelling_support", "brutality_support", "withering_touch_support", "multiple_totems_support", "behead_support", "eternal_blessing_support", "mark_on_hit_support", "trauma_support", "returning_projectiles_support", "rupture_support", "overexertion_support"], "rewardTotal": 98, "vendorTotal": 223, "npc": "페타루스와 바냐", "cost": "alchemy"},
+      {"act": 4, "questName": "봉인 해제", "reward": ["summon_chaos_golem", "summon_ice_golem", "summon_flame_golem", "summon_stone_golem", "summon_lightning_golem"], "vendor": ["summon_chaos_golem", "summon_ice_golem", "summon_flame_golem", "summon_stone_golem", "summon_lightning_golem", "immortal_call", "phase_run", "berserk", "ambush", "flame_link", "intuitive_link", "vampiric_link", "frozen_legion"], "rewardTotal": 103, "vendorTotal": 236, "npc": "페타루스와 바냐", "cost": "chance"},
+    ],
+    earliest: {"added_chaos_damage_support":[-1,11],"added_fire_damage_support":[4,4],"additional_accuracy_support":[-1,4],"ambush":[-1,13],"ancestral_call_support":[2,2],"ancestral_cry":[6,6],"ancestral_protector":[-1,3],"ancestral_warchief":[-1,10],"anger":[-1,9],"animate_guardian":[-1,10],"arctic_armour":[-1,8],"arrogance_support":[11,11],"arrow_nova_support":[-1,4],"artillery_ballista":[-1,10],"assassins_mark":[-1,9],"autoexertion":[-1,9],"automation":[-1,9],"ballista_totem_support":[-1,4],"barrage":[-1,5],"barrage_support":[12,12],"battlemages_cry":[-1,10],"behead_support":[12,12],"berserk":[-1,13],"blade_flurry":[-1,10],"bladestorm":[10,10],"blasphemy_support":[-1,11],"blast_rain":[10,10],"blind_support":[-1,4],"blink_arrow":[4,4],"blood_and_sand":[3,3],"blood_rage":[6,6],"bloodlust_support":[-1,7],"bloodthirst_support":[11,11],"boneshatter":[-1,10],"brutality_support":[-1,12],"burning_arrow":[-1,1],"cast_on_critical_strike_support":[-1,12],"cast_on_death_support":[-1,12],"cast_on_melee_kill_support":[-1,12],"cast_when_damage_taken_support":[-1,12],"cast_when_stunned_support":[-1,12],"cast_while_channelling_support":[-1,12],"caustic_arrow":[-1,1],"chain_hook":[-1,5],"chain_support":[12,12],"chance_to_bleed_support":[0,1],"chance_to_flee_support":[-1,4],"chance_to_poison_support":[2,2],"charged_dash":[10,10],"clarity":[-1,4],"cleave":[1,1],"close_combat_support":[7,7],"controlled_blaze_support":[-1,11],"corrupting_cry_support":[11,11],"corrupting_fever":[6,6],"cruelty_support":[7,7],"crushing_fist":[3,3],"culling_strike_support":[-1,7],"cyclone":[10,10],"damage_on_full_life_support":[-1,7],"dash":[3,3],"deadly_ailments_support":[-1,7],"decoy_totem":[3,3],"defiance_banner":[6,6],"determination":[-1,9],"devouring_totem":[-1,3],"discharge":[-1,10],"dominating_blow":[-1,10],"double_strike":[0,1],"dread_banner":[9,9],"dual_strike":[-1,1],"earthbreaker_support":[-1,4],"earthquake":[-1,10],"earthshatter":[5,5],"elemental_damage_with_attacks_support":[7,7],"elemental_hit":[-1,5],"endurance_charge_on_melee_stun_support":[-1,7],"enduring_cry":[4,4],"ensnaring_arrow":[-1,8],"eternal_blessing_support":[-1,12],"eviscerate":[6,6],"expert_retaliation_support":[11,11],"explosive_arrow":[-1,10],"explosive_concoction":[-1,10],"faster_attacks_support":[4,4],"fist_of_war_support":[12,12],"flame_link":[-1,13],"flesh_and_stone":[6,6],"flicker_strike":[-1,4],"focused_ballista_support":[-1,11],"fork_support":[-1,11],"fortify_support":[11,11],"frenzy":[6,6],"frost_blades":[-1,1],"frost_wall":[-1,3],"frostblink":[-1,3],"frozen_legion":[-1,13],"galvanic_arrow":[1,1],"generals_cry":[-1,9],"glacial_hammer":[-1,1],"glacial_shield_swipe":[6,3],"grace":[9,9],"greater_multiple_projectiles_support":[12,12],"greater_volley_support":[12,12],"ground_slam":[-1,1],"haste":[-1,9],"hatred":[9,9],"heavy_strike":[-1,1],"herald_of_agony":[-1,8],"herald_of_ash":[6,6],"herald_of_ice":[6,6],"herald_of_purity":[-1,8],"herald_of_thunder":[6,6],"hextouch_support":[-1,12],"hypothermia_support":[11,11],"ice_bite_support":[-1,11],"ice_crash":[10,10],"ice_shot":[-1,1],"immortal_call":[-1,13],"impale_support":[11,11],"increased_area_of_effect_support":[12,12],"infernal_blow":[-1,5],"infernal_cry":[-1,9],"inspiration_support":[-1,11],"intimidating_cry":[4,4],"intuitive_link":[-1,13],"iron_grip_support":[-1,7],"iron_will_support":[-1,7],"knockback_support":[-1,4],"lacerate":[5,5],"lancing_steel":[10,10],"leap_slam":[4,4],"less_duration_support":[-1,11],"lesser_multiple_projectiles_support":[4,4],"life_gain_on_hit_support":[-1,4],"life_leech_support":[11,11],"lifetap_support":[4,4],"lightning_arrow":[-1,5],"lightning_strike":[-1,5],"maim_support":[4,4],"mana_leech_support":[-1,11],"mark_on_hit_support":[-1,12],"melee_physical_damage_support":[7,7],"melee_splash_support":[4,4],"mirage_archer_support":[2,2],"molten_shell":[-1,6],"molten_strike":[1,1],"momentum_support":[2,2],"more_duration_support":[-1,11],"multiple_totems_support":[-1,12],"multistrike_support":[12,12],"overexertion_support":[-1,12],"perforate":[1,1],"petrified_blood":[9,9],"phase_run":[-1,13],"physical_to_lightning_support":[-1,7],"pierce_support":[2,2],"plague_bearer":[-1,8],"poachers_mark":[6,6],"point_blank_support":[-1,7],"poisonous_concoction":[-1,5],"precision":[4,4],"pride":[9,9],"pulverise_support":[11,11],"puncture":[3,3],"punishment":[-1,9],"purity_of_elements":[-1,9],"purity_of_fire":[-1,9],"purity_of_ice":[-1,9],"rage_support":[7,7],"rage_vortex":[-1,10],"rain_of_arrows":[5,5],"rallying_cry":[9,9],"reave":[-1,5],"rejuvenation_totem":[-1,3],"returning_projectiles_support":[-1,12],"rupture_support":[-1,12],"ruthless_support":[2,2],"sadism_support":[7,7],"scourge_arrow":[-1,10],"second_wind_support":[-1,11],"seismic_cry":[6,6],"shattering_steel":[5,5],"shield_charge":[3,3],"shield_crush":[-1,1],"shockwave_support":[-1,7],"shrapnel_ballista":[-1,3],"siege_ballista":[-1,5],"slower_projectiles_support":[-1,11],"smoke_mine":[-1,4],"snipers_mark":[3,3],"spectral_helix":[-1,5],"spectral_shield_throw":[10,10],"spectral_throw":[-1,1],"spell_echo_support":[12,12],"split_arrow":[-1,1],"splitting_steel":[1,1],"static_strike":[-1,5],"steelskin":[-1,3],"storm_rain":[-1,10],"stun_support":[-1,4],"summon_chaos_golem":[13,13],"summon_flame_golem":[13,13],"summon_ice_golem":[13,13],"summon_lightning_golem":[13,13],"summon_stone_golem":[13,13],"sunder":[-1,5],"sweep":[5,5],"swift_assembly_support":[-1,2],"swordstorm":[6,3],"tectonic_slam":[-1,10],"tempest_shield":[-1,8],"thunderstorm":[10,10],"tornado_shot":[-1,10],"toxic_rain":[-1,5],"trap_support":[-1,4],"trauma_support":[12,12],"trinity_support":[-1,7],"urgent_orders_support":[11,11],"vaal_double_strike":[-1,6],"vampiric_link":[-1,13],"vengeful_cry":[-1,9],"vicious_projectiles_support":[7,7],"vigilant_strike":[3,3],"viper_strike":[-1,1],"vitality":[4,4],"volatility_support":[-1,7],"volcanic_fissure":[-1,5],"volley_support":[2,2],"vulnerability":[-1,9],"war_banner":[3,3],"warlords_mark":[6,6],"whirling_blades":[4,4],"windburst_support":[11,11],"withering_step":[-1,4],"withering_touch_support":[-1,12]},
+  },
+  shadow: {
+    steps: [
+      {"act": 1, "questName": "황혼의 해안", "reward": ["viper_strike", "chance_to_poison_support"], "vendor": [], "rewardTotal": 2, "vendorTotal": 0},
+      {"act": 1, "questName": "눈 앞의 적", "reward": ["freezing_pulse", "explosive_trap", "stormblast_mine", "ethereal_knives", "blight", "cobra_lash"], "vendor": ["freezing_pulse", "blight", "explosive_trap", "stormblast_mine", "ethereal_knives", "cobra_lash", "fireball", "double_strike", "dual_strike", "caustic_arrow", "split_arrow", "spark", "viper_strike", "burning_arrow", "spectral_throw", "lightning_tendrils", "frost_blades", "frostbolt", "purifying_flame", "kinetic_bolt", "rolling_magma"], "rewardTotal": 8, "vendorTotal": 21, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "자비로운 임무", "reward": ["swift_assembly_support", "elemental_proliferation_support", "pierce_support", "momentum_support", "volley_support", "spell_cascade_support", "infused_channelling_support"], "vendor": ["elemental_proliferation_support", "spell_cascade_support", "infused_channelling_support", "pierce_support", "volley_support", "swift_assembly_support", "momentum_support", "arcane_surge_support", "summon_phantasm_support", "mirage_archer_support", "chance_to_poison_support"], "rewardTotal": 15, "vendorTotal": 32, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "로아 알 깨트리기", "reward": ["bear_trap", "orb_of_storms", "contagion", "detonate_dead", "dash", "frostblink"], "vendor": ["orb_of_storms", "contagion", "detonate_dead", "bear_trap", "frostblink", "dash", "glacial_shield_swipe", "puncture", "conversion_trap", "animate_weapon", "frost_bomb", "shrapnel_ballista", "flame_wall"], "rewardTotal": 21, "vendorTotal": 45, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "감금된 덩치", "reward": ["faster_attacks_support", "added_cold_damage_support", "added_lightning_damage_support", "lesser_multiple_projectiles_support", "void_manipulation_support", "multiple_traps_support", "clarity", "precision", "flame_dash", "whirling_blades", "smoke_mine", "withering_step", "unearth", "siphoning_trap"], "vendor": ["clarity", "flame_dash", "whirling_blades", "precision", "smoke_mine", "withering_step", "unearth", "siphoning_trap", "added_lightning_damage_support", "void_manipulation_support", "lesser_multiple_projectiles_support", "added_cold_damage_support", "multiple_traps_support", "faster_attacks_support", "added_fire_damage_support", "additional_accuracy_support", "increased_critical_strikes_support", "flicker_strike", "trap_support", "lightning_warp", "combustion_support", "vitality", "blastchain_mine_support", "chance_to_flee_support", "blind_support", "ballista_totem_support", "melee_splash_support", "blink_arrow", "wither", "efficacy_support", "unbound_ailments_support", "bodyswap", "arrow_nova_support", "devour_support", "locus_mine_support", "prismatic_burst_support"], "rewardTotal": 35, "vendorTotal": 81, "npc": "네사", "cost": "transmutation"},
+      {"act": 1, "questName": "사이렌의 마침곡", "reward": ["reave", "voltaxic_burst", "icicle_mine", "lightning_trap", "fire_trap", "blade_vortex", "essence_drain", "volatile_dead", "venom_gyre"], "vendor": ["essence_drain", "volatile_dead", "reave", "icicle_mine", "lightning_trap", "fire_trap", "blade_vortex", "venom_gyre", "lacerate", "elemental_hit", "creeping_frost", "ice_spear", "rain_of_arrows", "lightning_strike", "power_siphon", "lightning_arrow", "arc", "incinerate", "storm_call", "barrage", "flame_surge", "siege_ballista", "scorching_ray", "storm_burst", "toxic_rain", "wintertide_brand", "blazing_salvo", "exsanguinate", "blade_trap", "voltaxic_burst", "manabond", "spectral_helix", "poisonous_concoction", "kinetic_fusillade"], "rewardTotal": 44, "vendorTotal": 115, "npc": "네사", "cost": "transmutation"},
+      {"act": 2, "questName": "검은 침략자", "reward": ["assassins_mark", "herald_of_agony", "herald_of_thunder", "herald_of_ash", "herald_of_ice", "blade_blast", "arctic_armour", "cold_snap", "summon_skitterbots", "blood_rage", "arcane_cloak"], "vendor": ["herald_of_ash", "herald_of_thunder", "herald_of_ice", "arctic_armour", "cold_snap", "arcane_cloak", "blood_rage", "herald_of_agony", "blade_blast", "summon_skitterbots", "assassins_mark", "forbidden_rite", "galvanic_field", "vaal_blight", "wall_of_force"], "rewardTotal": 55, "vendorTotal": 130, "npc": "예나", "cost": "alteration"},
+      {"act": 2, "questName": "예리하고 잔인한", "reward": ["faster_casting_support", "melee_physical_damage_support", "trap_and_mine_damage_support", "elemental_focus_support", "deadly_ailments_support", "nightblade_support", "trinity_support"], "vendor": ["faster_casting_support", "elemental_focus_support", "melee_physical_damage_support", "trap_and_mine_damage_support", "deadly_ailments_support", "nightblade_support", "increased_critical_damage_support", "concentrated_effect_support", "cold_to_fire_support", "elemental_damage_with_attacks_support", "bloodlust_support", "culling_strike_support", "point_blank_support", "power_charge_on_critical_support", "physical_to_lightning_support", "controlled_destruction_support", "close_combat_support", "rage_support", "trinity_support", "overcharge_support", "sadism_support", "sacred_wisps_support", "kinetic_instability_support"], "rewardTotal": 62, "vendorTotal": 153, "npc": "예나", "cost": "alteration"},
+      {"act": 2, "questName": "문제의 근원", "reward": [], "vendor": ["frenzy", "tempest_shield", "desecrate", "wave_of_conviction", "ensnaring_arrow", "inspiration_support"], "rewardTotal": 62, "vendorTotal": 159, "npc": "예나", "cost": "alteration"},
+      {"act": 3, "questName": "떠나보낸 연인", "reward": ["flammability", "conductivity", "frostbite", "elemental_weakness", "despair", "enfeeble", "temporal_chains", "wrath", "hatred", "bane", "malevolence", "plague_bearer"], "vendor": ["flammability", "conductivity", "frostbite", "despair", "malevolence", "bane", "hatred", "wrath", "plague_bearer", "temporal_chains", "elemental_weakness", "enfeeble", "haste", "purity_of_elements", "discipline", "grace", "purity_of_ice", "purity_of_lightning", "poachers_mark", "zealotry", "pride", "spellslinger", "snipers_mark", "energy_blade", "alchemists_mark", "automation"], "rewardTotal": 74, "vendorTotal": 185, "npc": "클라리사", "cost": "alteration"},
+      {"act": 3, "questName": "오른팔 잘라내기", "reward": ["pyroclast_mine", "ball_lightning", "flamethrower_trap", "lightning_spire_trap", "seismic_trap", "bladefall", "blade_flurry", "charged_dash", "cremation", "soulrend", "pestilent_strike", "hexblast"], "vendor": ["ball_lightning", "cremation", "soulrend", "charged_dash", "blade_flurry", "pyroclast_mine", "flamethrower_trap", "lightning_spire_trap", "seismic_trap", "bladefall", "pestilent_strike", "discharge", "shock_nova", "firestorm", "animate_guardian", "flameblast", "glacial_cascade", "tornado_shot", "kinetic_blast", "ice_crash", "ice_trap", "wild_strike", "vortex", "dark_pact", "scourge_arrow", "winter_orb", "stormbind", "divine_ire", "artillery_ballista", "crackling_lance", "hexblast", "storm_rain", "explosive_concoction", "eye_of_winter", "lightning_conduit", "kinetic_rain", "thunderstorm", "somatic_shell"], "rewardTotal": 86, "vendorTotal": 223, "npc": "클라리사", "cost": "chance"},
+      {"act": 3, "questName": "운명의 흔적", "reward": ["second_wind_support", "cold_penetration_support", "lightning_penetration_support", "faster_projectiles_support", "ice_bite_support", "innervate_support", "critical_strike_affliction_support", "swift_affliction_support", "charged_traps_support", "high-impact_mine_support", "energy_leech_support", "charged_mines_support", "archmage_support", "impending_doom_support", "pinpoint_support", "focused_channelling_support"], "vendor": ["cold_penetration_support", "lightning_penetration_support", "swift_affliction_support", "energy_leech_support", "archmage_support", "ice_bite_support", "second_wind_support", "faster_projectiles_support", "innervate_support", "charged_traps_support", "high-impact_mine_support", "charged_mines_support", "life_leech_support", "mana_leech_support", "item_rarity_support", "fire_penetration_support", "fork_support", "slower_projectiles_support", "blasphemy_support", "fortify_support", "hypothermia_support", "advanced_traps_support", "intensify_support", "impale_support", "swiftbrand_support", "pinpoint_support", "impending_doom_support", "focused_ballista_support", "critical_strike_affliction_support", "cursed_ground_support", "sacrifice_support", "focused_channelling_support", "windburst_support"], "rewardTotal": 102, "vendorTotal": 256, "npc": "시오사", "cost": "chance"},
+      {"act": 4, "questName": "영원한 악몽", "reward": ["spell_echo_support", "multistrike_support", "greater_multiple_projectiles_support", "chain_support", "increased_area_of_effect_support", "vile_toxins_support", "withering_touch_support", "bonechill_support", "cluster_traps_support", "minefield_support", "unleash_support", "greater_volley_support", "barrage_support", "returning_projectiles_support"], "vendor": ["spell_echo_support", "multistrike_support", "greater_multiple_projectiles_support", "chain_support", "increased_area_of_effect_support", "bonechill_support", "unleash_support", "greater_volley_support", "barrage_support", "withering_touch_support", "vile_toxins_support", "cluster_traps_support", "minefield_support", "hextouch_support", "cast_on_critical_strike_support", "cast_on_melee_kill_support", "cast_on_death_support", "cast_when_damage_taken_support", "cast_when_stunned_support", "cast_while_channelling_support", "decay_support", "multiple_totems_support", "arcanist_brand", "eternal_blessing_support", "mark_on_hit_support", "hex_bloom_support", "returning_projectiles_support", "spellblade_support"], "rewardTotal": 116, "vendorTotal": 284, "npc": "페타루스와 바냐", "cost": "alchemy"},
+      {"act": 4, "questName": "봉인 해제", "reward": ["summon_chaos_golem", "summon_ice_golem", "summon_flame_golem", "summon_stone_golem", "summon_lightning_golem", "temporal_rift", "void_sphere", "frost_shield", "tornado", "ambush"], "vendor": ["summon_chaos_golem", "summon_ice_golem", "summon_flame_golem", "summon_stone_golem", "summon_lightning_golem", "phase_run", "summon_carrion_golem", "void_sphere", "frost_shield", "sigil_of_power", "ambush", "temporal_rift", "tornado", "soul_link", "intuitive_link", "destructive_link"], "rewardTotal": 126, "vendorTotal": 300, "npc": "페타루스와 바냐", "cost": "chance"},
+      {"act": 5, "questName": "오리아스로의 귀환", "reward": [], "vendor": ["vaal_arc"], "rewardTotal": 126, "vendorTotal": 301, "npc": "???", "cost": "???"},
+    ],
+    earliest: {"added_cold_damage_support":[4,4],"added_fire_damage_support":[-1,4],"added_lightning_damage_support":[4,4],"additional_accuracy_support":[-1,4],"advanced_traps_support":[-1,11],"alchemists_mark":[-1,9],"ambush":[13,13],"animate_guardian":[-1,10],"animate_weapon":[-1,3],"arc":[-1,5],"arcane_cloak":[6,6],"arcane_surge_support":[-1,2],"arcanist_brand":[-1,12],"archmage_support":[11,11],"arctic_armour":[6,6],"arrow_nova_support":[-1,4],"artillery_ballista":[-1,10],"assassins_mark":[6,6],"automation":[-1,9],"ball_lightning":[10,10],"ballista_totem_support":[-1,4],"bane":[9,9],"barrage":[-1,5],"barrage_support":[12,12],"bear_trap":[3,3],"blade_blast":[6,6],"blade_flurry":[10,10],"blade_trap":[-1,5],"blade_vortex":[5,5],"bladefall":[10,10],"blasphemy_support":[-1,11],"blastchain_mine_support":[-1,4],"blazing_salvo":[-1,5],"blight":[1,1],"blind_support":[-1,4],"blink_arrow":[-1,4],"blood_rage":[6,6],"bloodlust_support":[-1,7],"bodyswap":[-1,4],"bonechill_support":[12,12],"burning_arrow":[-1,1],"cast_on_critical_strike_support":[-1,12],"cast_on_death_support":[-1,12],"cast_on_melee_kill_support":[-1,12],"cast_when_damage_taken_support":[-1,12],"cast_when_stunned_support":[-1,12],"cast_while_channelling_support":[-1,12],"caustic_arrow":[-1,1],"chain_support":[12,12],"chance_to_flee_support":[-1,4],"chance_to_poison_support":[0,2],"charged_dash":[10,10],"charged_mines_support":[11,11],"charged_traps_support":[11,11],"clarity":[4,4],"close_combat_support":[-1,7],"cluster_traps_support":[12,12],"cobra_lash":[1,1],"cold_penetration_support":[11,11],"cold_snap":[6,6],"cold_to_fire_support":[-1,7],"combustion_support":[-1,4],"concentrated_effect_support":[-1,7],"conductivity":[9,9],"contagion":[3,3],"controlled_destruction_support":[-1,7],"conversion_trap":[-1,3],"crackling_lance":[-1,10],"creeping_frost":[-1,5],"cremation":[10,10],"critical_strike_affliction_support":[11,11],"culling_strike_support":[-1,7],"cursed_ground_support":[-1,11],"dark_pact":[-1,10],"dash":[3,3],"deadly_ailments_support":[7,7],"decay_support":[-1,12],"desecrate":[-1,8],"despair":[9,9],"destructive_link":[-1,13],"detonate_dead":[3,3],"devour_support":[-1,4],"discharge":[-1,10],"discipline":[-1,9],"divine_ire":[-1,10],"double_strike":[-1,1],"dual_strike":[-1,1],"efficacy_support":[-1,4],"elemental_damage_with_attacks_support":[-1,7],"elemental_focus_support":[7,7],"elemental_hit":[-1,5],"elemental_proliferation_support":[2,2],"elemental_weakness":[9,9],"energy_blade":[-1,9],"energy_leech_support":[11,11],"enfeeble":[9,9],"ensnaring_arrow":[-1,8],"essence_drain":[5,5],"eternal_blessing_support":[-1,12],"ethereal_knives":[1,1],"explosive_concoction":[-1,10],"explosive_trap":[1,1],"exsanguinate":[-1,5],"eye_of_winter":[-1,10],"faster_attacks_support":[4,4],"faster_casting_support":[7,7],"faster_projectiles_support":[11,11],"fire_penetration_support":[-1,11],"fire_trap":[5,5],"fireball":[-1,1],"firestorm":[-1,10],"flame_dash":[4,4],"flame_surge":[-1,5],"flame_wall":[-1,3],"flameblast":[-1,10],"flamethrower_trap":[10,10],"flammability":[9,9],"flicker_strike":[-1,4],"focused_ballista_support":[-1,11],"focused_channelling_support":[11,11],"forbidden_rite":[-1,6],"fork_support":[-1,11],"fortify_support":[-1,11],"freezing_pulse":[1,1],"frenzy":[-1,8],"frost_blades":[-1,1],"frost_bomb":[-1,3],"frost_shield":[13,13],"frostbite":[9,9],"frostblink":[3,3],"frostbolt":[-1,1],"galvanic_field":[-1,6],"glacial_cascade":[-1,10],"glacial_shield_swipe":[-1,3],"grace":[-1,9],"greater_multiple_projectiles_support":[12,12],"greater_volley_support":[12,12],"haste":[-1,9],"hatred":[9,9],"herald_of_agony":[6,6],"herald_of_ash":[6,6],"herald_of_ice":[6,6],"herald_of_thunder":[6,6],"hex_bloom_support":[-1,12],"hexblast":[10,10],"hextouch_support":[-1,12],"high-impact_mine_support":[11,11],"hypothermia_support":[-1,11],"ice_bite_support":[11,11],"ice_crash":[-1,10],"ice_spear":[-1,5],"ice_trap":[-1,10],"icicle_mine":[5,5],"impale_support":[-1,11],"impending_doom_support":[11,11],"incinerate":[-1,5],"increased_area_of_effect_support":[12,12],"increased_critical_damage_support":[-1,7],"increased_critical_strikes_support":[-1,4],"infused_channelling_support":[2,2],"innervate_support":[11,11],"inspiration_support":[-1,8],"intensify_support":[-1,11],"intuitive_link":[-1,13],"item_rarity_support":[-1,11],"kinetic_blast":[-1,10],"kinetic_bolt":[-1,1],"kinetic_fusillade":[-1,5],"kinetic_instability_support":[-1,7],"kinetic_rain":[-1,10],"lacerate":[-1,5],"lesser_multiple_projectiles_support":[4,4],"life_leech_support":[-1,11],"lightning_arrow":[-1,5],"lightning_conduit":[-1,10],"lightning_penetration_support":[11,11],"lightning_spire_trap":[10,10],"lightning_strike":[-1,5],"lightning_tendrils":[-1,1],"lightning_trap":[5,5],"lightning_warp":[-1,4],"locus_mine_support":[-1,4],"malevolence":[9,9],"mana_leech_support":[-1,11],"manabond":[-1,5],"mark_on_hit_support":[-1,12],"melee_physical_damage_support":[7,7],"melee_splash_support":[-1,4],"minefield_support":[12,12],"mirage_archer_support":[-1,2],"momentum_support":[2,2],"multiple_totems_support":[-1,12],"multiple_traps_support":[4,4],"multistrike_support":[12,12],"nightblade_support":[7,7],"orb_of_storms":[3,3],"overcharge_support":[-1,7],"pestilent_strike":[10,10],"phase_run":[-1,13],"physical_to_lightning_support":[-1,7],"pierce_support":[2,2],"pinpoint_support":[11,11],"plague_bearer":[9,9],"poachers_mark":[-1,9],"point_blank_support":[-1,7],"poisonous_concoction":[-1,5],"power_charge_on_critical_support":[-1,7],"power_siphon":[-1,5],"precision":[4,4],"pride":[-1,9],"prismatic_burst_support":[-1,4],"puncture":[-1,3],"purifying_flame":[-1,1],"purity_of_elements":[-1,9],"purity_of_ice":[-1,9],"purity_of_lightning":[-1,9],"pyroclast_mine":[10,10],"rage_support":[-1,7],"rain_of_arrows":[-1,5],"reave":[5,5],"returning_projectiles_support":[12,12],"rolling_magma":[-1,1],"sacred_wisps_support":[-1,7],"sacrifice_support":[-1,11],"sadism_support":[-1,7],"scorching_ray":[-1,5],"scourge_arrow":[-1,10],"second_wind_support":[11,11],"seismic_trap":[10,10],"shock_nova":[-1,10],"shrapnel_ballista":[-1,3],"siege_ballista":[-1,5],"sigil_of_power":[-1,13],"siphoning_trap":[4,4],"slower_projectiles_support":[-1,11],"smoke_mine":[4,4],"snipers_mark":[-1,9],"somatic_shell":[-1,10],"soul_link":[-1,13],"soulrend":[10,10],"spark":[-1,1],"spectral_helix":[-1,5],"spectral_throw":[-1,1],"spell_cascade_support":[2,2],"spell_echo_support":[12,12],"spellblade_support":[-1,12],"spellslinger":[-1,9],"split_arrow":[-1,1],"storm_burst":[-1,5],"storm_call":[-1,5],"storm_rain":[-1,10],"stormbind":[-1,10],"stormblast_mine":[1,1],"summon_carrion_golem":[-1,13],"summon_chaos_golem":[13,13],"summon_flame_golem":[13,13],"summon_ice_golem":[13,13],"summon_lightning_golem":[13,13],"summon_phantasm_support":[-1,2],"summon_skitterbots":[6,6],"summon_stone_golem":[13,13],"swift_affliction_support":[11,11],"swift_assembly_support":[2,2],"swiftbrand_support":[-1,11],"tempest_shield":[-1,8],"temporal_chains":[9,9],"temporal_rift":[13,13],"thunderstorm":[-1,10],"tornado":[13,13],"tornado_shot":[-1,10],"toxic_rain":[-1,5],"trap_and_mine_damage_support":[7,7],"trap_support":[-1,4],"trinity_support":[7,7],"unbound_ailments_support":[-1,4],"unearth":[4,4],"unleash_support":[12,12],"vaal_arc":[-1,14],"vaal_blight":[-1,6],"venom_gyre":[5,5],"vile_toxins_support":[12,12],"viper_strike":[0,1],"vitality":[-1,4],"void_manipulation_support":[4,4],"void_sphere":[13,13],"volatile_dead":[5,5],"volley_support":[2,2],"voltaxic_burst":[5,5],"vortex":[-1,10],"wall_of_force":[-1,6],"wave_of_conviction":[-1,8],"whirling_blades":[4,4],"wild_strike":[-1,10],"windburst_support":[-1,11],"winter_orb":[-1,10],"wintertide_brand":[-1,5],"wither":[-1,4],"withering_step":[4,4],"withering_touch_support":[12,12],"wrath":[9,9],"zealotry":[-1,9]},
+  },
+  templar: {
+    steps: [
+      {"act": 1, "questName": "황혼의 해안", "reward": ["glacial_hammer", "elemental_proliferation_support"], "vendor": [], "rewardTotal": 2, "vendorTotal": 0},
+      {"act": 1, "questName": "눈 앞의 적", "reward": ["smite", "frostbolt", "rolling_magma", "lightning_tendrils", "molten_strike", "purifying_flame"], "vendor": ["lightning_tendrils", "smite", "frostbolt", "molten_strike", "purifying_flame", "fireball", "ground_slam", "raise_zombie", "spark", "glacial_hammer", "freezing_pulse", "heavy_strike", "elemental_proliferation_support", "spectral_throw", "blight", "stormblast_mine", "shield_crush", "rolling_magma"], "rewardTotal": 8, "vendorTotal": 18, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "자비로운 임무", "reward": ["arcane_surge_support", "ruthless_support", "chance_to_bleed_support", "spell_cascade_support", "infused_channelling_support", "ancestral_call_support"], "vendor": ["spell_cascade_support", "infused_channelling_support", "arcane_surge_support", "ruthless_support", "chance_to_bleed_support", "ancestral_call_support", "momentum_support", "summon_phantasm_support"], "rewardTotal": 14, "vendorTotal": 26, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "로아 알 깨트리기", "reward": ["frost_bomb", "summon_holy_relic", "holy_flame_totem", "vigilant_strike", "flame_wall", "shield_charge", "frostblink"], "vendor": ["frost_bomb", "summon_holy_relic", "holy_flame_totem", "ancestral_protector", "vigilant_strike", "frostblink", "shield_charge", "frost_wall", "swordstorm", "rejuvenation_totem", "decoy_totem", "devouring_totem", "summon_raging_spirit", "orb_of_storms", "contagion", "war_banner", "steelskin", "dash", "flame_wall", "crushing_fist"], "rewardTotal": 21, "vendorTotal": 46, "npc": "네사", "cost": "wisdom"},
+      {"act": 1, "questName": "감금된 덩치", "reward": ["added_fire_damage_support", "added_lightning_damage_support", "melee_splash_support", "combustion_support", "lifetap_support", "flame_dash", "clarity", "vitality", "leap_slam"], "vendor": ["clarity", "flame_dash", "leap_slam", "added_lightning_damage_support", "minion_damage_support", "combustion_support", "added_fire_damage_support", "melee_splash_support", "vitality", "enduring_cry", "unearth", "additional_accuracy_support", "knockback_support", "stun_support", "lightning_warp", "summon_skeletons", "life_gain_on_hit_support", "spell_totem_support", "blastchain_mine_support", "wither", "void_manipulation_support", "efficacy_support", "unbound_ailments_support", "bodyswap", "precision", "infernal_legion_support", "intimidating_cry", "lifetap_support", "earthbreaker_support", "devour_support", "flamewood_support", "increased_critical_strikes_support"], "rewardTotal": 30, "vendorTotal": 78, "npc": "네사", "cost": "transmutation"},
+      {"act": 1, "questName": "사이렌의 마침곡", "reward": ["static_strike", "ice_nova", "blazing_salvo", "storm_call", "searing_bond", "scorching_ray", "storm_brand", "storm_burst", "wintertide_brand", "absolution", "manabond"], "vendor": ["ice_nova", "scorching_ray", "storm_burst", "storm_brand", "wintertide_brand", "static_strike", "storm_call", "searing_bond", "spectral_shield_throw", "sweep", "lacerate", "volatile_dead", "creeping_frost", "ice_spear", "infernal_blow", "lightning_strike", "arc", "icicle_mine", "incinerate", "flame_surge", "flesh_offering", "bone_offering", "spirit_offering", "essence_drain", "sunder", "earthshatter", "blazing_salvo", "exsanguinate", "absolution", "manabond", "spectral_helix", "volcanic_fissure"], "rewardTotal": 41, "vendorTotal": 110, "npc": "네사", "cost": "transmutation"},
+      {"act": 2, "questName": "검은 침략자", "reward": ["herald_of_purity", "herald_of_thunder", "herald_of_ash", "herald_of_ice", "brand_recall", "wave_of_conviction", "arcane_cloak", "divine_retribution"], "vendor": ["herald_of_ash", "herald_of_thunder", "herald_of_ice", "arcane_cloak", "brand_recall", "herald_of_purity", "wave_of_conviction", "molten_shell", "corrupting_fever", "defiance_banner", "galvanic_field", "physical_to_lightning_support", "vaal_cold_snap", "divine_retribution", "eviscerate"], "rewardTotal": 49, "vendorTotal": 125, "npc": "예나", "cost": "alteration"},
+      {"act": 2, "questName": "예리하고 잔인한", "reward": ["faster_casting_support", "concentrated_effect_support", "elemental_damage_with_attacks_support", "melee_physical_damage_support", "controlled_destruction_support", "elemental_focus_support", "shockwave_support", "cruelty_support"], "vendor": ["faster_casting_support", "concentrated_effect_support", "controlled_destruction_support", "elemental_focus_support", "elemental_damage_with_attacks_support", "melee_physical_damage_support", "shockwave_support", "faster_attacks_support", "cold_to_fire_support", "minion_speed_support", "minion_life_support", "bloodlust_support", "culling_strike_support", "iron_grip_support", "iron_will_support", "damage_on_full_life_support", "endurance_charge_on_melee_stun_support", "trap_and_mine_damage_support", "deadly_ailments_support", "close_combat_support", "rage_support", "predator_support", "trinity_support", "cruelty_support", "overcharge_support", "fresh_meat_support", "sadism_support", "volatility_support", "sacred_wisps_support", "living_lightning_support"], "rewardTotal": 57, "vendorTotal": 155, "npc": "예나", "cost": "alteration"},
+      {"act": 2, "questName": "문제의 근원", "reward": ["minion_damage_support"], "vendor": ["cold_snap", "righteous_fire", "tempest_shield", "arctic_armour", "desecrate", "seismic_cry", "blade_blast", "ancestral_cry", "inspiration_support", "increased_critical_damage_support"], "rewardTotal": 58, "vendorTotal": 165, "npc": "예나", "cost": "alteration"},
+      {"act": 3, "questName": "떠나보낸 연인", "reward": ["flammability", "conductivity", "frostbite", "elemental_weakness", "vulnerability", "enfeeble", "punishment", "zealotry", "battlemages_cry"], "vendor": ["flammability", "conductivity", "frostbite", "zealotry", "punishment", "vulnerability", "elemental_weakness", "enfeeble", "purity_of_elements", "discipline", "determination", "anger", "wrath", "purity_of_fire", "purity_of_lightning", "rallying_cry", "infernal_cry", "dread_banner", "bane", "malevolence", "pride", "spellslinger", "generals_cry", "petrified_blood", "battlemages_cry", "energy_blade", "automation", "autoexertion"], "rewardTotal": 67, "vendorTotal": 193, "npc": "클라리사", "cost": "alteration"},
+      {"act": 3, "questName": "오른팔 잘라내기", "reward": ["ice_crash", "stormbind", "flameblast", "firestorm", "shock_nova", "shockwave_totem", "consecrated_path", "dominating_blow", "armageddon_brand", "divine_ire", "penance_brand"], "vendor": ["firestorm", "flameblast", "stormbind", "penance_brand", "armageddon_brand", "ice_crash", "shock_nova", "shockwave_totem", "consecrated_path", "dominating_blow", "divine_ire", "charged_dash", "discharge", "raise_spectre", "cyclone", "animate_guardian", "ball_lightning", "glacial_cascade", "pyroclast_mine", "kinetic_blast", "earthquake", "vortex", "ancestral_warchief", "cremation", "tectonic_slam", "winter_orb", "soulrend", "crackling_lance", "hexblast", "reap", "rage_vortex", "boneshatter", "summon_reaper", "eye_of_winter", "lightning_conduit", "kinetic_rain", "somatic_shell"], "rewardTotal": 78, "vendorTotal": 230, "npc": "클라리사", "cost": "chance"},
+      {"act": 3, "questName": "운명의 흔적", "reward": ["fire_penetration_support", "cold_penetration_support", "lightning_penetration_support", "fortify_support", "burning_damage_support", "blasphemy_support", "energy_leech_support", "intensify_support", "pulverise_support", "archmage_support", "swiftbrand_support", "arrogance_support", "guardians_blessing_support"], "vendor": ["fire_penetration_support", "cold_penetration_support", "lightning_penetration_support", "burning_damage_support", "blasphemy_support", "energy_leech_support", "intensify_support", "archmage_support", "swiftbrand_support", "fortify_support", "pulverise_support", "life_leech_support", "item_rarity_support", "more_duration_support", "elemental_army_support", "less_duration_support", "generosity_support", "ice_bite_support", "hypothermia_support", "innervate_support", "swift_affliction_support", "feeding_frenzy_support", "meat_shield_support", "second_wind_support", "urgent_orders_support", "pinpoint_support", "impending_doom_support", "bloodthirst_support", "arrogance_support", "divine_blessing_support", "guardians_blessing_support", "controlled_blaze_support", "corrupting_cry_support", "sacrifice_support", "expert_retaliation_support"], "rewardTotal": 91, "vendorTotal": 265, "npc": "시오사", "cost": "chance"},
+      {"act": 4, "questName": "영원한 악몽", "reward": ["spell_echo_support", "multistrike_support", "greater_multiple_projectiles_support", "chain_support", "increased_area_of_effect_support", "ignite_proliferation_support", "multiple_totems_support", "unleash_support", "arcanist_brand", "fist_of_war_support", "frigid_bond_support", "spellblade_support"], "vendor": ["spell_echo_support", "multistrike_support", "greater_multiple_projectiles_support", "chain_support", "increased_area_of_effect_support", "multiple_totems_support", "unleash_support", "arcanist_brand", "ignite_proliferation_support", "fist_of_war_support", "greater_volley_support", "hextouch_support", "cast_on_critical_strike_support", "cast_on_melee_kill_support", "cast_on_death_support", "cast_when_damage_taken_support", "cast_when_stunned_support", "cast_while_channelling_support", "immolate_support", "bonechill_support", "barrage_support", "behead_support", "eternal_blessing_support", "mark_on_hit_support", "frigid_bond_support", "spellblade_support", "returning_projectiles_support", "trauma_support", "rupture_support", "overexertion_support"], "rewardTotal": 103, "vendorTotal": 295, "npc": "페타루스와 바냐", "cost": "alchemy"},
+      {"act": 4, "questName": "봉인 해제", "reward": ["summon_chaos_golem", "summon_ice_golem", "summon_flame_golem", "summon_stone_golem", "summon_lightning_golem", "summon_carrion_golem", "sigil_of_power", "void_sphere", "frost_shield", "hydrosphere", "frozen_legion"], "vendor": ["summon_chaos_golem", "summon_ice_golem", "summon_flame_golem", "summon_stone_golem", "summon_lightning_golem", "summon_carrion_golem", "immortal_call", "berserk", "void_sphere", "frost_shield", "sigil_of_power", "hydrosphere", "soul_link", "flame_link", "protective_link", "frozen_legion"], "rewardTotal": 114, "vendorTotal": 311, "npc": "페타루스와 바냐", "cost": "chance"},
+      {"act": 4, "questName": "불굴의 혼백", "reward": [], "vendor": ["vaal_absolution", "slower_projectiles_support"], "rewardTotal": 114, "vendorTotal": 313, "npc": "???", "cost": "???"},
+    ],
+    earliest: {"absolution":[5,5],"added_fire_damage_support":[4,4],"added_lightning_damage_support":[4,4],"additional_accuracy_support":[-1,4],"ancestral_call_support":[2,2],"ancestral_cry":[-1,8],"ancestral_protector":[-1,3],"ancestral_warchief":[-1,10],"anger":[-1,9],"animate_guardian":[-1,10],"arc":[-1,5],"arcane_cloak":[6,6],"arcane_surge_support":[2,2],"arcanist_brand":[12,12],"archmage_support":[11,11],"arctic_armour":[-1,8],"armageddon_brand":[10,10],"arrogance_support":[11,11],"autoexertion":[-1,9],"automation":[-1,9],"ball_lightning":[-1,10],"bane":[-1,9],"barrage_support":[-1,12],"battlemages_cry":[9,9],"behead_support":[-1,12],"berserk":[-1,13],"blade_blast":[-1,8],"blasphemy_support":[11,11],"blastchain_mine_support":[-1,4],"blazing_salvo":[5,5],"blight":[-1,1],"bloodlust_support":[-1,7],"bloodthirst_support":[-1,11],"bodyswap":[-1,4],"bone_offering":[-1,5],"bonechill_support":[-1,12],"boneshatter":[-1,10],"brand_recall":[6,6],"burning_damage_support":[11,11],"cast_on_critical_strike_support":[-1,12],"cast_on_death_support":[-1,12],"cast_on_melee_kill_support":[-1,12],"cast_when_damage_taken_support":[-1,12],"cast_when_stunned_support":[-1,12],"cast_while_channelling_support":[-1,12],"chain_support":[12,12],"chance_to_bleed_support":[2,2],"charged_dash":[-1,10],"clarity":[4,4],"close_combat_support":[-1,7],"cold_penetration_support":[11,11],"cold_snap":[-1,8],"cold_to_fire_support":[-1,7],"combustion_support":[4,4],"concentrated_effect_support":[7,7],"conductivity":[9,9],"consecrated_path":[10,10],"contagion":[-1,3],"controlled_blaze_support":[-1,11],"controlled_destruction_support":[7,7],"corrupting_cry_support":[-1,11],"corrupting_fever":[-1,6],"crackling_lance":[-1,10],"creeping_frost":[-1,5],"cremation":[-1,10],"cruelty_support":[7,7],"crushing_fist":[-1,3],"culling_strike_support":[-1,7],"cyclone":[-1,10],"damage_on_full_life_support":[-1,7],"dash":[-1,3],"deadly_ailments_support":[-1,7],"decoy_totem":[-1,3],"defiance_banner":[-1,6],"desecrate":[-1,8],"determination":[-1,9],"devour_support":[-1,4],"devouring_totem":[-1,3],"discharge":[-1,10],"discipline":[-1,9],"divine_blessing_support":[-1,11],"divine_ire":[10,10],"divine_retribution":[6,6],"dominating_blow":[10,10],"dread_banner":[-1,9],"earthbreaker_support":[-1,4],"earthquake":[-1,10],"earthshatter":[-1,5],"efficacy_support":[-1,4],"elemental_army_support":[-1,11],"elemental_damage_with_attacks_support":[7,7],"elemental_focus_support":[7,7],"elemental_proliferation_support":[0,1],"elemental_weakness":[9,9],"endurance_charge_on_melee_stun_support":[-1,7],"enduring_cry":[-1,4],"energy_blade":[-1,9],"energy_leech_support":[11,11],"enfeeble":[9,9],"essence_drain":[-1,5],"eternal_blessing_support":[-1,12],"eviscerate":[-1,6],"expert_retaliation_support":[-1,11],"exsanguinate":[-1,5],"eye_of_winter":[-1,10],"faster_attacks_support":[-1,7],"faster_casting_support":[7,7],"feeding_frenzy_support":[-1,11],"fire_penetration_support":[11,11],"fireball":[-1,1],"firestorm":[10,10],"fist_of_war_support":[12,12],"flame_dash":[4,4],"flame_link":[-1,13],"flame_surge":[-1,5],"flame_wall":[3,3],"flameblast":[10,10],"flamewood_support":[-1,4],"flammability":[9,9],"flesh_offering":[-1,5],"fortify_support":[11,11],"freezing_pulse":[-1,1],"fresh_meat_support":[-1,7],"frigid_bond_support":[12,12],"frost_bomb":[3,3],"frost_shield":[13,13],"frost_wall":[-1,3],"frostbite":[9,9],"frostblink":[3,3],"frostbolt":[1,1],"frozen_legion":[13,13],"galvanic_field":[-1,6],"generals_cry":[-1,9],"generosity_support":[-1,11],"glacial_cascade":[-1,10],"glacial_hammer":[0,1],"greater_multiple_projectiles_support":[12,12],"greater_volley_support":[-1,12],"ground_slam":[-1,1],"guardians_blessing_support":[11,11],"heavy_strike":[-1,1],"herald_of_ash":[6,6],"herald_of_ice":[6,6],"herald_of_purity":[6,6],"herald_of_thunder":[6,6],"hexblast":[-1,10],"hextouch_support":[-1,12],"holy_flame_totem":[3,3],"hydrosphere":[13,13],"hypothermia_support":[-1,11],"ice_bite_support":[-1,11],"ice_crash":[10,10],"ice_nova":[5,5],"ice_spear":[-1,5],"icicle_mine":[-1,5],"ignite_proliferation_support":[12,12],"immolate_support":[-1,12],"immortal_call":[-1,13],"impending_doom_support":[-1,11],"incinerate":[-1,5],"increased_area_of_effect_support":[12,12],"increased_critical_damage_support":[-1,8],"increased_critical_strikes_support":[-1,4],"infernal_blow":[-1,5],"infernal_cry":[-1,9],"infernal_legion_support":[-1,4],"infused_channelling_support":[2,2],"innervate_support":[-1,11],"inspiration_support":[-1,8],"intensify_support":[11,11],"intimidating_cry":[-1,4],"iron_grip_support":[-1,7],"iron_will_support":[-1,7],"item_rarity_support":[-1,11],"kinetic_blast":[-1,10],"kinetic_rain":[-1,10],"knockback_support":[-1,4],"lacerate":[-1,5],"leap_slam":[4,4],"less_duration_support":[-1,11],"life_gain_on_hit_support":[-1,4],"life_leech_support":[-1,11],"lifetap_support":[4,4],"lightning_conduit":[-1,10],"lightning_penetration_support":[11,11],"lightning_strike":[-1,5],"lightning_tendrils":[1,1],"lightning_warp":[-1,4],"living_lightning_support":[-1,7],"malevolence":[-1,9],"manabond":[5,5],"mark_on_hit_support":[-1,12],"meat_shield_support":[-1,11],"melee_physical_damage_support":[7,7],"melee_splash_support":[4,4],"minion_damage_support":[8,4],"minion_life_support":[-1,7],"minion_speed_support":[-1,7],"molten_shell":[-1,6],"molten_strike":[1,1],"momentum_support":[-1,2],"more_duration_support":[-1,11],"multiple_totems_support":[12,12],"multistrike_support":[12,12],"orb_of_storms":[-1,3],"overcharge_support":[-1,7],"overexertion_support":[-1,12],"penance_brand":[10,10],"petrified_blood":[-1,9],"physical_to_lightning_support":[-1,6],"pinpoint_support":[-1,11],"precision":[-1,4],"predator_support":[-1,7],"pride":[-1,9],"protective_link":[-1,13],"pulverise_support":[11,11],"punishment":[9,9],"purifying_flame":[1,1],"purity_of_elements":[-1,9],"purity_of_fire":[-1,9],"purity_of_lightning":[-1,9],"pyroclast_mine":[-1,10],"rage_support":[-1,7],"rage_vortex":[-1,10],"raise_spectre":[-1,10],"raise_zombie":[-1,1],"rallying_cry":[-1,9],"reap":[-1,10],"rejuvenation_totem":[-1,3],"returning_projectiles_support":[-1,12],"righteous_fire":[-1,8],"rolling_magma":[1,1],"rupture_support":[-1,12],"ruthless_support":[2,2],"sacred_wisps_support":[-1,7],"sacrifice_support":[-1,11],"sadism_support":[-1,7],"scorching_ray":[5,5],"searing_bond":[5,5],"second_wind_support":[-1,11],"seismic_cry":[-1,8],"shield_charge":[3,3],"shield_crush":[-1,1],"shock_nova":[10,10],"shockwave_support":[7,7],"shockwave_totem":[10,10],"sigil_of_power":[13,13],"slower_projectiles_support":[-1,14],"smite":[1,1],"somatic_shell":[-1,10],"soul_link":[-1,13],"soulrend":[-1,10],"spark":[-1,1],"spectral_helix":[-1,5],"spectral_shield_throw":[-1,5],"spectral_throw":[-1,1],"spell_cascade_support":[2,2],"spell_echo_support":[12,12],"spell_totem_support":[-1,4],"spellblade_support":[12,12],"spellslinger":[-1,9],"spirit_offering":[-1,5],"static_strike":[5,5],"steelskin":[-1,3],"storm_brand":[5,5],"storm_burst":[5,5],"storm_call":[5,5],"stormbind":[10,10],"stormblast_mine":[-1,1],"stun_support":[-1,4],"summon_carrion_golem":[13,13],"summon_chaos_golem":[13,13],"summon_flame_golem":[13,13],"summon_holy_relic":[3,3],"summon_ice_golem":[13,13],"summon_lightning_golem":[13,13],"summon_phantasm_support":[-1,2],"summon_raging_spirit":[-1,3],"summon_reaper":[-1,10],"summon_skeletons":[-1,4],"summon_stone_golem":[13,13],"sunder":[-1,5],"sweep":[-1,5],"swift_affliction_support":[-1,11],"swiftbrand_support":[11,11],"swordstorm":[-1,3],"tectonic_slam":[-1,10],"tempest_shield":[-1,8],"trap_and_mine_damage_support":[-1,7],"trauma_support":[-1,12],"trinity_support":[-1,7],"unbound_ailments_support":[-1,4],"unearth":[-1,4],"unleash_support":[12,12],"urgent_orders_support":[-1,11],"vaal_absolution":[-1,14],"vaal_cold_snap":[-1,6],"vigilant_strike":[3,3],"vitality":[4,4],"void_manipulation_support":[-1,4],"void_sphere":[13,13],"volatile_dead":[-1,5],"volatility_support":[-1,7],"volcanic_fissure":[-1,5],"vortex":[-1,10],"vulnerability":[9,9],"war_banner":[-1,3],"wave_of_conviction":[6,6],"winter_orb":[-1,10],"wintertide_brand":[5,5],"wither":[-1,4],"wrath":[-1,9],"zealotry":[9,9]},
+  },
+};
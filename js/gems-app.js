@@ -108,6 +108,7 @@
     body.innerHTML = '';
 
     const engFlags = getEnglishFlags();
+    if (engFlags.quest !== false) loadEnNames();  // re-renders on 'en-names-loaded'
     const rewards = activeTab === 'quest' ? GEM_DATA.questRewards : GEM_DATA.vendorRewards;
     if (!rewards) return;
 
@@ -393,6 +394,17 @@
     if (modalBody) {
       modalBody.addEventListener('scroll', () => GemTooltip.hide());
     }
+
+    // Newer gem data from a release delta (data-release.js)
+    window.addEventListener('data-release-applied', () => {
+      const overlay = document.getElementById('gem-modal-overlay');
+      if (overlay && overlay.classList.contains('open')) renderBody();
+    });
+    // English quest names arrived (loadEnNames in i18n.js)
+    window.addEventListener('en-names-loaded', () => {
+      const overlay = document.getElementById('gem-modal-overlay');
+      if (overlay && overlay.classList.contains('open')) renderBody();
+    });
   }
 
   // Expose for external reset (from app.js new league / clear all)
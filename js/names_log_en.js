@@ -0,0 +1,170 @@
+// EN client log zone name -> Korean zone, generated by names.py (do not edit)
+// Keys are normName()-normalized; loaded by sync.js for logs in this language
+const LOG_ZONES_EN = {
+  "twilight strand": "황혼의 해안",
+  "coast": "해안 지대",
+  "submerged passage": "물에 잠긴 길",
+  "mud flats": "갯벌",
+  "tidal island": "물결 섬",
+  "ledge": "바위 턱",
+  "flooded depths": "물에 잠긴 심연",
+  "climb": "고개",
+  "lower prison": "수용소 하층",
+  "upper prison": "수용소 상층",
+  "prisoner's gate": "죄수의 문",
+  "ship graveyard": "배들의 묘지",
+  "ship graveyard cave": "배들의 묘지 동굴",
+  "cavern of wrath": "진노의 암굴",
+  "southern forest": "남쪽 숲",
+  "southen forest": "남쪽 숲",
+  "forest encampment": "숲 야영지",
+  "old fields": "버려진 경작지",
+  "den": "굴",
+  "crossroads": "갈림길",
+  "chamber of sins level 1": "죄악의 방 1층",
+  "chamber of sins": "죄악의 방 1층",
+  "chamber of sins 1": "죄악의 방 1층",
+  "chamber of sins level 2": "죄악의 방 2층",
+  "chamber of sins 2": "죄악의 방 2층",
+  "riverways": "강변길",
+  "western forest": "서쪽 숲",
+  "weaver's chambers": "거미의 방",
+  "weaver's chamber": "거미의 방",
+  "broken bridge": "부서진 다리",
+  "wetlands": "습지대",
+  "wetlannds": "습지대",
+  "fellshrine ruins": "몰락한 성소 유적",
+  "felshrine ruins": "몰락한 성소 유적",
+  "vaal ruins": "바알 유적",
+  "northern forest": "북쪽 숲",
+  "caverns": "동굴",
+  "ancient pyramid": "고대 피라미드",
+  "crypt": "지하실",
+  "crypt level 2": "지하실 2층",
+  "city of sarn": "사안 도시",
+  "slums": "빈민가",
+  "crematorium": "화장터",
+  "sewers": "하수도",
+  "marketplace": "장터",
+  "catacombs": "지하 묘지",
+  "battlefront": "전쟁터",
+  "docks": "항구",
+  "solaris temple level 1": "솔라리스 사원 1층",
+  "solaris temple 1": "솔라리스 사원 1층",
+  "solaris temple 1 (a8)": "솔라리스 사원 1층",
+  "solaris temple level 2": "솔라리스 사원 2층",
+  "solaris temple 2": "솔라리스 사원 2층",
+  "ebony barracks": "칠흑의 군단 주둔지",
+  "ebony baracks": "칠흑의 군단 주둔지",
+  "lunaris temple level 1": "루나리스 사원 1층",
+  "lunaris temple 1": "루나리스 사원 1층",
+  "lunaris temple 1 (a8)": "루나리스 사원 1층",
+  "lunaris temple level 2": "루나리스 사원 2층",
+  "lunaris temple 2": "루나리스 사원 2층",
+  "lunaris temple 2 (a8)": "루나리스 사원 2층",
+  "imperial gardens": "황실 정원",
+  "imperial garden": "황실 정원",
+  "library": "도서관",
+  "archives": "서고",
+  "sceptre of god": "신의 셉터",
+  "sceptre of god 1": "신의 셉터",
+  "upper sceptre of god": "신의 셉터 상층",
+  "sceptre of god 2": "신의 셉터 상층",
+  "aqueduct": "수로",
+  "dried lake": "말라붙은 호수",
+  "mines level 1": "광산 1층",
+  "mines": "광산 1층",
+  "mines level 2": "광산 2층",
+  "mines 2": "광산 2층",
+  "crystal veins": "수정 광맥",
+  "daresso's dream": "다레소의 꿈",
+  "grand arena": "대 투기장",
+  "kaom's dream": "카옴의 꿈",
+  "kaom's stronghold": "카옴의 요새",
+  "belly of the beast level 1": "짐승의 소굴 1층",
+  "belly of the beast 1": "짐승의 소굴 1층",
+  "belly of the beast level 2": "짐승의 소굴 2층",
+  "belly of the beast 2": "짐승의 소굴 2층",
+  "harvest": "수확소",
+  "ascent": "오르막길",
+  "slave pens": "노예 감호소",
+  "control blocks": "관리 구역",
+  "oriath square": "오리아스 광장",
+  "templar courts": "템플러의 법정",
+  "courthouse": "템플러의 법정",
+  "chamber of innocence": "결백의 방",
+  "ruined square": "멸망한 광장",
+  "ossuary": "납골당",
+  "reliquary": "성유물 보관실",
+  "cathedral rooftop": "대성당 옥상",
+  "karui ramparts": "카루이 방벽",
+  "karui fortress": "카루이 요새",
+  "ridge": "산등성이",
+  "shavronne's tower": "샤브론의 탑",
+  "shavrones tower": "샤브론의 탑",
+  "cavern of anger": "분노의 암굴",
+  "beacon": "등대",
+  "brine king's reef": "염수왕의 암초",
+  "spawning ground": "산란장",
+  "maligaro's sanctum": "말리가로의 지성소",
+  "ashen fields": "잿빛 들판",
+  "fortress encampment": "요새 야영지",
+  "dread thicket": "공포의 잡목림",
+  "den of despair": "절망의 소굴",
+  "causeway": "둑길",
+  "vaal city": "바알 도시",
+  "temple of decay level 1": "부패의 사원 1층",
+  "temple of decay 1": "부패의 사원 1층",
+  "temple of decay level 2": "부패의 사원 2층",
+  "temple of decay 2": "부패의 사원 2층",
+  "valley of the fire drinker": "불 마시는 자의 계곡",
+  "sarn ramparts": "사안 성벽",
+  "sarn encampment": "사안 야영지",
+  "toxic conduits": "독성 도관",
+  "toxic conduit": "독성 도관",
+  "doedre's cesspool": "도이드리의 정화조",
+  "doedress cespool": "도이드리의 정화조",
+  "cauldron": "가마솥",
+  "sewer outlet": "하수도 출구",
+  "quay": "부두",
+  "resurrection site": "부활의 장소",
+  "grain gate": "곡물의 문",
+  "imperial fields": "황실 들판",
+  "underbelly": "황실 들판",
+  "solaris concourse": "솔라리스 중앙 광장",
+  "harbour bridge": "항구 다리",
+  "lunaris concourse": "루나리스 중앙 광장",
+  "sky shrine": "하늘의 성소",
+  "blood aqueduct": "피의 수로",
+  "blood auquaduct": "피의 수로",
+  "bath house": "목욕탕",
+  "high gardens": "고층 정원",
+  "pools of terror": "공포의 웅덩이",
+  "descent": "비탈",
+  "vastiri desert": "바스티리 사막",
+  "oasis": "오아시스",
+  "foothills": "구릉",
+  "boiling lake": "끓어오르는 호수",
+  "tunnel": "터널",
+  "quarry": "채석장",
+  "refinery": "제련소",
+  "shrine of the winds": "바람의 성소",
+  "belly of the beast": "짐승의 소굴",
+  "rotting core": "썩어가는 중심부",
+  "black core": "검은 중심부",
+  "shavronne's sorrow": "샤브론의 슬픔",
+  "doedre's despair": "도이드리의 절망",
+  "maligaro's misery": "말리가로의 비탄",
+  "black heart": "검은 심장",
+  "oriath docks": "오리아스 부두",
+  "cathedral pinnacle": "대성당 첨탑",
+  "ravaged square": "파괴된 광장",
+  "torched courts": "타오르는 법정",
+  "torched courts (a10)": "타오르는 법정",
+  "desecrated chambers": "무너진 방",
+  "sanctum of innocence": "결백의 성소",
+  "canals": "운하",
+  "feeding trough": "먹이통",
+  "feeding through": "먹이통",
+  "altar of hunger": "굶주림의 제단",
+};
@@ -0,0 +1,138 @@
+// KR client log zone name -> Korean zone, generated by names.py (do not edit)
+// Keys are normName()-normalized; loaded by sync.js for logs in this language
+const LOG_ZONES_KR = {
+  "황혼의 해안": "황혼의 해안",
+  "해안 지대": "해안 지대",
+  "물에 잠긴 길": "물에 잠긴 길",
+  "갯벌": "갯벌",
+  "물결 섬": "물결 섬",
+  "바위 턱": "바위 턱",
+  "물에 잠긴 심연": "물에 잠긴 심연",
+  "고개": "고개",
+  "수용소 하층": "수용소 하층",
+  "수용소 상층": "수용소 상층",
+  "죄수의 문": "죄수의 문",
+  "배들의 묘지": "배들의 묘지",
+  "배들의 묘지 동굴": "배들의 묘지 동굴",
+  "진노의 암굴": "진노의 암굴",
+  "남쪽 숲": "남쪽 숲",
+  "숲 야영지": "숲 야영지",
+  "버려진 경작지": "버려진 경작지",
+  "굴": "굴",
+  "갈림길": "갈림길",
+  "죄악의 방 1층": "죄악의 방 1층",
+  "죄악의 방 2층": "죄악의 방 2층",
+  "강변길": "강변길",
+  "서쪽 숲": "서쪽 숲",
+  "거미의 방": "거미의 방",
+  "부서진 다리": "부서진 다리",
+  "습지대": "습지대",
+  "몰락한 성소 유적": "몰락한 성소 유적",
+  "바알 유적": "바알 유적",
+  "북쪽 숲": "북쪽 숲",
+  "동굴": "동굴",
+  "고대 피라미드": "고대 피라미드",
+  "지하실": "지하실",
+  "지하실 2층": "지하실 2층",
+  "사안 도시": "사안 도시",
+  "빈민가": "빈민가",
+  "화장터": "화장터",
+  "하수도": "하수도",
+  "장터": "장터",
+  "지하 묘지": "지하 묘지",
+  "전쟁터": "전쟁터",
+  "항구": "항구",
+  "솔라리스 사원 1층": "솔라리스 사원 1층",
+  "솔라리스 사원 2층": "솔라리스 사원 2층",
+  "칠흑의 군단 주둔지": "칠흑의 군단 주둔지",
+  "루나리스 사원 1층": "루나리스 사원 1층",
+  "루나리스 사원 2층": "루나리스 사원 2층",
+  "황실 정원": "황실 정원",
+  "도서관": "도서관",
+  "서고": "서고",
+  "신의 셉터": "신의 셉터",
+  "신의 셉터 상층": "신의 셉터 상층",
+  "수로": "수로",
+  "말라붙은 호수": "말라붙은 호수",
+  "광산 1층": "광산 1층",
+  "광산 2층": "광산 2층",
+  "수정 광맥": "수정 광맥",
+  "다레소의 꿈": "다레소의 꿈",
+  "대 투기장": "대 투기장",
+  "카옴의 꿈": "카옴의 꿈",
+  "카옴의 요새": "카옴의 요새",
+  "짐승의 소굴 1층": "짐승의 소굴 1층",
+  "짐승의 소굴 2층": "짐승의 소굴 2층",
+  "수확소": "수확소",
+  "오르막길": "오르막길",
+  "노예 감호소": "노예 감호소",
+  "관리 구역": "관리 구역",
+  "오리아스 광장": "오리아스 광장",
+  "템플러의 법정": "템플러의 법정",
+  "결백의 방": "결백의 방",
+  "멸망한 광장": "멸망한 광장",
+  "납골당": "납골당",
+  "성유물 보관실": "성유물 보관실",
+  "대성당 옥상": "대성당 옥상",
+  "카루이 방벽": "카루이 방벽",
+  "카루이 요새": "카루이 요새",
+  "산등성이": "산등성이",
+  "샤브론의 탑": "샤브론의 탑",
+  "분노의 암굴": "분노의 암굴",
+  "등대": "등대",
+  "염수왕의 암초": "염수왕의 암초",
+  "산란장": "산란장",
+  "말리가로의 지성소": "말리가로의 지성소",
+  "잿빛 들판": "잿빛 들판",
+  "요새 야영지": "요새 야영지",
+  "공포의 잡목림": "공포의 잡목림",
+  "절망의 소굴": "절망의 소굴",
+  "둑길": "둑길",
+  "바알 도시": "바알 도시",
+  "부패의 사원 1층": "부패의 사원 1층",
+  "부패의 사원 2층": "부패의 사원 2층",
+  "불 마시는 자의 계곡": "불 마시는 자의 계곡",
+  "사안 성벽": "사안 성벽",
+  "사안 야영지": "사안 야영지",
+  "독성 도관": "독성 도관",
+  "도이드리의 정화조": "도이드리의 정화조",
+  "가마솥": "가마솥",
+  "하수도 출구": "하수도 출구",
+  "부두": "부두",
+  "부활의 장소": "부활의 장소",
+  "곡물의 문": "곡물의 문",
+  "황실 들판": "황실 들판",
+  "솔라리스 중앙 광장": "솔라리스 중앙 광장",
+  "항구 다리": "항구 다리",
+  "루나리스 중앙 광장": "루나리스 중앙 광장",
+  "하늘의 성소": "하늘의 성소",
+  "피의 수로": "피의 수로",
+  "목욕탕": "목욕탕",
+  "고층 정원": "고층 정원",
+  "공포의 웅덩이": "공포의 웅덩이",
+  "비탈": "비탈",
+  "바스티리 사막": "바스티리 사막",
+  "오아시스": "오아시스",
+  "구릉": "구릉",
+  "끓어오르는 호수": "끓어오르는 호수",
+  "터널": "터널",
+  "채석장": "채석장",
+  "제련소": "제련소",
+  "바람의 성소": "바람의 성소",
+  "짐승의 소굴": "짐승의 소굴",
+  "썩어가는 중심부": "썩어가는 중심부",
+  "검은 중심부": "검은 중심부",
+  "샤브론의 슬픔": "샤브론의 슬픔",
+  "도이드리의 절망": "도이드리의 절망",
+  "말리가로의 비탄": "말리가로의 비탄",
+  "검은 심장": "검은 심장",
+  "오리아스 부두": "오리아스 부두",
+  "대성당 첨탑": "대성당 첨탑",
+  "파괴된 광장": "파괴된 광장",
+  "타오르는 법정": "타오르는 법정",
+  "무너진 방": "무너진 방",
+  "결백의 성소": "결백의 성소",
+  "운하": "운하",
+  "먹이통": "먹이통",
+  "굶주림의 제단": "굶주림의 제단",
+};
@@ -0,0 +1,298 @@
+// Step HTML prerendered from data_v2.js + names.py by prerender.py (do not edit)
+// [sectionId][stepIdx] = html, or [html, newLeagueVariantHtml]
+// hashes[sectionId] = source_hash() of the steps the section was rendered from
+const PRERENDERED = {
+  engTypes: ["zone", "boss", "npc", "quest", "trial"],
+  hashes: {"general": "811c9dc5", "act1": "f8b41fa6", "act2": "c46fbab6", "act3": "1c0a4312", "act4": "883fc9d6", "act5": "e09901ae", "act6": "dfcd456b", "act7": "136ba5f9", "act8": "0fccb321", "act9": "af427f0d", "act10": "46672994"},
+  general: [
+  ],
+  act1: [
+    "<span class=\"zone\">황혼의 해안<span class=\"eng-anno\">The Twilight Strand</span></span>에서 첫 몹 처치 ➞ <span class=\"boss\">힐록<span class=\"eng-anno\">Hillock</span></span> 처치. 힐록은 레벨업 보장, 다른 몹은 잡을 필요 없음",
+    "<span class=\"npc\">타클레이</span>에게 퀘스트 제출(스킬 젬 보상), <span class=\"zone\">물에 잠긴 길<span class=\"eng-anno\">The Submerged Passage</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동",
+    ["<span class=\"zone\">해안 지대<span class=\"eng-anno\">The Coast</span></span>에서 아무것도 잡지 말고 ➞ <span class=\"zone\">갯벌<span class=\"eng-anno\">The Mud Flats</span></span>. 다음 두 구역에서 레벨 4 충분", "<span class=\"zone\">해안 지대<span class=\"eng-anno\">The Coast</span></span>에서 아무것도 잡지 말고 ➞ <span class=\"zone\">갯벌<span class=\"eng-anno\">The Mud Flats</span></span> (<span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기). 다음 두 구역에서 레벨 4 충분"],
+    "<span class=\"zone\">갯벌<span class=\"eng-anno\">The Mud Flats</span></span>에서 <span class=\"quest\">상형 문자<span class=\"eng-anno\">Glyphs</span></span> 3개 수집 ➞ <span class=\"zone\">물에 잠긴 길<span class=\"eng-anno\">The Submerged Passage</span></span>",
+    ["<span class=\"zone\">해안 지대<span class=\"eng-anno\">The Coast</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">물결 섬<span class=\"eng-anno\">The Tidal Island</span></span>", "<span class=\"zone\">물에 잠긴 길<span class=\"eng-anno\">The Submerged Passage</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>를 찍고, <span class=\"zone\">해안 지대<span class=\"eng-anno\">The Coast</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">물결 섬<span class=\"eng-anno\">The Tidal Island</span></span>"],
+    "<span class=\"zone\">물결 섬<span class=\"eng-anno\">The Tidal Island</span></span>에서 <span class=\"boss\">우박 갈퀴<span class=\"eng-anno\">Hailrake</span></span> 처치, <span class=\"quest\">약품 상자<span class=\"eng-anno\">Medicine Chest</span></span> 획득, <span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 귀환 <span class=\"zone izone\">라이온아이 초소</span>. 레벨 4 목표 (이동 스킬 + 퀵실버 해금)",
+    "<span class=\"zone\">라이온아이 초소</span>에서 <span class=\"npc\">네사</span>에게 퀘스트 제출(퀵실버 + 보조 젬), <span class=\"zone\">물에 잠긴 길<span class=\"eng-anno\">The Submerged Passage</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동",
+    "긴 계단이나 다리를 찾기",
+    "계단/다리에서 <span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>을 열고 ➞ <span class=\"zone\">바위 턱<span class=\"eng-anno\">The Ledge</span></span>",
+    ["마을로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동, 아까 놓은 <span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 되돌아감 <span class=\"zone izone\">라이온아이 초소</span>", "<span class=\"zone\">바위 턱<span class=\"eng-anno\">The Ledge</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>를 찍고 마을로 이동, 아까 놓은 <span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 되돌아감 <span class=\"zone izone\">라이온아이 초소</span>"],
+    "계단 오른쪽으로 가면 <span class=\"zone\">물에 잠긴 심연<span class=\"eng-anno\">The Flooded Depths</span></span>",
+    "<span class=\"boss\">심연의 주인<span class=\"eng-anno\">The Dweller of the Deep</span></span> 처치 후 로그아웃",
+    "<span class=\"zone\">바위 턱<span class=\"eng-anno\">The Ledge</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">고개<span class=\"eng-anno\">The Climb</span></span>",
+    "<span class=\"zone\">고개<span class=\"eng-anno\">The Climb</span></span> (석순 3개가 출구 방향을 가리킴) ➞ <span class=\"zone\">수용소 하층<span class=\"eng-anno\">The Lower Prison</span></span>",
+    ["<span class=\"zone\">수용소 하층<span class=\"eng-anno\">The Lower Prison</span></span> ➞ <span class=\"zone\">수용소 상층<span class=\"eng-anno\">The Upper Prison</span></span>", "<span class=\"zone\">수용소 하층<span class=\"eng-anno\">The Lower Prison</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>를 찍고 <span class=\"trial\">전직 시험<span class=\"eng-anno\">Trial of Ascendancy</span></span> 완료 ➞ <span class=\"zone\">수용소 상층<span class=\"eng-anno\">The Upper Prison</span></span>"],
+    "<span class=\"boss\">브루투스<span class=\"eng-anno\">Brutus</span></span> 처치 후 로그아웃",
+    "<span class=\"zone\">죄수의 문<span class=\"eng-anno\">Prisoner's Gate</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">배들의 묘지<span class=\"eng-anno\">The Ship Graveyard</span></span>",
+    "<span class=\"zone\">배들의 묘지 동굴<span class=\"eng-anno\">The Ship Graveyard Cave</span></span> 앞에 <span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span> 열기",
+    ["마을로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동, <span class=\"npc\">네사</span>에게 스킬 젬 보상 수령 <span class=\"zone izone\">라이온아이 초소</span>", "<span class=\"zone\">진노의 암굴<span class=\"eng-anno\">The Cavern of Wrath</span></span> <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>를 찾아 마을로 이동, <span class=\"npc\">네사</span>에게 스킬 젬 보상 수령 <span class=\"zone izone\">라이온아이 초소</span>"],
+    "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 <span class=\"zone\">배들의 묘지 동굴<span class=\"eng-anno\">The Ship Graveyard Cave</span></span>에 들어가 <span class=\"quest\">올플레임<span class=\"eng-anno\">Allflame</span></span> 획득 후 로그아웃",
+    "<span class=\"zone\">배들의 묘지<span class=\"eng-anno\">The Ship Graveyard</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"boss\">페어그레이브즈 선장<span class=\"eng-anno\">Captain Fairgraves</span></span> 처치 후 로그아웃",
+    "<span class=\"zone\">라이온아이 초소</span>에서 <span class=\"npc\">베스텔<span class=\"eng-anno\">Bestel</span></span>에게 말걸어 스킬 포인트 획득",
+    "<span class=\"zone\">진노의 암굴<span class=\"eng-anno\">The Cavern of Wrath</span></span> <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>로 이동 ➞ <span class=\"boss\">사이렌 머베일<span class=\"eng-anno\">Merveil the Siren</span></span> 처치 ➞ 2장. 머베일 처치 시 레벨 11.5~12 목표",
+  ],
+  act2: [
+    "<span class=\"zone\">남쪽 숲<span class=\"eng-anno\">The Southern Forest</span></span>으로 이동 ➞ <span class=\"zone\">숲 야영지<span class=\"eng-anno\">The Forest Encampment</span></span>",
+    "북동쪽 <span class=\"zone\">버려진 경작지<span class=\"eng-anno\">The Old Fields</span></span>로 이동, <span class=\"zone\">굴<span class=\"eng-anno\">The Den</span></span> 앞에 <span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span> 열기 ➞ <span class=\"zone\">갈림길<span class=\"eng-anno\">The Crossroads</span></span>",
+    ["마을로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동, <span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 <span class=\"zone\">굴<span class=\"eng-anno\">The Den</span></span> 입장 <span class=\"zone izone\">숲 야영지</span>", "<span class=\"zone\">갈림길<span class=\"eng-anno\">The Crossroads</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>를 찍고 마을로 이동, <span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 <span class=\"zone\">굴<span class=\"eng-anno\">The Den</span></span> 입장 <span class=\"zone izone\">숲 야영지</span>"],
+    "<span class=\"zone\">굴<span class=\"eng-anno\">The Den</span></span>에서 <span class=\"boss\">거대한 백색 야수<span class=\"eng-anno\">The Great White Beast</span></span> 처치 후 로그아웃",
+    "<span class=\"zone\">갈림길<span class=\"eng-anno\">The Crossroads</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ 북쪽 <span class=\"zone\">죄악의 방 1층<span class=\"eng-anno\">The Chamber of Sins Level 1</span></span>",
+    ["<span class=\"zone\">죄악의 방 1층<span class=\"eng-anno\">The Chamber of Sins Level 1</span></span> ➞ 2층 (<span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>가 다음 층 방향을 가리킴)", "<span class=\"zone\">죄악의 방 1층<span class=\"eng-anno\">The Chamber of Sins Level 1</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 (<span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>가 다음 층 방향을 가리킴) ➞ 2층"],
+    ["<span class=\"zone\">죄악의 방 2층<span class=\"eng-anno\">The Chamber of Sins Level 2</span></span>에서 긴 복도를 찾기", "<span class=\"zone\">죄악의 방 2층<span class=\"eng-anno\">The Chamber of Sins Level 2</span></span>에서 <span class=\"trial\">전직 시험<span class=\"eng-anno\">Trial of Ascendancy</span></span> 완료 (보통 북쪽), 긴 복도를 찾기"],
+    "<span class=\"boss\">피델리타스<span class=\"eng-anno\">Fidelitas</span></span> 처치, <span class=\"quest\">사악한 젬<span class=\"eng-anno\">The Baleful Gem</span></span> 획득 후 로그아웃",
+    ["<span class=\"zone\">숲 야영지<span class=\"eng-anno\">The Forest Encampment</span></span>에서 <span class=\"npc\">그루스트</span>에게 헤럴드 보상 (또는 스키터봇) 수령", "<span class=\"zone\">숲 야영지<span class=\"eng-anno\">The Forest Encampment</span></span>에서 <span class=\"npc\">그루스트</span>에게 헤럴드 보상 (또는 스키터봇) 수령, 상인 확인"],
+    "<span class=\"zone\">갈림길<span class=\"eng-anno\">The Crossroads</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ 남쪽 <span class=\"zone\">몰락한 성소 유적<span class=\"eng-anno\">The Fellshrine Ruins</span></span>",
+    "<span class=\"zone\">계단</span> 말고 <span class=\"zone\">지하실 1층</span>을 찾아 <span class=\"trial\">전직 시험<span class=\"eng-anno\">Trial of Ascendancy</span></span> 완료 후 로그아웃",
+    "<span class=\"zone\">갈림길<span class=\"eng-anno\">The Crossroads</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">강변길<span class=\"eng-anno\">The Riverways</span></span>, <span class=\"npc\">아인하르<span class=\"eng-anno\">Einhar</span></span> 퀘스트 진행 ➞ <span class=\"zone\">서쪽 숲<span class=\"eng-anno\">The Western Forest</span></span>",
+    ["<span class=\"zone\">서쪽 숲<span class=\"eng-anno\">The Western Forest</span></span> (<span class=\"boss\">알리라<span class=\"eng-anno\">Alira</span></span>는 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>와 같은 쪽, <span class=\"zone\">거미의 방<span class=\"eng-anno\">The Weaver's Chambers</span></span>은 반대쪽)", "<span class=\"zone\">서쪽 숲<span class=\"eng-anno\">The Western Forest</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 (<span class=\"boss\">알리라<span class=\"eng-anno\">Alira</span></span>는 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>와 같은 쪽, <span class=\"zone\">거미의 방<span class=\"eng-anno\">The Weaver's Chambers</span></span>은 반대쪽)"],
+    "<span class=\"zone\">거미의 방<span class=\"eng-anno\">The Weaver's Chambers</span></span>으로 이동, 거미 처치, <span class=\"quest\">실 감개<span class=\"eng-anno\">Silk Spool</span></span> 획득 후 로그아웃. 레벨 16 목표 (헤럴드 등 레벨 16 젬 활용)",
+    "<span class=\"npc\">실크</span>에게 보조 젬 보상 수령, <span class=\"zone\">갈림길<span class=\"eng-anno\">The Crossroads</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ 북쪽 <span class=\"zone\">부서진 다리<span class=\"eng-anno\">The Broken Bridge</span></span>",
+    "<span class=\"boss\">크레이틴<span class=\"eng-anno\">Kraityn</span></span> 처치 (또는 도적 선택), 로그아웃 후 재접속",
+    "<span class=\"zone\">강변길<span class=\"eng-anno\">The Riverways</span></span>을 따라 북쪽 ➞ <span class=\"zone\">습지대<span class=\"eng-anno\">The Wetlands</span></span>",
+    ["<span class=\"zone\">습지대<span class=\"eng-anno\">The Wetlands</span></span>에서 <span class=\"boss\">오크<span class=\"eng-anno\">Oak</span></span> 처치", "<span class=\"zone\">습지대<span class=\"eng-anno\">The Wetlands</span></span>에서 <span class=\"boss\">오크<span class=\"eng-anno\">Oak</span></span> 처치, 바로 북쪽 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기"],
+    "<span class=\"zone\">서쪽 숲<span class=\"eng-anno\">The Western Forest</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동, <span class=\"boss\">알리라<span class=\"eng-anno\">Alira</span></span> 도움",
+    "<span class=\"boss\">아르테리<span class=\"eng-anno\">Arteri</span></span> 처치, <span class=\"quest\">마석 아황산염<span class=\"eng-anno\">Thaumetic Sulphite</span></span> 획득 후 로그아웃",
+    ["2장 마을로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">습지대<span class=\"eng-anno\">The Wetlands</span></span> ➞ <span class=\"zone\">바알 유적<span class=\"eng-anno\">The Vaal Ruins</span></span> <span class=\"zone izone\">숲 야영지</span>", "1장으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동, <span class=\"npc\">베스텔<span class=\"eng-anno\">Bestel</span></span>에게 스킬 포인트 보상 수령, 상인 확인 ➞ 2장 마을 ➞ <span class=\"zone\">습지대<span class=\"eng-anno\">The Wetlands</span></span> ➞ <span class=\"zone\">바알 유적<span class=\"eng-anno\">The Vaal Ruins</span></span> <span class=\"zone izone\">숲 야영지</span>"],
+    "<span class=\"zone\">바알 유적<span class=\"eng-anno\">The Vaal Ruins</span></span> ➞ <span class=\"zone\">북쪽 숲<span class=\"eng-anno\">The Northern Forest</span></span> ➞ <span class=\"zone\">동굴<span class=\"eng-anno\">The Caverns</span></span>",
+    ["마을로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 <span class=\"zone izone\">숲 야영지</span>", "<span class=\"zone\">동굴<span class=\"eng-anno\">The Caverns</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>를 찍고 마을로 이동, 상인 확인 <span class=\"zone izone\">숲 야영지</span>"],
+    "<span class=\"zone\">동굴<span class=\"eng-anno\">The Caverns</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">고대 피라미드<span class=\"eng-anno\">The Ancient Pyramid</span></span>",
+    ["<span class=\"boss\">바알 오버소울<span class=\"eng-anno\">Vaal Oversoul</span></span> 처치. 레벨 21~22 목표", "<span class=\"boss\">바알 오버소울<span class=\"eng-anno\">Vaal Oversoul</span></span> 처치 (제작법 잊지 말 것). 레벨 21~22 목표"],
+    ["로그아웃, 3장으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동", "로그아웃, 상인 확인 후 3장으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동"],
+  ],
+  act3: [
+    "북쪽으로 이동하여 <span class=\"npc\">클라리사<span class=\"eng-anno\">Clarissa</span></span> 구출 (도착할 때까지 기다릴 것)",
+    "마을 ➞ <span class=\"zone\">빈민가<span class=\"eng-anno\">The Slums</span></span> ➞ <span class=\"zone\">화장터<span class=\"eng-anno\">The Crematorium</span></span> <span class=\"zone izone\">사안 야영지</span>",
+    "동물원으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동하여 유니크 확인",
+    "<span class=\"zone\">화장터<span class=\"eng-anno\">The Crematorium</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동, <span class=\"trial\">전직 시험<span class=\"eng-anno\">Trial of Ascendancy</span></span> 완료",
+    "<span class=\"boss\">파이어티<span class=\"eng-anno\">Piety</span></span> 처치, <span class=\"quest\">톨먼의 팔찌<span class=\"eng-anno\">Tolman's Bracelet</span></span> 획득 후 로그아웃",
+    ["<span class=\"zone\">사안 야영지<span class=\"eng-anno\">The Sarn Encampment</span></span>에서 <span class=\"npc\">마라모아</span>에게 보상 수령(오라/저주 젬)", "<span class=\"zone\">사안 야영지<span class=\"eng-anno\">The Sarn Encampment</span></span>에서 <span class=\"npc\">마라모아</span>에게 보상 수령(오라/저주 젬), 상인 확인"],
+    "<span class=\"zone\">사안 야영지<span class=\"eng-anno\">The Sarn Encampment</span></span>에서 <span class=\"npc\">클라리사<span class=\"eng-anno\">Clarissa</span></span>에게 말걸어 하수도 열쇠 획득",
+    "<span class=\"zone\">빈민가<span class=\"eng-anno\">The Slums</span></span>로 돌아가 ➞ <span class=\"zone\">하수도<span class=\"eng-anno\">The Sewers</span></span>",
+    ["<span class=\"zone\">하수도<span class=\"eng-anno\">The Sewers</span></span>에서 <span class=\"quest\">백금 흉상<span class=\"eng-anno\">Platinum Busts</span></span> 3개 수집 ➞ <span class=\"zone\">장터<span class=\"eng-anno\">The Marketplace</span></span>", "<span class=\"zone\">하수도<span class=\"eng-anno\">The Sewers</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>를 찍고 <span class=\"quest\">백금 흉상<span class=\"eng-anno\">Platinum Busts</span></span> 3개 수집 ➞ <span class=\"zone\">장터<span class=\"eng-anno\">The Marketplace</span></span>"],
+    "<span class=\"zone\">장터<span class=\"eng-anno\">The Marketplace</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>를 찍고 ➞ <span class=\"zone\">지하 묘지<span class=\"eng-anno\">The Catacombs</span></span>, <span class=\"trial\">전직 시험<span class=\"eng-anno\">Trial of Ascendancy</span></span> 완료 후 로그아웃",
+    ["➞ <span class=\"zone\">전쟁터<span class=\"eng-anno\">The Battlefront</span></span> (보통 <span class=\"zone\">지하 묘지<span class=\"eng-anno\">The Catacombs</span></span> 반대편)", "<span class=\"zone\">장터<span class=\"eng-anno\">The Marketplace</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">전쟁터<span class=\"eng-anno\">The Battlefront</span></span> (보통 <span class=\"zone\">지하 묘지<span class=\"eng-anno\">The Catacombs</span></span> 반대편)"],
+    ["<span class=\"zone\">전쟁터<span class=\"eng-anno\">The Battlefront</span></span>에서 <span class=\"quest\">끈 감개<span class=\"eng-anno\">The Ribbon Spool</span></span> 획득", "<span class=\"zone\">전쟁터<span class=\"eng-anno\">The Battlefront</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>를 찍고 <span class=\"quest\">끈 감개<span class=\"eng-anno\">The Ribbon Spool</span></span> 획득"],
+    "<span class=\"zone\">항구<span class=\"eng-anno\">The Docks</span></span>로 이동 (레벨 23 이하면 솔라리스 사원으로). 경험치를 얻으려면 레벨 24+ 필요, 레벨 26.5까지 파밍하기 좋음",
+    ["<span class=\"zone\">항구<span class=\"eng-anno\">The Docks</span></span>에서 <span class=\"quest\">마석 아황산염<span class=\"eng-anno\">Thaumetic Sulphite</span></span> 획득, 로그아웃 후 <span class=\"npc\">하간</span>에게 퀘스트 제출(스킬 포인트)", "<span class=\"zone\">항구<span class=\"eng-anno\">The Docks</span></span>에서 <span class=\"quest\">마석 아황산염<span class=\"eng-anno\">Thaumetic Sulphite</span></span> 획득, 로그아웃 후 <span class=\"npc\">하간</span>에게 퀘스트 제출(스킬 포인트), 상인 확인"],
+    "<span class=\"zone\">전쟁터<span class=\"eng-anno\">The Battlefront</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ 북쪽 <span class=\"zone\">솔라리스 사원 1층<span class=\"eng-anno\">The Solaris Temple Level 1</span></span>",
+    ["<span class=\"zone\">솔라리스 사원 1층<span class=\"eng-anno\">The Solaris Temple Level 1</span></span> ➞ 2층", "<span class=\"zone\">솔라리스 사원 1층<span class=\"eng-anno\">The Solaris Temple Level 1</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 ➞ 2층"],
+    "<span class=\"zone\">솔라리스 사원 2층<span class=\"eng-anno\">The Solaris Temple Level 2</span></span>에서 <span class=\"quest\">끈 감개<span class=\"eng-anno\">The Ribbon Spool</span></span> 제출",
+    ["<span class=\"zone\">하수도<span class=\"eng-anno\">The Sewers</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">칠흑의 군단 주둔지<span class=\"eng-anno\">The Ebony Barracks</span></span>", "<span class=\"zone\">하수도<span class=\"eng-anno\">The Sewers</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동, 제작법 획득 ➞ <span class=\"zone\">칠흑의 군단 주둔지<span class=\"eng-anno\">The Ebony Barracks</span></span>"],
+    ["<span class=\"zone\">칠흑의 군단 주둔지<span class=\"eng-anno\">The Ebony Barracks</span></span>에서 <span class=\"boss\">그라비시우스 장군<span class=\"eng-anno\">General Gravicius</span></span> 처치 (매우 위험) ➞ <span class=\"zone\">루나리스 사원 1층<span class=\"eng-anno\">The Lunaris Temple Level 1</span></span>", "<span class=\"zone\">칠흑의 군단 주둔지<span class=\"eng-anno\">The Ebony Barracks</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>를 찍고 <span class=\"boss\">그라비시우스 장군<span class=\"eng-anno\">General Gravicius</span></span> 처치 (매우 위험) ➞ <span class=\"zone\">루나리스 사원 1층<span class=\"eng-anno\">The Lunaris Temple Level 1</span></span>"],
+    ["<span class=\"zone\">루나리스 사원 1층<span class=\"eng-anno\">The Lunaris Temple Level 1</span></span>에서 <span class=\"npc\">콜<span class=\"eng-anno\">Kole</span></span>을 무시하고 ➞ <span class=\"zone\">루나리스 사원 2층<span class=\"eng-anno\">The Lunaris Temple Level 2</span></span>", "<span class=\"zone\">루나리스 사원 1층<span class=\"eng-anno\">The Lunaris Temple Level 1</span></span>에서 <span class=\"npc\">콜<span class=\"eng-anno\">Kole</span></span>을 무시하고 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 ➞ <span class=\"zone\">루나리스 사원 2층<span class=\"eng-anno\">The Lunaris Temple Level 2</span></span>"],
+    "길 찾기 팁: 마차 1대 = 올바른 길, 2대 = 잘못된 길 (촉수 피조물은 계속 움직여서 피하기)",
+    ["<span class=\"boss\">파이어티<span class=\"eng-anno\">Piety</span></span> 처치 후 로그아웃", "<span class=\"boss\">파이어티<span class=\"eng-anno\">Piety</span></span> 처치, 제작법 획득 후 로그아웃"],
+    "<span class=\"npc\">그리고어</span>에게 퀘스트 제출(스킬 포인트), <span class=\"npc\">마라모아</span>에게 스킬 젬 보상 수령, <span class=\"zone\">칠흑의 군단 주둔지<span class=\"eng-anno\">The Ebony Barracks</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">황실 정원<span class=\"eng-anno\">The Imperial Gardens</span></span>",
+    ["<span class=\"zone\">황실 정원<span class=\"eng-anno\">The Imperial Gardens</span></span> ➞ 북쪽 ➞ <span class=\"zone\">도서관<span class=\"eng-anno\">The Library</span></span>", "<span class=\"zone\">황실 정원<span class=\"eng-anno\">The Imperial Gardens</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>를 찍고 북쪽 ➞ <span class=\"zone\">도서관<span class=\"eng-anno\">The Library</span></span>"],
+    ["<span class=\"zone\">도서관<span class=\"eng-anno\">The Library</span></span> ➞ 느슨한 촛대 ➞ <span class=\"zone\">서고<span class=\"eng-anno\">The Archives</span></span>", "<span class=\"zone\">도서관<span class=\"eng-anno\">The Library</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 ➞ 느슨한 촛대 ➞ <span class=\"zone\">서고<span class=\"eng-anno\">The Archives</span></span>"],
+    "<span class=\"quest\">금빛 서판<span class=\"eng-anno\">Golden Pages</span></span> 4개 획득 후 로그아웃",
+    "<span class=\"zone\">도서관<span class=\"eng-anno\">The Library</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동, <span class=\"npc\">시오사</span>에게 부족한 스킬 젬 구매",
+    ["<span class=\"zone\">황실 정원<span class=\"eng-anno\">The Imperial Gardens</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동", "<span class=\"zone\">황실 정원<span class=\"eng-anno\">The Imperial Gardens</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동, <span class=\"trial\">전직 시험<span class=\"eng-anno\">Trial of Ascendancy</span></span> 완료, 제작법 획득"],
+    ["<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동 <span class=\"zone izone\">사안 야영지</span>", "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, 열망가의 광장 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 획득 <span class=\"zone izone\">사안 야영지</span>"],
+    "<span class=\"zone\">황실 정원<span class=\"eng-anno\">The Imperial Gardens</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">신의 셉터<span class=\"eng-anno\">The Sceptre of God</span></span>",
+    "<span class=\"zone\">신의 셉터<span class=\"eng-anno\">The Sceptre of God</span></span> ➞ <span class=\"zone\">신의 셉터 상층<span class=\"eng-anno\">The Upper Sceptre of God</span></span>",
+    "<span class=\"boss\">도미누스<span class=\"eng-anno\">Dominus</span></span> 처치. 레벨 29~30 목표",
+    "<span class=\"zone\">신의 셉터 상층<span class=\"eng-anno\">The Upper Sceptre of God</span></span> ➞ <span class=\"zone\">수로<span class=\"eng-anno\">The Aqueduct</span></span>를 통해 4장으로 이동",
+  ],
+  act4: [
+    "<span class=\"zone\">수로<span class=\"eng-anno\">The Aqueduct</span></span> ➞ 마을 ➞ <span class=\"zone\">말라붙은 호수<span class=\"eng-anno\">The Dried Lake</span></span> <span class=\"zone izone\">하이게이트</span>",
+    "<span class=\"zone\">말라붙은 호수<span class=\"eng-anno\">The Dried Lake</span></span>에서 <span class=\"boss\">순수의 황제 볼<span class=\"eng-anno\">Voll, Emperor of Purity</span></span> 처치",
+    ["레벨 27~28 미만이면 계속 사냥", "제작법 획득 (레벨 27~28 미만이면 계속 사냥)"],
+    ["<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동 ➞ <span class=\"zone\">광산 1층<span class=\"eng-anno\">The Mines Level 1</span></span> ➞ <span class=\"zone\">광산 2층<span class=\"eng-anno\">The Mines Level 2</span></span> <span class=\"zone izone\">하이게이트</span>", "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, 상인 확인 ➞ <span class=\"zone\">광산 1층<span class=\"eng-anno\">The Mines Level 1</span></span> ➞ <span class=\"zone\">광산 2층<span class=\"eng-anno\">The Mines Level 2</span></span> <span class=\"zone izone\">하이게이트</span>"],
+    "<span class=\"quest\">데쉬렛의 영혼<span class=\"eng-anno\">Deshret's Spirit</span></span> 획득 ➞ <span class=\"zone\">수정 광맥<span class=\"eng-anno\">The Crystal Veins</span></span>",
+    "<span class=\"zone\">수정 광맥<span class=\"eng-anno\">The Crystal Veins</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>와 제작법 획득",
+    "마을로 이동, <span class=\"npc\">타수니</span>에게 스킬 포인트 수령 <span class=\"zone izone\">하이게이트</span>",
+    "열망가의 광장으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동",
+    "승천 시험 완료 (첫 번째 승천) ➞ <span class=\"zone\">수정 광맥<span class=\"eng-anno\">The Crystal Veins</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동. 레벨 30~31 목표 (꿈 구역 경험치 패널티 방지)",
+    "<span class=\"zone\">다레소의 꿈<span class=\"eng-anno\">Daresso's Dream</span></span> ➞ <span class=\"zone\">대 투기장<span class=\"eng-anno\">The Grand Arena</span></span>",
+    ["<span class=\"zone\">대 투기장<span class=\"eng-anno\">The Grand Arena</span></span> ➞ <span class=\"zone\">수정 광맥<span class=\"eng-anno\">The Crystal Veins</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동", "<span class=\"zone\">대 투기장<span class=\"eng-anno\">The Grand Arena</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 ➞ <span class=\"zone\">수정 광맥<span class=\"eng-anno\">The Crystal Veins</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동"],
+    "<span class=\"zone\">카옴의 꿈<span class=\"eng-anno\">Kaom's Dream</span></span> ➞ <span class=\"zone\">카옴의 요새<span class=\"eng-anno\">Kaom's Stronghold</span></span>",
+    "<span class=\"boss\">카옴 왕<span class=\"eng-anno\">King Kaom</span></span> 처치, <span class=\"quest\">광분의 눈<span class=\"eng-anno\">Eye of Fury</span></span> 획득",
+    ["<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동 <span class=\"zone izone\">하이게이트</span>", "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, 상인 확인 <span class=\"zone izone\">하이게이트</span>"],
+    "<span class=\"zone\">대 투기장<span class=\"eng-anno\">The Grand Arena</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동",
+    "<span class=\"boss\">검의 제왕 다레소<span class=\"eng-anno\">Daresso, King of Swords</span></span> 처치",
+    "<span class=\"zone\">수정 광맥<span class=\"eng-anno\">The Crystal Veins</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동",
+    "퀘스트 제출 ➞ <span class=\"zone\">짐승의 소굴 1층<span class=\"eng-anno\">The Belly of the Beast Level 1</span></span> ➞ 2층",
+    "<span class=\"zone\">짐승의 소굴 2층<span class=\"eng-anno\">The Belly of the Beast Level 2</span></span>에서 <span class=\"boss\">파이어티<span class=\"eng-anno\">Piety</span></span> 처치 (빔에 맞지 않기) ➞ <span class=\"zone\">수확소<span class=\"eng-anno\">The Harvest</span></span>",
+    "<span class=\"zone\">수확소<span class=\"eng-anno\">The Harvest</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기",
+    "<span class=\"boss\">도이드리<span class=\"eng-anno\">Doedre</span></span> 처치, <span class=\"quest\">말라카이의 허파<span class=\"eng-anno\">Malachai's Lungs</span></span> 획득",
+    "<span class=\"boss\">말리가로<span class=\"eng-anno\">Maligaro</span></span> 처치, <span class=\"quest\">말라카이의 심장<span class=\"eng-anno\">Malachai's Heart</span></span> 획득",
+    "<span class=\"boss\">샤브론<span class=\"eng-anno\">Shavronne</span></span> 처치, <span class=\"quest\">말라카이의 창자<span class=\"eng-anno\">Malachai's Entrails</span></span> 획득",
+    "<span class=\"npc\">파이어티<span class=\"eng-anno\">Piety</span></span>에게 제출 ➞ <span class=\"boss\">악몽 같은 자 말라카이<span class=\"eng-anno\">Malachai, The Nightmare</span></span> 처치. 레벨 35~36 목표",
+    "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동 <span class=\"zone izone\">하이게이트</span>",
+    ["<span class=\"zone\">하이게이트</span>에서 <span class=\"npc\">오윤</span>에게 스킬 젬(골렘), <span class=\"npc\">디알라</span>에게 보조 젬 보상 수령", "<span class=\"zone\">하이게이트</span>에서 상인 4링크 확인, <span class=\"npc\">오윤</span>에게 스킬 젬(골렘), <span class=\"npc\">디알라</span>에게 보조 젬 보상 수령"],
+    "<span class=\"zone\">오르막길<span class=\"eng-anno\">The Ascent</span></span>로 이동",
+    "<span class=\"zone\">오르막길<span class=\"eng-anno\">The Ascent</span></span>에서 제작법 획득",
+    "공명 장치 옆 레버 당기기 ➞ 5장",
+  ],
+  act5: [
+    "<span class=\"zone\">노예 감호소<span class=\"eng-anno\">The Slave Pens</span></span> ➞ <span class=\"boss\">간수 크로우<span class=\"eng-anno\">Overseer Krow</span></span> 처치",
+    "마을로 이동, <span class=\"npc\">라니<span class=\"eng-anno\">Lani</span></span>에게 말걸어 반지 획득 <span class=\"zone izone\">감시탑</span>",
+    "<span class=\"zone\">관리 구역<span class=\"eng-anno\">The Control Blocks</span></span> ➞ <span class=\"quest\">독기 측정기<span class=\"eng-anno\">Miasmeter</span></span> 획득",
+    "<span class=\"boss\">카스티쿠스 법관<span class=\"eng-anno\">Justicar Casticus</span></span> 처치 ➞ <span class=\"zone\">오리아스 광장<span class=\"eng-anno\">Oriath Square</span></span>",
+    "<span class=\"zone\">오리아스 광장<span class=\"eng-anno\">Oriath Square</span></span> ➞ <span class=\"zone\">템플러의 법정<span class=\"eng-anno\">The Templar Courts</span></span>",
+    ["<span class=\"zone\">결백의 방<span class=\"eng-anno\">The Chamber of Innocence</span></span>으로 이동. 레벨 41까지 파밍하기 좋은 구역", "<span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 ➞ <span class=\"zone\">결백의 방<span class=\"eng-anno\">The Chamber of Innocence</span></span>. 레벨 41까지 파밍하기 좋은 구역"],
+    "<span class=\"boss\">고위 템플러 아배리우스<span class=\"eng-anno\">High Templar Avarius</span></span> 처치 (페이즈마다 10팩 소환, 레이저 회피)",
+    "나와서 마을로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 <span class=\"zone izone\">감시탑</span>",
+    "<span class=\"zone\">감시탑</span>에서 <span class=\"npc\">반론<span class=\"eng-anno\">Bannon</span></span>에게 말걸어 보석과 플라스크 획득 (실버 추천)",
+    "<span class=\"zone\">결백의 방<span class=\"eng-anno\">The Chamber of Innocence</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">타오르는 법정<span class=\"eng-anno\">The Torched Courts</span></span> ➞ <span class=\"zone\">멸망한 광장<span class=\"eng-anno\">The Ruined Square</span></span>",
+    ["<span class=\"zone\">멸망한 광장<span class=\"eng-anno\">The Ruined Square</span></span> ➞ <span class=\"zone\">납골당<span class=\"eng-anno\">The Ossuary</span></span>", "<span class=\"zone\">멸망한 광장<span class=\"eng-anno\">The Ruined Square</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 ➞ <span class=\"zone\">납골당<span class=\"eng-anno\">The Ossuary</span></span>"],
+    ["<span class=\"zone\">납골당<span class=\"eng-anno\">The Ossuary</span></span>에서 <span class=\"quest\">정화의 징표<span class=\"eng-anno\">Sign of Purity</span></span> 획득", "<span class=\"zone\">납골당<span class=\"eng-anno\">The Ossuary</span></span>에서 <span class=\"quest\">정화의 징표<span class=\"eng-anno\">Sign of Purity</span></span>와 제작법 획득"],
+    ["<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동 <span class=\"zone izone\">감시탑</span>", "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, 상인 확인 <span class=\"zone izone\">감시탑</span>"],
+    "<span class=\"zone\">멸망한 광장<span class=\"eng-anno\">The Ruined Square</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ 남쪽 <span class=\"zone\">성유물 보관실<span class=\"eng-anno\">The Reliquary</span></span>",
+    "<span class=\"zone\">성유물 보관실<span class=\"eng-anno\">The Reliquary</span></span>에서 <span class=\"quest\">키타바의 고통<span class=\"eng-anno\">Kitava's Torments</span></span> 3개 수집 (지도 4개 모서리 확인)",
+    "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, <span class=\"npc\">비렌시아</span>·<span class=\"npc\">라니<span class=\"eng-anno\">Lani</span></span>에게 스킬 포인트 수령 <span class=\"zone izone\">감시탑</span>",
+    "<span class=\"zone\">멸망한 광장<span class=\"eng-anno\">The Ruined Square</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">대성당 옥상<span class=\"eng-anno\">The Cathedral Rooftop</span></span>",
+    "<span class=\"boss\">만족을 모르는 키타바<span class=\"eng-anno\">Kitava, the Insatiable</span></span> 처치 (저항 -30% 패널티). 레벨 41~42 목표",
+  ],
+  act6: [
+    "<span class=\"zone\">황혼의 해안<span class=\"eng-anno\">The Twilight Strand</span></span> 정리",
+    "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동 <span class=\"zone izone\">라이온아이 초소</span>",
+    "<span class=\"zone\">라이온아이 초소</span>에서 상인 확인, 부족한 젬 구매 ➞ <span class=\"zone\">해안 지대<span class=\"eng-anno\">The Coast</span></span>",
+    ["<span class=\"zone\">해안 지대<span class=\"eng-anno\">The Coast</span></span> ➞ <span class=\"zone\">갯벌<span class=\"eng-anno\">The Mud Flats</span></span>, 부가 퀘스트 건너뛰기", "<span class=\"zone\">해안 지대<span class=\"eng-anno\">The Coast</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기, 부가 퀘스트 건너뛰고 ➞ <span class=\"zone\">갯벌<span class=\"eng-anno\">The Mud Flats</span></span>"],
+    "<span class=\"zone\">갯벌<span class=\"eng-anno\">The Mud Flats</span></span>에서 <span class=\"boss\">모욕당한 여왕<span class=\"eng-anno\">The Dishonoured Queen</span></span> 처치, <span class=\"quest\">정복의 눈<span class=\"eng-anno\">Eye of Conquest</span></span> 획득",
+    "서쪽으로 ➞ <span class=\"zone\">카루이 방벽<span class=\"eng-anno\">The Karui Ramparts</span></span>",
+    "<span class=\"zone\">카루이 방벽<span class=\"eng-anno\">The Karui Ramparts</span></span> ➞ <span class=\"zone\">카루이 요새<span class=\"eng-anno\">The Karui Fortress</span></span>, <span class=\"boss\">투코하마<span class=\"eng-anno\">Tukohama, Karui God of War</span></span> 처치",
+    "<span class=\"zone\">카루이 방벽<span class=\"eng-anno\">The Karui Ramparts</span></span>으로 복귀",
+    "<span class=\"zone\">카루이 방벽<span class=\"eng-anno\">The Karui Ramparts</span></span> ➞ <span class=\"zone\">산등성이<span class=\"eng-anno\">The Ridge</span></span> ➞ <span class=\"zone\">수용소 하층<span class=\"eng-anno\">The Lower Prison</span></span>",
+    ["<span class=\"zone\">수용소 하층<span class=\"eng-anno\">The Lower Prison</span></span> ➞ <span class=\"zone\">샤브론의 탑<span class=\"eng-anno\">Shavronne's Tower</span></span>", "<span class=\"zone\">수용소 하층<span class=\"eng-anno\">The Lower Prison</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>를 찍고 <span class=\"trial\">전직 시험<span class=\"eng-anno\">Trial of Ascendancy</span></span> 완료 ➞ <span class=\"zone\">샤브론의 탑<span class=\"eng-anno\">Shavronne's Tower</span></span>"],
+    "계단을 올라가 <span class=\"boss\">되돌아온 샤브론<span class=\"eng-anno\">Shavronne the Returned</span></span>과 <span class=\"boss\">재조립된 브루투스<span class=\"eng-anno\">Brutus, Reassembled</span></span> 처치",
+    "간수의 방에서 제작법 획득",
+    "<span class=\"zone\">죄수의 문<span class=\"eng-anno\">Prisoner's Gate</span></span>으로 이동 (<span class=\"boss\">발굽 달린 아버라스<span class=\"eng-anno\">Abberath, the Cloven One</span></span>는 지금 건너뛰기)",
+    ["<span class=\"zone\">서쪽 숲<span class=\"eng-anno\">The Western Forest</span></span> (길 따라가기) ➞ <span class=\"zone\">강변길<span class=\"eng-anno\">The Riverways</span></span>", "<span class=\"zone\">서쪽 숲<span class=\"eng-anno\">The Western Forest</span></span> (길 따라가기), <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 ➞ <span class=\"zone\">강변길<span class=\"eng-anno\">The Riverways</span></span>"],
+    ["<span class=\"zone\">강변길<span class=\"eng-anno\">The Riverways</span></span> ➞ <span class=\"zone\">습지대<span class=\"eng-anno\">The Wetlands</span></span>", "<span class=\"zone\">강변길<span class=\"eng-anno\">The Riverways</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 ➞ <span class=\"zone\">습지대<span class=\"eng-anno\">The Wetlands</span></span>"],
+    "<span class=\"zone\">습지대<span class=\"eng-anno\">The Wetlands</span></span> ➞ <span class=\"zone\">산란장<span class=\"eng-anno\">The Spawning Ground</span></span>에서 <span class=\"boss\">꼭두각시 여사 리슬라사<span class=\"eng-anno\">Ryslatha, the Puppet Mistress</span></span> 처치",
+    ["<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, <span class=\"npc\">베스텔<span class=\"eng-anno\">Bestel</span></span>·<span class=\"npc\">타클레이</span>에게 스킬 포인트, 4링크 투구 보상 수령 <span class=\"zone izone\">라이온아이 초소</span>", "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, 상인 확인, <span class=\"npc\">베스텔<span class=\"eng-anno\">Bestel</span></span>·<span class=\"npc\">타클레이</span>에게 스킬 포인트, 4링크 투구 보상 수령 <span class=\"zone izone\">라이온아이 초소</span>"],
+    ["<span class=\"zone\">강변길<span class=\"eng-anno\">The Riverways</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">남쪽 숲<span class=\"eng-anno\">The Southern Forest</span></span>", "<span class=\"zone\">강변길<span class=\"eng-anno\">The Riverways</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">남쪽 숲<span class=\"eng-anno\">The Southern Forest</span></span>, <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기"],
+    "<span class=\"zone\">남쪽 숲<span class=\"eng-anno\">The Southern Forest</span></span> ➞ <span class=\"zone\">분노의 암굴<span class=\"eng-anno\">The Cavern of Anger</span></span> (배신은 무시) ➞ <span class=\"zone\">등대<span class=\"eng-anno\">The Beacon</span></span>",
+    "<span class=\"zone\">등대<span class=\"eng-anno\">The Beacon</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>와 제작법 획득",
+    "기둥 이벤트 진행",
+    "스위치와 봉화를 클릭한 후 반대 방향으로 달리기",
+    "<span class=\"npc\">웨일럼<span class=\"eng-anno\">Weylam</span></span>에게 말걸어 이동 ➞ <span class=\"zone\">염수왕의 암초<span class=\"eng-anno\">The Brine King's Reef</span></span>",
+    "<span class=\"boss\">염수왕 소아고스<span class=\"eng-anno\">Tsoagoth, The Brine King</span></span> 처치 (냉기 저항 낮으면 포탈 열어두고 번개 페이즈 회피). 레벨 45~46 목표",
+  ],
+  act7: [
+    "<span class=\"zone\">부서진 다리<span class=\"eng-anno\">The Broken Bridge</span></span> ➞ <span class=\"quest\">은색 로켓<span class=\"eng-anno\">Silver Locket</span></span> 획득 (플라스크 보상)",
+    "<span class=\"zone\">갈림길<span class=\"eng-anno\">The Crossroads</span></span>로 이동 (야수 잊지 말 것)",
+    ["마을로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 <span class=\"zone izone\">다리 야영지</span>", "<span class=\"zone\">갈림길<span class=\"eng-anno\">The Crossroads</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>를 찍고 마을로 이동 <span class=\"zone izone\">다리 야영지</span>"],
+    "동물원에서 좋은 야수가 있으면 제작",
+    "<span class=\"zone\">갈림길<span class=\"eng-anno\">The Crossroads</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">몰락한 성소 유적<span class=\"eng-anno\">The Fellshrine Ruins</span></span> ➞ <span class=\"zone\">지하실<span class=\"eng-anno\">The Crypt</span></span>",
+    "<span class=\"zone\">지하실<span class=\"eng-anno\">The Crypt</span></span>에서 <span class=\"trial\">전직 시험<span class=\"eng-anno\">Trial of Ascendancy</span></span> 완료, 제작법 획득",
+    "<span class=\"zone\">지하실 2층<span class=\"eng-anno\">The Crypt Level 2</span></span> 석관에서 <span class=\"quest\">말리가로의 지도<span class=\"eng-anno\">Maligaro's Map</span></span> 획득",
+    "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, <span class=\"npc\">웨일럼<span class=\"eng-anno\">Weylam</span></span>에게 퀘스트 제출(플라스크) <span class=\"zone izone\">다리 야영지</span>",
+    "<span class=\"zone\">갈림길<span class=\"eng-anno\">The Crossroads</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">죄악의 방 1층<span class=\"eng-anno\">The Chamber of Sins Level 1</span></span>",
+    ["<span class=\"quest\">말리가로의 지도<span class=\"eng-anno\">Maligaro's Map</span></span> 사용 ➞ <span class=\"zone\">말리가로의 지성소<span class=\"eng-anno\">Maligaro's Sanctum</span></span>", "제작법 획득, <span class=\"quest\">말리가로의 지도<span class=\"eng-anno\">Maligaro's Map</span></span> 사용 ➞ <span class=\"zone\">말리가로의 지성소<span class=\"eng-anno\">Maligaro's Sanctum</span></span>"],
+    "<span class=\"boss\">말리가로<span class=\"eng-anno\">Maligaro</span></span> 처치, <span class=\"quest\">검은 독액<span class=\"eng-anno\">The Black Venom</span></span> 획득 후 <span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동",
+    "<span class=\"zone\">다리 야영지</span>에서 <span class=\"quest\">검은 독액<span class=\"eng-anno\">The Black Venom</span></span> 제출, <span class=\"quest\">흑요석 열쇠<span class=\"eng-anno\">Obsidian Key</span></span> 획득",
+    ["<span class=\"zone\">죄악의 방 2층<span class=\"eng-anno\">The Chamber of Sins Level 2</span></span> ➞ <span class=\"zone\">굴<span class=\"eng-anno\">The Den</span></span>", "<span class=\"zone\">죄악의 방 2층<span class=\"eng-anno\">The Chamber of Sins Level 2</span></span>에서 <span class=\"trial\">전직 시험<span class=\"eng-anno\">Trial of Ascendancy</span></span> 완료 ➞ <span class=\"zone\">굴<span class=\"eng-anno\">The Den</span></span>"],
+    ["<span class=\"zone\">굴<span class=\"eng-anno\">The Den</span></span> ➞ <span class=\"zone\">잿빛 들판<span class=\"eng-anno\">The Ashen Fields</span></span>", "<span class=\"zone\">굴<span class=\"eng-anno\">The Den</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 ➞ <span class=\"zone\">잿빛 들판<span class=\"eng-anno\">The Ashen Fields</span></span>"],
+    ["<span class=\"zone\">잿빛 들판<span class=\"eng-anno\">The Ashen Fields</span></span> ➞ <span class=\"zone\">요새 야영지<span class=\"eng-anno\">The Fortress Encampment</span></span>", "<span class=\"zone\">잿빛 들판<span class=\"eng-anno\">The Ashen Fields</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 ➞ <span class=\"zone\">요새 야영지<span class=\"eng-anno\">The Fortress Encampment</span></span>"],
+    "<span class=\"boss\">숲의 군주 그루스트<span class=\"eng-anno\">Greust, Lord of the Forest</span></span> 처치",
+    "<span class=\"zone\">북쪽 숲<span class=\"eng-anno\">The Northern Forest</span></span>으로 이동 ➞ 마을로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동, <span class=\"npc\">웨일럼<span class=\"eng-anno\">Weylam</span></span>에게 스킬 포인트 수령 <span class=\"zone izone\">다리 야영지</span>",
+    "6장 <span class=\"zone\">죄수의 문<span class=\"eng-anno\">Prisoner's Gate</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">불 마시는 자의 계곡<span class=\"eng-anno\">The Valley of the Fire Drinker</span></span>",
+    "<span class=\"boss\">발굽 달린 아버라스<span class=\"eng-anno\">Abberath, the Cloven One</span></span> 처치 (생명력 1.6k 이상 추천)",
+    "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, 퀘스트 제출 <span class=\"zone izone\">다리 야영지</span>",
+    "<span class=\"zone\">북쪽 숲<span class=\"eng-anno\">The Northern Forest</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">공포의 잡목림<span class=\"eng-anno\">The Dread Thicket</span></span>",
+    "<span class=\"quest\">반딧불이<span class=\"eng-anno\">Fireflies</span></span> 7개 수집 ➞ <span class=\"zone\">절망의 소굴<span class=\"eng-anno\">The Den of Despair</span></span>에서 <span class=\"boss\">절망의 어미 그루스컬<span class=\"eng-anno\">Gruthkul, Mother of Despair</span></span> 처치",
+    ["나머지 <span class=\"quest\">반딧불이<span class=\"eng-anno\">Fireflies</span></span> 수집, <span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, <span class=\"npc\">헬레나</span>(장화/목걸이)·<span class=\"npc\">에라미어</span>(스킬 포인트 x2) 보상 수령 <span class=\"zone izone\">다리 야영지</span>", "나머지 <span class=\"quest\">반딧불이<span class=\"eng-anno\">Fireflies</span></span> 수집, 제작법 획득, <span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, <span class=\"npc\">헬레나</span>(장화/목걸이)·<span class=\"npc\">에라미어</span>(스킬 포인트 x2) 보상 수령 <span class=\"zone izone\">다리 야영지</span>"],
+    "<span class=\"zone\">북쪽 숲<span class=\"eng-anno\">The Northern Forest</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">둑길<span class=\"eng-anno\">The Causeway</span></span>",
+    ["<span class=\"zone\">둑길<span class=\"eng-anno\">The Causeway</span></span>에서 <span class=\"npc\">알바<span class=\"eng-anno\">Alva</span></span> 진행", "<span class=\"zone\">둑길<span class=\"eng-anno\">The Causeway</span></span>에서 제작법과 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 획득, <span class=\"npc\">알바<span class=\"eng-anno\">Alva</span></span> 진행"],
+    "<span class=\"zone\">둑길<span class=\"eng-anno\">The Causeway</span></span> ➞ <span class=\"zone\">바알 도시<span class=\"eng-anno\">The Vaal City</span></span>",
+    ["<span class=\"zone\">바알 도시<span class=\"eng-anno\">The Vaal City</span></span>에서 <span class=\"npc\">예나<span class=\"eng-anno\">Yeena</span></span>에게 말걸기", "<span class=\"zone\">바알 도시<span class=\"eng-anno\">The Vaal City</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기, <span class=\"npc\">예나<span class=\"eng-anno\">Yeena</span></span>에게 말걸기"],
+    "마을로 이동, <span class=\"npc\">웨일럼<span class=\"eng-anno\">Weylam</span></span>에게 스킬 포인트 수령 <span class=\"zone izone\">다리 야영지</span>",
+    "열망가의 광장으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 (판테온에서 랄라케쉬의 혼 설정)",
+    ["승천 시험 완료 (두 번째 승천)", "승천 시험 완료 (두 번째 승천, 제작법 잊지 말 것)"],
+    ["<span class=\"zone\">바알 도시<span class=\"eng-anno\">The Vaal City</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동", "상인 확인, <span class=\"zone\">바알 도시<span class=\"eng-anno\">The Vaal City</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동"],
+    "<span class=\"zone\">부패의 사원 1층<span class=\"eng-anno\">The Temple of Decay Level 1</span></span> ➞ 2층",
+    "<span class=\"zone\">부패의 사원 2층<span class=\"eng-anno\">The Temple of Decay Level 2</span></span>에서 제작법 획득",
+    "<span class=\"boss\">아라칼리<span class=\"eng-anno\">Arakaali</span></span> 처치",
+  ],
+  act8: [
+    ["<span class=\"zone\">사안 성벽<span class=\"eng-anno\">The Sarn Ramparts</span></span> ➞ <span class=\"zone\">사안 야영지<span class=\"eng-anno\">The Sarn Encampment</span></span>", "<span class=\"zone\">사안 성벽<span class=\"eng-anno\">The Sarn Ramparts</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 ➞ <span class=\"zone\">사안 야영지<span class=\"eng-anno\">The Sarn Encampment</span></span>"],
+    ["<span class=\"zone\">독성 도관<span class=\"eng-anno\">The Toxic Conduits</span></span>으로 이동", "<span class=\"zone\">사안 야영지<span class=\"eng-anno\">The Sarn Encampment</span></span>에서 상인 확인 ➞ <span class=\"zone\">독성 도관<span class=\"eng-anno\">The Toxic Conduits</span></span>"],
+    "<span class=\"zone\">독성 도관<span class=\"eng-anno\">The Toxic Conduits</span></span> ➞ <span class=\"zone\">도이드리의 정화조<span class=\"eng-anno\">Doedre's Cesspool</span></span> ➞ <span class=\"zone\">가마솥<span class=\"eng-anno\">The Cauldron</span></span>",
+    "<span class=\"boss\">사악한 도이드리<span class=\"eng-anno\">Doedre the Vile</span></span> 처치 (근접 거리 유지, 화강암 플라스크 사용)",
+    ["<span class=\"zone\">하수도 출구<span class=\"eng-anno\">The Sewer Outlet</span></span> ➞ <span class=\"zone\">부두<span class=\"eng-anno\">The Quay</span></span>", "<span class=\"zone\">하수도 출구<span class=\"eng-anno\">The Sewer Outlet</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>와 제작법 획득 ➞ <span class=\"zone\">부두<span class=\"eng-anno\">The Quay</span></span>"],
+    "<span class=\"zone\">부두<span class=\"eng-anno\">The Quay</span></span>에서 <span class=\"quest\">영원의 앙크<span class=\"eng-anno\">Ankh of Eternity</span></span> 획득",
+    "<span class=\"zone\">부활의 장소<span class=\"eng-anno\">The Resurrection Site</span></span>에서 <span class=\"npc\">클라리사<span class=\"eng-anno\">Clarissa</span></span>에게 말걸기, <span class=\"npc\">톨먼<span class=\"eng-anno\">Tolman</span></span> 처치",
+    "<span class=\"zone\">부두<span class=\"eng-anno\">The Quay</span></span> ➞ <span class=\"zone\">곡물의 문<span class=\"eng-anno\">The Grain Gate</span></span>",
+    ["<span class=\"zone\">곡물의 문<span class=\"eng-anno\">The Grain Gate</span></span> ➞ <span class=\"zone\">황실 들판<span class=\"eng-anno\">The Imperial Fields</span></span>", "<span class=\"zone\">곡물의 문<span class=\"eng-anno\">The Grain Gate</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 ➞ <span class=\"zone\">황실 들판<span class=\"eng-anno\">The Imperial Fields</span></span>"],
+    ["<span class=\"zone\">황실 들판<span class=\"eng-anno\">The Imperial Fields</span></span>에서 길을 따라 ➞ <span class=\"zone\">솔라리스 사원 1층<span class=\"eng-anno\">The Solaris Temple Level 1</span></span>", "<span class=\"zone\">황실 들판<span class=\"eng-anno\">The Imperial Fields</span></span>에서 길을 따라 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 ➞ <span class=\"zone\">솔라리스 사원 1층<span class=\"eng-anno\">The Solaris Temple Level 1</span></span>"],
+    ["<span class=\"zone\">솔라리스 사원 1층<span class=\"eng-anno\">The Solaris Temple Level 1</span></span> ➞ 2층", "<span class=\"zone\">솔라리스 사원 1층<span class=\"eng-anno\">The Solaris Temple Level 1</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 ➞ 2층"],
+    ["<span class=\"zone\">솔라리스 사원 2층<span class=\"eng-anno\">The Solaris Temple Level 2</span></span>에서 포탈 진입 ➞ <span class=\"boss\">솔라리스의 선구자 새벽<span class=\"eng-anno\">Dawn, Harbinger of Solaris</span></span> 처치", "<span class=\"zone\">솔라리스 사원 2층<span class=\"eng-anno\">The Solaris Temple Level 2</span></span>에서 포탈 진입 ➞ <span class=\"boss\">솔라리스의 선구자 새벽<span class=\"eng-anno\">Dawn, Harbinger of Solaris</span></span> 처치, 제작법 획득"],
+    "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, 퀘스트 제출 <span class=\"zone izone\">사안 야영지</span>",
+    "<span class=\"zone\">솔라리스 사원 1층<span class=\"eng-anno\">The Solaris Temple Level 1</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">솔라리스 중앙 광장<span class=\"eng-anno\">The Solaris Concourse</span></span>",
+    ["<span class=\"zone\">솔라리스 중앙 광장<span class=\"eng-anno\">The Solaris Concourse</span></span> ➞ <span class=\"zone\">항구 다리<span class=\"eng-anno\">The Harbour Bridge</span></span>", "<span class=\"zone\">솔라리스 중앙 광장<span class=\"eng-anno\">The Solaris Concourse</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 ➞ <span class=\"zone\">항구 다리<span class=\"eng-anno\">The Harbour Bridge</span></span>"],
+    ["<span class=\"zone\">항구 다리<span class=\"eng-anno\">The Harbour Bridge</span></span> ➞ <span class=\"zone\">루나리스 중앙 광장<span class=\"eng-anno\">The Lunaris Concourse</span></span> ➞ <span class=\"zone\">루나리스 사원 1층<span class=\"eng-anno\">The Lunaris Temple Level 1</span></span>", "<span class=\"zone\">항구 다리<span class=\"eng-anno\">The Harbour Bridge</span></span> ➞ <span class=\"zone\">루나리스 중앙 광장<span class=\"eng-anno\">The Lunaris Concourse</span></span>, <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 ➞ <span class=\"zone\">루나리스 사원 1층<span class=\"eng-anno\">The Lunaris Temple Level 1</span></span>"],
+    ["<span class=\"zone\">루나리스 사원 1층<span class=\"eng-anno\">The Lunaris Temple Level 1</span></span> ➞ 2층", "<span class=\"zone\">루나리스 사원 1층<span class=\"eng-anno\">The Lunaris Temple Level 1</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 ➞ 2층"],
+    ["<span class=\"zone\">루나리스 사원 2층<span class=\"eng-anno\">The Lunaris Temple Level 2</span></span>에서 포탈 진입 ➞ <span class=\"boss\">루나리스의 선구자 황혼<span class=\"eng-anno\">Dusk, Harbinger of Lunaris</span></span> 처치", "<span class=\"zone\">루나리스 사원 2층<span class=\"eng-anno\">The Lunaris Temple Level 2</span></span>에서 포탈 진입 ➞ <span class=\"boss\">루나리스의 선구자 황혼<span class=\"eng-anno\">Dusk, Harbinger of Lunaris</span></span> 처치, 제작법 획득"],
+    "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, 퀘스트 제출 <span class=\"zone izone\">사안 야영지</span>",
+    "<span class=\"zone\">솔라리스 중앙 광장<span class=\"eng-anno\">The Solaris Concourse</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">항구 다리<span class=\"eng-anno\">The Harbour Bridge</span></span> ➞ <span class=\"zone\">하늘의 성소<span class=\"eng-anno\">The Sky Shrine</span></span>",
+    "<span class=\"boss\">솔라리스<span class=\"eng-anno\">Solaris</span></span>와 <span class=\"boss\">루나리스<span class=\"eng-anno\">Lunaris</span></span> 처치 (계속 움직이며 스킬 회피) ➞ <span class=\"zone\">피의 수로<span class=\"eng-anno\">The Blood Aqueduct</span></span>",
+    "<span class=\"zone\">피의 수로<span class=\"eng-anno\">The Blood Aqueduct</span></span>에서 파밍 가능 (탐광도 가능)",
+    "<span class=\"zone\">루나리스 중앙 광장<span class=\"eng-anno\">The Lunaris Concourse</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">목욕탕<span class=\"eng-anno\">The Bath House</span></span>",
+    "<span class=\"zone\">목욕탕<span class=\"eng-anno\">The Bath House</span></span>에서 <span class=\"trial\">전직 시험<span class=\"eng-anno\">Trial of Ascendancy</span></span>과 제작법 완료",
+    "<span class=\"zone\">목욕탕<span class=\"eng-anno\">The Bath House</span></span> 안의 <span class=\"zone\">고층 정원<span class=\"eng-anno\">The High Gardens</span></span> ➞ <span class=\"zone\">공포의 웅덩이<span class=\"eng-anno\">The Pools of Terror</span></span>",
+    "<span class=\"boss\">공포의 반향 유굴<span class=\"eng-anno\">Yugul, Reflection of Terror</span></span> 처치, <span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, <span class=\"npc\">하간</span>에게 스킬 포인트 수령",
+  ],
+  act9: [
+    "<span class=\"zone\">비탈<span class=\"eng-anno\">The Descent</span></span>을 내려가 ➞ <span class=\"zone\">바스티리 사막<span class=\"eng-anno\">The Vastiri Desert</span></span>. 피의 수로에서 레벨 60~61까지 파밍 가능",
+    "<span class=\"zone\">바스티리 사막<span class=\"eng-anno\">The Vastiri Desert</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span>와 제작법 획득",
+    "<span class=\"quest\">폭풍의 칼날<span class=\"eng-anno\">Storm Blade</span></span> 찾기",
+    "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동 <span class=\"zone izone\">하이게이트</span>",
+    "<span class=\"zone\">하이게이트</span>에서 퀘스트 제출 (<span class=\"npc\">신<span class=\"eng-anno\">Sin</span></span> + 페타루스와 바냐에게 말걸기)",
+    "<span class=\"zone\">바스티리 사막<span class=\"eng-anno\">The Vastiri Desert</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">오아시스<span class=\"eng-anno\">The Oasis</span></span>",
+    "<span class=\"boss\">모래의 여왕 샤카리<span class=\"eng-anno\">Shakari, Queen of the Sands</span></span> 처치",
+    "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동 <span class=\"zone izone\">하이게이트</span>",
+    "<span class=\"zone\">바스티리 사막<span class=\"eng-anno\">The Vastiri Desert</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">구릉<span class=\"eng-anno\">The Foothills</span></span> (보통 북쪽)",
+    ["<span class=\"zone\">구릉<span class=\"eng-anno\">The Foothills</span></span> ➞ <span class=\"zone\">끓어오르는 호수<span class=\"eng-anno\">The Boiling Lake</span></span>", "<span class=\"zone\">구릉<span class=\"eng-anno\">The Foothills</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 ➞ <span class=\"zone\">끓어오르는 호수<span class=\"eng-anno\">The Boiling Lake</span></span>"],
+    ["<span class=\"boss\">바실리스크<span class=\"eng-anno\">The Basilisk</span></span> 처치", "<span class=\"boss\">바실리스크<span class=\"eng-anno\">The Basilisk</span></span> 처치, 제작법 획득"],
+    "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동 <span class=\"zone izone\">하이게이트</span>",
+    "<span class=\"zone\">구릉<span class=\"eng-anno\">The Foothills</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ 운명의 달력 찾기 ➞ <span class=\"zone\">터널<span class=\"eng-anno\">The Tunnel</span></span>",
+    "<span class=\"zone\">터널<span class=\"eng-anno\">The Tunnel</span></span>에서 <span class=\"trial\">전직 시험<span class=\"eng-anno\">Trial of Ascendancy</span></span>과 제작법 완료",
+    ["<span class=\"zone\">터널<span class=\"eng-anno\">The Tunnel</span></span> ➞ <span class=\"zone\">채석장<span class=\"eng-anno\">The Quarry</span></span>", "<span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 ➞ <span class=\"zone\">채석장<span class=\"eng-anno\">The Quarry</span></span>"],
+    "<span class=\"zone\">채석장<span class=\"eng-anno\">The Quarry</span></span>에서 제작법과 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 획득 (중앙)",
+    "북쪽으로 ➞ <span class=\"zone\">제련소<span class=\"eng-anno\">The Refinery</span></span>",
+    "<span class=\"boss\">아두스 장군<span class=\"eng-anno\">General Adus</span></span> 처치, <span class=\"quest\">트라탄 화약<span class=\"eng-anno\">Trarthan Powder</span></span> 획득",
+    "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, 퀘스트 제출 <span class=\"zone izone\">하이게이트</span>",
+    "<span class=\"zone\">채석장<span class=\"eng-anno\">The Quarry</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ 서쪽 <span class=\"zone\">바람의 성소<span class=\"eng-anno\">The Shrine of the Winds</span></span>",
+    "<span class=\"boss\">바람의 여왕 가루칸<span class=\"eng-anno\">Garukhan, Queen of the Winds</span></span> 처치",
+    "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, 퀘스트 제출 <span class=\"zone izone\">하이게이트</span>",
+    "<span class=\"zone\">채석장<span class=\"eng-anno\">The Quarry</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">짐승의 소굴<span class=\"eng-anno\">The Belly of the Beast</span></span>",
+    "<span class=\"zone\">짐승의 소굴<span class=\"eng-anno\">The Belly of the Beast</span></span> ➞ <span class=\"zone\">썩어가는 중심부<span class=\"eng-anno\">The Rotting Core</span></span> ➞ <span class=\"zone\">검은 중심부<span class=\"eng-anno\">The Black Core</span></span>",
+    "<span class=\"zone\">샤브론의 슬픔<span class=\"eng-anno\">Shavronne's Sorrow</span></span>에서 <span class=\"boss\">속박 풀린 샤브론<span class=\"eng-anno\">Shavronne, Unbound</span></span> 처치 ➞ <span class=\"zone\">썩어가는 중심부<span class=\"eng-anno\">The Rotting Core</span></span>로 복귀",
+    "<span class=\"zone\">도이드리의 절망<span class=\"eng-anno\">Doedre's Despair</span></span>에서 <span class=\"boss\">어두운 영혼 도이드리<span class=\"eng-anno\">Doedre, Darksoul</span></span> 처치 ➞ <span class=\"zone\">썩어가는 중심부<span class=\"eng-anno\">The Rotting Core</span></span>로 복귀",
+    "<span class=\"zone\">말리가로의 비탄<span class=\"eng-anno\">Maligaro's Misery</span></span>에서 <span class=\"boss\">부서진 말리가로<span class=\"eng-anno\">Maligaro, The Broken</span></span> 처치 ➞ <span class=\"zone\">썩어가는 중심부<span class=\"eng-anno\">The Rotting Core</span></span>로 복귀, <span class=\"npc\">신<span class=\"eng-anno\">Sin</span></span>에게 말걸기",
+    "<span class=\"zone\">검은 심장<span class=\"eng-anno\">The Black Heart</span></span>에서 <span class=\"boss\">타락한 삼위일체<span class=\"eng-anno\">The Depraved Trinity</span></span> 처치. 레벨 61~62 목표",
+    "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동 <span class=\"zone izone\">하이게이트</span>, <span class=\"zone\">오리아스 부두<span class=\"eng-anno\">Oriath Docks</span></span>로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동",
+  ],
+  act10: [
+    "<span class=\"zone\">대성당 옥상<span class=\"eng-anno\">The Cathedral Rooftop</span></span>으로 이동 ➞ <span class=\"zone\">대성당 첨탑<span class=\"eng-anno\">The Cathedral Pinnacle</span></span>",
+    "<span class=\"npc\">반론<span class=\"eng-anno\">Bannon</span></span> 구출",
+    "<span class=\"zone\">대성당 옥상<span class=\"eng-anno\">The Cathedral Rooftop</span></span>으로 복귀 ➞ <span class=\"zone\">파괴된 광장<span class=\"eng-anno\">The Ravaged Square</span></span>",
+    "<span class=\"zone\">파괴된 광장<span class=\"eng-anno\">The Ravaged Square</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기",
+    "다리 앞에 <span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span> 열기",
+    ["마을로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 <span class=\"zone izone\">오리아스 부두</span>", "마을로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동, 상인 확인 <span class=\"zone izone\">오리아스 부두</span>"],
+    "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 <span class=\"zone\">파괴된 광장<span class=\"eng-anno\">The Ravaged Square</span></span> 복귀 ➞ <span class=\"zone\">관리 구역<span class=\"eng-anno\">The Control Blocks</span></span>",
+    ["<span class=\"zone\">관리 구역<span class=\"eng-anno\">The Control Blocks</span></span> (하드코어는 <span class=\"boss\">바일렌타<span class=\"eng-anno\">Vilenta</span></span> 건너뛸 수 있음, 매우 위험)", "<span class=\"zone\">관리 구역<span class=\"eng-anno\">The Control Blocks</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기 (하드코어는 <span class=\"boss\">바일렌타<span class=\"eng-anno\">Vilenta</span></span> 건너뛸 수 있음, 매우 위험)"],
+    "성벽의 구멍을 이동 스킬로 통과 ➞ 투기장에서 <span class=\"boss\">바일렌타<span class=\"eng-anno\">Vilenta</span></span> 처치",
+    "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, 퀘스트 제출 <span class=\"zone izone\">오리아스 부두</span>",
+    "<span class=\"zone\">파괴된 광장<span class=\"eng-anno\">The Ravaged Square</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">납골당<span class=\"eng-anno\">The Ossuary</span></span>",
+    ["<span class=\"zone\">납골당<span class=\"eng-anno\">The Ossuary</span></span>에서 <span class=\"quest\">유혹의 영약<span class=\"eng-anno\">Elixir of Allure</span></span> 찾기", "<span class=\"zone\">납골당<span class=\"eng-anno\">The Ossuary</span></span>에서 <span class=\"quest\">유혹의 영약<span class=\"eng-anno\">Elixir of Allure</span></span> 찾기, <span class=\"trial\">전직 시험<span class=\"eng-anno\">Trial of Ascendancy</span></span> 완료"],
+    "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, 퀘스트 제출 <span class=\"zone izone\">오리아스 부두</span>",
+    "<span class=\"zone\">파괴된 광장<span class=\"eng-anno\">The Ravaged Square</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동 ➞ <span class=\"zone\">타오르는 법정<span class=\"eng-anno\">The Torched Courts</span></span>",
+    "<span class=\"zone\">타오르는 법정<span class=\"eng-anno\">The Torched Courts</span></span> ➞ <span class=\"zone\">무너진 방<span class=\"eng-anno\">The Desecrated Chambers</span></span>",
+    ["<span class=\"zone\">무너진 방<span class=\"eng-anno\">The Desecrated Chambers</span></span> ➞ <span class=\"zone\">결백의 성소<span class=\"eng-anno\">The Sanctum of Innocence</span></span>", "<span class=\"zone\">무너진 방<span class=\"eng-anno\">The Desecrated Chambers</span></span>에서 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 찍기, 제작법 획득 ➞ <span class=\"zone\">결백의 성소<span class=\"eng-anno\">The Sanctum of Innocence</span></span>"],
+    "<span class=\"boss\">아배리우스 재조립<span class=\"eng-anno\">Avarius, Reassembled</span></span> 처치, <span class=\"quest\">순수의 지팡이<span class=\"eng-anno\">Staff of Purity</span></span> 획득",
+    ["<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, 퀘스트 제출 <span class=\"zone izone\">오리아스 부두</span>", "<span class=\"tp\"><img class=\"tp-icon\" src=\"https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp\" width=\"14\" height=\"14\" alt=\"\" loading=\"lazy\">귀환 포탈</span>로 마을 이동, 상인 확인, 퀘스트 제출 <span class=\"zone izone\">오리아스 부두</span>"],
+    "레벨 68이면 승천 시험 진행 (하드코어는 <span class=\"zone\">피의 수로<span class=\"eng-anno\">The Blood Aqueduct</span></span>에서 70까지 파밍 후 승천 추천). 62 이상 권장",
+    "<span class=\"zone\">파괴된 광장<span class=\"eng-anno\">The Ravaged Square</span></span>으로 <span class=\"waypoint\"><svg class=\"wp-icon\" width=\"12\" height=\"12\" viewBox=\"0 0 12 12\"><path d=\"M6 1L11 6L6 11L1 6Z\" fill=\"currentColor\" opacity=\"0.85\"/><circle cx=\"6\" cy=\"6\" r=\"1.5\" fill=\"#fff\" opacity=\"0.5\"/></svg>웨이포인트</span> 이동, <span class=\"npc\">이노센스<span class=\"eng-anno\">Innocence</span></span>에게 말걸기 ➞ <span class=\"zone\">운하<span class=\"eng-anno\">The Canals</span></span>",
+    "<span class=\"zone\">운하<span class=\"eng-anno\">The Canals</span></span> ➞ <span class=\"zone\">먹이통<span class=\"eng-anno\">The Feeding Trough</span></span>",
+    ["<span class=\"zone\">먹이통<span class=\"eng-anno\">The Feeding Trough</span></span> ➞ <span class=\"zone\">굶주림의 제단<span class=\"eng-anno\">The Altar of Hunger</span></span>. 레벨 62~63 목표", "<span class=\"zone\">먹이통<span class=\"eng-anno\">The Feeding Trough</span></span>에서 제작법 획득 ➞ <span class=\"zone\">굶주림의 제단<span class=\"eng-anno\">The Altar of Hunger</span></span>. 레벨 62~63 목표"],
+    "<span class=\"boss\">만족을 모르는 키타바<span class=\"eng-anno\">Kitava, the Insatiable</span></span> 처치",
+    "<span class=\"npc\">신<span class=\"eng-anno\">Sin</span></span>에게 말걸기, 오리아스로 포탈 이동",
+    "오리아스에서 <span class=\"npc\">라니<span class=\"eng-anno\">Lani</span></span>에게 말걸기",
+    "도시 북서쪽에서 이동 속도 제작법 획득",
+    "축하합니다! 엔드게임 시작! (저항 -60% 패널티, 은신처에서 저항 재조정)",
+  ],
+};
@@ -0,0 +1,4 @@
+// Data release, generated by releases.py (do not edit)
+// version: latest release; root: snapshots.py root of its records
+// base: release gems.js/gem_details.js are precached as; deltas: applied on top in order
+const DATA_RELEASE = {"version":1,"base":1,"root":"dae6a8841cc44a5cce982fce47383b1fa42b41ba25f89c2a8ab1a118db19e55b","deltas":[]};
@@ -0,0 +1,16 @@
+// Quest x class x gem reward bitsets, generated by reward_matrix.py
+// quests: [act, questName, kind (0=reward, 1=vendor)]
+// masks[cls][quest]: hex bitmask over gems[] (bit i = gems[i]); use BigInt('0x' + m)
+const REWARD_MATRIX = {
+  gems: ["absolution","added_chaos_damage_support","added_cold_damage_support","added_fire_damage_support","added_lightning_damage_support","additional_accuracy_support","advanced_traps_support","alchemists_mark","ambush","ancestral_call_support","ancestral_cry","ancestral_protector","ancestral_warchief","anger","animate_guardian","animate_weapon","arc","arcane_cloak","arcane_surge_support","arcanist_brand","archmage_support","arctic_armour","armageddon_brand","arrogance_support","arrow_nova_support","artillery_ballista","assassins_mark","autoexertion","automation","ball_lightning","ballista_totem_support","bane","barrage","barrage_support","battlemages_cry","bear_trap","behead_support","berserk","blade_blast","blade_flurry","blade_trap","blade_vortex","bladefall","bladestorm","blasphemy_support","blast_rain","blastchain_mine_support","blazing_salvo","blight","blind_support","blink_arrow","blood_and_sand","blood_rage","bloodlust_support","bloodthirst_support","bodyswap","bone_offering","bonechill_support","boneshatter","brand_recall","brutality_support","burning_arrow","burning_damage_support","cast_on_critical_strike_support","cast_on_death_support","cast_on_melee_kill_support","cast_when_damage_taken_support","cast_when_stunned_support","cast_while_channelling_support","caustic_arrow","chain_hook","chain_support","chance_to_bleed_support","chance_to_flee_support","chance_to_poison_support","charged_dash","charged_mines_support","charged_traps_support","clarity","cleave","close_combat_support","cluster_traps_support","cobra_lash","cold_penetration_support","cold_snap","cold_to_fire_support","combustion_support","concentrated_effect_support","conductivity","conflagration","consecrated_path","contagion","controlled_blaze_support","controlled_destruction_support","conversion_trap","corrupting_cry_support","corrupting_fever","crackling_lance","creeping_frost","cremation","critical_strike_affliction_support","cruelty_support","crushing_fist","culling_strike_support","cursed_ground_support","cyclone","damage_on_full_life_support","dark_pact","dash","deadly_ailments_support","decay_support","decoy_totem","defiance_banner","desecrate","despair","destructive_link","determination","detonate_dead","devour_support","devouring_totem","discharge","discipline","divine_blessing_support","divine_ire","divine_retribution","dominating_blow","double_strike","dread_banner","dual_strike","earthbreaker_support","earthquake","earthshatter","efficacy_support","elemental_army_support","elemental_damage_with_attacks_support","elemental_focus_support","elemental_hit","elemental_proliferation_support","elemental_weakness","endurance_charge_on_melee_stun_support","enduring_cry","energy_blade","energy_leech_support","enfeeble","ensnaring_arrow","essence_drain","eternal_blessing_support","ethereal_knives","eviscerate","expert_retaliation_support","explosive_arrow","explosive_concoction","explosive_trap","exsanguinate","eye_of_winter","faster_attacks_support","faster_casting_support","faster_projectiles_support","feeding_frenzy_support","fire_penetration_support","fire_trap","fireball","firestorm","fist_of_war_support","flame_dash","flame_link","flame_surge","flame_wall","flameblast","flamethrower_trap","flamewood_support","flammability","flesh_and_stone","flesh_offering","flicker_strike","focused_ballista_support","focused_channelling_support","forbidden_rite","fork_support","fortify_support","freezing_pulse","frenzy","fresh_meat_support","frigid_bond_support","frost_blades","frost_bomb","frost_shield","frost_wall","frostbite","frostblink","frostbolt","frozen_legion","galvanic_arrow","galvanic_field","generals_cry","generosity_support","glacial_cascade","glacial_hammer","glacial_shield_swipe","grace","greater_multiple_projectiles_support","greater_volley_support","ground_slam","guardians_blessing_support","haste","hatred","heavy_strike","herald_of_agony","herald_of_ash","herald_of_ice","herald_of_purity","herald_of_thunder","hex_bloom_support","hexblast","hextouch_support","high-impact_mine_support","holy_flame_totem","hydrosphere","hypothermia_support","ice_bite_support","ice_crash","ice_nova","ice_shot","ice_spear","ice_trap","icicle_mine","ignite_proliferation_support","immolate_support","immortal_call","impale_support","impending_doom_support","incinerate","increased_area_of_effect_support","increased_critical_damage_support","increased_critical_strikes_support","infernal_blow","infernal_cry","infernal_legion_support","infused_channelling_support","innervate_support","inspiration_support","intensify_support","intimidating_cry","intuitive_link","iron_grip_support","iron_will_support","item_rarity_support","kinetic_blast","kinetic_bolt","kinetic_fusillade","kinetic_instability_support","kinetic_rain","knockback_support","lacerate","lancing_steel","leap_slam","less_duration_support","lesser_multiple_projectiles_support","life_gain_on_hit_support","life_leech_support","lifetap_support","lightning_arrow","lightning_conduit","lightning_penetration_support","lightning_spire_trap","lightning_strike","lightning_tendrils","lightning_trap","lightning_warp","living_lightning_support","locus_mine_support","maim_support","malevolence","mana_leech_support","manabond","manaforged_arrows_support","mark_on_hit_support","meat_shield_support","melee_physical_damage_support","melee_splash_support","minefield_support","minion_damage_support","minion_life_support","minion_speed_support","mirage_archer_support","mirror_arrow","molten_shell","molten_strike","momentum_support","more_duration_support","multiple_totems_support","multiple_traps_support","multistrike_support","nightblade_support","orb_of_storms","overcharge_support","overexertion_support","penance_brand","perforate","pestilent_strike","petrified_blood","phase_run","physical_to_lightning_support","pierce_support","pinpoint_support","plague_bearer","poachers_mark","point_blank_support","poisonous_concoction","power_charge_on_critical_support","power_siphon","precision","predator_support","pride","prismatic_burst_support","protective_link","pulverise_support","puncture","punishment","purifying_flame","purity_of_elements","purity_of_fire","purity_of_ice","purity_of_lightning","pyroclast_mine","rage_support","rage_vortex","rain_of_arrows","raise_spectre","raise_zombie","rallying_cry","reap","reave","rejuvenation_totem","returning_projectiles_support","righteous_fire","rolling_magma","rupture_support","ruthless_support","sacred_wisps_support","sacrifice_support","sadism_support","scorching_ray","scourge_arrow","searing_bond","second_wind_support","seismic_cry","seismic_trap","shattering_steel","shield_charge","shield_crush","shock_nova","shockwave_support","shockwave_totem","shrapnel_ballista","siege_ballista","sigil_of_power","siphoning_trap","slower_projectiles_support","smite","smoke_mine","snipe","snipers_mark","somatic_shell","soul_link","soulrend","spark","spectral_helix","spectral_shield_throw","spectral_throw","spell_cascade_support","spell_echo_support","spell_totem_support","spellblade_support","spellslinger","spirit_offering","split_arrow","splitting_steel","static_strike","steelskin","storm_brand","storm_burst","storm_call","storm_rain","stormbind","stormblast_mine","stun_support","summon_carrion_golem","summon_chaos_golem","summon_flame_golem","summon_holy_relic","summon_ice_golem","summon_lightning_golem","summon_phantasm_support","summon_raging_spirit","summon_reaper","summon_skeletons","summon_skitterbots","summon_stone_golem","sunder","sweep","swift_affliction_support","swift_assembly_support","swiftbrand_support","swordstorm","tectonic_slam","tempest_shield","temporal_chains","temporal_rift","thunderstorm","tornado","tornado_shot","toxic_rain","trap_and_mine_damage_support","trap_support","trauma_support","trinity_support","unbound_ailments_support","unearth","unleash_support","urgent_orders_support","vaal_absolution","vaal_ancestral_warchief","vaal_arc","vaal_blight","vaal_burning_arrow","vaal_cold_snap","vaal_double_strike","vaal_ground_slam","vaal_lightning_arrow","vampiric_link","vengeful_cry","venom_gyre","vicious_projectiles_support","vigilant_strike","vile_toxins_support","viper_strike","vitality","void_manipulation_support","void_sphere","volatile_dead","volatility_support","volcanic_fissure","volley_support","voltaxic_burst","vortex","vulnerability","wall_of_force","war_banner","warlords_mark","wave_of_conviction","whirling_blades","wild_strike","windburst_support","winter_orb","wintertide_brand","wither","withering_step","withering_touch_support","wrath","zealotry"],
+  quests: [[1,"황혼의 해안",0],[1,"눈 앞의 적",0],[1,"눈 앞의 적",1],[1,"자비로운 임무",0],[1,"자비로운 임무",1],[1,"로아 알 깨트리기",0],[1,"로아 알 깨트리기",1],[1,"감금된 덩치",0],[1,"감금된 덩치",1],[1,"사이렌의 마침곡",0],[1,"사이렌의 마침곡",1],[2,"검은 침략자",0],[2,"검은 침략자",1],[2,"예리하고 잔인한",0],[2,"예리하고 잔인한",1],[2,"문제의 근원",0],[2,"문제의 근원",1],[3,"떠나보낸 연인",0],[3,"떠나보낸 연인",1],[3,"빅타리오의 비밀",1],[3,"오른팔 잘라내기",0],[3,"오른팔 잘라내기",1],[3,"운명의 흔적",0],[3,"운명의 흔적",1],[4,"영원한 악몽",0],[4,"영원한 악몽",1],[4,"봉인 해제",0],[4,"봉인 해제",1],[4,"불굴의 혼백",0],[4,"불굴의 혼백",1],[5,"오리아스로의 귀환",1],[6,"움브라의 정수",1]],
+  masks: {
+    marauder: ["4000000000000000000000000000000004000000000000000000000000000000000000000000000000000","4000000000000000800000000000000000000400000000000000000000000000000000000000000000000000","200804004000000000400800000000000000000004420000000020008000140000000000080000000000000000000","1000000000000000000000000000000000000000000000000000001000000000000000200","800000000000000000000000000000000000001000000000000000000000000000000000000000000000000000001000000000000000200","4000000000000080000002000000000000000000000000000000000000000000000000000000000008040000000000000000000000000","10004000000100000080000042000200000000000000000000000000001000040200000000000000000809040000000000008000800000800","20000000000000000000000000000000000000008000108004000000000000000004000800100000000000000000000000000000000008","20120000000004001001000000000000800000008080149004000000000000000044000800100200000000004042000002000000000028","400000000018000040000000000000000000000000000000000080000000000000000000000000800000000000000400000000000000000","400000000018000040180000100000000000000000000002000080000000000000000000200000800000000000000400000000000000001","200000000000000000000000004000000000000004000000000000000000b0000000000000010000000000001000000000000000000000400","200000000001000000000000004000000000000004000000000000000000b0040000000000010000000010001000000000000000000000400","200000000000000000000010000002000000000004000000000000000000000000000000000004000000020000100000000000000000000","2020000000000000000000100200020000040000040000000300000000000000000000008000840000004a0000100000020000000000000","402000000000000000000000000000000000000000000100000000000000000000000000000004000000000000000000000000000000000","4000000000000004008000000000000000000000000000000f0000002010000000000000000000000000000810000000000400","4000800000000000000000000000000042001000000000000000100000000004000000000000000000100000000000000000000000002000","24000800000000000000000000000040342001000000000000000100000002004000008000000000080100040000000000000000018002000","400000000000000","200000000000000000004000000000000000000000000010000000000000000000000400000200000000000000000000000000","200000000000020000084000000000000000000000000010000000000001000040000421000200040008000000080402005000","1000000000000000000000000010000002000000080000002000000000000800000000000000000000900000000040000000800000","1000000000000000000000000010000002000000090001002000000008000800008020000000000000900000004040100000800000","80000000000800000000000000000114000000000000010000000100000000080004000000000000000000801000001000000000","800000000008000000024000000001140010000000000108004003000000000800040000000000000000009f9000001200000000","41b0000000000000000000000000000000000000000000000000000000000000000000000000000000000000002000000000","41b0000000000000000008000000000000000000001000000000800000200000000000000000000000000000002000000000","402000000000000000000000000000000000000000000100000000000000000000000008000004000000000000000000000000000000000","2000000000000000","1000000000000000000000000000000000000000000000000000040000000000000000","4000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000"],
+    witch: ["20000000000000000000000000000000000040000","1020000000000000004000100000000000000001000000000000000000000000000000001000000000000","2000040000001020080000000000004000100000000000000401000020108000000000000000000000001000000040000","200000400000000000000000000000000000000400000000000000000000000020000000000000004000000000000000000","800000000040200000400000000000000000000000000000000400000000000000000000000020000000000000004000000000000040000","400000000000000000000000040000000000000000000000000220000800000000000200000080000000000000000000000","4400000000020000000000000400000000000000000010000002a0000800000000000a01000480000000000000000008000","1000040000200001000000000000000000000000000020010000000200000000000000000100000001000400000004040000080000000000010","3000060000640001000001041200000000000800008028050020000240000000000000000100000001000400000004040000080400000000014","100000000000000000000000040000000000000000400000000000020000000000020000002000000000004000000000000800000010000","8011000000000000005080000001400000004000000004080002000082a0000000000020410202000000000004000000000100820000010001","80000000000000000000000000000000000000000000000000000000000b0002000000000000000000020000001000000000000000220000","80000000000000000000000000000000000040000000000000000000000b0002000200000000000010020000001000000000000000220000","100000000000000000008000001000080080020000400000000000000004000001000008000000020208000000000000000000000","1200000000000000000280000012000800c40200004000200000000000040000010000080000020a020a000000000000000000000","800000000000000000000000000000000000000000000000000000000000000000000000000000001000000000200000000000000000040000","400000000004020000000000000008000000000000000000000010000000f0000000000000000000000020000001000000800004000220000","10000000000000800000004000000000000100000000000100000000000000000000100008000000840002040000010000000000000080000000","18000000000000800000004000000000000902000000000100000000000000002000100008000000840002040000010000000000000090000000","2000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000","80100002800000001000000000000000040088000000020001000000104040000000000000a000000000000000020000000","200000000040080100002802880009100000000000000140088000010020001000000304040000000900000a000000000000040020404000","2000000000000001000000001000000200080000200400000000000010000c000400000000000000800004000100000100000","2000000100000021000001001000000220080004280400c80080800050000e000402000000100000830004000100000100042","800000000000800000000000000000010000000000000010800100100000000000000000000004000000000800200000000000000","800000000002800000000400000000014011000000000010c005003000080000000040000000040000002009f8200000200000000","800000000041b8000000100000000000000000000000000000000002000000040000000000000000000000000000000000000000000000","800000010041b8000010100000000000000000000000000000000002000000040000000000000000080000000000000000000000000000","800000000000000000000000000000000000000000000000000000000004000000000000000000001000000000200000000200000000000000","400000000000000000000000000000000000000000000000000000","",""],
+    scion: ["200000000000004000000000000000000000000000000000000000000000000000000000000000000000000000000","30000000000000000000000800004000000000000000000000000000000000000000000000000000000000000000000","10000000000002030240804001020080000401800004000100000040004001410000020100000140000000000480202001000000000000","800000000000200000400000004000000008001000000000000000000000000000000000000020000000000000005000000000000040200","800000000040200000400000004000000008001100000000000400000000000000000000000020000000000000005000000000000040200","4000000000000000000002000000000000000000000000000000000000000220000000000000000009000000000000000000800000000","10004000000000400080000042000200000000040000000000000000000000000220000800000000000809040480000000008000800008800","200000000020000000000000000000000000000000000800012800000000000000000000010080000000000000000000000000400000000001c","30000600006400010040010402000000000008000080280d016900404000000000000004410080010120040000000004200008640004100003c","240080000040008000000000000000000000000020000000000000000200000000000000000000000000020000000000","80150100001000800074818008104000800050000000040a0022000882a0000000000020410202010800000004000000400100830100000001","b0000002000000000000000000001000000000000000000200000","80000000001000000000000000000000000040004000000000000000000b0040002200000010000010010001000000000000000000200000","2000000000000000000000020000000000000004000000000000000000000000000001000004000002020008000000000000000000000","2020001200000000000000100280020012840200c402000043002000000000000400000180008c0000024a020a100000020000000000000","","400000000004020000000000004008000000000000000000000010000000f8000002010000001000000020000001000000810004000220400","18004000000000800000000000000000000040001000000100000000000000002000100008000000040000000000010000000000000080002000","18024000800000800000004004000000040f42061000000100000000100000003004100008000000a4008204000001000000000000009c002080","","8200000000020000000080000000000000000000000000000200000000001000000000008000200000008000000048000000000","50200000000a200801800028008880095000000a00000001004880000110200010000003040480000429000a0a0400080004002c8402405000","880002804008000000000800008000400000000000000800000040000000800000","2000000010000a000000000040021000001001000000220089004380600c800808000c8000e020402000000110900830004040100000900040","800000000000800000000400000000010000000000000010800000300008000000000000000004000000000800000000200000000","4000008000880000000002800000002400000000114011000000000010c005003000080000800040000000040000002009f9200001200080000","800000000041b0000010000000000000000000000000000008000000000000040000200000000000000000000000000000000000000000","804000050041b8000010100000000008002000000000000008001002000000840000200000000000080000000000000000002000000100","","","",""],
+    ranger: ["1000000000000000000000000000000000000000000000000000000002000000000000000","10000000000000000000000000000000000000040000001010000000000000000000000000000200000000000000000","10000000000000030200000000000000000401000000000100000040000001010000000100000140000000000480202000000000000000","800000000000000000000000000000000008000100000000000000000000000000000000000000000000000000004000000000000000000","800000000040000000000000000000000008001100000000000000000000000000000000000000000000000000005000000000000000200","4040000000020000000000000000000000000000000000000000000000000001000000000000000000800000000","10004000000000000000004042000000020000000000000000000000000000040200000000000000000a09000400000000008000800000000","80040000000000000000001000000000000800000008800020000000000000000000000000800000000000000000000000004000001000004","20800600004400000000000010000000000008000082088c002800004000000000000004000080000000000000000004200008640004100002c","10000000000000080000108000100000000002200000000000000000000000000000010000000000000000000000000000000000","10100001000000004018008100010800010000000000a202000080000000000000000010000010000000000000000000000030100000000","400000000000000000000000b8000002000000001000000000000000000000010000000200000","440000000000000000000000b8040002000000001000000000000000000000010000000200000","2000100000000000000000000000000000000000000000000000000000000000000000000004000000000000100000000000000000000","20001200000000000000000280020002840a0004000000010020000000000000000000800004000002080000100000020000000000000","","20000000000000000000000000000000000000010000000b8000002000000001000000020400001000000010004040200000","2080000000000000000000040000000000000000000000000080","8020000000000800000000004000000000502060000000000000000000000003080100000000000000080040000000000000000000014002080","200000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000","10000000000a000000800000000080000000000000000000000000000000000000000000000080000000000000020008000000208002000000","10000000000a0000008000000000800000000008000000000040000000100000000000000000c0000001000208020008000000248002004000","20000000000000000000000000020000000000000000000008000000200c000000000c80000000000000000010000000000000000000000000","20000000000002000000100040020000001000000000020008000080200c000000000c80002000000000000010000800000000100000000040","4000000000000000000000800000002400000000010000000000000010000000300000000000000000000000000000000800000000200000000","40000080000000000000008000000024000000000140010000000000100004003000000000000040000000000000002009f8000000200000000","40041b0000002000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000","4000050041b8000002000000000000002000000000000008000000000000000000000000000000000000000000000000000000000100","","400000000000000000000000000000000000000000000000000000","1000000000000000000000000000000000000000000000000000040000000100000000",""],
+    duelist: ["40000000000001000000000000000000","20000000000000000000400800000000000000000000001000000000000000000000000000080000000000000000000","10000000000000030200004000000000000400800000000000000040004421010000000000000140000000000081202000000000000000","800000000000000000000000004000000008001100000000000000000000000000000000000000000000000000004000000000000000200","800000000040000000000000004000000008001100000000000000000000000000000000000000000000000000004000000000000000200","10004000000000000000004002000000020000000000000000000000000000000000000000000000000009040000000000008000000000000","10004000000100000080004042000200020000000000000000000000000000040280000000000000000809040000000000008000000000800","80020000000000000000000000000000000800000008080128004000000000000000000000800100000000000000000000004000000000008","2080020000040000004000001000000000000800000008080169004000000000000000040000800100200000000000042000006000041000028","10000000000001000008000000000000000002000000000000000000000000000000800000000000000000000000000000000","400000010018000040080081000108000100000000002202000080000000000000000000000010800000000000000400000000100000000","200000000001000000000000004000000000400000000000000000000000b0040002010000010000000010001000000000010000000000400","200000800001000000000000004000000000400004000000000000000000b0040002010000010000000010001000000000010000000000400","2000000000000000000000020002000000000004000000000000000000000000000000000004000000020000100000000000000000000","2020001000000000000000100200020000840000040000000300000000000000000000008000840000024a0000100000020000000000000","","4000000000000004000000000200000000000000000000000f8000002010000001000000000000000000000010000000200400","40002001000000000000000000000002080000000000000000080000000000000000000000000000000","2400080000000000000000400000004074204100000000000000010000000308400000000000000008010004000000000000000001c002000","","2000000000100000000000000000000000000004000000010000000000000000000000000000200000008000000280000000000","a2000008001000000800040000000000000000040000000100000000000000000c0000421000200000008000400288402005000","200000001000000000000000000000000010000000000000080000002004000000000800000020000000000000800000000040000000800000","20000000100000000000000040020000001000000200020009000100200c000000000c80000020000000000000900000000040100000800002","80000000000800000000000000000010000000000000010000000300000000080000000000000000000000800000001200000000","40000000000800000000008000000024000000001140010000000000100004003000000000800040000000000000000009f9000001200000000","41b0000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000","4000000041b0000000000000000000002000000000000008001000000000800000200000000000000000000000000000002000000100","","","",""],
+    shadow: ["10000000000000000000000000000000000000000000000000000000000000000000000000000000000000000004000000000000000000","2000000000000000000000000000000000000000000000000001000000108000000000000000400000001000000000000","10000000000002010240000001000080000000000004000100000000000000411000020108000140000000000400202001000000000000","800000000040000000400000000000000008001000000000000400000000000000000000000020000000000000000000000000000000000","800000000040200000400000000000000008001100000000000400000000000000000000000020000000000000004000000000000040000","40000000000000000000000000200000000000000000201000080000000000000800000000","40000000020000040000000000000000000000040220000800000000000201000480000000000000800008000","2080040000400000000000001200000000000800008000000020000000000000000000000100800000000000000000040000000000000000014","308006000064000000000000120000000000480000800805002000004000000000000004010080000100040000000404200008640004100003c","1101000000000000000000000000100000000000000008000000000200000000000000010002000000000000000000000000020000000000","80110100001000000060008008004010800050000000040a202200008280000000000000410202010000000004000000000000c30100010000","20000000000000000000000000000000000000000000000b8000000000000000000000000000001000000010004004220000","80000100000020000000000000000000000000000000000000000000000b8002000200000000000000000000001000000010004004220000","120000000000000000000000000000020004000000000000000000000000000001000008000002000000000000000000000000000","1200000000000000000280020002840a000400000040002000000000000000000180000c00000208020a100000020000000000000","","400000000004020000000000000000000000000000000000000010200000b8000002000000001000000020000001000000010004000220000","8000000000000800000000000000000000000020000000100000000000000002000100008000000840000040000010000000000000080000000","18000000000000800000004004000000000d02060000000100000000000000003080100008000000a40002040000010000000000000094000080","","20000800001000000800000001000000000000200000000002000000000000000008000008000000048020000000","50200000000a00000180002800888000100020080000000140088000011020001000000304048000000900080a000008000000048022004000","20000000000000200000000010000000000800000804008800000000100002000400000000010000830000000000000100000","2000000000000a000000000040021000000001000000020088004280600c800000000d8000a000400000000110000830000000100000100040","4000008000800000000000800000000400000000010010000000000010000000300000000000000000000000000000200800200000200000000","40000080008000000000028000000004000000000140110000000000100005003000000000000040000000040000002009f8200000200080000","800000050041b0000000000000000000000000000000000000000000000000040000000000000000000000000000000000000000000100","800000050041b8000010100000000000002000000000000008000000000000040000000000000000080000000000000000000000000100","","","8000000000000000000000000000000000001000000000000000000000000000000000000000000000000000000000000000000000",""],
+    templar: ["20000000000000020000000000000000000000000000000000","800001000080000000800004000000000000000000400000000000000000000000000000000000000000000000","2000240804001020080000000800004000000000000004420401000020000020000000000000000000001000000000000","400000004000000000000000000000000400000000000000000000000000000000000000001000000000000040200","200000400000004000000000001000000000000400000000000000000000000000000000000000001000000000000040200","4000000000040000000002000000000000000000000000000000001000000220000800000000000000000000000000000000000000000","100040000001004400800000020002000000000400000000000000000010000002a0000800000000000809040080000000000000000000800","20000000000000000000000000000000000000008000108000000000000000000000100000000000000000004040000000000000000018","1000060000600001004001000000000000000800000028010149004240000000000000004100000101200400000004040000080400000000038","800000000000000000740000000140000000000000000400000000000020000000000000000000000000000000000000000000800000000001","8005000000000180007481800001400000000000000004020020000882a0000000000020400202000800000004000000000100800000010001","400000000000000000000000000000000000000000000000000000000000f0000000000000000000010000000000000000800000000020000","400000400000000000000000000000000000040004000000000000000000f0002000000000010000010010001000000000800000000020000","1000000000000000000400000000000000000000000000000100000c000000020208000000000000000000000","2000001200000000000000100280020010040800c402000003000000000000000400000180008c0000024a020a100000020000000000000","40000000000000000000000024000100000000000000000000000000000004000000000000000000000000000040011","400000000004000000000000004008000000000000000000000010200000f0000000000000000000000020000001000000800004000220400","10004000000000000000000000000000000040000000000000000000000000000000100008000000840000000000010000000000000400000000","18004000000000000000004000000000040b42001000000100000000100000000004100008000000a40082100040010000000000000498002000","","1000000028000000000000200000000000000000010000000000001040000000028000000040000000000000000400000","40200000000060080100002802800009500000020000000040088000001020001000000104040000042900020a040008000400000020405000","80000000000000000000010000000000000800002000000000800000800008000400000000000000800004000100000900000","10000a000000000000021000001001000200200089004380400c00080800080000c020402004000000900800004040100000900000","800000000002800000000000000000014000000000000010400000100008000080000000000000000000000800000000000080000","880000000002800000002400000000114001000000000010c004003000080000800040000000000000000009f8200001200080000","800000000041b8000000100000000000000000000000000000000002000000840000000000000000000000000000000000000000000000","800000000041b8000010100000000008000000000000000000001002000000840000200000000000000000000000000000002000000000","1002c000100000000010000000000800000000004020000000000000000000000000000000","2000000000000000400000000000000000000000000000000000400000000000000000000000000000000000000000000000000000","",""],
+  },
+};
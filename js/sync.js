@@ -8,6 +8,46 @@
   let currentZone = null;
   let currentAct = null;
 
+  // Must match normalize() in names.py
+  function normName(name) {
+    return name.normalize('NFC').toLowerCase().trim().replace(/\s+/g, ' ').replace(/^the\s+/, '');
+  }
+
+  // Log zone → Korean guide zone. Each client language has its own table
+  // (names_log_en.js / names_log_kr.js), loaded once the log's language is
+  // known from its first SCENE line
+  let logLang = null;
+  let logZones = {};
+
+  function detectLogLang(text) {
+    const m = /\[SCENE\] Set Source \[([^\]]+)\]/.exec(text);
+    if (!m || m[1] === '(null)' || m[1] === '(unknown)') return null;
+    return /[\uac00-\ud7a3]/.test(m[1]) ? 'kr' : 'en';
+  }
+
+  function loadLogZones(lang) {
+    return new Promise((resolve) => {
+      const s = document.createElement('script');
+      s.src = lang === 'kr' ? 'js/names_log_kr.js' : 'js/names_log_en.js';
+      s.onload = () => {
+        logZones = lang === 'kr' ? LOG_ZONES_KR : LOG_ZONES_EN;
+        resolve();
+      };
+      s.onerror = () => { console.warn(`[sync] ${s.src} failed to load`); resolve(); };
+      document.head.appendChild(s);
+    });
+  }
+
+  async function ensureLogZones(text) {
+    if (logLang) return;
+    logLang = detectLogLang(text);
+    if (logLang) await loadLogZones(logLang);
+  }
+
+  function toKoreanZone(zone) {
+    return logZones[normName(zone)] || zone;
+  }
+
   // Extract zone names from [SCENE] Set Source [zone] log lines
   function parseSceneEvents(text) {
     const regex = /\[SCENE\] Set Source \[([^\]]+)\]/g;
@@ -16,7 +56,7 @@
     while ((match = regex.exec(text)) !== null) {
       const z = match[1];
       if (z === '(null)' || z === '(unknown)') continue;
-      zones.push(z);
+      zones.push(toKoreanZone(z));
     }
     return zones;
   }
@@ -42,6 +82,7 @@
       const blob = file.slice(lastSize);
       const newText = await blob.text();
       lastSize = file.size;
+      await ensureLogZones(newText);
 
       const logAct = parseActFromLog(newText);
       if (logAct) currentAct = 'act' + logAct;
@@ -76,6 +117,7 @@
       // Read only the tail to find the last SCENE event
       const start = Math.max(0, file.size - TAIL_BYTES);
       const tail = await file.slice(start).text();
+      await ensureLogZones(tail);
       const logAct = parseActFromLog(tail);
       if (logAct) currentAct = 'act' + logAct;
 
@@ -103,6 +145,8 @@
     lastSize = 0;
     currentZone = null;
     currentAct = null;
+    logLang = null;  // the next log may come from the other client
+    logZones = {};
     updateSyncButton(false);
     updateZoneDisplay(null);
     clearHighlight();
@@ -139,7 +183,11 @@
         showEng = (typeof val === 'object' && val !== null) ? val.zone !== false : val !== false;
       }
     } catch {}
-    const eng = showEng && EN_NAMES && EN_NAMES.zone ? (EN_NAMES.zone[zoneName] || '') : '';
+    if (showEng && typeof EN_NAMES === 'undefined') {
+      // Annotations are fetched on demand; show the zone again once they arrive
+      loadEnNames().then(() => { if (currentZone === zoneName) updateZoneDisplay(zoneName); });
+    }
+    const eng = showEng ? getEnglishName('zone', zoneName) : '';
     const engStr = eng ? ` ${eng}` : '';
 
     // Debug: show mapped act section
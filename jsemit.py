@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""Shared reader/writer for the generated js/*.js data files.
+
+Every generator writes its data constants as JS object literals
+(`const GEM_DATA = { ... };`). With JSON_PARSE enabled (cli.py --json-parse),
+write_js() re-encodes each constant as
+
+    const GEM_DATA = JSON.parse('{"classes":[...],...}');
+
+which browsers parse considerably faster than an equivalent object literal
+for payloads in the hundreds of KB. read_js() turns either form back into
+literal text, so the scraper's section-based readers work on both.
+
+Usage:
+    python jsemit.py bench    # write bench/json_parse.html + both variants of each file
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+
+# Set by cli.py --json-parse; read by write_js() in every generator
+JSON_PARSE = False
+
+# Data files the frontend loads (and that bench compares)
+DATA_FILES = ["gems.js", "gem_details.js", "guide.js", "gem_stats.js", "reward_matrix.js",
+              "prerendered.js", "names_en.js", "names_log_en.js", "names_log_kr.js"]
+
+JS_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|([A-Za-z_]\w*)(\s*:)|,(\s*[}\]])')
+CONST_RE = re.compile(r"^const (\w+) = ", re.MULTILINE)
+JSON_PARSE_RE = re.compile(r"^const (\w+) = JSON\.parse\('((?:[^'\\]|\\.)*)'\);", re.MULTILINE)
+IDENT_RE = re.compile(r"^[A-Za-z_$][\w$]*$")
+COMMENT_RE = re.compile(r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|(//[^\n]*|/\*.*?\*/)', re.DOTALL)
+
+
+def js_literal_to_json(text):
+    """Convert a JS object/array literal (bare keys, trailing commas) to JSON text."""
+    def fix(m):
+        if m.group(1):
+            return f'"{m.group(1)}"{m.group(2)}'
+        if m.group(3) is not None:
+            return m.group(3)
+        return m.group(0)  # string literal, untouched
+    return JS_TOKEN_RE.sub(fix, text)
+
+
+def strip_js_comments(text):
+    """Remove // and /* */ comments (outside string literals) from JS source."""
+    return COMMENT_RE.sub(lambda m: "" if m.group(1) else m.group(0), text)
+
+
+def read_const(text, name):
+    """Return the value of `const name = {literal};` in hand-written JS source."""
+    m = re.search(rf"^const {name} = ", text, re.MULTILINE)
+    if not m:
+        raise ValueError(f"const {name} not found")
+    end = _literal_end(text, m.end())
+    return json.loads(js_literal_to_json(strip_js_comments(text[m.end():end])))
+
+
+# == Encoding (literal -> JSON.parse) ==========================================
+
+
+def json_parse_expr(obj):
+    """Return `JSON.parse('...')` source for obj.
+
+    The JSON keeps Korean text as-is (UTF-8 file); backslashes and single
+    quotes are escaped for the JS string, and U+2028/U+2029 are escaped so the
+    string literal stays valid in older engines.
+    """
+    text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    text = (text.replace("\\", "\\\\").replace("'", "\\'")
+            .replace("\u2028", "\\u2028").replace("\u2029", "\\u2029"))
+    return f"JSON.parse('{text}')"
+
+
+def _literal_end(text, pos):
+    """Index just past the bracketed literal starting at text[pos] ('{' or '[')."""
+    depth = 0
+    in_str = None
+    i = pos
+    while i < len(text):
+        ch = text[i]
+        if in_str:
+            if ch == "\\":
+                i += 1
+            elif ch == in_str:
+                in_str = None
+        elif ch in "\"'":
+            in_str = ch
+        elif ch in "{[":
+            depth += 1
+        elif ch in "}]":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    raise ValueError("unterminated literal")
+
+
+def encode_text(text):
+    """Rewrite every `const X = {literal};` in text as `const X = JSON.parse('...');`."""
+    out = []
+    pos = 0
+    for m in CONST_RE.finditer(text):
+        start = m.end()
+        if m.start() < pos or text[start] not in "{[":
+            continue
+        end = _literal_end(text, start)
+        obj = json.loads(js_literal_to_json(text[start:end]))
+        out.append(text[pos:start])
+        out.append(json_parse_expr(obj))
+        pos = end
+    out.append(text[pos:])
+    return "".join(out)
+
+
+# == Decoding (JSON.parse -> literal) ==========================================
+
+
+def _unescape_js_string(body):
+    return re.sub(r"\\(\\|'|u2028|u2029)",
+                  lambda m: {"\\": "\\", "'": "'", "u2028": "\u2028", "u2029": "\u2029"}[m.group(1)],
+                  body)
+
+
+def _key(k):
+    return k if IDENT_RE.match(k) else json.dumps(k, ensure_ascii=False)
+
+
+def _is_flat(value):
+    return not isinstance(value, (dict, list)) or (
+        isinstance(value, list) and all(not isinstance(v, (dict, list)) for v in value)
+    )
+
+
+def to_js_literal(value, indent=0):
+    """Pretty-print obj in the layout the generators use.
+
+    Top-level keys sit at two spaces (`  gems: [`), flat objects are written
+    on one line (`{ id: "x", name: "y" }`) and scalar arrays inline, which is
+    what GEM_ENTRY_RE and find_section_bounds expect.
+    """
+    pad = "  " * indent
+    inner = "  " * (indent + 1)
+    if isinstance(value, dict):
+        if value and all(_is_flat(v) and not isinstance(v, list) for v in value.values()) and indent > 0:
+            return "{ " + ", ".join(f"{_key(k)}: {to_js_literal(v)}" for k, v in value.items()) + " }"
+        items = [f"{inner}{_key(k)}: {to_js_literal(v, indent + 1)}," for k, v in value.items()]
+        return "{\n" + "\n".join(items) + f"\n{pad}}}"
+    if isinstance(value, list):
+        if _is_flat(value):
+            return json.dumps(value, ensure_ascii=False)
+        items = [f"{inner}{to_js_literal(v, indent + 1)}," for v in value]
+        return "[\n" + "\n".join(items) + f"\n{pad}]"
+    return json.dumps(value, ensure_ascii=False)
+
+
+def decode_text(text):
+    """Rewrite every `const X = JSON.parse('...');` in text back to a JS literal."""
+    def repl(m):
+        obj = json.loads(_unescape_js_string(m.group(2)))
+        return f"const {m.group(1)} = {to_js_literal(obj)};"
+    return JSON_PARSE_RE.sub(repl, text)
+
+
+# == File helpers ==============================================================
+
+
+def read_js(path):
+    """Read a data file as object-literal text, whichever form it was written in."""
+    text = Path(path).read_text(encoding="utf-8")
+    return decode_text(text) if "JSON.parse('" in text else text
+
+
+def write_js(path, text, json_parse=None):
+    """Write object-literal text, re-encoded as JSON.parse if enabled."""
+    if JSON_PARSE if json_parse is None else json_parse:
+        text = encode_text(text)
+    Path(path).write_text(text, encoding="utf-8")
+
+
+def encode_file(path):
+    """Re-encode a file in place (for writers that stream literal text to disk)."""
+    if JSON_PARSE:
+        write_js(path, Path(path).read_text(encoding="utf-8"))
+
+
+# == Parse-time benchmark ======================================================
+
+BENCH_HTML = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="UTF-8">
+<title>JSON.parse vs object literal parse time</title>
+<style>body{font:14px sans-serif;margin:2em}td,th{padding:4px 12px;text-align:right}</style>
+</head>
+<body>
+<h1>JSON.parse vs object literal</h1>
+<p>Each variant is compiled and run <b id="runs"></b> times with <code>new Function</code>;
+median wall time per run. Serve the repo root over HTTP (e.g. <code>python -m http.server</code>) and open bench/json_parse.html.</p>
+<table id="out"><tr><th>file</th><th>literal KB</th><th>literal ms</th><th>JSON.parse KB</th><th>JSON.parse ms</th><th>speedup</th></tr></table>
+<script>
+const FILES = __FILES__;
+const RUNS = 25;
+document.getElementById('runs').textContent = RUNS;
+function median(xs) { xs.sort((a, b) => a - b); return xs[xs.length >> 1]; }
+function time(src) {
+  const xs = [];
+  for (let i = 0; i < RUNS; i++) {
+    const t = performance.now();
+    new Function(src + '\\n//' + Math.random())();  // unique source: no compile-cache hits
+    xs.push(performance.now() - t);
+  }
+  return median(xs);
+}
+(async () => {
+  const table = document.getElementById('out');
+  for (const f of FILES) {
+    const lit = await (await fetch('data/' + f + '.literal.js')).text();
+    const jp = await (await fetch('data/' + f + '.json.js')).text();
+    const a = time(lit), b = time(jp);
+    const row = table.insertRow();
+    [f, (lit.length / 1024).toFixed(0), a.toFixed(2), (jp.length / 1024).toFixed(0), b.toFixed(2),
+     (a / b).toFixed(2) + 'x'].forEach(v => { row.insertCell().textContent = v; });
+  }
+})();
+</script>
+</body>
+</html>
+"""
+
+
+def write_bench(out_dir=ROOT / "bench"):
+    """Write both variants of every data file plus the comparison page."""
+    data_dir = out_dir / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    files = []
+    for name in DATA_FILES:
+        path = ROOT / "js" / name
+        if not path.exists():
+            continue
+        literal = read_js(path)
+        write_js(data_dir / f"{name}.literal.js", literal, json_parse=False)
+        write_js(data_dir / f"{name}.json.js", literal, json_parse=True)
+        size_a = (data_dir / f"{name}.literal.js").stat().st_size
+        size_b = (data_dir / f"{name}.json.js").stat().st_size
+        print(f"  {name:<18} literal {size_a:>8,} B   JSON.parse {size_b:>8,} B")
+        files.append(name)
+    (out_dir / "json_parse.html").write_text(
+        BENCH_HTML.replace("__FILES__", json.dumps(files)), encoding="utf-8"
+    )
+    print(f"Written to {out_dir / 'json_parse.html'}")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["bench"]:
+        write_bench()
+    else:
+        sys.exit(__doc__)
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""File watching and browser push for the generators' --watch modes.
+
+watch_files() yields the set of changed paths each time one of the given
+files is written. On Linux it blocks on inotify (through ctypes, watching the
+parent directories so editors that save by rename are caught); elsewhere, or
+if inotify is unavailable, it polls mtimes.
+
+EventServer is a small Server-Sent Events endpoint on localhost:
+
+    GET /events     event stream; send() pushes a named JSON event to every client
+    GET /live.js    client script: loads js/guide.js (the page itself does not),
+                    then applies 'guide' events to GUIDE_NOTES
+
+index.html loads /live.js when opened with ?live (or ?live=PORT).
+"""
+
+import ctypes
+import ctypes.util
+import json
+import os
+import queue
+import select
+import struct
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+LIVE_PORT = 8765
+
+POLL_INTERVAL = 0.2
+DEBOUNCE = 0.03  # collect the burst of events one save produces
+
+IN_MODIFY = 0x002
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+# == Watching ==================================================================
+
+
+def _inotify_open(paths):
+    """Return (fd, {wd: {name: path}}) watching the paths' directories."""
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    if not hasattr(libc, "inotify_init1"):
+        raise OSError("no inotify")
+    fd = libc.inotify_init1(os.O_CLOEXEC)
+    if fd < 0:
+        raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+    by_dir = {}
+    for p in paths:
+        by_dir.setdefault(p.parent, {})[p.name] = p
+    wds = {}
+    for directory, files in by_dir.items():
+        wd = libc.inotify_add_watch(fd, str(directory).encode(),
+                                    IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE)
+        if wd < 0:
+            os.close(fd)
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        wds[wd] = files
+    return fd, wds
+
+
+def _inotify_changes(fd, wds):
+    def read_events(timeout):
+        changed = set()
+        while select.select([fd], [], [], timeout)[0]:
+            buf = os.read(fd, 64 * 1024)
+            pos = 0
+            while pos < len(buf):
+                wd, _mask, _cookie, length = EVENT_HEADER.unpack_from(buf, pos)
+                name = buf[pos + EVENT_HEADER.size:pos + EVENT_HEADER.size + length]
+                pos += EVENT_HEADER.size + length
+                path = wds.get(wd, {}).get(name.rstrip(b"\0").decode(errors="replace"))
+                if path:
+                    changed.add(path)
+            timeout = DEBOUNCE
+        return changed
+
+    try:
+        while True:
+            changed = read_events(None)
+            if changed:
+                yield changed
+    finally:
+        os.close(fd)
+
+
+def _poll_changes(paths):
+    def stamp(p):
+        try:
+            st = p.stat()
+            return st.st_mtime_ns, st.st_size
+        except FileNotFoundError:
+            return None
+
+    last = {p: stamp(p) for p in paths}
+    while True:
+        time.sleep(POLL_INTERVAL)
+        changed = {p for p in paths if stamp(p) != last[p]}
+        if changed:
+            time.sleep(DEBOUNCE)
+            for p in changed:
+                last[p] = stamp(p)
+            yield changed
+
+
+def watch_files(paths, poll=False):
+    """Yield sets of changed paths forever (inotify, falling back to polling)."""
+    paths = [Path(p).resolve() for p in paths]
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            fd, wds = _inotify_open(paths)
+        except OSError as e:
+            print(f"  inotify unavailable ({e}), polling every {POLL_INTERVAL}s")
+        else:
+            print("  watching with inotify")
+            yield from _inotify_changes(fd, wds)
+            return
+    else:
+        print(f"  polling every {POLL_INTERVAL}s")
+    yield from _poll_changes(paths)
+
+
+# == Browser push ==============================================================
+
+LIVE_JS = """// Live guide reload client, served by livereload.py
+(() => {
+  function listen() {
+    const es = new EventSource(__EVENTS_URL__);
+    es.addEventListener('guide', (e) => {
+      const { act, notes } = JSON.parse(e.data);
+      if (typeof GUIDE_NOTES !== 'undefined') GUIDE_NOTES[act] = notes;
+      window.dispatchEvent(new CustomEvent('guide-notes-updated', { detail: { act, notes } }));
+      console.log(`[live] ${act}: ${notes.length} notes reloaded`);
+    });
+    es.addEventListener('reload', () => location.reload());
+  }
+
+  // The page itself does not load the guide notes; show the current ones first
+  const s = document.createElement('script');
+  s.src = `js/guide.js?${Date.now()}`;
+  s.onload = () => {
+    for (const [act, notes] of Object.entries(GUIDE_NOTES)) {
+      window.dispatchEvent(new CustomEvent('guide-notes-updated', { detail: { act, notes } }));
+    }
+    listen();
+  };
+  s.onerror = listen;
+  document.body.appendChild(s);
+})();
+"""
+
+
+class EventServer:
+    """Server-Sent Events broadcaster plus the /live.js client script."""
+
+    def __init__(self, port=LIVE_PORT, host="127.0.0.1"):
+        self.clients = set()
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if self.path == "/live.js":
+                    url = json.dumps(f"http://{self.headers.get('Host', f'{host}:{port}')}/events")
+                    body = LIVE_JS.replace("__EVENTS_URL__", url).encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/javascript; charset=utf-8")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.send_header("Cache-Control", "no-store")
+                    self.end_headers()
+                    self.wfile.write(body)
+                elif self.path == "/events":
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/event-stream")
+                    self.send_header("Cache-Control", "no-store")
+                    self.send_header("Access-Control-Allow-Origin", "*")
+                    self.end_headers()
+                    server.stream(self.wfile)
+                else:
+                    self.send_error(404)
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+
+    def start(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        host, port = self.httpd.server_address[:2]
+        print(f"  live reload on http://{host}:{port}/events (open index.html?live={port})")
+
+    def stream(self, wfile):
+        q = queue.Queue()
+        with self.lock:
+            self.clients.add(q)
+        try:
+            wfile.write(b": connected\n\n")
+            wfile.flush()
+            while True:
+                try:
+                    wfile.write(q.get(timeout=15))
+                except queue.Empty:
+                    wfile.write(b": ping\n\n")
+                wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            with self.lock:
+                self.clients.discard(q)
+
+    def send(self, event, data):
+        """Push a named event with a JSON payload; returns the number of clients."""
+        payload = json.dumps(data, ensure_ascii=False)
+        msg = f"event: {event}\ndata: {payload}\n\n".encode("utf-8")
+        with self.lock:
+            for q in self.clients:
+                q.put(msg)
+            return len(self.clients)
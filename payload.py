@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""Payload and dead-asset report for the frontend bundle.
+
+Starting from index.html, follows what the page actually loads:
+
+    script   <script src>, <link rel=stylesheet>, other <link href>
+    lazy     js/css/json paths quoted in loaded scripts (e.g. sync.js injecting
+             js/names_log_en.js, the sw.js registration) and url() in loaded CSS
+
+Every other file in js/, css/ and fonts/ is reported as unused. sw.js still
+precaches those files, so each one costs every visitor a download.
+
+For each file the report gives raw, gzip and brotli sizes (brotli only when
+the module is installed) and the parse cost. With --measure the parse cost
+is timed in node, the way bench/json_parse.html times it; otherwise it is
+estimated from the size at PARSE_MS_PER_KB. Data constants also get entry
+counts and duplicated-string statistics: strings repeated across entries,
+grouped by the key they appear under.
+
+Budgets live in payload-budgets.json:
+
+    {"loaded": {"raw": B, "gzip": B},        total of index.html + eager assets
+     "files": {"<glob>": {"raw": B, "gzip": B}},   first matching glob per file
+     "unused": N}                             most unused js/css/fonts files
+
+Any budget exceeded makes the run exit with status 1 (and fails cli.py build).
+
+Usage:
+    python payload.py [--measure] [--budgets F] [--top N]
+"""
+
+import argparse
+import fnmatch
+import gzip
+import json
+import re
+import shutil
+import subprocess
+import sys
+from collections import Counter, defaultdict
+from html.parser import HTMLParser
+from pathlib import Path
+
+import jsemit
+from precache import COMPRESSED_SUFFIXES
+
+ROOT = Path(__file__).parent
+INDEX_HTML = ROOT / "index.html"
+BUDGETS_JSON = ROOT / "payload-budgets.json"
+REPORT_JSON = ROOT / "payload-report.json"
+
+ASSET_DIRS = ["js", "css", "fonts"]
+
+# Parse+evaluate cost per KB, from --measure runs in node on a desktop CPU
+# (phones are several times slower; compare files, not absolute numbers)
+PARSE_MS_PER_KB = {"data": 0.015, "code": 0.025}
+MIN_DUP_LEN = 8  # shorter strings (ids, colors, tags) are not worth deduplicating
+
+QUOTED_PATH_RE = re.compile(r"""['"`]((?:js|css|fonts|releases)/[\w./-]+\.(?:js|css|json|woff2)|[\w-]+\.js)['"`]""")
+CSS_URL_RE = re.compile(r"""url\(\s*['"]?([^'")]+)['"]?\s*\)""")
+
+NODE_TIMER = r"""
+const fs = require('fs');
+const RUNS = 15;
+const out = {};
+for (const file of process.argv.slice(1)) {
+  const src = fs.readFileSync(file, 'utf8');
+  const xs = [];
+  for (let i = 0; i < RUNS; i++) {
+    const t = process.hrtime.bigint();
+    const fn = new Function(src + '\n//' + Math.random());  // unique source: no code cache
+    try { fn(); } catch (e) { /* code files touch the DOM; compile time still counts */ }
+    xs.push(Number(process.hrtime.bigint() - t) / 1e6);
+  }
+  xs.sort((a, b) => a - b);
+  out[file] = xs[xs.length >> 1];
+}
+console.log(JSON.stringify(out));
+"""
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+# == Loaded assets =============================================================
+
+
+class _PageAssets(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.assets = []        # (path, how)
+        self.inline = []        # inline script bodies
+        self._in_script = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "script":
+            if attrs.get("src"):
+                self.assets.append((attrs["src"], "script"))
+            else:
+                self._in_script = True
+        elif tag == "link" and attrs.get("href"):
+            self.assets.append((attrs["href"], attrs.get("rel", "link")))
+
+    def handle_endtag(self, tag):
+        if tag == "script":
+            self._in_script = False
+
+    def handle_data(self, data):
+        if self._in_script:
+            self.inline.append(data)
+
+
+def _local(ref, base=ROOT):
+    """Site-relative path of a local reference, or None for remote/missing ones."""
+    if "://" in ref or ref.startswith("//"):
+        return None
+    path = (base / ref.split("?")[0].split("#")[0]).resolve()
+    try:
+        rel = path.relative_to(ROOT.resolve()).as_posix()
+    except ValueError:
+        return None
+    return rel if path.is_file() else None
+
+
+def loaded_assets(index_html=INDEX_HTML):
+    """{site path: how it is loaded}, in load order, index.html first."""
+    page = _PageAssets()
+    page.feed(index_html.read_text(encoding="utf-8"))
+    loaded = {"index.html": "page"}
+    texts = list(page.inline)
+    for ref, how in page.assets:
+        rel = _local(ref)
+        if rel and rel not in loaded:
+            loaded[rel] = how
+            texts.append((ROOT / rel).read_text(encoding="utf-8"))
+            if rel.endswith(".css"):
+                for url in CSS_URL_RE.findall(texts[-1]):
+                    css_rel = _local(url, (ROOT / rel).parent)
+                    if css_rel:
+                        loaded.setdefault(css_rel, "lazy")
+    for text in texts:
+        for ref in QUOTED_PATH_RE.findall(text):
+            rel = _local(ref)
+            if rel:
+                loaded.setdefault(rel, "lazy")
+    return loaded
+
+
+def unused_assets(loaded):
+    """js/css/fonts files the page never loads."""
+    out = []
+    for d in ASSET_DIRS:
+        for p in sorted((ROOT / d).rglob("*")):
+            rel = p.relative_to(ROOT).as_posix()
+            if p.is_file() and p.suffix not in COMPRESSED_SUFFIXES and rel not in loaded:
+                out.append(rel)
+    return out
+
+
+# == Per-file statistics =======================================================
+
+
+def data_constants(text):
+    """{const name: value} for every literal data constant in a JS file."""
+    text = jsemit.decode_text(text) if "JSON.parse('" in text else text
+    out = {}
+    for m in jsemit.CONST_RE.finditer(text):
+        if text[m.end():m.end() + 1] not in ("{", "["):
+            continue
+        try:
+            out[m.group(1)] = jsemit.read_const(text, m.group(1))
+        except ValueError:
+            pass  # code-built constants (app.js lookup tables with expressions)
+    return out
+
+
+def entry_counts(consts):
+    """{"NAME" or "NAME.key": entries} for top-level collections."""
+    counts = {}
+    for name, value in consts.items():
+        if isinstance(value, dict) and all(isinstance(v, (dict, list)) for v in value.values()) \
+                and len(value) <= 12:
+            for key, v in value.items():
+                counts[f"{name}.{key}"] = len(v)
+        else:
+            counts[name] = len(value)
+    return counts
+
+
+def _strings(value, key=None):
+    if isinstance(value, str):
+        yield key, value
+    elif isinstance(value, dict):
+        for k, v in value.items():
+            yield from _strings(v, k)
+    elif isinstance(value, list):
+        for v in value:
+            yield from _strings(v, key)
+
+
+def duplicate_stats(consts):
+    """Repeated strings of at least MIN_DUP_LEN characters, per key name.
+
+    Returns {"strings", "distinct", "repeated_bytes", "by_key": [...], "top": [...]},
+    where repeated_bytes counts every copy after the first (UTF-8 bytes).
+    """
+    counts = Counter()
+    per_key = defaultdict(Counter)
+    for value in consts.values():
+        for key, s in _strings(value):
+            if len(s) >= MIN_DUP_LEN:
+                counts[s] += 1
+                per_key[key or "-"][s] += 1
+
+    def wasted(counter):
+        return sum((n - 1) * len(s.encode("utf-8")) for s, n in counter.items())
+
+    by_key = sorted(
+        ({"key": k, "values": sum(c.values()), "distinct": len(c), "repeated_bytes": wasted(c)}
+         for k, c in per_key.items()),
+        key=lambda r: -r["repeated_bytes"],
+    )
+    top = sorted(((s, n) for s, n in counts.items() if n > 1),
+                 key=lambda sn: -(sn[1] - 1) * len(sn[0].encode("utf-8")))
+    return {
+        "strings": sum(counts.values()),
+        "distinct": len(counts),
+        "repeated_bytes": wasted(counts),
+        "by_key": [r for r in by_key if r["repeated_bytes"]],
+        "top": [{"text": s, "count": n} for s, n in top[:50]],
+    }
+
+
+def measure_parse(paths):
+    """{path: median ms} timed in node, or None when node is not installed."""
+    node = shutil.which("node")
+    if not node or not paths:
+        return None
+    result = subprocess.run([node, "-e", NODE_TIMER, *[str(ROOT / p) for p in paths]],
+                            capture_output=True, text=True, check=True)
+    timings = json.loads(result.stdout)
+    return {p: timings[str(ROOT / p)] for p in paths}
+
+
+def file_stats(rel):
+    data = (ROOT / rel).read_bytes()
+    stats = {"raw": len(data), "gzip": len(gzip.compress(data, compresslevel=9, mtime=0))}
+    brotli = _brotli()
+    stats["br"] = len(brotli.compress(data, quality=11)) if brotli else None
+    if rel.endswith(".js"):
+        consts = data_constants(data.decode("utf-8"))
+        stats["kind"] = "data" if consts and not re.search(rb"^function ", data, re.M) else "code"
+        stats["parse_ms"] = round(len(data) / 1024 * PARSE_MS_PER_KB[stats["kind"]], 2)
+        stats["parse_measured"] = False
+        if consts:
+            stats["entries"] = entry_counts(consts)
+            stats["duplicates"] = duplicate_stats(consts)
+    return stats
+
+
+# == Budgets ===================================================================
+
+
+def check_budgets(report, budgets):
+    """List of human-readable budget violations."""
+    violations = []
+    for measure, limit in budgets.get("loaded", {}).items():
+        total = report["loaded_total"][measure]
+        if total > limit:
+            violations.append(f"loaded {measure} {total:,} B > {limit:,} B")
+    patterns = budgets.get("files", {})
+    for rel, stats in report["files"].items():
+        # The first matching pattern applies, so specific entries go before globs
+        pattern = next((p for p in patterns if fnmatch.fnmatch(rel, p)), None)
+        if pattern:
+            for measure, limit in patterns[pattern].items():
+                if stats.get(measure) is not None and stats[measure] > limit:
+                    violations.append(f"{rel} {measure} {stats[measure]:,} B > {limit:,} B ({pattern})")
+    limit = budgets.get("unused")
+    if limit is not None and len(report["unused"]) > limit:
+        violations.append(f"{len(report['unused'])} unused assets > {limit}")
+    return violations
+
+
+# == Report ====================================================================
+
+
+def build_report(measure=False):
+    loaded = loaded_assets()
+    unused = unused_assets(loaded)
+    files = {rel: file_stats(rel) for rel in [*loaded, *unused]}
+    if measure:
+        timings = measure_parse([rel for rel in files if rel.endswith(".js")])
+        for rel, ms in (timings or {}).items():
+            files[rel].update(parse_ms=round(ms, 2), parse_measured=True)
+    eager = [rel for rel, how in loaded.items() if how != "lazy"]
+    total = {m: sum(files[rel][m] or 0 for rel in eager) for m in ("raw", "gzip", "br")}
+    total["parse_ms"] = round(sum(files[rel].get("parse_ms", 0) for rel in eager), 2)
+    return {"loaded": loaded, "unused": unused, "files": files, "loaded_total": total}
+
+
+def _kb(n):
+    return "-" if n is None else f"{n / 1024:.1f}"
+
+
+def print_report(report, top=5):
+    files = report["files"]
+    header = f"  {'file':<30} {'load':<10} {'raw KB':>8} {'gzip KB':>8} {'br KB':>7} {'parse ms':>9}"
+
+    def row(rel, how):
+        s = files[rel]
+        parse = s.get("parse_ms")
+        parse = "" if parse is None else f"{parse:.2f}" if s["parse_measured"] else f"~{parse:.2f}"
+        print(f"  {rel:<30} {how:<10} {_kb(s['raw']):>8} {_kb(s['gzip']):>8} {_kb(s['br']):>7} {parse:>9}")
+
+    print("== Loaded by index.html ==")
+    print(header)
+    for rel, how in report["loaded"].items():
+        row(rel, how)
+    t = report["loaded_total"]
+    print(f"  {'eager total':<30} {'':<10} {_kb(t['raw']):>8} {_kb(t['gzip']):>8} "
+          f"{_kb(t['br'] if _brotli() else None):>7} {t['parse_ms']:>9.2f}")
+
+    print("\n== Not loaded (served, not precached) ==")
+    if report["unused"]:
+        print(header)
+        for rel in report["unused"]:
+            row(rel, "unused")
+        wasted = sum(files[rel]["gzip"] for rel in report["unused"])
+        print(f"  {len(report['unused'])} files, {_kb(wasted)} KB gzip downloaded for nothing")
+    else:
+        print("  none")
+
+    print("\n== Entries ==")
+    for rel, s in files.items():
+        if s.get("entries"):
+            print(f"  {rel:<30} " + ", ".join(f"{k} {n:,}" for k, n in s["entries"].items()))
+
+    print(f"\n== Duplicated strings (>= {MIN_DUP_LEN} chars) ==")
+    for rel, s in files.items():
+        dup = s.get("duplicates")
+        if not dup or not dup["repeated_bytes"]:
+            continue
+        share = dup["repeated_bytes"] / s["raw"] * 100
+        print(f"  {rel}: {dup['strings']:,} strings, {dup['distinct']:,} distinct, "
+              f"{_kb(dup['repeated_bytes'])} KB in repeats ({share:.0f}% of the file)")
+        for r in dup["by_key"][:top]:
+            print(f"    {r['key']:<20} {r['values']:>6,} values {r['distinct']:>6,} distinct "
+                  f"{_kb(r['repeated_bytes']):>8} KB repeated")
+        for t in dup["top"][:top]:
+            text = t["text"] if len(t["text"]) <= 60 else t["text"][:57] + "..."
+            print(f"      x{t['count']:<5} {json.dumps(text, ensure_ascii=False)}")
+
+
+def main(budgets_path=BUDGETS_JSON, measure=False, top=5):
+    """Print the report, write payload-report.json and enforce the budgets."""
+    report = build_report(measure)
+    print_report(report, top)
+    budgets = json.loads(budgets_path.read_text(encoding="utf-8")) if budgets_path.exists() else {}
+    report["violations"] = check_budgets(report, budgets)
+    REPORT_JSON.write_text(json.dumps(report, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+
+    print("\n== Budgets ==")
+    if not budgets:
+        print(f"  no budgets ({budgets_path.name} missing)")
+    for v in report["violations"]:
+        print(f"  OVER  {v}")
+    if report["violations"]:
+        sys.exit(f"{len(report['violations'])} payload budget(s) exceeded")
+    if budgets:
+        print(f"  all within {budgets_path.name}")
+    print(f"Written to {REPORT_JSON}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="payload.py", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--measure", action="store_true", help="time parse cost in node")
+    parser.add_argument("--budgets", type=Path, default=BUDGETS_JSON, help="budget file")
+    parser.add_argument("--top", type=int, default=5, help="rows per duplicate listing")
+    args = parser.parse_args()
+    main(args.budgets, args.measure, args.top)
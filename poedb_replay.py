@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""Record/replay stand-in for poedb.tw, for offline scraper load tests.
+
+record   runs a scraper command with POEDB_BASE pointed at a recording proxy.
+         Every page it requests is fetched once from poedb (CDN images via
+         /cdn/...) and saved to a zip fixture archive. Paths already in the
+         archive are not fetched again, so several runs can fill one archive.
+serve    replays the archive on localhost with injected faults:
+           --latency/--jitter   per-response delay (ms)
+           --error-rate         share of random 500/502/503 responses
+           --throttle-rate      share of random 429s
+           --rate               token bucket (req/s); excess gets 429 + Retry-After
+         --synthesize N adds N gem pages (/kr/Synthetic_Gem_00001 ...) built
+         from js/gem_details.js records, listed on /kr/Synthetic_Gems, with
+         icons served from img/gems/.
+bench    serves in-process and runs the real scrape_gem_details() over the
+         synthetic pages (in a scratch copy of the scraper, so the committed
+         js/gem_details.js and fetch state are left alone).
+
+Recorded pages keep their absolute https://cdn.poedb.tw/ image URLs; the
+replay server rewrites them to its own /cdn/ so icon downloads stay local.
+GET /__stats returns the response counts by status.
+
+Usage:
+    python poedb_replay.py record [--archive F] [-- CMD ...]   # default CMD: scrape_poedb.py --bulk
+    python poedb_replay.py serve [--port N] [--latency MS] [--jitter MS] [--error-rate P]
+                                 [--throttle-rate P] [--rate RPS] [--synthesize N]
+    python poedb_replay.py bench [--pages N] [--min-delay S] [--bounded] [serve options]
+
+    POEDB_BASE=http://127.0.0.1:8780 python scrape_poedb.py --details
+"""
+
+import argparse
+import html
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import zipfile
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+ARCHIVE = ROOT / "fixtures" / "poedb.zip"
+PORT = 8780
+
+UPSTREAM = "https://poedb.tw"
+CDN_UPSTREAM = "https://cdn.poedb.tw"
+CDN_PREFIX = "/cdn"
+MANIFEST = "manifest.json"  # archive entry: {path: {"status", "type", "entry"}}
+
+SYNTHETIC_PAGE = "Synthetic_Gem_{:05d}"
+SYNTHETIC_LIST = "Synthetic_Gems"
+SYNTHETIC_PAGE_BYTES = 80 * 1024  # padding when the archive has no gem pages to measure
+ERROR_STATUSES = [500, 502, 503]
+
+
+# == Fixture archive ===========================================================
+
+
+class Archive:
+    """path -> (status, content type, body), stored in one zip file."""
+
+    def __init__(self, path=ARCHIVE):
+        self.path = path
+        self.entries = {}
+        self.lock = threading.Lock()
+        self.dirty = False
+        if path.exists():
+            with zipfile.ZipFile(path) as zf:
+                manifest = json.loads(zf.read(MANIFEST))
+                for url_path, meta in manifest.items():
+                    self.entries[url_path] = (meta["status"], meta["type"], zf.read(meta["entry"]))
+
+    def get(self, url_path):
+        return self.entries.get(url_path)
+
+    def put(self, url_path, status, content_type, body):
+        with self.lock:
+            self.entries[url_path] = (status, content_type, body)
+            self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        manifest = {}
+        with zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as zf:
+            for i, (url_path, (status, content_type, body)) in enumerate(sorted(self.entries.items())):
+                entry = f"bodies/{i:06d}"
+                zf.writestr(entry, body)
+                manifest[url_path] = {"status": status, "type": content_type, "entry": entry}
+            zf.writestr(MANIFEST, json.dumps(manifest, ensure_ascii=False, indent=1))
+        tmp.replace(self.path)
+        self.dirty = False
+        size = self.path.stat().st_size
+        print(f"  Archive: {len(self.entries)} responses, {size / 1e6:.1f} MB -> {self.path}")
+
+    def gem_page_size(self):
+        """Mean size of recorded pages that carry a .gemPopup, or None."""
+        sizes = [len(body) for status, ctype, body in self.entries.values()
+                 if status == 200 and b"gemPopup" in body]
+        return sum(sizes) // len(sizes) if sizes else None
+
+
+def fetch_upstream(url_path):
+    """(status, content type, body) from poedb or its CDN."""
+    from scrape_poedb import HEADERS
+
+    if url_path.startswith(CDN_PREFIX + "/"):
+        url = CDN_UPSTREAM + url_path[len(CDN_PREFIX):]
+        headers = {**HEADERS, "Referer": UPSTREAM + "/"}
+    else:
+        url = UPSTREAM + url_path
+        headers = HEADERS
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=30) as resp:
+            return resp.status, resp.headers.get("Content-Type", ""), resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers.get("Content-Type", ""), e.read()
+    except (urllib.error.URLError, TimeoutError) as e:
+        return 502, "text/plain", f"upstream unreachable: {e}\n".encode()
+
+
+# == Synthetic gem pages =======================================================
+
+
+def synthetic_gems(count):
+    """gems.js-style entries for the synthetic pages, cycling the real gems."""
+    import dataset
+
+    gems = [g for g in dataset.load().gems if g.details]
+    out = []
+    for i in range(count):
+        gem = gems[i % len(gems)]
+        name = SYNTHETIC_PAGE.format(i + 1)
+        out.append({"id": name.lower(), "name": f"{gem.name} {i + 1}", "type": gem.type,
+                    "color": gem.color, "icon": f"{name}.png"})
+    return out
+
+
+class Synthesizer:
+    """Renders synthetic gem pages in the markup parse_gem_details() reads."""
+
+    COLOR_CLASS = {"str": "gem_red", "dex": "gem_green", "int": "gem_blue"}
+
+    def __init__(self, count, page_bytes=SYNTHETIC_PAGE_BYTES):
+        import dataset
+
+        self.count = count
+        self.page_bytes = page_bytes
+        self.gems = [g for g in dataset.load().gems if g.details]
+        self.icons = sorted((ROOT / "img" / "gems").glob("*.png"))
+
+    def _source(self, n):
+        """Real gem the n-th (1-based) synthetic page is modelled on, or None."""
+        if not 1 <= n <= self.count:
+            return None
+        return self.gems[(n - 1) % len(self.gems)]
+
+    @staticmethod
+    def _number(page, prefix):
+        try:
+            return int(page[len(prefix):]) if page.startswith(prefix) else None
+        except ValueError:
+            return None
+
+    def icon_url(self, n):
+        # Absolute, like poedb's own markup; respond() maps it to this server
+        return f"{CDN_UPSTREAM}/image/Art/2DItems/Gems/{SYNTHETIC_PAGE.format(n)}.png"
+
+    def page(self, url_path):
+        """Body for a synthetic URL path, or None."""
+        prefix = "/kr/" + SYNTHETIC_PAGE.split("{")[0]
+        if url_path == f"/kr/{SYNTHETIC_LIST}":
+            return "text/html; charset=utf-8", self.list_page()
+        n = self._number(url_path, prefix)
+        if n is not None and self._source(n):
+            return "text/html; charset=utf-8", self.gem_page(n)
+        n = self._number(url_path.removesuffix(".png"),
+                         f"{CDN_PREFIX}/image/Art/2DItems/Gems/{SYNTHETIC_PAGE.split('{')[0]}")
+        if n is not None and self._source(n) and self.icons:
+            return "image/png", self.icons[(n - 1) % len(self.icons)].read_bytes()
+        return None
+
+    def list_page(self):
+        rows = []
+        for n in range(1, self.count + 1):
+            gem = self._source(n)
+            name = SYNTHETIC_PAGE.format(n)
+            tags = "".join(f'<a class="GemTags">{html.escape(t)}</a>' for t in gem.details.tags)
+            rows.append(f'<tr><td><img src="{self.icon_url(n)}"></td>'
+                        f'<td><a class="{self.COLOR_CLASS.get(gem.color, "gem_green")}" '
+                        f'href="/kr/{name}">{html.escape(gem.name)} {n}</a></td><td>{tags}</td></tr>')
+        return f"<html><body><h1>{SYNTHETIC_LIST}</h1><table>{''.join(rows)}</table></body></html>".encode()
+
+    def gem_page(self, n):
+        gem = self._source(n)
+        d = gem.details
+        esc = html.escape
+        parts = [f'<html><body><h1>{esc(d.engName or gem.eng_name)} {n}</h1>',
+                 f'<img src="{self.icon_url(n)}">', '<div class="gemPopup">',
+                 '<div class="property">' + ", ".join(
+                     f'<a class="GemTags">{esc(t)}</a>' for t in d.tags) + "</div>"]
+        parts += [f'<div class="property">{esc(p)}</div>' for p in d.properties]
+        for cls, value in (("requirements", d.requirements), ("secDescrText", d.description)):
+            if value:
+                parts.append(f'<div class="{cls}">{esc(value)}</div>')
+        parts += [f'<div class="explicitMod">{esc(m)}</div>' for m in d.mods]
+        for cls, value in (("reminderText", d.reminder), ("text-type0", d.qualityHeader),
+                           ("qualityMod", d.qualityMod), ("default fst-italic", d.supportText)):
+            if value:
+                parts.append(f'<div class="{cls}">{esc(value)}</div>')
+        parts.append("</div>")
+        body = "".join(parts).encode("utf-8")
+        # Pad with site chrome-like markup so parse cost resembles a real page
+        filler = b'<div class="nav-item"><a href="/kr/Quest">Quest</a></div>\n'
+        padding = filler * max(0, (self.page_bytes - len(body)) // len(filler))
+        return body + padding + b"</body></html>"
+
+
+# == Server ====================================================================
+
+
+class ReplayServer:
+    """Serves archived (and synthetic) responses with injected faults."""
+
+    def __init__(self, archive, port=PORT, host="127.0.0.1", record=False, latency=0.0,
+                 jitter=0.0, error_rate=0.0, throttle_rate=0.0, rate=None, retry_after=1,
+                 synthesize=0, seed=None):
+        self.archive = archive
+        self.record = record
+        self.latency = latency / 1000
+        self.jitter = jitter / 1000
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.rate = rate
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.stats = Counter()
+        self.lock = threading.Lock()
+        self._tokens = rate or 0
+        self._refilled = time.monotonic()
+        page_bytes = archive.gem_page_size() or SYNTHETIC_PAGE_BYTES
+        self.synth = Synthesizer(synthesize, page_bytes) if synthesize else None
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                status, headers, body = server.respond(self.path, self.headers.get("Host"))
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+
+    @property
+    def base(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _fault(self):
+        """(status, headers) for an injected failure, or None."""
+        with self.lock:
+            if self.rate:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._refilled) * self.rate)
+                self._refilled = now
+                if self._tokens < 1:
+                    return 429, {"Retry-After": str(self.retry_after)}
+                self._tokens -= 1
+            roll = self.random.random()
+            if roll < self.throttle_rate:
+                return 429, {"Retry-After": str(self.retry_after)}
+            if roll < self.throttle_rate + self.error_rate:
+                return self.random.choice(ERROR_STATUSES), {}
+        return None
+
+    def _delay(self):
+        with self.lock:
+            jitter = self.random.uniform(-self.jitter, self.jitter)
+        return max(0.0, self.latency + jitter)
+
+    def respond(self, url_path, host):
+        if url_path == "/__stats":
+            with self.lock:
+                body = json.dumps(dict(self.stats)).encode()
+            return 200, {"Content-Type": "application/json"}, body
+
+        if self.record:
+            found = self.archive.get(url_path)
+            if found is None:
+                found = fetch_upstream(url_path)
+                if found[0] in (200, 404):  # never record throttling or outages
+                    self.archive.put(url_path, *found)
+        else:
+            fault = self._fault()
+            if fault:
+                status, headers = fault
+                self._count(status)
+                return status, {**headers, "Content-Type": "text/plain"}, b"injected fault\n"
+            time.sleep(self._delay())
+            found = self.archive.get(url_path)
+            if found is None and self.synth:
+                synthetic = self.synth.page(url_path)
+                found = (200, *synthetic) if synthetic else None
+        if found is None:
+            self._count(404)
+            return 404, {"Content-Type": "text/plain"}, b"not in fixture archive\n"
+
+        status, content_type, body = found
+        if content_type.startswith("text/html"):
+            body = body.replace(CDN_UPSTREAM.encode() + b"/", f"http://{host}{CDN_PREFIX}/".encode())
+        self._count(status)
+        return status, {"Content-Type": content_type}, body
+
+    def _count(self, status):
+        with self.lock:
+            self.stats[status] += 1
+
+    def start(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+# == Commands ==================================================================
+
+
+def record(archive_path=ARCHIVE, command=None, port=PORT):
+    """Run command against the recording proxy, then save the archive."""
+    archive = Archive(archive_path)
+    server = ReplayServer(archive, port=port, record=True).start()
+    command = command or [sys.executable, "scrape_poedb.py", "--bulk"]
+    print(f"=== Recording {UPSTREAM} through {server.base}: {' '.join(command)} ===\n")
+    try:
+        subprocess.run(command, cwd=ROOT, env={**os.environ, "POEDB_BASE": server.base}, check=False)
+    finally:
+        server.stop()
+        archive.save()
+
+
+def serve(archive_path=ARCHIVE, port=PORT, **faults):
+    archive = Archive(archive_path)
+    server = ReplayServer(archive, port=port, **faults)
+    synthetic = f", {faults['synthesize']} synthetic gem pages" if faults.get("synthesize") else ""
+    print(f"Replaying {len(archive.entries)} responses{synthetic} on {server.base}")
+    print(f"  POEDB_BASE={server.base} python scrape_poedb.py ...")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(f"Responses: {dict(sorted(server.stats.items()))}")
+
+
+# Runs in the scratch tree: the real scrape_gem_details() over the synthetic gems
+BENCH_DRIVER = """
+import json, sys, time
+import scrape_poedb
+gems_path, min_delay, bounded = sys.argv[1:]
+if min_delay:
+    scrape_poedb.scheduler = scrape_poedb.FetchScheduler(delay=float(min_delay), min_delay=float(min_delay))
+gems = json.loads(open(gems_path, encoding="utf-8").read())
+t0 = time.perf_counter()
+scrape_poedb.scrape_gem_details(gems, bounded=bounded == "1")
+print(f"__elapsed__ {time.perf_counter() - t0}")
+print(f"  Scheduler : {scrape_poedb.scheduler.status()}")
+"""
+
+# Copied into the scratch tree; everything scrape_gem_details() imports from ROOT
+BENCH_MODULES = ["scrape_poedb.py", "jsemit.py"]
+
+
+def bench(archive_path=ARCHIVE, pages=1000, min_delay=None, bounded=False, **faults):
+    """Run scrape_gem_details() over synthetic gem pages served in-process.
+
+    The scraper runs unmodified in a subprocess with POEDB_BASE pointed at the
+    replay server, from a scratch copy of its modules so the gem_details.js and
+    fetch state it writes never touch the real tree.
+    """
+    import tempfile
+
+    from scrape_poedb import iter_gem_details_js
+
+    server = ReplayServer(Archive(archive_path), port=0, synthesize=pages, **faults).start()
+    print(f"=== scrape_gem_details: {pages} synthetic pages from {server.base} ===\n")
+    try:
+        with tempfile.TemporaryDirectory(prefix="poedb-bench-") as tmp:
+            scratch = Path(tmp)
+            (scratch / "js").mkdir()
+            for name in BENCH_MODULES:
+                (scratch / name).write_bytes((ROOT / name).read_bytes())
+            gems_path = scratch / "bench_gems.json"
+            gems_path.write_text(json.dumps(synthetic_gems(pages)), encoding="utf-8")
+            command = [sys.executable, "-c", BENCH_DRIVER, str(gems_path),
+                       "" if min_delay is None else str(min_delay), "1" if bounded else "0"]
+            proc = subprocess.run(command, cwd=scratch, env={**os.environ, "POEDB_BASE": server.base},
+                                  stdout=subprocess.PIPE, text=True, check=False)
+            elapsed = None
+            for line in proc.stdout.splitlines():
+                if line.startswith("__elapsed__ "):
+                    elapsed = float(line.split()[1])
+                else:
+                    print(line)
+            output = scratch / "js" / "gem_details.js"
+            parsed = sum(1 for _ in iter_gem_details_js(output)) if output.exists() else 0
+    finally:
+        server.stop()
+
+    if proc.returncode or elapsed is None:
+        sys.exit(f"scrape_gem_details exited with status {proc.returncode}")
+    print(f"\n  Pages     : {parsed}/{pages} parsed in {elapsed:.1f}s "
+          f"({parsed / elapsed:.1f} pages/s)")
+    print(f"  Responses : {dict(sorted(server.stats.items()))}")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    command = None
+    if "--" in argv:
+        i = argv.index("--")
+        argv, command = argv[:i], argv[i + 1:]
+    parser = argparse.ArgumentParser(prog="poedb_replay.py", description=__doc__.split("\n\n")[0])
+    parser.add_argument("mode", choices=["record", "serve", "bench"])
+    parser.add_argument("--archive", type=Path, default=ARCHIVE)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--latency", type=float, default=0.0, help="mean response delay (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="+/- delay spread (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 5xx responses")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="share of random 429s")
+    parser.add_argument("--rate", type=float, help="token-bucket limit (requests/s)")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After on 429 (s)")
+    parser.add_argument("--synthesize", type=int, default=0, help="synthetic gem pages to serve")
+    parser.add_argument("--seed", type=int, help="fault injection seed")
+    parser.add_argument("--pages", type=int, default=1000, help="bench: synthetic pages to scrape")
+    parser.add_argument("--min-delay", type=float, help="bench: FetchScheduler min delay (s)")
+    parser.add_argument("--bounded", action="store_true", help="bench: scrape with --bounded")
+    args = parser.parse_args(argv)
+
+    faults = {"latency": args.latency, "jitter": args.jitter, "error_rate": args.error_rate,
+              "throttle_rate": args.throttle_rate, "rate": args.rate,
+              "retry_after": args.retry_after, "seed": args.seed}
+    if args.mode == "record":
+        record(args.archive, command, args.port)
+    elif args.mode == "serve":
+        serve(args.archive, args.port, synthesize=args.synthesize, **faults)
+    else:
+        bench(args.archive, args.pages, args.min_delay, args.bounded, **faults)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Hash the site's static assets and generate the service worker (sw.js).
+
+index.html and every asset it references (its scripts and stylesheet, plus
+files those name, e.g. fonts and lazily loaded scripts; see
+payload.loaded_assets) get a content revision (truncated SHA-256). Files the
+page never loads are not precached. The list is written to
+precache-manifest.json and embedded in sw.js, which:
+
+  - on install, fetches only entries whose url+revision is not cached yet,
+    requesting url?__rev=<revision> (hosts that ignore the query serve the
+    same file; serve.py marks it immutable)
+  - on activate, drops cache entries that are no longer in the manifest
+  - serves precached assets cache-first, ignoring ?query strings
+  - caches gem icons (img/gems/) at runtime, on first use, in a separate
+    cache: there are hundreds and a page only shows a few
+  - caches the on-demand name tables (ON_DEMAND: English annotations and the
+    per-language log zone tables) on first use, by revision like precached
+    assets: most visitors need one of them or none, so none is installed
+    up front
+
+Because sw.js embeds the revisions, any asset change changes sw.js and the
+browser installs the new worker; unchanged files are never re-downloaded and
+index.html no longer needs hand-bumped ?v=N strings. The exception is the
+data files releases.py pins to a base release (gems.js, gem_details.js):
+their revision is the base release, so a new release only adds its delta
+file (named in js/release.js) instead of re-downloading them.
+
+Run after every generator (cli.py all does this last).
+
+Usage:
+    python precache.py
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+MANIFEST_JSON = ROOT / 'precache-manifest.json'
+SW_JS = ROOT / 'sw.js'
+
+# Everything the site is made of (what serve.py serves); only the part
+# index.html loads is precached
+SITE_DIRS = ['js', 'css', 'fonts', 'img/gems']
+SITE_FILES = ['index.html']
+RUNTIME_DIRS = ['img/gems']  # cached by sw.js when first requested
+# Loaded by the page only when needed (i18n.js loadEnNames, sync.js); cached
+# by revision when first requested
+ON_DEMAND = ['js/names_en.js', 'js/names_log_en.js', 'js/names_log_kr.js']
+CACHE_NAME = 'poe-leveling-kr-precache'
+RUNTIME_CACHE_NAME = 'poe-leveling-kr-runtime'
+COMPRESSED_SUFFIXES = {'.gz', '.br'}  # precompressed copies, never assets of their own
+
+SW_TEMPLATE = """// Service worker generated by precache.py (do not edit)
+const CACHE = __CACHE__;
+const RUNTIME_CACHE = __RUNTIME_CACHE__;
+const RUNTIME_DIRS = __RUNTIME_DIRS__;
+const PRECACHE = __PRECACHE__;
+const ON_DEMAND = __ON_DEMAND__;
+
+const REV_PARAM = '__rev';
+const BASE = self.registration.scope;
+const INDEX = new URL('index.html', BASE).href;
+
+function cacheKey(url, revision) {
+  const u = new URL(url, BASE);
+  u.searchParams.set(REV_PARAM, revision);
+  return u.href;
+}
+
+// url (absolute, no query) -> cache key for the current manifest
+const KEYS = new Map(Object.entries(PRECACHE).map(([url, rev]) => [new URL(url, BASE).href, cacheKey(url, rev)]));
+const ON_DEMAND_KEYS = new Map(Object.entries(ON_DEMAND).map(([url, rev]) => [new URL(url, BASE).href, cacheKey(url, rev)]));
+
+self.addEventListener('install', (event) => {
+  event.waitUntil((async () => {
+    const cache = await caches.open(CACHE);
+    const missing = [];
+    for (const [url, key] of KEYS) {
+      if (!(await cache.match(key))) missing.push([url, key]);
+    }
+    await Promise.all(missing.map(async ([url, key]) => {
+      // The revisioned URL lets serve.py answer with an immutable response
+      const res = await fetch(key, { cache: 'no-cache' });
+      if (!res.ok) throw new Error(`precache ${url}: ${res.status}`);
+      await cache.put(key, res);
+    }));
+    await self.skipWaiting();
+  })());
+});
+
+self.addEventListener('activate', (event) => {
+  event.waitUntil((async () => {
+    const cache = await caches.open(CACHE);
+    const keep = new Set([...KEYS.values(), ...ON_DEMAND_KEYS.values()]);
+    for (const req of await cache.keys()) {
+      if (!keep.has(req.url)) await cache.delete(req);
+    }
+    await self.clients.claim();
+  })());
+});
+
+self.addEventListener('fetch', (event) => {
+  if (event.request.method !== 'GET') return;
+  const url = new URL(event.request.url);
+  url.search = '';
+  const href = event.request.mode === 'navigate' && url.href === BASE ? INDEX : url.href;
+  const key = KEYS.get(href);
+  if (key) {
+    event.respondWith((async () => {
+      const cache = await caches.open(CACHE);
+      return (await cache.match(key)) || fetch(event.request);
+    })());
+    return;
+  }
+  const onDemandKey = ON_DEMAND_KEYS.get(url.href);
+  if (onDemandKey) {
+    // Cache on first use under its revision; activate drops stale revisions
+    event.respondWith((async () => {
+      const cache = await caches.open(CACHE);
+      const hit = await cache.match(onDemandKey);
+      if (hit) return hit;
+      const res = await fetch(onDemandKey, { cache: 'no-cache' });
+      if (res.ok) await cache.put(onDemandKey, res.clone());
+      return res;
+    })());
+    return;
+  }
+  if (url.origin === self.location.origin
+      && RUNTIME_DIRS.some(dir => url.pathname.startsWith(new URL(dir + '/', BASE).pathname))) {
+    // Cache on first use; icon files do not change under the same name
+    event.respondWith((async () => {
+      const cache = await caches.open(RUNTIME_CACHE);
+      const hit = await cache.match(url.href);
+      if (hit) return hit;
+      const res = await fetch(event.request);
+      if (res.ok) await cache.put(url.href, res.clone());
+      return res;
+    })());
+  }
+});
+"""
+
+
+def iter_site_files(root=ROOT):
+    """Site-relative paths of every file in SITE_FILES/SITE_DIRS, sorted."""
+    paths = [root / f for f in SITE_FILES]
+    for d in SITE_DIRS:
+        paths += [p for p in (root / d).rglob('*')
+                  if p.is_file() and p.suffix not in COMPRESSED_SUFFIXES]
+    return sorted(p.relative_to(root).as_posix() for p in paths)
+
+
+def iter_assets(root=ROOT):
+    """Site-relative paths of every precached file, sorted: index.html and what it loads."""
+    from payload import loaded_assets
+
+    loaded = loaded_assets(root / 'index.html')
+    return sorted(rel for rel in loaded
+                  if rel != SW_JS.name and rel not in ON_DEMAND
+                  and not any(rel.startswith(d + '/') for d in RUNTIME_DIRS)
+                  and (root / rel).is_file())
+
+
+def on_demand_revisions(root=ROOT):
+    """{url: revision} for the ON_DEMAND files the page can load."""
+    from payload import loaded_assets
+
+    loaded = loaded_assets(root / 'index.html')
+    return {url: file_revision(root / url) for url in ON_DEMAND
+            if url in loaded and (root / url).is_file()}
+
+
+def file_revision(path):
+    """First 12 hex digits of the file's SHA-256."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()[:12]
+
+
+def build_manifest(root=ROOT, pinned=None):
+    """{url: revision} for every precached asset.
+
+    pinned ({url: revision}, default releases.pinned_revisions()) overrides
+    the content revision of release-pinned data files.
+    """
+    if pinned is None:
+        from releases import pinned_revisions
+        pinned = pinned_revisions()
+    return {url: pinned.get(url) or file_revision(root / url) for url in iter_assets(root)}
+
+
+def main():
+    manifest = build_manifest()
+    on_demand = on_demand_revisions()
+    previous = {}
+    if MANIFEST_JSON.exists():
+        previous = json.loads(MANIFEST_JSON.read_text(encoding='utf-8'))
+
+    MANIFEST_JSON.write_text(json.dumps(manifest, indent=1) + '\n', encoding='utf-8')
+    sw = (SW_TEMPLATE.replace('__CACHE__', json.dumps(CACHE_NAME))
+          .replace('__RUNTIME_CACHE__', json.dumps(RUNTIME_CACHE_NAME))
+          .replace('__RUNTIME_DIRS__', json.dumps(RUNTIME_DIRS))
+          .replace('__PRECACHE__', json.dumps(manifest, indent=1))
+          .replace('__ON_DEMAND__', json.dumps(on_demand, indent=1)))
+    SW_JS.write_text(sw, encoding='utf-8')
+
+    changed = [u for u, rev in manifest.items() if previous.get(u) != rev]
+    removed = [u for u in previous if u not in manifest]
+    size = sum((ROOT / u).stat().st_size for u in manifest)
+    print(f'{len(manifest)} assets ({size / 1024:.0f} KB), '
+          f'{len(changed)} changed, {len(removed)} removed since last build; '
+          f'{len(on_demand)} on demand')
+    for url in changed[:20]:
+        print(f'  ~ {url}')
+    print(f'Written to {SW_JS} and {MANIFEST_JSON}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Prerender the @zone{...}/@boss{...}/... step markup of js/data_v2.js into js/prerendered.js.
+
+app.js renders every step by HTML-escaping it, running the inline-tag regex
+and looking up EN_NAMES (names.py) for each entity. This does the same once at build
+time, producing the exact HTML parseStep() would produce with every English
+annotation switched on (the default). app.js uses these fragments when that
+is the user's setting and falls back to parseStep() otherwise.
+
+Each section also gets a hash of the step text it was rendered from
+(source_hash, mirrored by sourceHash() in app.js); app.js only uses a
+section's fragments while its live steps still hash the same, so an edited
+data_v2.js never shows stale HTML.
+
+Regenerate after editing data_v2.js or names.py.
+"""
+
+import json
+import re
+from pathlib import Path
+
+import jsemit
+from names import KR_TO_EN
+
+ROOT = Path(__file__).parent
+DATA_JS = ROOT / 'js' / 'data_v2.js'
+PRERENDERED_JS = ROOT / 'js' / 'prerendered.js'
+
+# Must match ENTITY_CLASS / WP_ICON / TP_ICON in app.js
+ENTITY_CLASS = {
+    'izone': 'zone izone', 'zone': 'zone', 'boss': 'boss', 'npc': 'npc',
+    'wp': 'waypoint', 'tp': 'tp', 'quest': 'quest', 'trial': 'trial',
+}
+WP_ICON = '<svg class="wp-icon" width="12" height="12" viewBox="0 0 12 12"><path d="M6 1L11 6L6 11L1 6Z" fill="currentColor" opacity="0.85"/><circle cx="6" cy="6" r="1.5" fill="#fff" opacity="0.5"/></svg>'
+TP_ICON = '<img class="tp-icon" src="https://cdn.poedb.tw/image/Art/2DItems/Currency/CurrencyPortal.webp" width="14" height="14" alt="" loading="lazy">'
+
+# Entity types that carry an English annotation (app.js showEnglish keys)
+ENG_TYPES = ['zone', 'boss', 'npc', 'quest', 'trial']
+
+TAG_RE = re.compile(r'@(izone|zone|boss|npc|wp|tp|quest|trial)\{([^}]+)\}')
+
+
+def render_step(text, en_names):
+    """Python port of app.js parseStep() with all English annotations on."""
+    escaped = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+    def repl(m):
+        kind, content = m.group(1), m.group(2)
+        prefix = WP_ICON if kind == 'wp' else TP_ICON if kind == 'tp' else ''
+        eng = en_names.get(kind, {}).get(content, '') if kind in ENG_TYPES else ''
+        suffix = f'<span class="eng-anno">{eng}</span>' if eng else ''
+        return f'<span class="{ENTITY_CLASS[kind]}">{prefix}{content}{suffix}</span>'
+
+    return TAG_RE.sub(repl, escaped)
+
+
+def source_hash(steps):
+    """FNV-1a (32-bit) over the UTF-16 code units of the steps' text, as hex.
+
+    Must match sourceHash() in app.js: each step contributes its text, plus
+    U+0000 and the newLeague variant when it has one; steps are separated by
+    U+001E.
+    """
+    parts = []
+    for step in steps:
+        if isinstance(step, str):
+            parts.append(step)
+        elif isinstance(step.get('newLeague'), str):
+            parts.append(step['text'] + '\0' + step['newLeague'])
+        else:
+            parts.append(step['text'])
+    data = '\x1e'.join(parts).encode('utf-16-le')
+    h = 0x811C9DC5
+    for i in range(0, len(data), 2):
+        h = ((h ^ (data[i] | data[i + 1] << 8)) * 0x01000193) & 0xFFFFFFFF
+    return f'{h:08x}'
+
+
+def prerender_steps(steps, en_names):
+    """One entry per step: html, or [html, variantHtml] for newLeague variants."""
+    out = []
+    for step in steps:
+        if isinstance(step, str):
+            out.append(render_step(step, en_names))
+            continue
+        rendered = render_step(step['text'], en_names)
+        if isinstance(step.get('newLeague'), str):
+            out.append([rendered, render_step(step['newLeague'], en_names)])
+        else:
+            out.append(rendered)
+    return out
+
+
+def build_prerendered(data, en_names):
+    """sectionId -> (source_hash, prerendered steps)."""
+    sources = {'general': data['general'].get('steps', [])}
+    for act in data['acts']:
+        sources[f'act{act["id"]}'] = act.get('steps', [])
+    return {
+        section_id: (source_hash(steps), prerender_steps(steps, en_names))
+        for section_id, steps in sources.items()
+    }
+
+
+def main(data_path=DATA_JS, output_path=PRERENDERED_JS):
+    data = jsemit.read_const(Path(data_path).read_text(encoding='utf-8'), 'DATA')
+    sections = build_prerendered(data, KR_TO_EN)
+
+    lines = [
+        '// Step HTML prerendered from data_v2.js + names.py by prerender.py (do not edit)',
+        '// [sectionId][stepIdx] = html, or [html, newLeagueVariantHtml]',
+        '// hashes[sectionId] = source_hash() of the steps the section was rendered from',
+        'const PRERENDERED = {',
+        f'  engTypes: {json.dumps(ENG_TYPES)},',
+        f'  hashes: {json.dumps({k: h for k, (h, _) in sections.items()})},',
+    ]
+    for section_id, (_, steps) in sections.items():
+        lines.append(f'  {section_id}: [')
+        for entry in steps:
+            lines.append(f'    {json.dumps(entry, ensure_ascii=False)},')
+        lines.append('  ],')
+    lines.append('};')
+    lines.append('')
+    jsemit.write_js(output_path, '\n'.join(lines))
+
+    total = sum(len(steps) for _, steps in sections.values())
+    print(f'{total} steps prerendered across {len(sections)} sections')
+    print(f'Written to {output_path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Cut a data release and publish the delta from the previous one.
+
+The generated data files are flattened into keyed records:
+
+    classes                      the classes[] list of gems.js
+    gem:<id>                     one gems[] entry
+    reward:<kind>:<act>:<quest>  one questRewards (kind=reward) / vendorRewards (kind=vendor) row
+    details:<id>                 one GEM_DETAILS entry
+
+Each release's records are saved as the snapshot "release-<N>" in the
+content-addressed store (snapshots.py), so a release only adds the records
+that changed. A new release compares against the previous one and writes
+only what changed:
+
+    releases/delta-<N>.json   {"version": N, "from": N-1,
+                               "added": {key: record}, "changed": {key: record},
+                               "removed": [key, ...],
+                               "positions": {key: index in its gems.js list}}
+    releases/index.json       {"latest": N, "base": B, "baseSize": bytes,
+                               "versions": [{version, date, delta, size, counts}]}
+    js/release.js             const DATA_RELEASE = {version: N, base: B, root: <snapshot root>,
+                                                    deltas: ["releases/delta-<B+1>.json", ...]}
+
+The site is served as a pinned base plus deltas. sw.js precaches gems.js
+and gem_details.js under the base release B (pinned_revisions) rather than
+their content hash, so a new release does not re-download them; it only
+changes js/release.js and adds one small delta file, both precached.
+js/data-release.js applies the listed deltas in order (delete removed, set
+changed, insert added at their positions). Deltas set whole records, so
+applying the chain to data from any release since B gives release N; a
+client that fetched a newer gems.js than B ends up at the same data.
+
+Once the deltas since B add up to more than REBASE_FRACTION of the base
+files, the release becomes the new base: the pin changes and clients fetch
+the full files once.
+
+Usage:
+    python releases.py    # cut a release if js/gems.js or js/gem_details.js changed
+"""
+
+import json
+import time
+
+import jsemit
+from jsemit import js_literal_to_json
+from scrape_poedb import (
+    ROOT,
+    find_section_bounds,
+    parse_existing_gems,
+    parse_existing_rewards,
+    parse_gem_details_js,
+)
+
+GEMS_JS = ROOT / "js" / "gems.js"
+DETAILS_JS = ROOT / "js" / "gem_details.js"
+RELEASES_DIR = ROOT / "releases"
+INDEX_JSON = RELEASES_DIR / "index.json"
+RELEASE_JS = ROOT / "js" / "release.js"
+PINNED_FILES = ["js/gems.js", "js/gem_details.js"]  # precached under the base release
+REBASE_FRACTION = 0.5  # rebase once the deltas since the base exceed this share of it
+LIST_SECTIONS = ("gem", "reward", "vendor")  # record kinds stored as gems.js list rows
+SNAPSHOT_PREFIX = "release-"  # snapshot names reserved for release baselines
+
+
+def _dump(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def load_records(gems_js=GEMS_JS, details_js=DETAILS_JS):
+    """Flatten gems.js and gem_details.js into {key: record}."""
+    text = jsemit.read_js(gems_js)
+    start, end = find_section_bounds(text, "classes")
+    records = {
+        "classes": json.loads(js_literal_to_json(
+            text[start + len("  classes: "):end].rstrip().rstrip(","))),
+    }
+    for gem in parse_existing_gems(text):
+        records[f"gem:{gem['id']}"] = gem
+    for kind, section in (("reward", "questRewards"), ("vendor", "vendorRewards")):
+        for row in parse_existing_rewards(text, section):
+            records[f"{kind}:{row.get('act') or 0}:{row['questName']}"] = row
+    if details_js.exists():
+        for gem_id, data in parse_gem_details_js(jsemit.read_js(details_js)).items():
+            records[f"details:{gem_id}"] = data
+    return records
+
+
+def diff_records(old, new):
+    """Added/changed/removed records between two {key: record} mappings."""
+    delta = {"added": {}, "changed": {}, "removed": [k for k in old if k not in new]}
+    for key, record in new.items():
+        if key not in old:
+            delta["added"][key] = record
+        elif old[key] != record:
+            delta["changed"][key] = record
+    return delta
+
+
+def list_positions(records, keys):
+    """{key: index within its gems.js list} for the list-row keys among keys."""
+    positions, counts = {}, {}
+    for key in records:
+        section = key.split(":", 1)[0]
+        if section not in LIST_SECTIONS:
+            continue
+        index = counts.get(section, 0)
+        counts[section] = index + 1
+        if key in keys:
+            positions[key] = index
+    return positions
+
+
+def apply_delta(records, delta):
+    """Return records updated by one delta (what a client does per version)."""
+    out = dict(records)
+    out.update(delta["added"])
+    out.update(delta["changed"])
+    for key in delta["removed"]:
+        out.pop(key, None)
+    return out
+
+
+def load_index():
+    if INDEX_JSON.exists():
+        return json.loads(INDEX_JSON.read_text(encoding="utf-8"))
+    return {"latest": 0, "base": 0, "baseSize": 0, "versions": []}
+
+
+def pending_deltas(index):
+    """Site paths of the deltas from the base release to the latest, in order."""
+    return [f"{RELEASES_DIR.name}/{v['delta']}" for v in index["versions"]
+            if v["version"] > index["base"] and v.get("delta")]
+
+
+def pinned_revisions(index=None):
+    """{site path: precache revision} for the files pinned to the base release."""
+    index = load_index() if index is None else index
+    if not index["base"]:
+        return {}
+    return {path: snapshot_name(index["base"]) for path in PINNED_FILES}
+
+
+def pinned_size():
+    return sum((ROOT / p).stat().st_size for p in PINNED_FILES if (ROOT / p).exists())
+
+
+def snapshot_name(version):
+    return f"{SNAPSHOT_PREFIX}{version}"
+
+
+def write_release_js(version, root, base=None, deltas=(), output_path=None):
+    """Write js/release.js: the latest release, its base and the deltas between."""
+    output_path = RELEASE_JS if output_path is None else output_path
+    release = {"version": version, "base": version if base is None else base,
+               "root": root, "deltas": list(deltas)}
+    lines = [
+        "// Data release, generated by releases.py (do not edit)",
+        "// version: latest release; root: snapshots.py root of its records",
+        "// base: release gems.js/gem_details.js are precached as; deltas: applied on top in order",
+        f"const DATA_RELEASE = {_dump(release)};",
+        "",
+    ]
+    jsemit.write_js(output_path, "\n".join(lines))
+
+
+def cut_release(records=None, store=None):
+    """Write a new release if the records differ from the last one; return its version or None."""
+    from snapshots import SnapshotStore
+
+    records = load_records() if records is None else records
+    store = SnapshotStore() if store is None else store
+    index = load_index()
+    previous = store.load(snapshot_name(index["latest"])) if index["latest"] else {}
+
+    version = index["latest"] + 1
+    entry = {"version": version, "date": time.strftime("%Y-%m-%d")}
+    if index["latest"]:
+        delta = diff_records(previous, records)
+        counts = {k: len(delta[k]) for k in ("added", "changed", "removed")}
+        if not any(counts.values()):
+            print(f"No changes since release {index['latest']}")
+            return None
+        delta["positions"] = list_positions(records, delta["added"])
+        name = f"delta-{version}.json"
+        text = _dump({"version": version, "from": index["latest"], **delta})
+        (RELEASES_DIR / name).write_text(text + "\n", encoding="utf-8")
+        entry.update(delta=name, size=len(text.encode("utf-8")), counts=counts)
+        print(f"Release {version}: +{counts['added']} ~{counts['changed']} "
+              f"-{counts['removed']} records, {name} {entry['size']:,} B")
+    else:
+        RELEASES_DIR.mkdir(exist_ok=True)
+        entry["delta"] = None
+        print(f"Release {version}: baseline of {len(records)} records")
+    index["latest"] = version
+    index["versions"].append(entry)
+
+    since_base = sum(v.get("size", 0) for v in index["versions"] if v["version"] > index["base"])
+    if not index["base"] or since_base > REBASE_FRACTION * index["baseSize"]:
+        index["base"], index["baseSize"] = version, pinned_size()
+        print(f"  new base: {', '.join(PINNED_FILES)} pinned to release {version}")
+
+    # force: a ref left by a run that stopped before updating the index is stale
+    root, new_objects = store.save(snapshot_name(version), records, force=True)
+    print(f"  snapshot {snapshot_name(version)}: {new_objects} new objects, root {root[:12]}")
+    write_release_js(version, root, index["base"], pending_deltas(index))
+    INDEX_JSON.write_text(json.dumps(index, indent=1) + "\n", encoding="utf-8")
+    print(f"Written to {RELEASES_DIR}")
+    return version
+
+
+if __name__ == "__main__":
+    cut_release()
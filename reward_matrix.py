@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Quest x class x gem reward availability as integer bitsets.
+
+Gems and quests get dense integer ids; each (class, quest) cell is one Python
+int whose bit i is set when gem i is available there. Set algebra across
+classes or acts is then a handful of | and & operations instead of walking
+the nested perClass lists in gems.js.
+
+    m = RewardMatrix.from_gems_js()
+    m.gems(m.available("witch", upto_act=3))             # everything by act 3
+    m.gems(m.available_all(["witch", "shadow"], kind="vendor"))
+    m.first_act("witch")["fireball"]                      # -> 1
+
+Usage:
+    python reward_matrix.py    # js/gems.js -> js/reward_matrix.js
+"""
+
+import json
+from functools import reduce
+from operator import and_, or_
+
+import jsemit
+from dataset import Reward, page_order
+from scrape_poedb import CLASS_COLUMNS, ROOT
+
+OUTPUT_JS = ROOT / "js" / "reward_matrix.js"
+
+KINDS = ("reward", "vendor")
+
+
+class RewardMatrix:
+    """Bitset-encoded availability of gems per (class, quest)."""
+
+    def __init__(self, gem_ids, classes=CLASS_COLUMNS):
+        self.gem_ids = list(gem_ids)
+        self.gem_index = {gid: i for i, gid in enumerate(self.gem_ids)}
+        self.classes = list(classes)
+        self.class_index = {cls: i for i, cls in enumerate(self.classes)}
+        self.quests = []  # [{"act", "questName", "kind"}], in page order
+        self.masks = [[] for _ in self.classes]  # masks[class][quest] -> int
+        self._prefix = {}
+
+    @classmethod
+    def from_rewards(cls, quest_rewards, vendor_rewards, gem_ids, to_id=None):
+        """Build from reward lists in scrape (perClass) or gems.js (rewards) form.
+
+        The two lists are merged into page order (dataset.page_order), so row
+        order is quest order across both kinds. to_id maps the names stored in
+        the lists to gem ids (e.g. eng_to_gemid for freshly scraped data);
+        names that map outside gem_ids are dropped.
+        """
+        rows = [Reward("reward", row) for row in quest_rewards]
+        rows += [Reward("vendor", row) for row in vendor_rewards]
+        return cls.from_reward_rows(page_order(rows), gem_ids, to_id)
+
+    @classmethod
+    def from_dataset(cls, ds):
+        """Build from a loaded dataset.Dataset (gems.js questRewards/vendorRewards)."""
+        return cls.from_reward_rows(ds.rewards, [g.id for g in ds.gems])
+
+    @classmethod
+    def from_reward_rows(cls, rewards, gem_ids, to_id=None):
+        """Build from dataset.Reward rows that are already in page order."""
+        matrix = cls(gem_ids)
+        cache = {}
+        for r in rewards:
+            masks = {}
+            for class_name, names in r.per_class.items():
+                mask = 0
+                for name in names:
+                    bit = cache.get(name)
+                    if bit is None:
+                        idx = matrix.gem_index.get(to_id(name) if to_id else name)
+                        bit = cache[name] = 0 if idx is None else 1 << idx
+                    mask |= bit
+                masks[class_name] = mask
+            matrix.add_quest(r.act, r.quest_name, r.kind, masks)
+        return matrix
+
+    @classmethod
+    def from_gems_js(cls):
+        """Build from the current js/gems.js."""
+        import dataset
+        return cls.from_dataset(dataset.load())
+
+    def add_quest(self, act, quest_name, kind, masks):
+        """Append a quest row (rows go in page order); masks maps class id -> gem bitmask."""
+        self.quests.append({"act": act, "questName": quest_name, "kind": kind})
+        for cls, row in zip(self.classes, self.masks):
+            row.append(masks.get(cls, 0))
+        self._prefix.clear()
+
+    # -- Queries ---------------------------------------------------------------
+
+    def mask(self, gem_ids):
+        """Bitmask for a collection of gem ids."""
+        return reduce(or_, (1 << self.gem_index[g] for g in gem_ids), 0)
+
+    def gems(self, mask):
+        """Gem ids whose bits are set in mask, in dense-id order."""
+        out = []
+        while mask:
+            low = mask & -mask
+            out.append(self.gem_ids[low.bit_length() - 1])
+            mask ^= low
+        return out
+
+    def _quest_rows(self, upto_act=None, kind=None):
+        return [
+            i for i, q in enumerate(self.quests)
+            if (upto_act is None or q["act"] <= upto_act) and (kind is None or q["kind"] == kind)
+        ]
+
+    def available(self, cls, upto_act=None, kind=None):
+        """Mask of gems a class can get (optionally by act / only reward or vendor)."""
+        row = self.masks[self.class_index[cls]]
+        return reduce(or_, (row[i] for i in self._quest_rows(upto_act, kind)), 0)
+
+    def available_any(self, classes, upto_act=None, kind=None):
+        """Union across classes: gems at least one of them can get."""
+        return reduce(or_, (self.available(c, upto_act, kind) for c in classes), 0)
+
+    def available_all(self, classes, upto_act=None, kind=None):
+        """Intersection across classes: gems every one of them can get."""
+        masks = [self.available(c, upto_act, kind) for c in classes]
+        return reduce(and_, masks) if masks else 0
+
+    def cumulative(self, cls, kind=None):
+        """Prefix-OR masks per quest row: [i] = everything available up to quest i."""
+        key = (cls, kind)
+        if key not in self._prefix:
+            row = self.masks[self.class_index[cls]]
+            acc, prefix = 0, []
+            for q, mask in zip(self.quests, row):
+                if kind is None or q["kind"] == kind:
+                    acc |= mask
+                prefix.append(acc)
+            self._prefix[key] = prefix
+        return self._prefix[key]
+
+    def first_act(self, cls, kind=None):
+        """gem_id -> first act in which the class can get it (absent = never)."""
+        out = {}
+        seen = 0
+        for q, acc in zip(self.quests, self.cumulative(cls, kind)):
+            new = acc & ~seen
+            if new:
+                for gid in self.gems(new):
+                    out[gid] = q["act"]
+                seen = acc
+        return out
+
+    # -- Serialization -----------------------------------------------------------
+
+    def to_json(self):
+        """Compact form: dense id tables plus one hex bitmask per (class, quest)."""
+        return {
+            "gems": self.gem_ids,
+            "quests": [[q["act"], q["questName"], KINDS.index(q["kind"])] for q in self.quests],
+            "masks": {
+                cls: [format(m, "x") if m else "" for m in row]
+                for cls, row in zip(self.classes, self.masks)
+            },
+        }
+
+    def write_js(self, output_path=OUTPUT_JS):
+        data = self.to_json()
+        lines = [
+            "// Quest x class x gem reward bitsets, generated by reward_matrix.py",
+            "// quests: [act, questName, kind (0=reward, 1=vendor)]",
+            "// masks[cls][quest]: hex bitmask over gems[] (bit i = gems[i]); use BigInt('0x' + m)",
+            "const REWARD_MATRIX = {",
+            f"  gems: {json.dumps(data['gems'], separators=(',', ':'))},",
+            f"  quests: {json.dumps(data['quests'], ensure_ascii=False, separators=(',', ':'))},",
+            "  masks: {",
+        ]
+        for cls, row in data["masks"].items():
+            lines.append(f"    {cls}: {json.dumps(row, separators=(',', ':'))},")
+        lines.append("  },")
+        lines.append("};")
+        jsemit.write_js(output_path, "\n".join(lines) + "\n")
+
+
+def main():
+    matrix = RewardMatrix.from_gems_js()
+    matrix.write_js()
+    print(f"{len(matrix.gem_ids)} gems x {len(matrix.quests)} quests x {len(matrix.classes)} classes")
+    print(f"Written to {OUTPUT_JS}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,37 +1,114 @@
 #!/usr/bin/env python3
 """Scrape poedb.tw/kr/Quest and regenerate js/gems.js.
 
+(Also available as `python cli.py scrape|details|icons`; see cli.py.)
+
 Updates three sections in gems.js:
   - gems[]: adds any missing gem entries discovered from poedb
   - questRewards: per-class format, page order
   - vendorRewards: per-class format with npc/cost, page order
+and writes js/reward_matrix.js (bitset-encoded rewards, see reward_matrix.py).
+js/gem_timeline.js is derived from gems.js offline (gem_timeline.py).
+
+--details keeps its refresh state next to this script. The two state files are
+committed together with js/gem_details.js, which they describe:
+  - gem_details_fetched.json: gem_id -> unix time the record was last fetched
+  - gem_details_failed.json: gem_id -> [consecutive failures, unix time of last]
+so a fresh clone keeps the refresh order and the failure backoff. Commit them
+whenever gem_details.js changes. The --bounded spool (gem_details.spool.jsonl)
+only matters to an interrupted local run and is gitignored.
 
 Usage:
     python scrape_poedb.py            # scrape rewards, update gems.js
-    python scrape_poedb.py --icons    # also download missing gem icons
+    python scrape_poedb.py --icons    # also download missing gem icons (icon URLs
+                                      # from the gem index pages when several are missing)
+    python scrape_poedb.py --bulk     # take gem color/type/icon URLs from the gem
+                                      # index pages instead of one page per gem
     python scrape_poedb.py --details  # scrape gem detail pages -> js/gem_details.js
+    python scrape_poedb.py --details --budget 100 --time-budget 600
+                                      # refresh at most 100 pages / 10 minutes,
+                                      # new gems first, then stale ones
+    python scrape_poedb.py --details --bounded
+                                      # spool records to disk; memory stays flat
+    python scrape_poedb.py --locales us,tw [--details]
+                                      # gem/quest names (and details) in other
+                                      # poedb locales -> js/locales/<locale>.js
 """
 
 import io
 import json
+import os
+import random
 import re
 import sys
+import threading
 import time
-import requests
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from bs4 import BeautifulSoup
+
+import jsemit
+from jsemit import js_literal_to_json
+
+# requests/bs4/lxml/PIL are imported inside the functions that use them, so
+# offline paths (cli.py guide, gems.js parsing) start without loading them.
 
 ROOT = Path(__file__).parent
 
 # == Configuration ============================================================
 
-POEDB_BASE = "https://poedb.tw"
-QUEST_URL = f"{POEDB_BASE}/kr/Quest"
+POEDB_BASE = os.environ.get("POEDB_BASE", "https://poedb.tw")  # override to test against a local server
+LOCALE = "kr"  # the dataset's own language; --locales adds text for others
+# poedb path prefixes (https://poedb.tw/<locale>/<Page>)
+POEDB_LOCALES = {
+    "us": "English", "tw": "繁體中文", "cn": "简体中文", "kr": "한국어", "jp": "日本語",
+    "ru": "Русский", "pt": "Português", "th": "ไทย", "fr": "Français", "de": "Deutsch",
+    "es": "Español",
+}
+LOCALES_DIR = ROOT / "js" / "locales"
+
+
+def poedb_url(page, locale=LOCALE):
+    """'Quest' -> 'https://poedb.tw/kr/Quest'"""
+    return f"{POEDB_BASE}/{locale}/{page}"
+
+
+def is_locale_href(href, locale=LOCALE):
+    """True for poedb links into `locale` (the Korean dataset only follows /kr/)."""
+    return f"/{locale}/" in href
+
+
+QUEST_URL = poedb_url("Quest")
+# Gem index pages: one response lists name, color and icon for many gems
+GEM_LIST_PAGES = {
+    "skill": "Skill_Gems",
+    "support": "Support_Gems",
+}
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
                   "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
 }
-FETCH_DELAY = 1  # seconds between HTTP requests
+FETCH_DELAY = 1  # initial seconds between HTTP requests (adapted at runtime)
+
+# Adaptive fetch scheduling (AIMD): see FetchScheduler
+FETCH_MIN_DELAY = 0.1      # fastest request spacing when poedb is healthy
+FETCH_MAX_DELAY = 30       # slowest request spacing after repeated throttling
+FETCH_MAX_CONCURRENCY = 6  # upper bound on parallel in-flight requests
+FETCH_MAX_RETRIES = 5      # retries per URL on 429/5xx/connection errors
+FETCH_BACKOFF_BASE = 1     # seconds; doubled per retry, full jitter
+FETCH_BACKOFF_MAX = 60     # cap for a single backoff sleep
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+LATENCY_SPIKE_RATIO = 2.5  # latency above this multiple of the EWMA counts as slow
+LATENCY_SPIKE_SAMPLES = 3  # slow responses in a row before they count as congestion
+DELAY_RECOVERY = 0.85      # delay multiplier per healthy response (30s -> 0.1s in ~35)
+
+# Gem detail refresh (--details): see plan_detail_refresh
+DETAILS_FETCHED_PATH = ROOT / "gem_details_fetched.json"  # gem_id -> unix time of last fetch
+DETAIL_REFRESH_AGE = 7 * 24 * 3600  # records younger than this are never re-fetched
+DETAILS_FAILED_PATH = ROOT / "gem_details_failed.json"  # gem_id -> [failures, unix time of last]
+DETAIL_RETRY_BASE = 3600  # a failed gem waits this long, doubling per consecutive failure
+DETAILS_SPOOL_PATH = ROOT / "gem_details.spool.jsonl"  # --bounded records, kept until written
 
 # poedb table column order (columns 1-7 after quest column)
 CLASS_COLUMNS = ["marauder", "witch", "scion", "ranger", "duelist", "shadow", "templar"]
@@ -91,11 +168,14 @@ NPC_COST_MAP = {
 # eng_name -> {"kr_name": str, "css_class": str}
 gem_registry = {}
 
+# eng_name -> {"kr_name", "css_class", "type", "icon_url"} (from the gem index pages)
+gem_index = {}
+
 
 def register_gem(a_tag):
     """Register gem metadata from an <a class='gem_*'> element."""
     href = a_tag.get("href", "")
-    if "/kr/" not in href:
+    if not is_locale_href(href):
         return
     eng_name = extract_eng_name(href)
     if eng_name in gem_registry:
@@ -109,13 +189,145 @@ def register_gem(a_tag):
 # == Helper functions =========================================================
 
 
+class FetchScheduler:
+    """Adaptive request pacing with AIMD (additive-increase, multiplicative-decrease).
+
+    Two knobs are adjusted together after every response:
+      - limit: how many requests may be in flight at once
+      - delay: minimum spacing between request starts
+
+    Healthy responses grow the limit by ~1 per window and shrink the delay by
+    DELAY_RECOVERY. A 429/5xx, a connection error or LATENCY_SPIKE_SAMPLES
+    slow responses in a row halve the limit and double the delay, at most once
+    per window: signals from requests that were already in flight when the
+    last decrease happened describe the same congestion event and are ignored.
+    A Retry-After header blocks all new requests until it expires.
+    """
+
+    def __init__(self, delay=FETCH_DELAY, min_delay=FETCH_MIN_DELAY,
+                 max_delay=FETCH_MAX_DELAY, max_concurrency=FETCH_MAX_CONCURRENCY):
+        self.delay = delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_concurrency = max_concurrency
+        self.limit = 1.0
+        self.in_flight = 0
+        self.latency_ewma = None
+        self.slow_streak = 0
+        self._issued = 0        # tickets handed out by acquire()
+        self._decreased_at = 0  # last ticket issued when the last decrease happened
+        self._next_start = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """Block until a request slot is free and the pacing delay has elapsed.
+
+        Returns a ticket to pass back to release().
+        """
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if self.in_flight < int(self.limit) and now >= self._next_start:
+                    self.in_flight += 1
+                    self._next_start = now + self.delay
+                    self._issued += 1
+                    return self._issued
+                timeout = max(self._next_start - now, 0) or None
+                self._cond.wait(timeout)
+
+    def release(self, ticket=None, latency=None, throttled=False, retry_after=None):
+        """Return a slot and feed the outcome of the request into the controller."""
+        with self._cond:
+            self.in_flight -= 1
+            ticket = self._issued if ticket is None else ticket
+            slow = (
+                latency is not None
+                and self.latency_ewma is not None
+                and latency > self.latency_ewma * LATENCY_SPIKE_RATIO
+            )
+            self.slow_streak = self.slow_streak + 1 if slow else 0
+            congested = throttled or self.slow_streak >= LATENCY_SPIKE_SAMPLES
+            if congested:
+                if ticket > self._decreased_at:
+                    self.limit = max(1.0, self.limit / 2)
+                    self.delay = min(self.max_delay, max(self.delay * 2, self.min_delay))
+                    self._decreased_at = self._issued
+                    self.slow_streak = 0
+            elif not slow:
+                self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+                self.delay = max(self.min_delay, self.delay * DELAY_RECOVERY)
+            if latency is not None and not throttled:
+                self.latency_ewma = (
+                    latency if self.latency_ewma is None
+                    else 0.8 * self.latency_ewma + 0.2 * latency
+                )
+            if retry_after:
+                self._next_start = max(self._next_start, time.monotonic() + retry_after)
+            self._cond.notify_all()
+
+    def status(self):
+        """Short human-readable state for progress output."""
+        return f"limit={int(self.limit)} delay={self.delay:.2f}s"
+
+
+scheduler = FetchScheduler()
+
+
+def parse_retry_after(value):
+    """Parse a Retry-After header (seconds or HTTP-date) into seconds, or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt):
+    """Exponential backoff with full jitter for the given retry attempt (0-based)."""
+    return random.uniform(0, min(FETCH_BACKOFF_MAX, FETCH_BACKOFF_BASE * 2 ** attempt))
+
+
 def fetch(url):
-    """Fetch a URL and return BeautifulSoup parsed HTML."""
-    print(f"  Fetching {url} ...", end=" ", flush=True)
-    resp = requests.get(url, headers=HEADERS, timeout=30)
-    resp.raise_for_status()
-    print(f"OK ({len(resp.text):,} bytes)")
-    return BeautifulSoup(resp.text, "lxml")
+    """Fetch a URL through the adaptive scheduler and return BeautifulSoup parsed HTML.
+
+    Retries 429/5xx responses and connection errors with jittered exponential
+    backoff, honoring Retry-After. Other HTTP errors are raised immediately.
+    """
+    import requests
+    from bs4 import BeautifulSoup
+
+    for attempt in range(FETCH_MAX_RETRIES + 1):
+        ticket = scheduler.acquire()
+        started = time.monotonic()
+        try:
+            resp = requests.get(url, headers=HEADERS, timeout=30)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            scheduler.release(ticket, throttled=True)
+            error = f"{type(e).__name__}"
+        else:
+            latency = time.monotonic() - started
+            if resp.status_code not in RETRY_STATUSES:
+                scheduler.release(ticket, latency=latency)
+                resp.raise_for_status()
+                print(f"  Fetched {url} OK ({len(resp.text):,} bytes, {scheduler.status()})")
+                return BeautifulSoup(resp.text, "lxml")
+            retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+            scheduler.release(ticket, throttled=True, retry_after=retry_after)
+            error = f"HTTP {resp.status_code}"
+
+        if attempt == FETCH_MAX_RETRIES:
+            break
+        wait = backoff_delay(attempt)
+        print(f"  Fetching {url} -> {error}, retry {attempt + 1}/{FETCH_MAX_RETRIES} "
+              f"in {wait:.1f}s ({scheduler.status()})")
+        time.sleep(wait)
+
+    raise requests.HTTPError(f"{error} after {FETCH_MAX_RETRIES} retries: {url}")
 
 
 def extract_eng_name(href):
@@ -158,12 +370,21 @@ def extract_gems_from_cell(cell):
     gems = []
     for a in cell.find_all("a", class_=re.compile(r"^gem_")):
         href = a.get("href", "")
-        if "/kr/" in href:
+        if is_locale_href(href):
             register_gem(a)
             gems.append(extract_eng_name(href))
     return gems
 
 
+def find_icon_url(container):
+    """Return the first gem-art image URL inside an element, or None."""
+    for img in container.find_all("img"):
+        src = img.get("src") or img.get("data-src") or ""
+        if "/Art/2DItems/Gems/" in src:
+            return src
+    return None
+
+
 def collect_tables(soup, start_id, stop_id=None):
     """Collect top-level <table> elements after start_id until stop_id is reached."""
     start = soup.find(id=start_id)
@@ -291,10 +512,8 @@ def parse_vendor_rewards(soup, act_map):
 
 
 def deep_fetch_quest(quest_eng):
-    """Fetch /kr/{quest_eng} page and extract per-class gem rewards."""
-    url = f"{POEDB_BASE}/kr/{quest_eng}"
-    soup = fetch(url)
-    time.sleep(FETCH_DELAY)
+    """Fetch the {quest_eng} page and extract per-class gem rewards."""
+    soup = fetch(poedb_url(quest_eng))
 
     per_class = {}
     for table in soup.find_all("table"):
@@ -313,9 +532,49 @@ def deep_fetch_quest(quest_eng):
         if found_any and per_class:
             break
 
+    soup.decompose()
     return per_class
 
 
+# == Bulk gem harvesting (--bulk) =============================================
+
+
+def parse_gem_list(soup, gem_type):
+    """Parse a poedb gem index page into gem_index entries.
+
+    Each gem link (<a class='gem_*' href='/kr/...'>) is read together with its
+    enclosing row, which carries the icon <img>.
+    """
+    found = 0
+    for a in soup.find_all("a", class_=re.compile(r"^gem_")):
+        href = a.get("href", "")
+        if not is_locale_href(href):
+            continue
+        eng_name = extract_eng_name(href)
+        if eng_name in gem_index:
+            continue
+        row = a.find_parent("tr") or a.parent
+        classes = a.get("class", [])
+        gem_index[eng_name] = {
+            "kr_name": a.get_text(strip=True),
+            "css_class": next((c for c in classes if c.startswith("gem_")), "gem_green"),
+            "type": gem_type,
+            "icon_url": find_icon_url(row),
+        }
+        found += 1
+    return found
+
+
+def harvest_gem_lists():
+    """Fill gem_index from the skill/support gem index pages (one request each)."""
+    for gem_type, page in GEM_LIST_PAGES.items():
+        url = poedb_url(page)
+        found = parse_gem_list(fetch(url), gem_type)
+        print(f"  {found} {gem_type} gem(s) from {url}")
+    with_icons = sum(1 for info in gem_index.values() if info["icon_url"])
+    print(f"  Gem index: {len(gem_index)} gems, {with_icons} with icon URLs")
+
+
 # == gems[] management ========================================================
 
 GEM_ENTRY_RE = re.compile(
@@ -341,6 +600,13 @@ def parse_existing_gems(text):
     return entries
 
 
+def parse_existing_rewards(text, section_name):
+    """Parse the questRewards/vendorRewards array of gems.js into a list of dicts."""
+    start, end = find_section_bounds(text, section_name)
+    literal = text[start + len(f"  {section_name}: "):end].rstrip().rstrip(",")
+    return json.loads(js_literal_to_json(literal))
+
+
 def build_missing_gems(existing_gems):
     """Find gems in gem_registry that are missing from existing gems[].
 
@@ -354,8 +620,10 @@ def build_missing_gems(existing_gems):
         if gid in existing_ids:
             continue
 
-        color = GEM_COLOR_MAP.get(info["css_class"], "dex")
-        gtype = "support" if "_Support" in eng_name else "skill"
+        # Prefer list-page metadata (--bulk) over the Quest page link / name heuristic
+        listed = gem_index.get(eng_name, {})
+        color = GEM_COLOR_MAP.get(listed.get("css_class", info["css_class"]), "dex")
+        gtype = listed.get("type") or ("support" if "_Support" in eng_name else "skill")
         icon = f"{eng_name}.png"
 
         new_entries.append({
@@ -395,7 +663,7 @@ def generate_quest_rewards_js(quest_rewards, gem_id_set):
         class_lines = []
         for cls in CLASS_COLUMNS:
             raw_gems = q["perClass"].get(cls, [])
-            gem_ids = [eng_to_gemid(e) for e in raw_gems if eng_to_gemid(e) in gem_id_set]
+            gem_ids = [gid for gid in map(eng_to_gemid, raw_gems) if gid in gem_id_set]
             if gem_ids:
                 gems_str = ", ".join(f'"{g}"' for g in gem_ids)
                 class_lines.append(f"      {cls}: [{gems_str}]")
@@ -424,7 +692,7 @@ def generate_vendor_rewards_js(vendor_rewards, gem_id_set):
         class_lines = []
         for cls in CLASS_COLUMNS:
             raw_gems = q["perClass"].get(cls, [])
-            gem_ids = [eng_to_gemid(e) for e in raw_gems if eng_to_gemid(e) in gem_id_set]
+            gem_ids = [gid for gid in map(eng_to_gemid, raw_gems) if gid in gem_id_set]
             if gem_ids:
                 gems_str = ", ".join(f'"{g}"' for g in gem_ids)
                 class_lines.append(f"      {cls}: [{gems_str}]")
@@ -501,19 +769,20 @@ def find_missing_icons(all_gems):
 
 def fetch_gem_icon_url(eng_name):
     """Fetch a gem's poedb page and extract the CDN icon URL."""
-    url = f"{POEDB_BASE}/kr/{eng_name}"
-    soup = fetch(url)
-    time.sleep(FETCH_DELAY)
+    soup = fetch(poedb_url(eng_name))
+    icon_url = find_icon_url(soup)
+    soup.decompose()
+    return icon_url
 
-    for img in soup.find_all("img"):
-        src = img.get("src", "")
-        if "/Art/2DItems/Gems/" in src:
-            return src
-    return None
+
+def gem_icon_url(eng_name):
+    """CDN icon URL from the gem index (harvest_gem_lists), else from the gem's page."""
+    return gem_index.get(eng_name, {}).get("icon_url") or fetch_gem_icon_url(eng_name)
 
 
 def download_icon_image(icon_url):
     """Download a webp image from CDN and return as PIL Image, or None on failure."""
+    import requests
     from PIL import Image
 
     # Try with Referer header (some CDNs require it)
@@ -542,7 +811,7 @@ def download_icons(missing_gems):
         eng_name = gem["icon"].replace(".png", "")
         print(f"  [{i+1}/{len(missing_gems)}] {eng_name}...", end=" ", flush=True)
 
-        icon_url = fetch_gem_icon_url(eng_name)
+        icon_url = gem_icon_url(eng_name)
         if not icon_url:
             print("SKIP (no icon URL found)")
             failed.append(eng_name)
@@ -632,78 +901,312 @@ def parse_gem_details(soup):
     return data
 
 
-def scrape_gem_details(all_gems):
-    """Scrape detail pages for all gems and generate js/gem_details.js.
+def load_fetched_at():
+    """Load per-gem fetch timestamps (gem_id -> unix time) for detail records."""
+    if not DETAILS_FETCHED_PATH.exists():
+        return {}
+    return json.loads(DETAILS_FETCHED_PATH.read_text(encoding="utf-8"))
+
+
+def _write_fetched_at(fetched_at):
+    DETAILS_FETCHED_PATH.write_text(
+        json.dumps(dict(sorted(fetched_at.items())), indent=1) + "\n", encoding="utf-8"
+    )
+
+
+def load_failed():
+    """Load per-gem failed attempts (gem_id -> [consecutive failures, unix time of last])."""
+    if not DETAILS_FAILED_PATH.exists():
+        return {}
+    return json.loads(DETAILS_FAILED_PATH.read_text(encoding="utf-8"))
+
+
+def _write_failed(failed_at):
+    DETAILS_FAILED_PATH.write_text(
+        json.dumps(dict(sorted(failed_at.items())), indent=1) + "\n", encoding="utf-8"
+    )
+
+
+def _record_failure(failed_at, gem_id):
+    count = failed_at.get(gem_id, [0, 0])[0]
+    failed_at[gem_id] = [count + 1, int(time.time())]
+
+
+def retry_after(failure):
+    """Unix time before which a gem with this [failures, last] entry is not retried."""
+    count, last = failure
+    return last + min(DETAIL_RETRY_BASE * 2 ** (count - 1), DETAIL_REFRESH_AGE)
+
+
+def plan_detail_refresh(all_gems, details, fetched_at, referenced_ids=(), budget=None, now=None,
+                        failed_at=None):
+    """Order gems for detail fetching, most urgent first, capped at budget.
+
+    Priority tiers:
+      0. gems with no detail record yet
+      1. gems referenced by questRewards/vendorRewards, oldest fetch first
+      2. all other gems, oldest fetch first
+    Records fetched less than DETAIL_REFRESH_AGE ago are left alone. Records
+    without a timestamp (scraped before timestamps existed) count as oldest.
+
+    Gems whose last attempt failed (failed_at, see load_failed) back off
+    exponentially and, once due, rank after every gem of their tier that has
+    not failed, so a page that keeps failing cannot starve the refresh.
+    """
+    now = time.time() if now is None else now
+    referenced_ids = set(referenced_ids)
+    failed_at = failed_at or {}
+    ranked = []
+    for gem in all_gems:
+        gem_id = gem["id"]
+        failure = failed_at.get(gem_id)
+        if failure and now < retry_after(failure):
+            continue
+        failures = failure[0] if failure else 0
+        if gem_id not in details:
+            ranked.append((0, failures, 0, gem_id, gem))
+            continue
+        age_from = fetched_at.get(gem_id, 0)
+        if now - age_from < DETAIL_REFRESH_AGE:
+            continue
+        tier = 1 if gem_id in referenced_ids else 2
+        ranked.append((tier, failures, age_from, gem_id, gem))
+    ranked.sort(key=lambda r: r[:4])
+    plan = [r[4] for r in ranked]
+    return plan if budget is None else plan[:budget]
+
+
+class DetailSpool(Mapping):
+    """Disk-backed gem_id -> detail record mapping for --bounded runs.
 
-    Reads existing gem_details.js to skip already-scraped gems (resume-friendly).
+    Records are appended to `path` as JSON lines ([gem_id, record]); only the
+    byte offset of each record is kept in memory. Re-putting a gem appends a
+    new line and moves its offset, so the latest record wins.
+
+    The file survives a crash: reopening it re-indexes the complete lines
+    (dropping a torn last line), so an interrupted run resumes with every
+    record it had already fetched. remove() deletes it after a clean finish.
+    """
+
+    def __init__(self, path=DETAILS_SPOOL_PATH):
+        self.path = path
+        self._offsets = {}
+        self._file = open(path, "a+b")
+        self._file.seek(0)
+        good = 0
+        for line in iter(self._file.readline, b""):
+            try:
+                gem_id, _ = json.loads(line)
+            except ValueError:
+                break  # torn write from a crashed run; everything after it is lost
+            self._offsets[gem_id] = good
+            good += len(line)
+        self._file.truncate(good)
+        self.resumed = len(self._offsets)
+
+    def __setitem__(self, gem_id, data):
+        self._file.seek(0, io.SEEK_END)
+        self._offsets[gem_id] = self._file.tell()
+        self._file.write(json.dumps([gem_id, data], ensure_ascii=False).encode("utf-8") + b"\n")
+
+    def __getitem__(self, gem_id):
+        self._file.seek(self._offsets[gem_id])
+        return json.loads(self._file.readline())[1]
+
+    def __contains__(self, gem_id):
+        return gem_id in self._offsets  # Mapping's default would read the record
+
+    def __iter__(self):
+        return iter(self._offsets)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def flush(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        self._file.close()
+
+    def remove(self):
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+
+DETAIL_START_RE = re.compile(r'^  "([^"]+)": \{$')
+
+
+def iter_gem_details_js(path):
+    """Yield (gem_id, record) from gem_details.js one record at a time.
+
+    Reads the layout _write_gem_details_js produces (one `  "id": {` ... `  },`
+    block per gem) line by line. A file in the --json-parse form is a single
+    string literal and is parsed whole.
+    """
+    if not path.exists():
+        return
+    with path.open(encoding="utf-8") as f:
+        head = f.readline()
+        if "JSON.parse('" in head or not head.startswith("const GEM_DETAILS = {"):
+            yield from load_gem_details(path).items()
+            return
+        gem_id, block = None, []
+        for line in f:
+            line = line.rstrip("\n")
+            if gem_id is None:
+                m = DETAIL_START_RE.match(line)
+                if m:
+                    gem_id, block = m.group(1), ["{"]
+            elif line == "  },":
+                block.append("}")
+                yield gem_id, json.loads(js_literal_to_json("\n".join(block)))
+                gem_id = None
+            else:
+                block.append(line)
+
+
+def parse_gem_details_js(text):
+    """Parse the GEM_DETAILS object of a gem_details.js text into a dict."""
+    # Extract the object literal between first { and last }
+    m = re.search(r"const GEM_DETAILS\s*=\s*(\{.*\});", text, re.DOTALL)
+    if not m:
+        return {}
+    return json.loads(js_literal_to_json(m.group(1)))
+
+
+def load_gem_details(path):
+    """Load an existing gem_details.js into a dict ({} if missing or unparsable)."""
+    if not path.exists():
+        return {}
+    try:
+        existing = parse_gem_details_js(jsemit.read_js(path))
+        print(f"  Loaded {len(existing)} existing entries from gem_details.js")
+        return existing
+    except json.JSONDecodeError as e:
+        print(f"  WARNING: Could not parse existing gem_details.js ({e}), starting fresh")
+        return {}
+
+
+def scrape_gem_details(all_gems, referenced_ids=(), budget=None, time_budget=None,
+                       bounded=False):
+    """Scrape detail pages and generate js/gem_details.js.
+
+    Reads existing gem_details.js and per-gem fetch timestamps, then fetches at
+    most `budget` pages chosen by plan_detail_refresh. Once `time_budget` seconds
+    have passed, pages not yet started are deferred to the next run.
+
+    With `bounded`, finished records go straight to a DetailSpool on disk and
+    the output is streamed from it, so memory stays proportional to the pages
+    in flight rather than to the size of the dataset.
     """
     output_path = ROOT / "js" / "gem_details.js"
 
     # Load existing details to support resume
-    existing = {}
-    if output_path.exists():
-        text = output_path.read_text(encoding="utf-8")
-        # Extract JSON-like content between first { and last }
-        m = re.search(r"const GEM_DETAILS\s*=\s*(\{.*\});", text, re.DOTALL)
-        if m:
-            try:
-                # Convert bare JS keys to quoted JSON keys for parsing
-                js_obj = m.group(1)
-                js_obj = re.sub(r'(?m)^(\s+)(tags|properties|requirements|description|mods|reminder|qualityHeader|qualityMod|supportText|engName):', r'\1"\2":', js_obj)
-                # Remove trailing commas (JS allows, JSON doesn't)
-                js_obj = re.sub(r',(\s*[}\]])', r'\1', js_obj)
-                existing = json.loads(js_obj)
-                print(f"  Loaded {len(existing)} existing entries from gem_details.js")
-            except json.JSONDecodeError as e:
-                print(f"  WARNING: Could not parse existing gem_details.js ({e}), starting fresh")
-
-    details = dict(existing)
+    if bounded:
+        details = DetailSpool()
+        if details.resumed:
+            print(f"  Resuming {details.resumed} spooled record(s) from {details.path.name}")
+        loaded = 0
+        for gem_id, data in iter_gem_details_js(output_path):
+            if gem_id not in details:  # spooled records are newer than the output
+                details[gem_id] = data
+                loaded += 1
+        print(f"  Spooled {loaded} existing entries from gem_details.js")
+    else:
+        details = load_gem_details(output_path)
+    fetched_at = load_fetched_at()
+    failed_at = load_failed()
     total = len(all_gems)
     scraped = 0
-    skipped = 0
     failed = []
 
-    for i, gem in enumerate(all_gems):
-        gem_id = gem["id"]
-
-        if gem_id in details:
-            skipped += 1
-            continue
-
+    now = time.time()
+    due = plan_detail_refresh(all_gems, details, fetched_at, referenced_ids, now=now,
+                              failed_at=failed_at)
+    pending = due if budget is None else due[:budget]
+    over_budget = len(due) - len(pending)
+    backing_off = sum(1 for g in all_gems
+                      if g["id"] in failed_at and now < retry_after(failed_at[g["id"]]))
+    up_to_date = total - len(due) - backing_off
+    new_count = sum(1 for g in pending if g["id"] not in details)
+    print(f"  Refresh plan: {len(pending)} page(s), {new_count} new, "
+          f"{len(pending) - new_count} stale")
+    deadline = time.monotonic() + time_budget if time_budget else None
+
+    def scrape_one(gem):
         # Map gem ID back to English name for URL
         eng_name = gem["icon"].replace(".png", "")
-        url = f"{POEDB_BASE}/kr/{eng_name}"
-
-        print(f"  [{i+1}/{total}] {gem_id} ({eng_name})...", end=" ", flush=True)
-
+        soup = fetch(poedb_url(eng_name))
         try:
-            soup = fetch(url)
-            time.sleep(FETCH_DELAY)
-
-            data = parse_gem_details(soup)
-            if data:
-                details[gem_id] = data
-                scraped += 1
-                print(f"OK ({len(data.get('mods', []))} mods)")
-            else:
-                print("SKIP (no .gemPopup found)")
-                failed.append(gem_id)
-        except Exception as e:
-            print(f"FAIL ({e})")
-            failed.append(gem_id)
+            return parse_gem_details(soup)
+        finally:
+            soup.decompose()  # free the parse tree now, not at the next GC cycle
+
+    # Keep only a small window of futures alive; the scheduler decides how
+    # many of them actually run at once
+    queue = iter(pending)
+    window = {}
+    done_count = 0
+    with ThreadPoolExecutor(max_workers=FETCH_MAX_CONCURRENCY) as pool:
+        while True:
+            while len(window) < FETCH_MAX_CONCURRENCY * 2 and not (
+                deadline and time.monotonic() > deadline
+            ):
+                gem = next(queue, None)
+                if gem is None:
+                    break
+                window[pool.submit(scrape_one, gem)] = gem["id"]
+            if not window:
+                break
 
-        # Periodically save progress
-        if scraped > 0 and scraped % 50 == 0:
-            _write_gem_details_js(output_path, details)
-            print(f"  -- Progress saved ({len(details)} entries) --")
+            finished, _ = wait(window, return_when=FIRST_COMPLETED)
+            for future in finished:
+                gem_id = window.pop(future)
+                done_count += 1
+                prefix = f"  [{done_count}/{len(pending)}] {gem_id}..."
+                try:
+                    data = future.result()
+                    if data:
+                        details[gem_id] = data
+                        fetched_at[gem_id] = int(time.time())
+                        failed_at.pop(gem_id, None)
+                        scraped += 1
+                        print(f"{prefix} OK ({len(data.get('mods', []))} mods)")
+                    else:
+                        print(f"{prefix} SKIP (no .gemPopup found)")
+                        _record_failure(failed_at, gem_id)
+                        failed.append(gem_id)
+                except Exception as e:
+                    print(f"{prefix} FAIL ({e})")
+                    _record_failure(failed_at, gem_id)
+                    failed.append(gem_id)
+
+                # Periodically save progress (bounded records already live in the spool)
+                if scraped > 0 and scraped % 50 == 0:
+                    if bounded:
+                        details.flush()
+                    else:
+                        _write_gem_details_js(output_path, details)
+                    _write_fetched_at(fetched_at)
+                    _write_failed(failed_at)
+                    print(f"  -- Progress saved ({len(details)} entries) --")
+    deferred = len(pending) - done_count
 
     # Final write
     _write_gem_details_js(output_path, details)
+    _write_fetched_at(fetched_at)
+    _write_failed(failed_at)
+    if bounded:
+        details.remove()  # the output now holds every record
 
     print(f"\n{'='*60}")
     print(f"  Total gems    : {total}")
-    print(f"  Already had   : {skipped}")
+    print(f"  Up to date    : {up_to_date}")
+    print(f"  Backing off   : {backing_off}")
+    print(f"  Over budget   : {over_budget}")
     print(f"  Scraped       : {scraped}")
+    print(f"  Deferred      : {deferred}")
     print(f"  Failed        : {len(failed)}")
     print(f"  Total entries : {len(details)}")
     print(f"{'='*60}")
@@ -714,56 +1217,202 @@ def scrape_gem_details(all_gems):
 
 
 def _write_gem_details_js(output_path, details):
-    """Write gem details dict to js/gem_details.js as a JS const."""
-    # Sort by key for stable output
-    sorted_details = dict(sorted(details.items()))
+    """Write gem details mapping to js/gem_details.js as a JS const.
+
+    Records are formatted and written one at a time, so a DetailSpool is
+    streamed to disk without being loaded into memory (the JSON.parse form,
+    if enabled, is applied to the finished file).
+    """
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        f.write("const GEM_DETAILS = {\n")
+        # Sort by key for stable output
+        for gem_id in sorted(details):
+            data = details[gem_id]
+            tags_str = json.dumps(data.get("tags", []), ensure_ascii=False)
+            props_str = json.dumps(data.get("properties", []), ensure_ascii=False)
+            mods_str = json.dumps(data.get("mods", []), ensure_ascii=False)
+
+            parts = [f'  "{gem_id}": {{']
+            parts.append(f'    tags: {tags_str},')
+            parts.append(f'    properties: {props_str},')
+
+            if data.get("requirements"):
+                parts.append(f'    requirements: {json.dumps(data["requirements"], ensure_ascii=False)},')
+            if data.get("description"):
+                parts.append(f'    description: {json.dumps(data["description"], ensure_ascii=False)},')
+
+            parts.append(f'    mods: {mods_str},')
+
+            if data.get("reminder"):
+                parts.append(f'    reminder: {json.dumps(data["reminder"], ensure_ascii=False)},')
+            if data.get("qualityHeader"):
+                parts.append(f'    qualityHeader: {json.dumps(data["qualityHeader"], ensure_ascii=False)},')
+            if data.get("qualityMod"):
+                parts.append(f'    qualityMod: {json.dumps(data["qualityMod"], ensure_ascii=False)},')
+            if data.get("supportText"):
+                parts.append(f'    supportText: {json.dumps(data["supportText"], ensure_ascii=False)},')
+            if data.get("engName"):
+                parts.append(f'    engName: {json.dumps(data["engName"], ensure_ascii=False)},')
+
+            parts.append('  },')
+            f.write("\n".join(parts) + "\n")
+        f.write("};\n")
+    tmp_path.replace(output_path)  # a crash mid-write leaves the old file intact
+    jsemit.encode_file(output_path)
+
+
+# == Other locales (--locales) ===============================================
+
+
+def parse_quest_names(soup, locale=LOCALE):
+    """Quest English page name -> display name, from a Quest page's quest links."""
+    names = {}
+    for a in soup.find_all("a", class_=["questitem", "WorldAreas"]):
+        href = a.get("href", "")
+        if is_locale_href(href, locale):
+            names.setdefault(extract_eng_name(href), a.get_text(strip=True))
+    return names
 
-    # Build JS object string with proper formatting
-    lines = ["const GEM_DETAILS = {"]
-    for gem_id, data in sorted_details.items():
-        tags_str = json.dumps(data.get("tags", []), ensure_ascii=False)
-        props_str = json.dumps(data.get("properties", []), ensure_ascii=False)
-        mods_str = json.dumps(data.get("mods", []), ensure_ascii=False)
 
-        parts = [f'  "{gem_id}": {{']
-        parts.append(f'    tags: {tags_str},')
-        parts.append(f'    properties: {props_str},')
+def parse_gem_names(soup, gem_ids, locale=LOCALE):
+    """gem_id -> display name from a gem index page, for gems already in gems.js.
 
-        if data.get("requirements"):
-            parts.append(f'    requirements: {json.dumps(data["requirements"], ensure_ascii=False)},')
-        if data.get("description"):
-            parts.append(f'    description: {json.dumps(data["description"], ensure_ascii=False)},')
+    Several poedb pages can map to one gem id (RENAMES, e.g. Old_Phase_Run);
+    the page whose name lowercases to the id wins.
+    """
+    names = {}
+    for a in soup.find_all("a", class_=re.compile(r"^gem_")):
+        href = a.get("href", "")
+        if not is_locale_href(href, locale):
+            continue
+        eng_name = extract_eng_name(href)
+        gem_id = eng_to_gemid(eng_name)
+        if gem_id in gem_ids and (gem_id not in names or eng_name.lower() == gem_id):
+            names[gem_id] = a.get_text(strip=True)
+    return names
+
+
+def scrape_locale(locale, quest_kr_by_eng, all_gems, details=False):
+    """Fetch one locale's translated text: gem names, quest names, optionally details.
+
+    Only text pages are fetched; structure (rewards, colors, icons, ids) comes
+    from the Korean dataset. Quests are keyed by their Korean questName, as
+    in gems.js.
+    """
+    gem_ids = {g["id"] for g in all_gems}
+    gems = {}
+    for page in GEM_LIST_PAGES.values():
+        soup = fetch(poedb_url(page, locale))
+        gems.update(parse_gem_names(soup, gem_ids, locale))
+        soup.decompose()
+
+    soup = fetch(poedb_url("Quest", locale))
+    quests = {
+        quest_kr_by_eng[eng]: name
+        for eng, name in parse_quest_names(soup, locale).items() if eng in quest_kr_by_eng
+    }
+    soup.decompose()
+    text = {"gems": dict(sorted(gems.items())), "quests": quests}
+    print(f"  [{locale}] {len(gems)}/{len(gem_ids)} gem names, {len(quests)} quest names")
+
+    if details:
+        def scrape_one(gem):
+            try:
+                soup = fetch(poedb_url(gem["icon"].replace(".png", ""), locale))
+            except Exception as e:
+                return gem["id"], e
+            try:
+                return gem["id"], parse_gem_details(soup)
+            except Exception as e:
+                return gem["id"], e
+            finally:
+                soup.decompose()
+
+        found, failed = {}, []
+        with ThreadPoolExecutor(max_workers=FETCH_MAX_CONCURRENCY) as pool:
+            for gem_id, data in pool.map(scrape_one, all_gems):
+                if isinstance(data, Exception):
+                    print(f"  [{locale}] {gem_id} FAIL ({data})")
+                    failed.append(gem_id)
+                elif data:
+                    found[gem_id] = data
+                else:
+                    print(f"  [{locale}] {gem_id} SKIP (no .gemPopup found)")
+                    failed.append(gem_id)
+        text["details"] = dict(sorted(found.items()))
+        print(f"  [{locale}] {len(found)}/{len(all_gems)} gem details")
+        if failed:
+            print(f"  [{locale}] Failed gems: {', '.join(failed)}")
+    return text
+
+
+def _write_locale_js(locale, text):
+    """Write js/locales/<locale>.js (const LOCALE_TEXT_<LOCALE>)."""
+    LOCALES_DIR.mkdir(parents=True, exist_ok=True)
+    output_path = LOCALES_DIR / f"{locale}.js"
+    lines = [
+        f"// {POEDB_LOCALES[locale]} text for the gems.js dataset, generated by "
+        f"scrape_poedb.py --locales (do not edit)",
+        "// gems: gem id -> name; quests: Korean questName -> name; details: as GEM_DETAILS",
+        f"const LOCALE_TEXT_{locale.upper()} = {jsemit.to_js_literal(text)};",
+        "",
+    ]
+    jsemit.write_js(output_path, "\n".join(lines))
+    return output_path
 
-        parts.append(f'    mods: {mods_str},')
 
-        if data.get("reminder"):
-            parts.append(f'    reminder: {json.dumps(data["reminder"], ensure_ascii=False)},')
-        if data.get("qualityHeader"):
-            parts.append(f'    qualityHeader: {json.dumps(data["qualityHeader"], ensure_ascii=False)},')
-        if data.get("qualityMod"):
-            parts.append(f'    qualityMod: {json.dumps(data["qualityMod"], ensure_ascii=False)},')
-        if data.get("supportText"):
-            parts.append(f'    supportText: {json.dumps(data["supportText"], ensure_ascii=False)},')
-        if data.get("engName"):
-            parts.append(f'    engName: {json.dumps(data["engName"], ensure_ascii=False)},')
+def main_locales(locales, details=False):
+    """Scrape translated text for several locales concurrently.
 
-        parts.append('  },')
-        lines.append("\n".join(parts))
+    The locale-independent part (the Korean Quest page that maps quest pages
+    to gems.js quest names) is fetched once and shared. Every locale then
+    costs its text pages only; all requests go through the one FetchScheduler,
+    so the rate budget is shared too.
+    """
+    unknown = [loc for loc in locales if loc not in POEDB_LOCALES or loc == LOCALE]
+    if unknown:
+        sys.exit(f"ERROR: unsupported locale(s) {', '.join(unknown)} "
+                 f"(choose from {', '.join(l for l in POEDB_LOCALES if l != LOCALE)})")
+    print(f"=== scrape_poedb.py --locales: {', '.join(locales)} ===\n")
 
-    lines.append("};")
+    import dataset
+    all_gems = [g.as_dict() for g in dataset.load().gems]
 
-    output_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    soup = fetch(QUEST_URL)
+    quest_kr_by_eng = parse_quest_names(soup)
+    soup.decompose()
+
+    with ThreadPoolExecutor(max_workers=len(locales)) as pool:
+        futures = {loc: pool.submit(scrape_locale, loc, quest_kr_by_eng, all_gems, details)
+                   for loc in locales}
+        failed = []
+        for loc, future in futures.items():
+            try:
+                text = future.result()
+            except Exception as e:  # one locale's outage must not discard the others
+                print(f"  [{loc}] FAIL ({e})")
+                failed.append(loc)
+                continue
+            print(f"Written to {_write_locale_js(loc, text)}")
+    if failed:
+        sys.exit(f"ERROR: locale(s) failed: {', '.join(failed)}")
 
 
 # == Main =====================================================================
 
 
-def main():
+def main(icons=False, bulk=False):
     print("=== scrape_poedb.py: Scraping poedb.tw Quest page ===\n")
 
+    # Step 0: Bulk gem metadata from list pages (if --bulk flag)
+    if bulk:
+        print("Harvesting gem index pages...")
+        harvest_gem_lists()
+        print()
+
     # Step 1: Fetch main Quest page
     soup = fetch(QUEST_URL)
-    time.sleep(FETCH_DELAY)
 
     # Step 2: Parse QuestReward tables (also populates gem_registry)
     print("\nParsing #QuestReward...")
@@ -815,7 +1464,7 @@ def main():
     print(f"\nGem registry: {len(gem_registry)} unique gem names collected from poedb")
 
     # Step 5: Load existing gems.js
-    gems_js_text = (ROOT / "js" / "gems.js").read_text(encoding="utf-8")
+    gems_js_text = jsemit.read_js(ROOT / "js" / "gems.js")
     existing_gems = parse_existing_gems(gems_js_text)
     print(f"Existing gems[]: {len(existing_gems)} entries")
 
@@ -849,7 +1498,13 @@ def main():
     new_text = replace_all_sections(gems_js_text, gems_js, quest_js, vendor_js)
 
     output_path = ROOT / "js" / "gems.js"
-    output_path.write_text(new_text, encoding="utf-8")
+    jsemit.write_js(output_path, new_text)
+
+    from reward_matrix import RewardMatrix
+    print("Generating reward_matrix.js...")
+    matrix = RewardMatrix.from_rewards(quest_rewards, vendor_rewards,
+                                       sorted(gem_id_set), to_id=eng_to_gemid)
+    matrix.write_js()
 
     # -- Stats --
     q_count = sum(1 for line in quest_js.split("\n") if "act:" in line)
@@ -864,30 +1519,66 @@ def main():
     print(f"\nWritten to {output_path}")
 
     # Step 9: Download missing icons (if --icons flag)
-    if "--icons" in sys.argv:
-        print("\n=== Checking for missing gem icons ===\n")
-        missing = find_missing_icons(all_gems)
-        if missing:
-            print(f"  {len(missing)} missing icon(s) - downloading from poedb CDN...")
-            download_icons(missing)
-        else:
-            print("  All icon files present!")
+    if icons:
+        download_missing_icons(all_gems)
+
+
+def download_missing_icons(all_gems):
+    """Download icons for every gem whose PNG is missing from img/gems/."""
+    print("\n=== Checking for missing gem icons ===\n")
+    missing = find_missing_icons(all_gems)
+    if missing:
+        # The index pages list every gem's icon URL: cheaper than one page per gem
+        if not gem_index and len(missing) > len(GEM_LIST_PAGES):
+            print("  Harvesting gem index pages for icon URLs...")
+            harvest_gem_lists()
+        print(f"  {len(missing)} missing icon(s) - downloading from poedb CDN...")
+        download_icons(missing)
+    else:
+        print("  All icon files present!")
+
+
+def main_icons():
+    """Download missing gem icons for the gems already in gems.js (no Quest scrape)."""
+    import dataset
+    download_missing_icons([g.as_dict() for g in dataset.load().gems])
 
 
-def main_details():
+def _argv_value(flag):
+    """Return the value of a '--flag=value' or '--flag value' argument, or None."""
+    for i, arg in enumerate(sys.argv):
+        if arg.startswith(flag + "="):
+            return arg.split("=", 1)[1]
+        if arg == flag and i + 1 < len(sys.argv):
+            return sys.argv[i + 1]
+    return None
+
+
+def main_details(budget=None, time_budget=None, bounded=False):
     """Scrape gem detail pages and generate js/gem_details.js."""
     print("=== scrape_poedb.py --details: Scraping gem detail pages ===\n")
 
     # Load all gems from gems.js
-    gems_js_text = (ROOT / "js" / "gems.js").read_text(encoding="utf-8")
-    all_gems = parse_existing_gems(gems_js_text)
+    import dataset
+    ds = dataset.load()
+    all_gems = [g.as_dict() for g in ds.gems]
     print(f"Loaded {len(all_gems)} gems from gems.js\n")
 
-    scrape_gem_details(all_gems)
+    referenced_ids = ds.reward_gem_ids()
+    scrape_gem_details(all_gems, referenced_ids, budget=budget, time_budget=time_budget,
+                       bounded=bounded)
 
 
 if __name__ == "__main__":
-    if "--details" in sys.argv:
-        main_details()
+    if "--locales" in sys.argv:
+        main_locales(_argv_value("--locales").split(","), details="--details" in sys.argv)
+    elif "--details" in sys.argv:
+        budget = _argv_value("--budget")
+        time_budget = _argv_value("--time-budget")
+        main_details(
+            budget=int(budget) if budget else None,
+            time_budget=float(time_budget) if time_budget else None,
+            bounded="--bounded" in sys.argv,
+        )
     else:
-        main()
+        main(icons="--icons" in sys.argv, bulk="--bulk" in sys.argv)
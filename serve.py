@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+"""Static file server for the site, for guide authors and as the edge origin.
+
+At startup every servable file is hashed and indexed in memory, and
+compressible files (html/js/css/json/svg) are precompressed into the index:
+gzip, plus brotli when the brotli module is installed. Compressed bodies are
+also kept in .serve-cache/ (gitignored), named by content revision, so a
+restart only compresses files that changed; nothing is written into the
+site's own directories. Each response then comes from the index:
+
+  - the smallest variant the client's Accept-Encoding allows (Vary set)
+  - a strong ETag per variant ("<rev>", "<rev>-gz", "<rev>-br"), where rev
+    is the precache.py revision of the file
+  - If-None-Match answered with 304 without touching the file
+  - Cache-Control: immutable for a year when the URL carries
+    ?__rev=<rev> (how sw.js fetches precached assets), no-cache otherwise
+  - single byte ranges (Range / If-Range) on the identity variant
+
+A stat() per request notices files regenerated while the server runs
+(build_guide.py --watch, cli.py build) and re-indexes just that file.
+
+Usage:
+    python serve.py [--host H] [--port N]     # serve the repo root (default 127.0.0.1:8000)
+    python serve.py --compress-only           # only refresh .serve-cache/
+    python serve.py bench [-n N] [-c C]       # load-test against http.server
+"""
+
+import argparse
+import gzip
+import hashlib
+import http.client
+import mimetypes
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import precache
+
+ROOT = Path(__file__).parent
+PORT = 8000
+CACHE_DIR_NAME = ".serve-cache"  # under the served root: <rev>.gz / <rev>.br (empty = not worth it)
+
+COMPRESSIBLE = {".html", ".js", ".css", ".json", ".svg", ".txt", ".md"}
+ENCODINGS = [("br", ".br"), ("gzip", ".gz")]  # preference order
+MIN_SAVING = 0.9  # keep a compressed variant only if it is below 90% of the original
+EXTRA_FILES = ["sw.js", "precache-manifest.json"]
+EXTRA_DIRS = ["releases", "js/locales", "bench"]
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+mimetypes.add_type("text/javascript", ".js")
+mimetypes.add_type("font/woff2", ".woff2")
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+# == Index =====================================================================
+
+
+class Variant:
+    __slots__ = ("body", "etag")
+
+    def __init__(self, body, etag):
+        self.body = body
+        self.etag = etag
+
+
+class Asset:
+    """One file: its identity body, encoded variants and headers."""
+
+    __slots__ = ("stat", "rev", "content_type", "last_modified", "variants")
+
+    def __init__(self, stat, rev, content_type, last_modified, variants):
+        self.stat = stat                  # (mtime_ns, size) the entry was built from
+        self.rev = rev
+        self.content_type = content_type
+        self.last_modified = last_modified
+        self.variants = variants          # {"identity"|"gzip"|"br": Variant}
+
+
+def _stat_key(path):
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def compress_cached(data, rev, encoding, suffix, cache_dir):
+    """Compressed bytes of data (revision rev), or None if not worth it.
+
+    Returns (body, compressed now). Results, including "not worth it" as an
+    empty file, are cached as cache_dir/<rev><suffix>; a revision is a
+    content hash, so cached entries never go stale.
+    """
+    cached = cache_dir / f"{rev}{suffix}"
+    if cached.exists():
+        return cached.read_bytes() or None, False
+    if encoding == "gzip":
+        packed = gzip.compress(data, compresslevel=9, mtime=0)
+    else:
+        brotli = _brotli()
+        if brotli is None:
+            return None, False
+        packed = brotli.compress(data, quality=11)
+    if len(packed) > len(data) * MIN_SAVING:
+        packed = b""
+    cache_dir.mkdir(exist_ok=True)
+    cached.write_bytes(packed)
+    return packed or None, True
+
+
+def load_asset(path, compress=True, cache_dir=ROOT / CACHE_DIR_NAME):
+    """Build the index entry for one file; returns (asset, variants compressed)."""
+    stat = _stat_key(path)
+    data = path.read_bytes()
+    rev = hashlib.sha256(data).hexdigest()[:12]  # same as precache.file_revision
+    variants = {"identity": Variant(data, f'"{rev}"')}
+    written = 0
+    if compress and path.suffix in COMPRESSIBLE:
+        for encoding, suffix in ENCODINGS:
+            packed, new = compress_cached(data, rev, encoding, suffix, cache_dir)
+            if packed is not None:
+                variants[encoding] = Variant(packed, f'"{rev}-{suffix[1:]}"')
+            written += new
+    content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    if content_type.startswith("text/") or content_type == "application/json":
+        content_type += "; charset=utf-8"
+    asset = Asset(stat, rev, content_type, formatdate(stat[0] / 1e9, usegmt=True), variants)
+    return asset, written
+
+
+def servable(rel):
+    """Whether a site-relative path is part of the site (not a script or a dotfile)."""
+    if rel.endswith(tuple(precache.COMPRESSED_SUFFIXES)) or "/." in "/" + rel:
+        return False
+    return (rel in precache.SITE_FILES or rel in EXTRA_FILES
+            or any(rel.startswith(d + "/") for d in precache.SITE_DIRS + EXTRA_DIRS))
+
+
+def iter_site_files(root=ROOT):
+    """Site-relative paths indexed at startup: the site's files plus extras."""
+    paths = set(precache.iter_site_files(root))
+    paths.update(f for f in EXTRA_FILES if (root / f).exists())
+    for d in EXTRA_DIRS:
+        if (root / d).exists():
+            paths.update(p.relative_to(root).as_posix()
+                         for p in (root / d).rglob("*") if p.is_file())
+    return sorted(p for p in paths if servable(p))
+
+
+class SiteIndex:
+    """url path -> Asset, built at startup, refreshed per file on change."""
+
+    def __init__(self, root=ROOT, compress=True):
+        self.root = root.resolve()
+        self.compress = compress
+        self.cache_dir = self.root / CACHE_DIR_NAME
+        self.assets = {}
+        self.lock = threading.Lock()
+        self.written = 0
+        for rel in iter_site_files(root):
+            self.assets["/" + rel], written = load_asset(root / rel, compress, self.cache_dir)
+            self.written += written
+        self.prune_cache()
+
+    def prune_cache(self):
+        """Drop cached variants of revisions no indexed file has any more."""
+        if not self.cache_dir.exists():
+            return
+        revs = {a.rev for a in self.assets.values()}
+        for path in self.cache_dir.iterdir():
+            if path.stem not in revs:
+                path.unlink()
+
+    def lookup(self, url_path):
+        """Current Asset for a URL path, or None (404)."""
+        if url_path.endswith("/"):
+            url_path += "index.html"
+        path = (self.root / unquote(url_path).lstrip("/")).resolve()
+        if self.root not in path.parents or not servable(path.relative_to(self.root).as_posix()):
+            return None
+        asset = self.assets.get(url_path)
+        try:
+            stat = _stat_key(path)
+        except (FileNotFoundError, NotADirectoryError):
+            if asset:
+                with self.lock:
+                    self.assets.pop(url_path, None)
+            return None
+        if path.is_dir():
+            return None
+        if asset is None or asset.stat != stat:
+            asset, _ = load_asset(path, self.compress, self.cache_dir)
+            with self.lock:
+                self.assets[url_path] = asset
+        return asset
+
+    def summary(self):
+        raw = sum(len(a.variants["identity"].body) for a in self.assets.values())
+        counts = {enc: sum(enc in a.variants for a in self.assets.values()) for enc, _ in ENCODINGS}
+        return (f"{len(self.assets)} files ({raw / 1024:.0f} KB), "
+                f"{counts['gzip']} gzip / {counts['br']} brotli variants, "
+                f"{self.written} compressed now")
+
+
+# == Serving ===================================================================
+
+
+def accepted_encodings(header):
+    """Encodings the client accepts (q > 0), from an Accept-Encoding header."""
+    accepted = set()
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name and q > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+def etag_matches(header, etag):
+    """If-None-Match check (weak comparison, as RFC 9110 requires for it)."""
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def parse_range(header, size):
+    """(start, end) inclusive for a single byte range, "invalid", or None to ignore."""
+    m = RANGE_RE.match(header.strip())
+    if not m or m.group(1) == m.group(2) == "":
+        return None  # multiple or malformed ranges: serve the whole file
+    first, last = m.groups()
+    if first == "":
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return "invalid"
+    return start, end
+
+
+def make_handler(index, verbose=False):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True  # headers and body are separate writes on keep-alive
+        server_version = "poe-leveling-kr"
+
+        def log_message(self, fmt, *args):
+            if verbose:
+                super().log_message(fmt, *args)
+
+        def do_HEAD(self):
+            self.respond(head=True)
+
+        def do_GET(self):
+            self.respond(head=False)
+
+        def respond(self, head):
+            url = urlsplit(self.path)
+            asset = index.lookup(url.path)
+            if asset is None:
+                self.send_error(404)
+                return
+            revs = parse_qs(url.query).get("__rev")
+            cache_control = IMMUTABLE if revs and revs[0] == asset.rev else REVALIDATE
+
+            range_header = self.headers.get("Range")
+            if_range = self.headers.get("If-Range")
+            if range_header and if_range and if_range.strip() not in (
+                    asset.variants["identity"].etag, asset.last_modified):
+                range_header = None
+            if range_header:
+                encoding = "identity"  # ranges address the identity bytes
+            else:
+                accepted = accepted_encodings(self.headers.get("Accept-Encoding"))
+                encoding = next((enc for enc, _ in ENCODINGS
+                                 if enc in asset.variants and enc in accepted), "identity")
+            variant = asset.variants[encoding]
+
+            status, body = 200, variant.body
+            if etag_matches(self.headers.get("If-None-Match"), variant.etag):
+                status, body = 304, b""
+            elif range_header:
+                span = parse_range(range_header, len(body))
+                if span == "invalid":
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{len(body)}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                if span:
+                    start, end = span
+                    status, body = 206, body[start:end + 1]
+
+            self.send_response(status)
+            self.send_header("ETag", variant.etag)
+            self.send_header("Cache-Control", cache_control)
+            self.send_header("Last-Modified", asset.last_modified)
+            if len(asset.variants) > 1:
+                self.send_header("Vary", "Accept-Encoding")
+            if status != 304:
+                self.send_header("Content-Type", asset.content_type)
+                self.send_header("Accept-Ranges", "bytes")
+                if encoding != "identity":
+                    self.send_header("Content-Encoding", encoding)
+                if status == 206:
+                    self.send_header("Content-Range",
+                                     f"bytes {start}-{end}/{len(variant.body)}")
+                self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if not head and body:
+                self.wfile.write(body)
+
+    return Handler
+
+
+def make_server(host="127.0.0.1", port=PORT, root=ROOT, compress=True, verbose=False):
+    t0 = time.perf_counter()
+    index = SiteIndex(root, compress)
+    print(f"Indexed {index.summary()} in {(time.perf_counter() - t0) * 1000:.0f} ms")
+    httpd = ThreadingHTTPServer((host, port), make_handler(index, verbose))
+    httpd.daemon_threads = True
+    return httpd
+
+
+# == Load benchmark ============================================================
+
+
+def _request_mix(root=ROOT):
+    """(path, headers) requests resembling page loads plus revalidations."""
+    icons = sorted(p.name for p in (root / "img" / "gems").glob("*.png"))[:200]
+    gz = {"Accept-Encoding": "gzip, deflate, br"}
+    mix = [
+        ("/index.html", gz),
+        ("/js/gem_details.js", gz),
+        ("/js/gems.js", gz),
+        ("/css/style.css", gz),
+        ("/js/gems.js", {"Range": "bytes=0-16383"}),
+    ]
+    mix += [(f"/img/gems/{name}", {}) for name in icons[:20]]
+    # Revalidations get their validators from a first response (see _validators)
+    mix += [(path, {**gz, "revalidate": "1"}) for path, _ in mix[:4]]
+    return mix
+
+
+def _validators(port, mix):
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    out = {}
+    for path, headers in mix:
+        if "revalidate" in headers:
+            conn.request("GET", path, headers={"Accept-Encoding": headers["Accept-Encoding"]})
+            res = conn.getresponse()
+            res.read()
+            if res.getheader("ETag"):
+                out[path] = {"If-None-Match": res.getheader("ETag")}
+            else:
+                out[path] = {"If-Modified-Since": res.getheader("Last-Modified")}
+    conn.close()
+    return out
+
+
+def run_load(port, requests, concurrency, mix, seed=1):
+    """Issue requests from concurrency keep-alive clients; return stats dict."""
+    validators = _validators(port, mix)
+    per_worker = requests // concurrency
+
+    def worker(n):
+        rng = random.Random(seed + n)
+        conn = http.client.HTTPConnection("127.0.0.1", port)
+        latencies, nbytes, statuses = [], 0, {}
+        for _ in range(per_worker):
+            path, headers = rng.choice(mix)
+            if "revalidate" in headers:
+                headers = {"Accept-Encoding": headers["Accept-Encoding"], **validators[path]}
+            t = time.perf_counter()
+            conn.request("GET", path, headers=headers)
+            res = conn.getresponse()
+            nbytes += len(res.read())
+            latencies.append(time.perf_counter() - t)
+            statuses[res.status] = statuses.get(res.status, 0) + 1
+        conn.close()
+        return latencies, nbytes, statuses
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(worker, range(concurrency)))
+    elapsed = time.perf_counter() - t0
+
+    latencies = sorted(x for r in results for x in r[0])
+    statuses = {}
+    for r in results:
+        for status, count in r[2].items():
+            statuses[status] = statuses.get(status, 0) + count
+    return {
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50": latencies[len(latencies) // 2] * 1000,
+        "p99": latencies[int(len(latencies) * 0.99)] * 1000,
+        "bytes": sum(r[1] for r in results),
+        "statuses": dict(sorted(statuses.items())),
+    }
+
+
+def bench(requests=4000, concurrency=16, root=ROOT):
+    """Compare this server with http.server.SimpleHTTPRequestHandler on one mix."""
+
+    class Baseline(SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=str(root), **kwargs)
+
+        def log_message(self, *args):
+            pass
+
+    servers = [("http.server", ThreadingHTTPServer(("127.0.0.1", 0), Baseline)),
+               ("serve.py", make_server(port=0, root=root))]
+    mix = _request_mix(root)
+    print(f"{requests} requests, {concurrency} clients, {len(mix)}-request mix\n")
+    print(f"  {'server':<12} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'MB sent':>8}  statuses")
+    for name, httpd in servers:
+        httpd.daemon_threads = True
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        stats = run_load(httpd.server_address[1], requests, concurrency, mix)
+        httpd.shutdown()
+        httpd.server_close()
+        statuses = " ".join(f"{s}x{n}" for s, n in stats["statuses"].items())
+        print(f"  {name:<12} {stats['rps']:>8.0f} {stats['p50']:>8.2f} {stats['p99']:>8.2f} "
+              f"{stats['bytes'] / 1e6:>8.1f}  {statuses}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="serve.py", description=__doc__.split("\n\n")[0])
+    parser.add_argument("mode", nargs="?", choices=["bench"], help="run the load benchmark")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--compress-only", action="store_true",
+                        help="refresh the compressed variants in .serve-cache/ and exit")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log every request")
+    parser.add_argument("-n", "--requests", type=int, default=4000, help="bench: total requests")
+    parser.add_argument("-c", "--concurrency", type=int, default=16, help="bench: parallel clients")
+    args = parser.parse_args(argv)
+
+    if args.mode == "bench":
+        bench(args.requests, args.concurrency)
+        return
+    if args.compress_only:
+        index = SiteIndex()
+        print(f"Indexed {index.summary()}")
+        return
+    if _brotli() is None:
+        print("  brotli not installed: serving gzip only")
+    httpd = make_server(args.host, args.port, verbose=args.verbose)
+    host, port = httpd.server_address[:2]
+    print(f"Serving {ROOT} on http://{host}:{port}/")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""Content-addressed snapshot store for the scraped dataset.
+
+Each snapshot records the records of releases.load_records() (classes,
+gem:<id>, reward:..., details:<id>) as a two-level hash tree:
+
+    record  -> object (its JSON), addressed by SHA-256
+    bucket  -> object {key: record hash} for the keys that hash into it
+    root    -> object {bucket id: bucket hash}
+    refs/<name>.json -> {"root": hash, "date", "records"}
+
+Objects are written once and shared by every snapshot that contains them,
+so a snapshot that changes a few gems only adds those records, their
+buckets and a new root (a few KB). diff() compares roots first and only
+opens buckets whose hashes differ, so its cost follows the number of
+changes, not the size of the dataset.
+
+Names starting with "release-" belong to releases.py, which diffs each new
+release against the previous one's baseline; save refuses them, and refuses
+to replace an existing snapshot unless --force is given.
+
+Usage:
+    python snapshots.py save [NAME] [--force]
+                                             # snapshot the current js/ data; NAME defaults
+                                             # to the date (date-2, date-3, ... if taken)
+    python snapshots.py list
+    python snapshots.py diff OLD NEW         # keys added/changed/removed between two snapshots
+    python snapshots.py show NAME KEY        # print one record, e.g. gem:fireball
+"""
+
+import hashlib
+import json
+import sys
+import time
+import zlib
+
+from releases import SNAPSHOT_PREFIX, load_records
+from scrape_poedb import ROOT
+
+STORE_DIR = ROOT / "snapshots"
+BUCKETS = 64
+
+
+def _dump(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def bucket_of(key):
+    return format(int(hashlib.sha256(key.encode("utf-8")).hexdigest()[:4], 16) % BUCKETS, "02x")
+
+
+class SnapshotStore:
+    """Object store plus named refs under one directory."""
+
+    def __init__(self, path=STORE_DIR):
+        self.path = path
+        self.objects = path / "objects"
+        self.refs = path / "refs"
+        self._cache = {}
+        self.written = 0  # objects newly written by this instance
+
+    # -- Objects ---------------------------------------------------------------
+
+    def _object_path(self, digest):
+        return self.objects / digest[:2] / digest[2:]
+
+    def put(self, value):
+        """Store a JSON value; return its hash (no-op if already stored)."""
+        data = _dump(value).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(zlib.compress(data))
+            tmp.replace(path)
+            self.written += 1
+        return digest
+
+    def get(self, digest):
+        if digest not in self._cache:
+            data = zlib.decompress(self._object_path(digest).read_bytes())
+            self._cache[digest] = json.loads(data)
+        return self._cache[digest]
+
+    # -- Snapshots ---------------------------------------------------------------
+
+    def save(self, name, records, force=False):
+        """Snapshot {key: record}; return (root hash, number of new objects).
+
+        Raises FileExistsError if the name is taken, unless force.
+        """
+        if not force and (self.refs / f"{name}.json").exists():
+            raise FileExistsError(f"snapshot {name!r} already exists (use --force to replace it)")
+        before = self.written
+        buckets = {}
+        for key, record in records.items():
+            buckets.setdefault(bucket_of(key), {})[key] = self.put(record)
+        root = self.put({b: self.put(dict(sorted(entries.items())))
+                         for b, entries in sorted(buckets.items())})
+        self.refs.mkdir(parents=True, exist_ok=True)
+        ref = {"root": root, "date": time.strftime("%Y-%m-%d %H:%M"), "records": len(records)}
+        (self.refs / f"{name}.json").write_text(json.dumps(ref) + "\n", encoding="utf-8")
+        return root, self.written - before
+
+    def ref(self, name):
+        path = self.refs / f"{name}.json"
+        if not path.exists():
+            raise KeyError(f"no snapshot named {name!r}")
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def names(self):
+        if not self.refs.exists():
+            return []
+        return sorted(p.stem for p in self.refs.glob("*.json"))
+
+    def _entries(self, name):
+        """{key: record hash} of a snapshot (opens every bucket)."""
+        out = {}
+        for bucket_hash in self.get(self.ref(name)["root"]).values():
+            out.update(self.get(bucket_hash))
+        return out
+
+    def load(self, name):
+        """Full {key: record} of a snapshot."""
+        return {key: self.get(h) for key, h in self._entries(name).items()}
+
+    def record(self, name, key):
+        bucket_hash = self.get(self.ref(name)["root"]).get(bucket_of(key))
+        digest = self.get(bucket_hash).get(key) if bucket_hash else None
+        return self.get(digest) if digest else None
+
+    def diff(self, old, new):
+        """{"added", "changed", "removed"}: sorted keys, visiting only differing buckets."""
+        old_root = self.get(self.ref(old)["root"])
+        new_root = self.get(self.ref(new)["root"])
+        added, changed, removed = [], [], []
+        for b in old_root.keys() | new_root.keys():
+            if old_root.get(b) == new_root.get(b):
+                continue
+            a = self.get(old_root[b]) if b in old_root else {}
+            n = self.get(new_root[b]) if b in new_root else {}
+            for key, digest in n.items():
+                if key not in a:
+                    added.append(key)
+                elif a[key] != digest:
+                    changed.append(key)
+            removed.extend(k for k in a if k not in n)
+        return {"added": sorted(added), "changed": sorted(changed), "removed": sorted(removed)}
+
+
+def default_name(store):
+    """Today's date, suffixed -2, -3, ... if a snapshot already has it."""
+    base = time.strftime("%Y-%m-%d")
+    taken = set(store.names())
+    name, n = base, 1
+    while name in taken:
+        n += 1
+        name = f"{base}-{n}"
+    return name
+
+
+def main(argv):
+    store = SnapshotStore()
+    force = "--force" in argv
+    argv = [a for a in argv if a != "--force"]
+    cmd, args = (argv[0], argv[1:]) if argv else (None, [])
+    if cmd == "save" and len(args) <= 1:
+        name = args[0] if args else default_name(store)
+        if name.startswith(SNAPSHOT_PREFIX):
+            sys.exit(f"snapshot names starting with {SNAPSHOT_PREFIX!r} are reserved for releases.py")
+        records = load_records()
+        try:
+            root, new_objects = store.save(name, records, force=force)
+        except FileExistsError as e:
+            sys.exit(str(e))
+        print(f"Snapshot {name}: {len(records)} records, {new_objects} new objects, root {root[:12]}")
+    elif cmd == "list" and not args:
+        for name in store.names():
+            ref = store.ref(name)
+            print(f"  {name:<20} {ref['date']}  {ref['records']:>5} records  {ref['root'][:12]}")
+    elif cmd == "diff" and len(args) == 2:
+        delta = store.diff(*args)
+        for kind, mark in (("added", "+"), ("changed", "~"), ("removed", "-")):
+            for key in delta[kind]:
+                print(f"  {mark} {key}")
+        print(f"{len(delta['added'])} added, {len(delta['changed'])} changed, "
+              f"{len(delta['removed'])} removed")
+    elif cmd == "show" and len(args) == 2:
+        record = store.record(*args)
+        if record is None:
+            sys.exit(f"{args[1]} not in snapshot {args[0]}")
+        print(json.dumps(record, ensure_ascii=False, indent=2))
+    else:
+        sys.exit(__doc__)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
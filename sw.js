@@ -0,0 +1,107 @@
+// Service worker generated by precache.py (do not edit)
+const CACHE = "poe-leveling-kr-precache";
+const RUNTIME_CACHE = "poe-leveling-kr-runtime";
+const RUNTIME_DIRS = ["img/gems"];
+const PRECACHE = {
+ "css/style.css": "6923fe592105",
+ "fonts/Fontin-SmallCaps.woff2": "af9190a57b28",
+ "index.html": "331de83b3043",
+ "js/app.js": "db408c7f3f55",
+ "js/data-release.js": "e98b567ae0ac",
+ "js/data_v2.js": "bf86d33283c5",
+ "js/gem-tooltip.js": "466c3f68e648",
+ "js/gem_details.js": "release-1",
+ "js/gems-app.js": "c48ba743f372",
+ "js/gems.js": "release-1",
+ "js/i18n.js": "76fd381301f2",
+ "js/prerendered.js": "1a120e303349",
+ "js/release.js": "6a23e0c14d17",
+ "js/sync.js": "53b28033c147"
+};
+const ON_DEMAND = {
+ "js/names_en.js": "1a55ab333acf",
+ "js/names_log_en.js": "0b308b976f02",
+ "js/names_log_kr.js": "a40e5113b16a"
+};
+
+const REV_PARAM = '__rev';
+const BASE = self.registration.scope;
+const INDEX = new URL('index.html', BASE).href;
+
+function cacheKey(url, revision) {
+  const u = new URL(url, BASE);
+  u.searchParams.set(REV_PARAM, revision);
+  return u.href;
+}
+
+// url (absolute, no query) -> cache key for the current manifest
+const KEYS = new Map(Object.entries(PRECACHE).map(([url, rev]) => [new URL(url, BASE).href, cacheKey(url, rev)]));
+const ON_DEMAND_KEYS = new Map(Object.entries(ON_DEMAND).map(([url, rev]) => [new URL(url, BASE).href, cacheKey(url, rev)]));
+
+self.addEventListener('install', (event) => {
+  event.waitUntil((async () => {
+    const cache = await caches.open(CACHE);
+    const missing = [];
+    for (const [url, key] of KEYS) {
+      if (!(await cache.match(key))) missing.push([url, key]);
+    }
+    await Promise.all(missing.map(async ([url, key]) => {
+      // The revisioned URL lets serve.py answer with an immutable response
+      const res = await fetch(key, { cache: 'no-cache' });
+      if (!res.ok) throw new Error(`precache ${url}: ${res.status}`);
+      await cache.put(key, res);
+    }));
+    await self.skipWaiting();
+  })());
+});
+
+self.addEventListener('activate', (event) => {
+  event.waitUntil((async () => {
+    const cache = await caches.open(CACHE);
+    const keep = new Set([...KEYS.values(), ...ON_DEMAND_KEYS.values()]);
+    for (const req of await cache.keys()) {
+      if (!keep.has(req.url)) await cache.delete(req);
+    }
+    await self.clients.claim();
+  })());
+});
+
+self.addEventListener('fetch', (event) => {
+  if (event.request.method !== 'GET') return;
+  const url = new URL(event.request.url);
+  url.search = '';
+  const href = event.request.mode === 'navigate' && url.href === BASE ? INDEX : url.href;
+  const key = KEYS.get(href);
+  if (key) {
+    event.respondWith((async () => {
+      const cache = await caches.open(CACHE);
+      return (await cache.match(key)) || fetch(event.request);
+    })());
+    return;
+  }
+  const onDemandKey = ON_DEMAND_KEYS.get(url.href);
+  if (onDemandKey) {
+    // Cache on first use under its revision; activate drops stale revisions
+    event.respondWith((async () => {
+      const cache = await caches.open(CACHE);
+      const hit = await cache.match(onDemandKey);
+      if (hit) return hit;
+      const res = await fetch(onDemandKey, { cache: 'no-cache' });
+      if (res.ok) await cache.put(onDemandKey, res.clone());
+      return res;
+    })());
+    return;
+  }
+  if (url.origin === self.location.origin
+      && RUNTIME_DIRS.some(dir => url.pathname.startsWith(new URL(dir + '/', BASE).pathname))) {
+    // Cache on first use; icon files do not change under the same name
+    event.respondWith((async () => {
+      const cache = await caches.open(RUNTIME_CACHE);
+      const hit = await cache.match(url.href);
+      if (hit) return hit;
+      const res = await fetch(event.request);
+      if (res.ok) await cache.put(url.href, res.clone());
+      return res;
+    })());
+  }
+});
@@ -0,0 +1,42 @@
+"""build.py: input globs skip derived files; dependency cycles fail clearly."""
+
+import pytest
+
+import build
+from build import Stage, Stamps, closure
+
+
+def test_globbed_inputs_skip_compressed_siblings_and_own_outputs(tmp_path, monkeypatch):
+    monkeypatch.setattr(build, "ROOT", tmp_path)
+    (tmp_path / "js").mkdir()
+    (tmp_path / "js" / "app.js").write_text("app")
+    stage = Stage("report", "x:y", ["js/*"], ["js/report.json"])
+    stamps = Stamps(tmp_path / "stamps.json")
+    before = stamps.input_digest(stage, False)
+
+    (tmp_path / "js" / "app.js.gz").write_bytes(b"gz")
+    (tmp_path / "js" / "app.js.br").write_bytes(b"br")
+    (tmp_path / "js" / "report.json").write_text("{}")
+    assert stamps.input_digest(stage, False) == before
+
+    (tmp_path / "js" / "app.js").write_text("changed")
+    assert stamps.input_digest(stage, False) != before
+
+
+def test_dependency_cycle_is_reported():
+    a = Stage("a", "x:y", ["b.out"], ["a.out"])
+    b = Stage("b", "x:y", ["c.out"], ["b.out"])
+    c = Stage("c", "x:y", ["a.out"], ["c.out"])
+    with pytest.raises(ValueError, match="a -> b -> c -> a"):
+        closure([a], stages=[a, b, c])
+
+
+def test_closure_follows_dependencies_in_stage_order():
+    a = Stage("a", "x:y", [], ["a.out"])
+    b = Stage("b", "x:y", ["a.out"], ["b.out"])
+    c = Stage("c", "x:y", ["b.out", "a.out"], ["c.out"])
+    assert [s.name for s in closure([c], stages=[a, b, c])] == ["a", "b", "c"]
+
+
+def test_real_graph_has_no_cycle():
+    assert closure(build.STAGES) == build.STAGES
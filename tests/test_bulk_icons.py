@@ -0,0 +1,45 @@
+"""--bulk gem index: icon URLs come from the list pages, not one page per gem."""
+
+import pytest
+
+import scrape_poedb
+
+
+@pytest.fixture
+def no_gem_pages(monkeypatch):
+    def fetch_gem_icon_url(eng_name):
+        raise AssertionError(f"fetched the page of {eng_name}")
+    monkeypatch.setattr(scrape_poedb, "fetch_gem_icon_url", fetch_gem_icon_url)
+    monkeypatch.setattr(scrape_poedb, "gem_index", {})
+
+
+def test_index_icon_url_skips_the_gem_page(no_gem_pages):
+    scrape_poedb.gem_index["Fireball"] = {"icon_url": "https://cdn.poedb.tw/Fireball.webp"}
+    assert scrape_poedb.gem_icon_url("Fireball") == "https://cdn.poedb.tw/Fireball.webp"
+
+
+@pytest.mark.parametrize("missing, harvests", [(1, 0), (5, 1)])
+def test_missing_icons_harvest_the_index(no_gem_pages, monkeypatch, missing, harvests):
+    calls = []
+    downloaded = []
+    monkeypatch.setattr(scrape_poedb, "harvest_gem_lists", lambda: calls.append(1))
+    monkeypatch.setattr(scrape_poedb, "download_icons", downloaded.extend)
+    gems = [{"icon": f"Missing_Gem_{i}.png"} for i in range(missing)]
+    scrape_poedb.download_missing_icons(gems)
+    assert len(calls) == harvests
+    assert downloaded == gems
+
+
+def test_parse_gem_list(monkeypatch):
+    bs4 = pytest.importorskip("bs4")
+    html = """<table>
+      <tr><td><img src="https://cdn.poedb.tw/image/Art/2DItems/Gems/Fireball.webp"></td>
+          <td><a class="gem_blue" href="/kr/Fireball">화염구</a></td></tr>
+      <tr><td><a class="gem_red" href="/us/Cleave">Cleave</a></td></tr>
+    </table>"""
+    index = {}
+    monkeypatch.setattr(scrape_poedb, "gem_index", index)
+    assert scrape_poedb.parse_gem_list(bs4.BeautifulSoup(html, "html.parser"), "skill") == 1
+    assert index == {"Fireball": {
+        "kr_name": "화염구", "css_class": "gem_blue", "type": "skill",
+        "icon_url": "https://cdn.poedb.tw/image/Art/2DItems/Gems/Fireball.webp"}}
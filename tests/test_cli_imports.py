@@ -0,0 +1,81 @@
+"""cli.py: offline commands never import the scraping stack, and start fast."""
+
+import json
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRAPING_STACK = ("requests", "bs4", "lxml", "PIL")
+# `import cli` takes ~30 ms; the scraping stack alone costs several times that
+CLI_IMPORT_BUDGET_US = 200_000
+
+# Every subcommand that works without the network (serve runs until killed)
+OFFLINE_COMMANDS = [
+    ["--help"],
+    ["guide", "--output", "js/guide.js"],
+    ["stats"],
+    ["timeline"],
+    ["names"],
+    ["prerender"],
+    ["precache"],
+    ["payload"],
+    ["release"],
+    ["snapshot", "cli-imports-test"],
+    ["bench"],
+    ["build", "-n"],
+]
+
+# Runs cli.py in a fresh interpreter with an import hook that records every
+# attempt to import the scraping stack (whether or not it is installed), and
+# reports which of those modules ended up in sys.modules.
+PROBE = """
+import json, runpy, sys
+attempted = []
+class Probe:
+    def find_spec(self, name, path=None, target=None):
+        if name.split(".")[0] in {stack!r}:
+            attempted.append(name)
+        return None
+sys.meta_path.insert(0, Probe())
+sys.argv = ["cli.py"] + {argv!r}
+try:
+    runpy.run_path("cli.py", run_name="__main__")
+except SystemExit:
+    pass
+loaded = [m for m in sys.modules if m.split(".")[0] in {stack!r}]
+print(json.dumps({{"attempted": sorted(set(attempted)), "loaded": sorted(loaded)}}))
+"""
+
+
+@pytest.fixture(scope="module")
+def scratch_tree(tmp_path_factory):
+    """A copy of the repo, so the generators can write their outputs freely."""
+    tree = tmp_path_factory.mktemp("tree") / "repo"
+    shutil.copytree(ROOT, tree, ignore=shutil.ignore_patterns(
+        ".git", "__pycache__", ".pytest_cache", ".serve-cache", "bench", "tests"))
+    return tree
+
+
+def scraping_imports(tree, argv):
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(stack=SCRAPING_STACK, argv=list(argv))],
+        cwd=tree, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("argv", OFFLINE_COMMANDS, ids=lambda argv: " ".join(argv))
+def test_offline_command_skips_scraping_stack(scratch_tree, argv):
+    assert scraping_imports(scratch_tree, argv) == {"attempted": [], "loaded": []}
+
+
+def test_cli_import_time_within_budget():
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import cli"],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    m = re.search(r"^import time:\s*\d+ \|\s*(\d+) \| cli$", result.stderr, re.MULTILINE)
+    assert m and int(m.group(1)) < CLI_IMPORT_BUDGET_US
@@ -0,0 +1,46 @@
+"""dataset: load() is shared and read-only, and reloads when a file changes."""
+
+import os
+
+import pytest
+
+import dataset
+
+
+@pytest.fixture
+def gems_js(tmp_path):
+    path = tmp_path / "gems.js"
+    path.write_text(dataset.GEMS_JS.read_text(encoding="utf-8"), encoding="utf-8")
+    return path
+
+
+def load(gems_js):
+    # No details/guide files: only gems.js drives the cache key here
+    return dataset.load(gems_js, gems_js.with_name("none.js"), gems_js.with_name("none.js"))
+
+
+def test_load_is_cached_until_mtime_changes(gems_js):
+    first = load(gems_js)
+    assert load(gems_js) is first
+
+    gems_js.write_text(gems_js.read_text(encoding="utf-8").replace('name: "화염구"', 'name: "파이어볼"'),
+                       encoding="utf-8")
+    st = gems_js.stat()
+    os.utime(gems_js, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    second = load(gems_js)
+    assert second is not first
+    assert second.gem("fireball").name == "파이어볼"
+    assert first.gem("fireball").name == "화염구"  # earlier callers keep their snapshot
+
+
+def test_shared_collections_are_read_only(gems_js):
+    ds = load(gems_js)
+    assert isinstance(ds.gems, tuple) and isinstance(ds.rewards, tuple)
+    with pytest.raises(TypeError):
+        ds.by_id["fireball"] = None
+    with pytest.raises(TypeError):
+        ds.by_class["witch"]["fireball"] = 99
+    with pytest.raises(TypeError):
+        ds.rewards[0].per_class["witch"] = ()
+    assert all(isinstance(rows, tuple) for rows in ds.by_act.values())
@@ -0,0 +1,36 @@
+"""plan_detail_refresh: failed gems back off instead of starving the refresh."""
+
+from scrape_poedb import DETAIL_REFRESH_AGE, DETAIL_RETRY_BASE, plan_detail_refresh
+
+NOW = 1_000_000_000
+GEMS = [{"id": gid} for gid in ("broken", "fresh", "new", "stale")]
+DETAILS = {"fresh": {}, "stale": {}}
+FETCHED = {"fresh": NOW - 60, "stale": NOW - DETAIL_REFRESH_AGE - 60}
+
+
+def plan(failed_at, now=NOW, budget=None):
+    return [g["id"] for g in plan_detail_refresh(GEMS, DETAILS, FETCHED, budget=budget,
+                                                 now=now, failed_at=failed_at)]
+
+
+def test_never_failed_new_gems_come_first():
+    assert plan({}) == ["broken", "new", "stale"]
+
+
+def test_failed_gem_backs_off_then_ranks_last_in_its_tier():
+    failed_at = {"broken": [1, NOW - 60]}
+    assert plan(failed_at) == ["new", "stale"]
+    later = NOW + DETAIL_RETRY_BASE
+    assert plan(failed_at, now=later) == ["new", "broken", "stale"]
+
+
+def test_backoff_doubles_and_is_capped():
+    failed_at = {"broken": [3, NOW]}
+    assert "broken" not in plan(failed_at, now=NOW + 3 * DETAIL_RETRY_BASE)
+    assert "broken" in plan(failed_at, now=NOW + 4 * DETAIL_RETRY_BASE)
+    failed_at = {"broken": [30, NOW]}
+    assert "broken" in plan(failed_at, now=NOW + DETAIL_REFRESH_AGE)
+
+
+def test_budget_keeps_failing_gem_from_starving_others():
+    assert plan({"broken": [5, 0]}, budget=1) == ["new"]
@@ -0,0 +1,58 @@
+"""FetchScheduler: one decrease per congestion window, fast recovery."""
+
+import pytest
+
+from scrape_poedb import DELAY_RECOVERY, LATENCY_SPIKE_SAMPLES, FetchScheduler
+
+
+def scheduler(**kwargs):
+    s = FetchScheduler(**{"delay": 0, "min_delay": 0, "max_concurrency": 6, **kwargs})
+    s.limit = 6.0
+    s.delay = 0.5
+    return s
+
+
+def take(s):
+    """acquire() without waiting out the pacing delay (only the controller is tested)."""
+    s._next_start = 0.0
+    return s.acquire()
+
+
+def test_burst_of_429s_decreases_once():
+    s = scheduler()
+    tickets = [take(s) for _ in range(6)]
+    for t in tickets:
+        s.release(t, throttled=True)
+    assert s.limit == 3.0
+    assert s.delay == pytest.approx(1.0)
+
+
+def test_later_request_can_decrease_again():
+    s = scheduler()
+    s.release(take(s), throttled=True)
+    s.release(take(s), throttled=True)  # started after the decrease: a new event
+    assert s.delay == pytest.approx(2.0)
+    assert s.limit == 1.5
+
+
+def test_delay_recovers_multiplicatively():
+    s = scheduler(min_delay=0.1)
+    s.delay = s.max_delay
+    successes = 0
+    while s.delay > s.min_delay:
+        s.release(take(s), latency=0.05)
+        successes += 1
+    assert DELAY_RECOVERY < 1
+    assert successes < 40
+
+
+def test_single_slow_sample_is_not_congestion():
+    s = scheduler()
+    for _ in range(5):
+        s.release(take(s), latency=0.1)
+    limit = s.limit
+    s.release(take(s), latency=10)
+    assert s.limit >= limit
+    for _ in range(LATENCY_SPIKE_SAMPLES - 1):
+        s.release(take(s), latency=10)
+    assert s.limit < limit
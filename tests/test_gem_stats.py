@@ -0,0 +1,33 @@
+"""build_gem_stats: presence is explicit and out-of-range values fail the build."""
+
+import pytest
+
+from build_gem_stats import COLUMNS, build_stats
+
+NAMES = list(COLUMNS)
+
+
+def has(stats, i, column):
+    return bool(stats["present"][i] >> NAMES.index(column) & 1)
+
+
+def test_zero_requirement_is_present_and_missing_cost_is_not():
+    stats = build_stats({"g": {"properties": ["레벨:(1—20)"],
+                               "requirements": "요구 사항 레벨(1—70),(0—0)지능"}})
+    assert has(stats, 0, "int") and stats["columns"]["intMax"] == [0]
+    assert not has(stats, 0, "cost") and not has(stats, 0, "str")
+
+
+def test_fractional_cost_is_kept():
+    stats = build_stats({"soul_link": {"properties": ["소모:생명력 (15—32.67)"]}})
+    assert stats["columns"]["costMax"] == [32.67]
+
+
+@pytest.mark.parametrize("requirements", [
+    "요구 사항 레벨(1—70000)",   # overflows Uint16
+    "요구 사항 레벨(1—7.5)",     # fractional in an integer column
+    "요구 사항 레벨(-1—70)",     # negative
+])
+def test_out_of_range_values_fail_loudly(requirements):
+    with pytest.raises(ValueError, match="reqLevel"):
+        build_stats({"g": {"requirements": requirements}})
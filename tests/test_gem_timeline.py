@@ -0,0 +1,38 @@
+"""gem_timeline: quest/vendor unlock steps for one class across act 1."""
+
+from dataset import Reward
+from gem_timeline import build_gem_timeline
+
+REWARDS = [
+    Reward("reward", {"act": 1, "questName": "황혼의 해안",
+                      "rewards": {"witch": ["fireball", "arcane_surge_support"]}}),
+    Reward("reward", {"act": 1, "questName": "눈 앞의 적",
+                      "rewards": {"witch": ["freezing_pulse", "fireball"]}}),
+    Reward("vendor", {"act": 1, "questName": "눈 앞의 적", "npc": "네사", "cost": "wisdom",
+                      "rewards": {"witch": ["fireball", "spark", "not_a_gem"]}}),
+    Reward("vendor", {"act": 1, "questName": "빅타리오의 비밀", "npc": "네사", "cost": "transmute",
+                      "rewards": {"witch": ["spark", "frostbolt"]}}),
+]
+GEM_IDS = {"fireball", "arcane_surge_support", "freezing_pulse", "spark", "frostbolt"}
+
+
+def test_witch_act1_steps():
+    witch = build_gem_timeline(REWARDS, GEM_IDS, classes=["witch"])["witch"]
+    assert witch["steps"] == [
+        {"act": 1, "questName": "황혼의 해안", "reward": ["fireball", "arcane_surge_support"],
+         "vendor": [], "rewardTotal": 2, "vendorTotal": 0},
+        {"act": 1, "questName": "눈 앞의 적", "reward": ["freezing_pulse"],
+         "vendor": ["fireball", "spark"], "rewardTotal": 3, "vendorTotal": 2,
+         "npc": "네사", "cost": "wisdom"},
+        {"act": 1, "questName": "빅타리오의 비밀", "reward": [], "vendor": ["frostbolt"],
+         "rewardTotal": 3, "vendorTotal": 3, "npc": "네사", "cost": "transmute"},
+    ]
+    assert witch["earliest"] == {
+        "fireball": [0, 1], "arcane_surge_support": [0, -1], "freezing_pulse": [1, -1],
+        "spark": [-1, 1], "frostbolt": [-1, 2],
+    }
+
+
+def test_class_without_rewards_is_empty():
+    assert build_gem_timeline(REWARDS, GEM_IDS, classes=["ranger"])["ranger"] == {
+        "steps": [], "earliest": {}}
@@ -0,0 +1,47 @@
+"""jsemit --json-parse: every data file survives encode -> decode unchanged."""
+
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from jsemit import CONST_RE, DATA_FILES, ROOT, decode_text, encode_text, read_const, read_js
+
+DATA = [ROOT / "js" / name for name in DATA_FILES]
+
+# Evaluates a data file in node and prints its constants as JSON
+NODE_DUMP = """
+const src = require('fs').readFileSync(process.argv[1], 'utf8');
+const names = [...src.matchAll(/^const (\\w+) = /gm)].map(m => m[1]);
+console.log(JSON.stringify(new Function(src + '\\nreturn {' + names.join(',') + '};')()));
+"""
+
+
+def constants(text):
+    return {name: read_const(text, name) for name in CONST_RE.findall(text)}
+
+
+@pytest.mark.parametrize("path", DATA, ids=lambda p: p.name)
+def test_round_trip(path):
+    literal = path.read_text(encoding="utf-8")
+    encoded = encode_text(literal)
+    assert encoded.count("JSON.parse('") == len(CONST_RE.findall(literal))
+    decoded = decode_text(encoded)
+    assert constants(decoded) == constants(literal)
+    assert decode_text(encode_text(decoded)) == decoded  # the decoded layout is stable
+
+
+@pytest.mark.skipif(not shutil.which("node"), reason="node not installed")
+@pytest.mark.parametrize("path", DATA, ids=lambda p: p.name)
+def test_browser_sees_the_same_data(path, tmp_path):
+    literal = read_js(path)
+    encoded = tmp_path / path.name
+    encoded.write_text(encode_text(literal), encoding="utf-8")
+
+    def dump(p):
+        out = subprocess.run(["node", "-e", NODE_DUMP, str(p)],
+                             capture_output=True, text=True, check=True).stdout
+        return json.loads(out)
+
+    assert dump(encoded) == dump(path) == constants(literal)
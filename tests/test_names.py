@@ -0,0 +1,14 @@
+"""names: each client language gets its own log zone table."""
+
+import re
+
+from names import LOG_ZONES, normalize
+
+HANGUL_RE = re.compile(r"[가-힣]")
+
+
+def test_log_tables_split_by_language():
+    assert LOG_ZONES["en"] and LOG_ZONES["kr"]
+    assert not any(HANGUL_RE.search(k) for k in LOG_ZONES["en"])
+    assert all(HANGUL_RE.search(k) for k in LOG_ZONES["kr"])
+    assert LOG_ZONES["en"][normalize("The Twilight Strand")] == LOG_ZONES["kr"][normalize("황혼의 해안")]
@@ -0,0 +1,21 @@
+"""precache: the manifest holds what index.html loads, not every file on disk."""
+
+from precache import ON_DEMAND, iter_assets, iter_site_files, on_demand_revisions
+
+
+def test_manifest_is_the_loaded_page():
+    assets = iter_assets()
+    assert "index.html" in assets and "js/app.js" in assets and "css/style.css" in assets
+    assert "fonts/Fontin-SmallCaps.woff2" in assets  # named by the stylesheet
+    assert "sw.js" not in assets
+    assert "js/guide.js" not in assets  # dev-only: live.js loads it under ?live
+    assert not any(a.startswith("img/gems/") for a in assets)  # cached at runtime
+    unreferenced = set(iter_site_files()) - set(assets)
+    assert "js/gem_stats.js" in unreferenced
+
+
+def test_name_tables_are_cached_on_demand():
+    assets = iter_assets()
+    on_demand = on_demand_revisions()
+    assert set(on_demand) == set(ON_DEMAND)  # sync.js / i18n.js name them all
+    assert not set(ON_DEMAND) & set(assets)  # never installed up front
@@ -0,0 +1,22 @@
+"""prerender.source_hash: the staleness key app.js compares against."""
+
+from prerender import source_hash
+
+
+def test_matches_fnv1a_over_utf16_code_units():
+    assert source_hash([]) == "811c9dc5"
+    assert source_hash(["a"]) == "e40c292c"  # FNV-1a 32 of the single unit 0x61
+
+
+def test_changes_with_any_rendered_text():
+    steps = ["@zone{황혼의 해안} 처치", {"text": "다음", "newLeague": "새 리그"}]
+    base = source_hash(steps)
+    assert source_hash(["@zone{황혼의 해안} 처치!", steps[1]]) != base
+    assert source_hash([steps[0], {"text": "다음", "newLeague": "새 리그 2"}]) != base
+    assert source_hash([steps[0], {"text": "다음", "newLeague": True}]) != base
+    # Same step count, different split: the old length check could not tell
+    assert source_hash(["ab", "c"]) != source_hash(["a", "bc"])
+
+
+def test_ignores_fields_that_are_not_prerendered():
+    assert source_hash([{"text": "x", "sub": "note"}]) == source_hash(["x"])
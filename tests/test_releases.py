@@ -0,0 +1,124 @@
+"""releases: baselines in the snapshot store, a pinned base plus precached deltas."""
+
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import releases
+from precache import build_manifest
+from snapshots import SnapshotStore
+
+DATA_RELEASE_JS = Path(releases.ROOT) / "js" / "data-release.js"
+
+
+@pytest.fixture
+def release_dirs(tmp_path, monkeypatch):
+    monkeypatch.setattr(releases, "RELEASES_DIR", tmp_path / "releases")
+    monkeypatch.setattr(releases, "INDEX_JSON", tmp_path / "releases" / "index.json")
+    monkeypatch.setattr(releases, "RELEASE_JS", tmp_path / "release.js")
+    monkeypatch.setattr(releases, "pinned_size", lambda: 10_000)
+    return tmp_path
+
+
+def data_release(release_dirs):
+    text = (release_dirs / "release.js").read_text(encoding="utf-8")
+    return json.loads(text.split("const DATA_RELEASE = ", 1)[1].rstrip().rstrip(";"))
+
+
+def test_second_release_diffs_against_stored_baseline(release_dirs):
+    store = SnapshotStore(release_dirs / "snapshots")
+    v1 = {"gem:a": {"id": "a"}, "gem:b": {"id": "b"}, "details:a": {"tags": []}}
+    assert releases.cut_release(v1, store) == 1
+    assert releases.cut_release(v1, store) is None  # unchanged
+
+    v2 = {"gem:a": {"id": "a", "name": "A"}, "details:a": {"tags": []}, "gem:c": {"id": "c"}}
+    before = store.written
+    assert releases.cut_release(v2, store) == 2
+    assert store.written - before < len(v2) + 3  # changed records + buckets + root only
+
+    delta = json.loads((release_dirs / "releases" / "delta-2.json").read_text(encoding="utf-8"))
+    assert delta["from"] == 1
+    assert delta["added"] == {"gem:c": {"id": "c"}}
+    assert delta["changed"] == {"gem:a": {"id": "a", "name": "A"}}
+    assert delta["removed"] == ["gem:b"]
+    assert releases.apply_delta(store.load("release-1"), delta) == store.load("release-2")
+
+    assert data_release(release_dirs) == {
+        "version": 2, "base": 1, "root": store.ref("release-2")["root"],
+        "deltas": ["releases/delta-2.json"]}
+    assert not (release_dirs / "releases" / "records.json").exists()
+
+
+def test_data_files_stay_pinned_until_rebase(release_dirs, monkeypatch):
+    monkeypatch.setattr(releases, "pinned_size", lambda: 300)  # two ~100 B deltas outweigh half
+    store = SnapshotStore(release_dirs / "snapshots")
+    releases.cut_release({"gem:a": {"id": "a"}}, store)
+    releases.cut_release({"gem:a": {"id": "a", "name": "A"}}, store)
+    assert releases.pinned_revisions(releases.load_index()) == {
+        "js/gems.js": "release-1", "js/gem_details.js": "release-1"}
+
+    releases.cut_release({"gem:a": {"id": "a", "name": "B"}}, store)
+    assert data_release(release_dirs)["base"] == 3
+    assert data_release(release_dirs)["deltas"] == []
+    assert releases.pinned_revisions(releases.load_index())["js/gems.js"] == "release-3"
+
+
+def test_manifest_uses_pinned_revisions():
+    manifest = build_manifest(pinned={"js/gems.js": "release-7"})
+    assert manifest["js/gems.js"] == "release-7"
+    assert manifest["js/app.js"] != "release-7"
+
+
+def test_added_rows_carry_their_list_position(release_dirs):
+    store = SnapshotStore(release_dirs / "snapshots")
+    a, c = {"act": 1, "questName": "A"}, {"act": 2, "questName": "C"}
+    releases.cut_release({"reward:1:A": a, "reward:2:C": c}, store)
+    b = {"act": 1, "questName": "B"}
+    releases.cut_release({"reward:1:A": a, "reward:1:B": b, "reward:2:C": c, "gem:x": {}}, store)
+    delta = json.loads((release_dirs / "releases" / "delta-2.json").read_text(encoding="utf-8"))
+    assert delta["positions"] == {"reward:1:B": 1, "gem:x": 0}
+
+
+NODE_HARNESS = r"""
+const fs = require('fs');
+const vm = require('vm');
+const [script, deltaJson] = process.argv.slice(1);
+const events = [];
+const ctx = {
+  DATA_RELEASE: {version: 2, base: 1, deltas: ['releases/delta-2.json']},
+  GEM_DATA: {
+    gems: [{id: 'a'}],
+    questRewards: [{act: 1, questName: 'A'}, {act: 2, questName: 'C'}],
+    vendorRewards: [{act: 1, questName: 'A', npc: 'old'}, {act: 1, questName: 'Gone'}],
+  },
+  GEM_DETAILS: {},
+  console,
+  fetch: async url => ({ok: true, json: async () => JSON.parse(deltaJson)}),
+  CustomEvent: class { constructor(type, init) { this.type = type; this.detail = init.detail; } },
+  window: {dispatchEvent: e => events.push(e.detail)},
+};
+vm.runInNewContext(fs.readFileSync(script, 'utf8'), ctx);
+setTimeout(() => console.log(JSON.stringify({data: ctx.GEM_DATA, details: ctx.GEM_DETAILS, events})), 0);
+"""
+
+
+@pytest.mark.skipif(not shutil.which("node"), reason="node not installed")
+def test_client_inserts_rows_at_their_page_position():
+    delta = {
+        "version": 2, "from": 1,
+        "added": {"reward:1:B": {"act": 1, "questName": "B"}, "reward:3:D": {"act": 3, "questName": "D"},
+                  "details:a": {"tags": ["x"]}},
+        "changed": {"vendor:1:A": {"act": 1, "questName": "A", "npc": "new"}},
+        "removed": ["vendor:1:Gone"],
+        "positions": {"reward:1:B": 1, "reward:3:D": 3},
+    }
+    out = subprocess.run(["node", "-e", NODE_HARNESS, str(DATA_RELEASE_JS), json.dumps(delta)],
+                         capture_output=True, text=True, check=True).stdout
+    result = json.loads(out)
+    assert [r["questName"] for r in result["data"]["questRewards"]] == ["A", "B", "C", "D"]
+    assert result["data"]["vendorRewards"] == [{"act": 1, "questName": "A", "npc": "new"}]
+    assert result["details"] == {"a": {"tags": ["x"]}}
+    assert result["events"] == [{"version": 2}]
@@ -0,0 +1,55 @@
+"""RewardMatrix: rows in page order across quest rewards and vendors."""
+
+import pytest
+
+import dataset
+from jsemit import read_js
+from reward_matrix import RewardMatrix
+from scrape_poedb import parse_existing_rewards
+
+GEMS = ["fireball", "spark", "frostbolt"]
+
+
+def naive_first_act(cls):
+    """Earliest act per gem, scanning both gems.js reward lists directly."""
+    text = read_js(dataset.GEMS_JS)
+    first = {}
+    for section in ("questRewards", "vendorRewards"):
+        for row in parse_existing_rewards(text, section):
+            for gid in row.get("rewards", {}).get(cls, ()):
+                if row.get("act"):
+                    first[gid] = min(first.get(gid, row["act"]), row["act"])
+    return first
+
+
+@pytest.fixture(scope="module")
+def matrix():
+    return RewardMatrix.from_gems_js()
+
+
+@pytest.mark.parametrize("cls", RewardMatrix([]).classes)
+def test_first_act_matches_naive_scan(matrix, cls):
+    expected = {gid: act for gid, act in naive_first_act(cls).items() if gid in matrix.gem_index}
+    assert matrix.first_act(cls) == expected
+
+
+def test_vendor_row_counts_before_later_quest_reward():
+    m = RewardMatrix.from_rewards(
+        [{"act": 1, "questName": "A", "perClass": {"witch": ["spark"]}},
+         {"act": 2, "questName": "B", "perClass": {"witch": ["fireball"]}}],
+        [{"act": 1, "questName": "A", "perClass": {"witch": ["fireball"]}}],
+        GEMS)
+    assert [(q["act"], q["questName"], q["kind"]) for q in m.quests] == [
+        (1, "A", "reward"), (1, "A", "vendor"), (2, "B", "reward")]
+    assert m.first_act("witch") == {"spark": 1, "fireball": 1}
+
+
+def test_vendor_row_without_act():
+    m = RewardMatrix.from_rewards(
+        [{"act": 3, "questName": "C", "perClass": {"witch": ["spark"]}}],
+        [{"questName": "C", "perClass": {"witch": ["fireball"]}},
+         {"questName": "Nowhere", "perClass": {"witch": ["frostbolt"]}}],
+        GEMS)
+    assert m.first_act("witch") == {"spark": 3, "fireball": 3}
+    assert m.available("witch", upto_act=2) == 0
+    assert m.gems(m.available("witch")) == ["fireball", "spark"]
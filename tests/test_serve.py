@@ -0,0 +1,32 @@
+"""serve.py: compressed variants live in the cache dir, never beside the site files."""
+
+import gzip
+import random
+
+from serve import load_asset
+
+
+def test_variants_are_cached_by_revision_not_written_as_siblings(tmp_path):
+    site = tmp_path / "js"
+    site.mkdir()
+    path = site / "gems.js"
+    path.write_text("const GEMS = [];\n" * 200)
+    cache = tmp_path / "cache"
+
+    asset, compressed = load_asset(path, cache_dir=cache)
+    assert compressed == 1
+    assert gzip.decompress(asset.variants["gzip"].body) == path.read_bytes()
+    assert sorted(p.name for p in site.iterdir()) == ["gems.js"]
+    assert [p.name for p in cache.iterdir()] == [f"{asset.rev}.gz"]
+
+    again, compressed = load_asset(path, cache_dir=cache)
+    assert compressed == 0
+    assert again.variants["gzip"].body == asset.variants["gzip"].body
+
+
+def test_incompressible_file_is_remembered(tmp_path):
+    path = tmp_path / "noise.js"
+    path.write_bytes(random.Random(0).randbytes(4096))
+    asset, _ = load_asset(path, cache_dir=tmp_path / "cache")
+    assert set(asset.variants) == {"identity"}
+    assert load_asset(path, cache_dir=tmp_path / "cache")[1] == 0
@@ -0,0 +1,66 @@
+"""snapshots: diff cost follows the changes; names cannot clobber baselines."""
+
+import pytest
+
+import snapshots
+from snapshots import BUCKETS, SnapshotStore
+
+
+class CountingStore(SnapshotStore):
+    """Counts object reads that miss the in-memory cache."""
+
+    loads = 0
+
+    def get(self, digest):
+        if digest not in self._cache:
+            self.loads += 1
+        return super().get(digest)
+
+
+def test_diff_opens_only_changed_buckets(tmp_path):
+    old = {f"gem:g{i}": {"id": f"g{i}", "n": i} for i in range(5000)}
+    new = dict(old)
+    new["gem:g7"] = {"id": "g7", "n": -1}
+    del new["gem:g42"]
+    new["gem:added"] = {"id": "added"}
+    writer = SnapshotStore(tmp_path)
+    writer.save("old", old)
+    writer.save("new", new)
+
+    store = CountingStore(tmp_path)
+    assert store.diff("old", "new") == {
+        "added": ["gem:added"], "changed": ["gem:g7"], "removed": ["gem:g42"]}
+    assert store.loads <= 2 + 2 * 3  # both roots, old and new bucket per change
+    assert store.loads < BUCKETS
+
+
+def test_save_refuses_to_replace_a_snapshot(tmp_path):
+    store = SnapshotStore(tmp_path)
+    store.save("mine", {"gem:a": {"id": "a"}})
+    with pytest.raises(FileExistsError):
+        store.save("mine", {"gem:a": {"id": "b"}})
+    store.save("mine", {"gem:a": {"id": "b"}}, force=True)
+    assert store.load("mine") == {"gem:a": {"id": "b"}}
+
+
+@pytest.fixture
+def cli_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshots, "SnapshotStore", lambda: SnapshotStore(tmp_path))
+    monkeypatch.setattr(snapshots, "load_records", lambda: {"gem:a": {"id": "a"}})
+    return SnapshotStore(tmp_path)
+
+
+def test_release_names_are_reserved(cli_store):
+    with pytest.raises(SystemExit):
+        snapshots.main(["save", "release-3"])
+    assert cli_store.names() == []
+
+
+def test_default_names_do_not_collide(cli_store):
+    snapshots.main(["save"])
+    snapshots.main(["save"])
+    first, second = sorted(cli_store.names(), key=len)
+    assert second == f"{first}-2"
+    with pytest.raises(SystemExit):
+        snapshots.main(["save", first])
+    snapshots.main(["save", first, "--force"])